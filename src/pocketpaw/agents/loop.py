@@ -1,6 +1,7 @@
 """Unified Agent Loop.
 Created: 2026-02-02
 Changes:
+  - 2026-10-19: Coalesce stream chunks per reply (StreamCoalescer) before publishing outbound.
   - 2026-02-17: Record errors to health engine ErrorStore on timeout and exception.
   - Added BrowserTool registration
   - 2026-02-05: Refactored to use AgentRouter for all backends.
@@ -22,6 +23,7 @@ import re
 from pocketpaw.agents.router import AgentRouter
 from pocketpaw.bootstrap import AgentContextBuilder
 from pocketpaw.bus import InboundMessage, OutboundMessage, SystemEvent, get_message_bus
+from pocketpaw.bus.coalesce import StreamCoalescer, StreamFlushRate, get_stream_flush_rate
 from pocketpaw.bus.commands import get_command_handler
 from pocketpaw.bus.events import Channel
 from pocketpaw.config import Settings, get_settings
@@ -92,6 +94,12 @@ class AgentLoop:
         self._global_semaphore = asyncio.Semaphore(self.settings.max_concurrent_conversations)
         self._background_tasks: set[asyncio.Task] = set()
 
+        # Stream-chunk coalescing window for channels without a declared rate
+        self._default_flush_rate = StreamFlushRate(
+            interval=float(self.settings.stream_coalesce_window_ms) / 1000,
+            max_chars=int(self.settings.stream_coalesce_max_chars),
+        )
+
         self._running = False
 
     def _get_router(self) -> AgentRouter:
@@ -257,6 +265,11 @@ class AgentLoop:
                     char_budget=self.settings.compaction_char_budget,
                     summary_chars=self.settings.compaction_summary_chars,
                     llm_summarize=self.settings.compaction_llm_summarize,
+                    token_budget=(
+                        self.settings.compaction_token_budget
+                        if self.settings.context_budget_unit == "tokens"
+                        else None
+                    ),
                 ),
             )
 
@@ -271,6 +284,11 @@ class AgentLoop:
             media_paths: list[str] = []
 
             run_iter = router.run(content, system_prompt=system_prompt, history=history)
+            # Merge token deltas into fewer outbound messages (per reply)
+            stream = StreamCoalescer(
+                self.bus.publish_outbound,
+                get_stream_flush_rate(message.channel, self._default_flush_rate),
+            )
             # External endpoints (OpenAI-compatible, Ollama) may need longer
             # for the first response — especially thinking/reasoning models.
             ft = 120 if self.settings.llm_provider == "openai_compatible" else 30
@@ -283,7 +301,7 @@ class AgentLoop:
                     if chunk_type == "message":
                         # Stream text to user
                         full_response += content
-                        await self.bus.publish_outbound(
+                        await stream.publish(
                             OutboundMessage(
                                 channel=message.channel,
                                 chat_id=message.chat_id,
@@ -307,7 +325,7 @@ class AgentLoop:
                         # Also stream to user
                         code_block = f"\n```{language}\n{content}\n```\n"
                         full_response += code_block
-                        await self.bus.publish_outbound(
+                        await stream.publish(
                             OutboundMessage(
                                 channel=message.channel,
                                 chat_id=message.chat_id,
@@ -331,7 +349,7 @@ class AgentLoop:
                         # Also stream to user
                         output_block = f"\n```output\n{content}\n```\n"
                         full_response += output_block
-                        await self.bus.publish_outbound(
+                        await stream.publish(
                             OutboundMessage(
                                 channel=message.channel,
                                 chat_id=message.chat_id,
@@ -401,7 +419,7 @@ class AgentLoop:
                                 },
                             )
                         )
-                        await self.bus.publish_outbound(
+                        await stream.publish(
                             OutboundMessage(
                                 channel=message.channel,
                                 chat_id=message.chat_id,
@@ -416,6 +434,7 @@ class AgentLoop:
             finally:
                 # Always close the async generator to kill any subprocess
                 await run_iter.aclose()
+                await stream.flush()
 
             # 4. Send stream end marker (with any media files detected)
             # Fallback: if no media tags found in tool_result chunks,
@@ -428,7 +447,7 @@ class AgentLoop:
             # Deduplicate while preserving order
             seen: set[str] = set()
             media_paths = [p for p in media_paths if not (p in seen or seen.add(p))]
-            await self.bus.publish_outbound(
+            await stream.publish(
                 OutboundMessage(
                     channel=message.channel,
                     chat_id=message.chat_id,
@@ -17,19 +17,39 @@ Changes:
                 'computer' tool uses OI for complex multi-step tasks only.
   - 2026-02-05: Added 'remember' and 'recall' tools for long-term memory.
   - 2026-02-17: Added health_check, error_log, config_doctor tools for health engine.
+  - 2026-10-19: Tool calls from one model turn run concurrently (bounded by
+                native_tool_concurrency); SERIAL_TOOLS run alone, in order.
+  - 2026-10-19: Streaming mode (native_streaming) for the Anthropic and
+                OpenAI-compatible paths: text deltas are yielded as they arrive
+                and tool calls start as soon as their block is complete.
+  - 2026-10-19: Prompt caching (native_prompt_caching): stable prefix order
+                (tools, tool guide, identity) with Anthropic cache breakpoints;
+                cached-token counts in token_usage; tool list rebuilt only when
+                its content hash changes.
+  - 2026-10-19: Large MCP catalogs: only the native_tool_top_k MCP tools most
+                relevant to the turn are offered, plus a load_tools meta-tool.
 """
 
 import asyncio
+import hashlib
+import json
 import logging
 import re
 from collections.abc import AsyncIterator
 from pathlib import Path
+from types import SimpleNamespace
 
 from pocketpaw.agents.protocol import AgentEvent
 from pocketpaw.config import Settings
 from pocketpaw.llm.client import LLMClient, resolve_llm_client
 from pocketpaw.security.rails import DANGEROUS_PATTERNS
 from pocketpaw.tools.policy import ToolPolicy
+from pocketpaw.tools.retrieval import (
+    LOAD_TOOLS_NAME,
+    ToolIndex,
+    ToolSelection,
+    load_tools_definition,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -75,6 +95,14 @@ REDACT_PATTERNS = [
     r"api[_-]?key[\"']?\s*[:=]\s*[\"']([^\"']+)",  # api_key = "..."
 ]
 
+# Tools with side effects that must not overlap other calls of the same turn.
+# Each runs alone: after every earlier call finishes and before any later one
+# starts. All other tools (reads, recall, MCP calls) run concurrently.
+SERIAL_TOOLS = {"computer", "shell", "write_file", "remember", "forget"}
+
+# Anthropic prompt-cache breakpoint
+_CACHE_CONTROL = {"type": "ephemeral"}
+
 # Default identity fallback (used when AgentContextBuilder prompt is not available)
 _DEFAULT_IDENTITY = (
     "You are PocketPaw, a helpful AI assistant that runs locally on the user's computer.\n"
@@ -337,6 +365,114 @@ ALWAYS instruct it to RETURN data as text, not open GUI apps.""",
 ]
 
 
+async def _iter_with_timeout(stream, timeout: float) -> AsyncIterator:
+    """Iterate an async stream, raising TimeoutError if it stalls for ``timeout``."""
+    iterator = stream.__aiter__()
+    while True:
+        try:
+            item = await asyncio.wait_for(iterator.__anext__(), timeout=timeout)
+        except StopAsyncIteration:
+            return
+        yield item
+
+
+async def _close_stream(stream) -> None:
+    """Release an SDK stream's pooled HTTP connection (safe after full consumption)."""
+    try:
+        await stream.close()
+    except Exception as e:
+        logger.debug("Error closing model stream: %s", e)
+
+
+async def _replay_response(response) -> AsyncIterator[tuple]:
+    """Stream events for an already complete (non-streamed) response."""
+    for block in response.content:
+        if block.type == "text" and block.text:
+            yield ("text", block.text)
+        elif block.type == "tool_use":
+            yield ("tool_use", block)
+    yield ("response", response)
+
+
+def _tokens(usage, name: str) -> int:
+    value = getattr(usage, name, None)
+    return value if isinstance(value, int) else 0
+
+
+def _anthropic_usage(usage, output_tokens: int | None = None) -> dict:
+    """token_usage metadata from an Anthropic usage object.
+
+    ``input_tokens`` counts uncached input only; prompt-cache reads and writes
+    are reported separately and included in ``total_tokens``.
+    """
+    data = {
+        "input_tokens": _tokens(usage, "input_tokens"),
+        "output_tokens": (
+            output_tokens if output_tokens is not None else _tokens(usage, "output_tokens")
+        ),
+    }
+    cache_read = _tokens(usage, "cache_read_input_tokens")
+    cache_write = _tokens(usage, "cache_creation_input_tokens")
+    if cache_read or cache_write:
+        data["cache_read_input_tokens"] = cache_read
+        data["cache_creation_input_tokens"] = cache_write
+    data["total_tokens"] = data["input_tokens"] + data["output_tokens"] + cache_read + cache_write
+    return data
+
+
+def _openai_usage(usage) -> dict:
+    """token_usage metadata from an OpenAI usage object (cached tokens are
+    part of ``input_tokens`` and also reported as ``cache_read_input_tokens``)."""
+    data = {
+        "input_tokens": getattr(usage, "prompt_tokens", 0),
+        "output_tokens": getattr(usage, "completion_tokens", 0),
+        "total_tokens": getattr(usage, "total_tokens", 0),
+    }
+    cached = _tokens(getattr(usage, "prompt_tokens_details", None), "cached_tokens")
+    if cached:
+        data["cache_read_input_tokens"] = cached
+    return data
+
+
+class _ToolCallRunner:
+    """Starts a turn's tool calls as soon as they are known.
+
+    Calls run concurrently (bounded by ``semaphore``) except SERIAL_TOOLS,
+    which wait for every earlier call and hold back every later one.
+    ``results()`` returns outputs in call order.
+    """
+
+    def __init__(self, execute, semaphore: asyncio.Semaphore, should_stop):
+        self._execute = execute
+        self._semaphore = semaphore
+        self._should_stop = should_stop
+        self._tasks: list[asyncio.Task] = []
+        self._barrier: asyncio.Task | None = None  # most recent serial call
+
+    def start(self, block) -> None:
+        serial = block.name in SERIAL_TOOLS
+        waits = list(self._tasks) if serial else [self._barrier] if self._barrier else []
+        task = asyncio.create_task(self._run(block, waits))
+        if serial:
+            self._barrier = task
+        self._tasks.append(task)
+
+    async def _run(self, block, waits: list[asyncio.Task]) -> str:
+        if waits:
+            await asyncio.gather(*waits, return_exceptions=True)
+        if self._should_stop():
+            return f"Skipped {block.name}: stopped by user"
+        async with self._semaphore:
+            return await self._execute(block.name, block.input)
+
+    async def results(self) -> list[str]:
+        return list(await asyncio.gather(*self._tasks))
+
+    def cancel(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+
+
 class PocketPawOrchestrator:
     """PocketPaw Native Orchestrator - Your own AI brain.
 
@@ -367,6 +503,11 @@ class PocketPawOrchestrator:
             allow=settings.tools_allow,
             deny=settings.tools_deny,
         )
+        # Tool list cache, keyed by a hash of the MCP tool definitions
+        self._tools_digest: str | None = None
+        self._tools: list[dict] = []
+        self._converted_tools: dict[str, list[dict]] = {}
+        self._tool_index: ToolIndex | None = None
         self._initialize()
 
     def _initialize(self) -> None:
@@ -428,10 +569,85 @@ class PocketPawOrchestrator:
         logger.info("=" * 50)
 
     def _get_filtered_tools(self) -> list[dict]:
-        """Return TOOLS filtered by the active tool policy, plus MCP tools."""
-        base = [t for t in TOOLS if self._policy.is_tool_allowed(t["name"])]
-        base.extend(self._get_mcp_tools())
-        return base
+        """Return TOOLS filtered by the active tool policy, plus MCP tools.
+
+        The list is the start of every prompt, so it is kept byte-stable for
+        prompt caching: MCP tools are sorted by name, and the list (and its
+        converted forms) is only rebuilt when the MCP tool definitions change.
+        """
+        mcp_tools = self._get_mcp_tools()
+        digest = hashlib.sha256(
+            json.dumps(mcp_tools, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        if digest != self._tools_digest:
+            base = [t for t in TOOLS if self._policy.is_tool_allowed(t["name"])]
+            base.extend(sorted(mcp_tools, key=lambda t: t["name"]))
+            self._tools = base
+            self._tools_digest = digest
+            self._converted_tools = {}
+            self._tool_index = None
+        return self._tools
+
+    def _tool_selection(self, message: str, history: list[dict] | None) -> ToolSelection | None:
+        """Relevance-ranked MCP tool subset for a turn.
+
+        Returns None (offer every tool) while the MCP catalog is no larger
+        than ``native_tool_top_k``.
+        """
+        top_k = int(self.settings.native_tool_top_k)
+        tools = self._get_filtered_tools()
+        mcp_tools = [t for t in tools if t["name"].startswith("mcp_")]
+        if top_k <= 0 or len(mcp_tools) <= top_k:
+            return None
+        if self._tool_index is None:
+            self._tool_index = ToolIndex(mcp_tools)
+
+        # The new message plus the user's last few turns
+        recent = [
+            m["content"]
+            for m in (history or [])
+            if m.get("role") == "user" and isinstance(m.get("content"), str)
+        ][-3:]
+        return ToolSelection(self._tool_index, " ".join([*recent, message]), top_k)
+
+    def _offered_tools(self, tools: list[dict], selection: ToolSelection) -> list[dict]:
+        """Built-in tools, the selected MCP tools, and the load_tools meta-tool."""
+        servers = sorted(
+            {parsed[0] for t in tools if (parsed := self._parse_mcp_tool_name(t["name"]))}
+        )
+        builtin = [t for t in tools if not t["name"].startswith("mcp_")]
+        return [*builtin, *selection.tools(), load_tools_definition(servers)]
+
+    def _converted(self, tools: list[dict], fmt: str) -> list[dict]:
+        """``tools`` in another format, memoized for the cached tool list."""
+        if tools is self._tools and fmt in self._converted_tools:
+            return self._converted_tools[fmt]
+        if fmt == "openai":
+            result = self._anthropic_tools_to_openai(tools)
+        else:  # "anthropic_cached": breakpoint after the last tool
+            result = [*tools[:-1], {**tools[-1], "cache_control": _CACHE_CONTROL}] if tools else []
+        if tools is self._tools:
+            self._converted_tools[fmt] = result
+        return result
+
+    def _prompt_caching(self) -> bool:
+        """Whether to send Anthropic cache breakpoints."""
+        return bool(self.settings.native_prompt_caching) and self._llm.is_anthropic
+
+    def _anthropic_prompt(self, identity: str, tools: list[dict]) -> tuple:
+        """System prompt and tools for the Messages API.
+
+        With prompt caching, the static tool guide and the per-conversation
+        identity are separate system blocks, each ending a cached prefix
+        (tools → tool guide → identity).
+        """
+        if not self._prompt_caching():
+            return _TOOL_GUIDE + "\n" + identity, tools
+        system = [
+            {"type": "text", "text": _TOOL_GUIDE, "cache_control": _CACHE_CONTROL},
+            {"type": "text", "text": identity, "cache_control": _CACHE_CONTROL},
+        ]
+        return system, self._converted(tools, "anthropic_cached")
 
     def _get_mcp_tools(self) -> list[dict]:
         """Convert MCP tools to Anthropic tool format, filtered by policy."""
@@ -525,8 +741,6 @@ class PocketPawOrchestrator:
                         if block.type == "text" and getattr(block, "text", ""):
                             text_parts.append(block.text)
                         elif block.type == "tool_use":
-                            import json
-
                             tool_calls.append(
                                 {
                                     "id": block.id,
@@ -548,6 +762,40 @@ class PocketPawOrchestrator:
                 oai.append({"role": role, "content": str(content)})
         return oai
 
+    def _openai_request_kwargs(
+        self, model: str, system_prompt: str, tools: list[dict], messages: list[dict]
+    ) -> dict:
+        """Build chat.completions.create() arguments from Anthropic-shaped inputs."""
+        oai_messages = self._build_openai_messages(system_prompt, messages)
+        oai_tools = self._converted(tools, "openai")
+
+        kwargs: dict = {
+            "model": model,
+            "messages": oai_messages,
+        }
+        if self.settings.openai_compatible_max_tokens > 0:
+            kwargs["max_tokens"] = self.settings.openai_compatible_max_tokens
+        if oai_tools:
+            kwargs["tools"] = oai_tools
+        return kwargs
+
+    @staticmethod
+    def _openai_stop_reason(finish: str | None) -> str:
+        """Map an OpenAI finish_reason to an Anthropic stop_reason."""
+        if finish == "stop":
+            return "end_turn"
+        if finish == "tool_calls":
+            return "tool_use"
+        return finish or "end_turn"
+
+    @staticmethod
+    def _openai_tool_block(call_id: str, name: str, arguments: str | None) -> SimpleNamespace:
+        try:
+            inp = json.loads(arguments or "{}")
+        except (json.JSONDecodeError, TypeError):
+            inp = {}
+        return SimpleNamespace(type="tool_use", id=call_id, name=name, input=inp)
+
     async def _call_openai_compatible(
         self,
         *,
@@ -561,22 +809,12 @@ class PocketPawOrchestrator:
         Returns an object that mimics the Anthropic response shape so the
         existing processing loop can handle it unchanged.
         """
-        import json
-        from types import SimpleNamespace
-
-        oai_messages = self._build_openai_messages(system_prompt, messages)
-        oai_tools = self._anthropic_tools_to_openai(tools)
-
-        kwargs: dict = {
-            "model": model,
-            "messages": oai_messages,
-        }
-        if self.settings.openai_compatible_max_tokens > 0:
-            kwargs["max_tokens"] = self.settings.openai_compatible_max_tokens
-        if oai_tools:
-            kwargs["tools"] = oai_tools
-
+        kwargs = self._openai_request_kwargs(model, system_prompt, tools, messages)
         response = await self._client.chat.completions.create(**kwargs)
+        return self._normalize_openai_response(response)
+
+    def _normalize_openai_response(self, response) -> SimpleNamespace:
+        """Convert a ChatCompletion to the Anthropic response shape."""
         choice = response.choices[0]
         msg = choice.message
 
@@ -586,37 +824,172 @@ class PocketPawOrchestrator:
             content_blocks.append(SimpleNamespace(type="text", text=msg.content))
         if msg.tool_calls:
             for tc in msg.tool_calls:
-                try:
-                    inp = json.loads(tc.function.arguments)
-                except (json.JSONDecodeError, TypeError):
-                    inp = {}
                 content_blocks.append(
-                    SimpleNamespace(
-                        type="tool_use",
-                        id=tc.id,
-                        name=tc.function.name,
-                        input=inp,
-                    )
+                    self._openai_tool_block(tc.id, tc.function.name, tc.function.arguments)
                 )
 
-        # Map finish_reason to Anthropic stop_reason
-        finish = choice.finish_reason
-        if finish == "stop":
-            stop_reason = "end_turn"
-        elif finish == "tool_calls":
-            stop_reason = "tool_use"
-        else:
-            stop_reason = finish or "end_turn"
-
         usage = None
         if hasattr(response, "usage") and response.usage:
-            usage = {
-                "input_tokens": getattr(response.usage, "prompt_tokens", 0),
-                "output_tokens": getattr(response.usage, "completion_tokens", 0),
-                "total_tokens": getattr(response.usage, "total_tokens", 0),
-            }
+            usage = _openai_usage(response.usage)
+
+        return SimpleNamespace(
+            content=content_blocks,
+            stop_reason=self._openai_stop_reason(choice.finish_reason),
+            usage=usage,
+        )
+
+    # =========================================================================
+    # STREAMING
+    # =========================================================================
+    #
+    # The _stream_* methods yield ("text", str) deltas as they arrive,
+    # ("tool_use", block) as soon as a tool call is complete, and finally
+    # ("response", normalized_response) shaped like the non-streaming result.
+
+    async def _stream_anthropic(self, *, timeout: float, **kwargs) -> AsyncIterator[tuple]:
+        """Stream a Messages API call."""
+        from anthropic import AsyncStream
+        from anthropic.types import TextBlock, ToolUseBlock
+
+        stream = await asyncio.wait_for(
+            self._client.messages.create(**kwargs, stream=True), timeout=timeout
+        )
+        if not isinstance(stream, AsyncStream):
+            # Endpoint answered with a complete message
+            async for item in _replay_response(stream):
+                yield item
+            return
+
+        pending: dict[int, dict] = {}  # open content blocks by index
+        content: list = []
+        start_usage = None
+        output_tokens = 0
+        stop_reason = None
+
+        try:
+            async for event in _iter_with_timeout(stream, timeout):
+                etype = event.type
+                if etype == "message_start":
+                    start_usage = event.message.usage
+                elif etype == "content_block_start":
+                    block = event.content_block
+                    if block.type in ("text", "tool_use"):
+                        pending[event.index] = {"block": block, "parts": []}
+                elif etype == "content_block_delta":
+                    entry = pending.get(event.index)
+                    if entry is None:
+                        continue
+                    delta = event.delta
+                    if delta.type == "text_delta":
+                        entry["parts"].append(delta.text)
+                        yield ("text", delta.text)
+                    elif delta.type == "input_json_delta":
+                        entry["parts"].append(delta.partial_json)
+                elif etype == "content_block_stop":
+                    entry = pending.pop(event.index, None)
+                    if entry is None:
+                        continue
+                    start, text = entry["block"], "".join(entry["parts"])
+                    if start.type == "text":
+                        content.append(TextBlock(type="text", text=text))
+                        continue
+                    try:
+                        inp = json.loads(text) if text else {}
+                    except json.JSONDecodeError:
+                        inp = {}
+                    block = ToolUseBlock(type="tool_use", id=start.id, name=start.name, input=inp)
+                    content.append(block)
+                    yield ("tool_use", block)
+                elif etype == "message_delta":
+                    stop_reason = event.delta.stop_reason or stop_reason
+                    if event.usage is not None:
+                        output_tokens = _tokens(event.usage, "output_tokens")
+        finally:
+            await _close_stream(stream)
+
+        usage = _anthropic_usage(start_usage, output_tokens=output_tokens)
+        yield ("response", SimpleNamespace(content=content, stop_reason=stop_reason, usage=usage))
+
+    async def _stream_openai_compatible(
+        self,
+        *,
+        model: str,
+        system_prompt: str,
+        tools: list[dict],
+        messages: list[dict],
+        timeout: float,
+    ) -> AsyncIterator[tuple]:
+        """Stream a chat.completions call, normalized to Anthropic shapes."""
+        from openai import AsyncStream
+
+        kwargs = self._openai_request_kwargs(model, system_prompt, tools, messages)
+        stream = await asyncio.wait_for(
+            self._client.chat.completions.create(
+                **kwargs, stream=True, stream_options={"include_usage": True}
+            ),
+            timeout=timeout,
+        )
+        if not isinstance(stream, AsyncStream):
+            # Some OpenAI-compatible servers ignore stream=True
+            async for item in _replay_response(self._normalize_openai_response(stream)):
+                yield item
+            return
+
+        text_parts: list[str] = []
+        calls: dict[int, dict] = {}  # tool calls still receiving arguments, by index
+        tool_blocks: list = []
+        finish = None
+        usage = None
+
+        def _complete(index: int) -> SimpleNamespace:
+            call = calls.pop(index)
+            block = self._openai_tool_block(call["id"], call["name"], "".join(call["args"]))
+            tool_blocks.append(block)
+            return block
 
-        return SimpleNamespace(content=content_blocks, stop_reason=stop_reason, usage=usage)
+        try:
+            async for chunk in _iter_with_timeout(stream, timeout):
+                if getattr(chunk, "usage", None):
+                    usage = _openai_usage(chunk.usage)
+                if not chunk.choices:
+                    continue
+                choice = chunk.choices[0]
+                delta = choice.delta
+                if delta is not None and delta.content:
+                    text_parts.append(delta.content)
+                    yield ("text", delta.content)
+                for tc in (delta.tool_calls if delta is not None else None) or []:
+                    if tc.index not in calls:
+                        # A new call means every earlier one has all its arguments
+                        for index in sorted(i for i in calls if i < tc.index):
+                            yield ("tool_use", _complete(index))
+                        calls[tc.index] = {"id": "", "name": "", "args": []}
+                    call = calls[tc.index]
+                    if tc.id:
+                        call["id"] = tc.id
+                    if tc.function is not None:
+                        if tc.function.name:
+                            call["name"] = call["name"] or tc.function.name
+                        if tc.function.arguments:
+                            call["args"].append(tc.function.arguments)
+                if choice.finish_reason:
+                    finish = choice.finish_reason
+
+            for index in sorted(calls):
+                yield ("tool_use", _complete(index))
+        finally:
+            await _close_stream(stream)
+
+        content: list = []
+        if text_parts:
+            content.append(SimpleNamespace(type="text", text="".join(text_parts)))
+        content.extend(tool_blocks)
+        yield (
+            "response",
+            SimpleNamespace(
+                content=content, stop_reason=self._openai_stop_reason(finish), usage=usage
+            ),
+        )
 
     # =========================================================================
     # SECURITY METHODS
@@ -913,6 +1286,14 @@ class PocketPawOrchestrator:
             # Security: redact secrets from error messages too
             return self._redact_secrets(f"Error executing {tool_name}: {e}")
 
+    @staticmethod
+    def _tool_use_event(block) -> AgentEvent:
+        return AgentEvent(
+            type="tool_use",
+            content=f"🔧 Using {block.name}...",
+            metadata={"name": block.name, "input": block.input},
+        )
+
     async def chat(
         self,
         message: str,
@@ -959,6 +1340,18 @@ class PocketPawOrchestrator:
         max_iterations = 10
         iteration = 0
 
+        # Bounds how many tool calls of one turn run at once
+        tool_semaphore = asyncio.Semaphore(max(1, int(self.settings.native_tool_concurrency)))
+        runner: _ToolCallRunner | None = None
+
+        # With a large MCP catalog, offer only the tools relevant to this turn
+        selection = self._tool_selection(message, history)
+
+        async def execute(tool_name: str, tool_input: dict) -> str:
+            if selection is not None and tool_name == LOAD_TOOLS_NAME:
+                return selection.load(tool_input.get("query", ""))
+            return await self._execute_tool(tool_name, tool_input)
+
         try:
             while iteration < max_iterations and not self._stop_flag:
                 iteration += 1
@@ -986,19 +1379,55 @@ class PocketPawOrchestrator:
                         selection.reason,
                     )
 
-                # Compose final system prompt: identity/memory + tool guide
+                # Compose final system prompt. The static tool guide goes first
+                # so the prompt prefix stays identical across turns (cacheable).
                 identity = system_prompt or _DEFAULT_IDENTITY
-                final_system = identity + "\n" + _TOOL_GUIDE
+                final_system = _TOOL_GUIDE + "\n" + identity
 
                 # Call LLM with timeout wrapper for safety
                 filtered_tools = self._get_filtered_tools()
+                if selection is not None:
+                    filtered_tools = self._offered_tools(filtered_tools, selection)
                 # OpenAI-compatible endpoints (especially thinking models)
                 # may need longer for first response.
                 api_timeout = (
                     180.0 if self._llm.is_openai_compatible or self._llm.is_gemini else 90.0
                 )
+                use_openai = self._llm.is_openai_compatible or self._llm.is_gemini
+                anthropic_system, anthropic_tools = self._anthropic_prompt(identity, filtered_tools)
+                streaming = self.settings.native_streaming
+                runner = _ToolCallRunner(execute, tool_semaphore, lambda: self._stop_flag)
+                response = None
                 try:
-                    if self._llm.is_openai_compatible or self._llm.is_gemini:
+                    if streaming:
+                        # Text is shown as it arrives; each tool call starts as
+                        # soon as its block is complete
+                        if use_openai:
+                            stream = self._stream_openai_compatible(
+                                model=model,
+                                system_prompt=final_system,
+                                tools=filtered_tools,
+                                messages=messages,
+                                timeout=api_timeout,
+                            )
+                        else:
+                            stream = self._stream_anthropic(
+                                timeout=api_timeout,
+                                model=model,
+                                max_tokens=4096,
+                                system=anthropic_system,
+                                tools=anthropic_tools,
+                                messages=messages,
+                            )
+                        async for kind, payload in stream:
+                            if kind == "text":
+                                yield AgentEvent(type="message", content=payload)
+                            elif kind == "tool_use":
+                                yield self._tool_use_event(payload)
+                                runner.start(payload)
+                            else:
+                                response = payload
+                    elif use_openai:
                         response = await asyncio.wait_for(
                             self._call_openai_compatible(
                                 model=model,
@@ -1013,19 +1442,21 @@ class PocketPawOrchestrator:
                             self._client.messages.create(
                                 model=model,
                                 max_tokens=4096,
-                                system=final_system,
-                                tools=filtered_tools,
+                                system=anthropic_system,
+                                tools=anthropic_tools,
                                 messages=messages,
                             ),
                             timeout=api_timeout,
                         )
                 except TimeoutError:
+                    runner.cancel()
                     yield AgentEvent(
                         type="error",
                         content="⏱️ Request timed out. Please check your network connection and API key.",
                     )
                     return
                 except Exception as api_error:
+                    runner.cancel()
                     logger.error(f"API error ({self._llm.provider}): {api_error}")
                     yield AgentEvent(
                         type="error",
@@ -1036,57 +1467,36 @@ class PocketPawOrchestrator:
                 # Emit token usage if available
                 usage = getattr(response, "usage", None)
                 if usage:
-                    if isinstance(usage, dict):
-                        usage_data = usage
-                    else:
-                        usage_data = {
-                            "input_tokens": getattr(usage, "input_tokens", 0),
-                            "output_tokens": getattr(usage, "output_tokens", 0),
-                            "total_tokens": (
-                                getattr(usage, "input_tokens", 0)
-                                + getattr(usage, "output_tokens", 0)
-                            ),
-                        }
+                    usage_data = usage if isinstance(usage, dict) else _anthropic_usage(usage)
                     yield AgentEvent(type="token_usage", content="", metadata=usage_data)
 
                 # Process response content blocks
-                assistant_content = []
+                assistant_content = [b for b in response.content if b.type in ("text", "tool_use")]
+                tool_calls = [b for b in assistant_content if b.type == "tool_use"]
                 tool_results_needed = []
 
-                for block in response.content:
-                    if block.type == "text":
-                        # Text response - yield to user
-                        if block.text:
-                            yield AgentEvent(type="message", content=block.text)
-                        assistant_content.append(block)
-
-                    elif block.type == "tool_use":
-                        # Tool call - execute it
-                        tool_name = block.name
-                        tool_input = block.input
-                        tool_id = block.id
-
-                        # Emit tool_use event
-                        yield AgentEvent(
-                            type="tool_use",
-                            content=f"🔧 Using {tool_name}...",
-                            metadata={"name": tool_name, "input": tool_input},
-                        )
-
-                        # Execute
-                        result = await self._execute_tool(tool_name, tool_input)
-
-                        # Emit tool_result event
-                        yield AgentEvent(
-                            type="tool_result",
-                            content=result[:500] + ("..." if len(result) > 500 else ""),
-                            metadata={"name": tool_name},
-                        )
-
-                        assistant_content.append(block)
-                        tool_results_needed.append(
-                            {"type": "tool_result", "tool_use_id": tool_id, "content": result}
-                        )
+                if not streaming:
+                    for block in assistant_content:
+                        if block.type == "text":
+                            # Text response - yield to user
+                            if block.text:
+                                yield AgentEvent(type="message", content=block.text)
+                        else:
+                            yield self._tool_use_event(block)
+                            runner.start(block)
+
+                # Independent tool calls ran concurrently; results are reported
+                # in the order the model issued them
+                results = await runner.results()
+                for block, result in zip(tool_calls, results):
+                    yield AgentEvent(
+                        type="tool_result",
+                        content=result[:500] + ("..." if len(result) > 500 else ""),
+                        metadata={"name": block.name},
+                    )
+                    tool_results_needed.append(
+                        {"type": "tool_result", "tool_use_id": block.id, "content": result}
+                    )
 
                 # Add assistant message to history
                 messages.append({"role": "assistant", "content": assistant_content})
@@ -1107,6 +1517,10 @@ class PocketPawOrchestrator:
         except Exception as e:
             logger.error(f"PocketPaw error: {e}")
             yield AgentEvent(type="error", content=f"❌ Error: {e}")
+        finally:
+            # Don't leave tool calls running if the consumer stops early
+            if runner is not None:
+                runner.cancel()
 
     async def run(
         self,
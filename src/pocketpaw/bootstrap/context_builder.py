@@ -4,6 +4,7 @@ Created: 2026-02-02
 Updated: 2026-02-17 - Inject health state into system prompt when degraded/unhealthy
 Updated: 2026-02-07 - Semantic context injection for mem0 backend
 Updated: 2026-02-10 - Channel-aware format hints
+Updated: 2026-10-19 - Token-budgeted memory context (context_budget_unit = "tokens")
 """
 
 from __future__ import annotations
@@ -33,6 +34,16 @@ class AgentContextBuilder:
         self.bootstrap = bootstrap_provider or DefaultBootstrapProvider()
         self.memory = memory_manager or get_memory_manager()
 
+    @staticmethod
+    def _memory_token_budget() -> int | None:
+        """Memory context token budget, or None when budgeting in chars."""
+        from pocketpaw.config import get_settings
+
+        settings = get_settings()
+        if settings.context_budget_unit == "tokens":
+            return settings.memory_context_token_budget
+        return None
+
     async def build_system_prompt(
         self,
         include_memory: bool = True,
@@ -52,10 +63,17 @@ class AgentContextBuilder:
         """
         # 1. Load static identity + memory context concurrently (independent I/O)
         if include_memory:
+            # Token budget only in token mode; char-mode calls stay unchanged
+            budget = {}
+            max_tokens = self._memory_token_budget()
+            if max_tokens is not None:
+                budget["max_tokens"] = max_tokens
             if user_query:
-                memory_coro = self.memory.get_semantic_context(user_query, sender_id=sender_id)
+                memory_coro = self.memory.get_semantic_context(
+                    user_query, sender_id=sender_id, **budget
+                )
             else:
-                memory_coro = self.memory.get_context_for_agent(sender_id=sender_id)
+                memory_coro = self.memory.get_context_for_agent(sender_id=sender_id, **budget)
             context, memory_context = await asyncio.gather(
                 self.bootstrap.get_context(),
                 memory_coro,
@@ -1,5 +1,6 @@
 # Browser automation module for PocketPaw
 # Changes: Added exports for snapshot, driver, and session components
+#          2026-10-19: Export BrowserPool
 #
 # This module provides Playwright-based browser automation with semantic
 # accessibility tree snapshots for AI agent control.
@@ -7,6 +8,7 @@
 
 from .snapshot import RefMap, AccessibilityNode, SnapshotGenerator
 from .driver import BrowserDriver, NavigationResult
+from .pool import BrowserPool
 from .session import BrowserSession, BrowserSessionManager, get_browser_session_manager
 
 __all__ = [
@@ -17,6 +19,8 @@ __all__ = [
     # Driver
     "BrowserDriver",
     "NavigationResult",
+    # Pool
+    "BrowserPool",
     # Session
     "BrowserSession",
     "BrowserSessionManager",
@@ -1,5 +1,8 @@
 # Playwright browser driver wrapper
 # Changes: Added auto-install and system Chrome support
+#          2026-10-19: Optional BrowserPool — pooled drivers borrow an isolated
+#          context from a shared browser instead of launching their own
+#          2026-10-19: diff_snapshots — click/scroll return only what changed
 #
 # Wraps Playwright browser automation with methods for navigate, click,
 # type, scroll, snapshot, and screenshot.
@@ -19,17 +22,78 @@ from typing import TYPE_CHECKING
 from .snapshot import AccessibilityNode, RefMap, SnapshotGenerator
 
 if TYPE_CHECKING:
-    from playwright.async_api import Browser, Page, Playwright
+    from playwright.async_api import Browser, BrowserContext, Page, Playwright
+
+    from .pool import BrowserPool
 
 logger = logging.getLogger(__name__)
 
 
+async def launch_chromium(playwright: Playwright, headless: bool) -> Browser:
+    """Launch a Chromium browser.
+
+    Tries in order:
+    1. System Chrome (no download needed)
+    2. Playwright's bundled Chromium (auto-installs if missing)
+    """
+    # Try system Chrome first (no download needed for users)
+    try:
+        browser = await playwright.chromium.launch(
+            headless=headless,
+            channel="chrome",  # Use system Chrome
+        )
+        logger.info("Using system Chrome")
+        return browser
+    except Exception as e:
+        logger.debug(f"System Chrome not available: {e}")
+
+    # Fall back to Playwright's Chromium
+    try:
+        browser = await playwright.chromium.launch(headless=headless)
+        logger.info("Using Playwright Chromium")
+        return browser
+    except Exception as install_error:
+        # Chromium not installed - auto-install it
+        if "Executable doesn't exist" not in str(install_error):
+            raise
+    logger.info("Installing Chromium browser (one-time download)...")
+    await _install_chromium()
+    # Try again after install
+    browser = await playwright.chromium.launch(headless=headless)
+    logger.info("Using Playwright Chromium (freshly installed)")
+    return browser
+
+
+async def _install_chromium() -> None:
+    """Auto-install Playwright's Chromium browser."""
+    logger.info("Downloading Chromium browser (~150MB)...")
+
+    # Run playwright install chromium
+    process = await asyncio.create_subprocess_exec(
+        sys.executable,
+        "-m",
+        "playwright",
+        "install",
+        "chromium",
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout, stderr = await process.communicate()
+
+    if process.returncode != 0:
+        error_msg = stderr.decode() if stderr else "Unknown error"
+        raise RuntimeError(f"Failed to install Chromium: {error_msg}")
+
+    logger.info("Chromium installed successfully")
+
+
 @dataclass
 class NavigationResult:
     """Result of a navigation or interaction that returns page state."""
 
     snapshot: str
     refmap: RefMap
+    is_diff: bool = False  # snapshot lists only changes since the previous one
 
 
 class BrowserDriver:
@@ -51,18 +115,32 @@ class BrowserDriver:
     # Scroll amount in pixels
     SCROLL_AMOUNT = 500
 
-    def __init__(self, headless: bool = True) -> None:
+    def __init__(
+        self,
+        headless: bool = True,
+        pool: BrowserPool | None = None,
+        diff_snapshots: bool = False,
+    ) -> None:
         """Initialize the browser driver.
 
         Args:
             headless: Whether to run browser in headless mode (default True)
+            pool: Shared browser to borrow a context from. Without one, the
+                driver launches (and closes) its own browser.
+            diff_snapshots: Return only the changed parts of the page after
+                click/scroll, with refs stable across snapshots
         """
         self.headless = headless
+        self._pool = pool
+        self._diff_snapshots = diff_snapshots
+        self._last_lines: list[str] | None = None
+        self._last_url: str | None = None
         self._playwright: Playwright | None = None
         self._browser: Browser | None = None
+        self._context: BrowserContext | None = None
         self._page: Page | None = None
         self._refmap: RefMap = RefMap()
-        self._snapshot_generator = SnapshotGenerator()
+        self._snapshot_generator = SnapshotGenerator(stable_refs=diff_snapshots)
 
         # Verify playwright is installed early (fail fast with helpful message)
         try:
@@ -94,75 +172,34 @@ class BrowserDriver:
         return self._page.url
 
     async def launch(self) -> None:
-        """Launch the browser.
+        """Launch the browser, or borrow a context from the pool."""
+        if self._pool is not None:
+            self._browser, self._context, self._page = await self._pool.acquire(self.headless)
+            return
 
-        Tries in order:
-        1. System Chrome (no download needed)
-        2. Playwright's bundled Chromium (auto-installs if missing)
-        """
         from playwright.async_api import async_playwright
 
         self._playwright = await async_playwright().start()
-
-        # Try system Chrome first (no download needed for users)
-        try:
-            self._browser = await self._playwright.chromium.launch(
-                headless=self.headless,
-                channel="chrome",  # Use system Chrome
-            )
-            logger.info("Using system Chrome")
-        except Exception as e:
-            logger.debug(f"System Chrome not available: {e}")
-            # Fall back to Playwright's Chromium
-            try:
-                self._browser = await self._playwright.chromium.launch(headless=self.headless)
-                logger.info("Using Playwright Chromium")
-            except Exception as install_error:
-                # Chromium not installed - auto-install it
-                if "Executable doesn't exist" in str(install_error):
-                    logger.info("Installing Chromium browser (one-time download)...")
-                    await self._install_chromium()
-                    # Try again after install
-                    self._browser = await self._playwright.chromium.launch(headless=self.headless)
-                    logger.info("Using Playwright Chromium (freshly installed)")
-                else:
-                    raise
-
-        context = await self._browser.new_context(viewport=self.DEFAULT_VIEWPORT)
-        self._page = await context.new_page()
-
-    async def _install_chromium(self) -> None:
-        """Auto-install Playwright's Chromium browser."""
-        logger.info("Downloading Chromium browser (~150MB)...")
-
-        # Run playwright install chromium
-        process = await asyncio.create_subprocess_exec(
-            sys.executable,
-            "-m",
-            "playwright",
-            "install",
-            "chromium",
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        stdout, stderr = await process.communicate()
-
-        if process.returncode != 0:
-            error_msg = stderr.decode() if stderr else "Unknown error"
-            raise RuntimeError(f"Failed to install Chromium: {error_msg}")
-
-        logger.info("Chromium installed successfully")
+        self._browser = await launch_chromium(self._playwright, self.headless)
+        self._context = await self._browser.new_context(viewport=self.DEFAULT_VIEWPORT)
+        self._page = await self._context.new_page()
 
     async def close(self) -> None:
-        """Close the browser and cleanup resources."""
-        if self._browser is not None:
+        """Close the browser (or return the pooled context) and cleanup resources."""
+        if self._pool is not None:
+            if self._context is not None:
+                await self._pool.release(self._context)
+            self._browser = None
+        elif self._browser is not None:
             await self._browser.close()
             self._browser = None
+        self._context = None
         if self._playwright is not None:
             await self._playwright.stop()
             self._playwright = None
         self._page = None
         self._refmap = RefMap()
+        self._last_lines = None
 
     def _require_page(self) -> Page:
         """Get page or raise if not launched."""
@@ -170,8 +207,13 @@ class BrowserDriver:
             raise RuntimeError("Browser not launched. Call launch() first.")
         return self._page
 
-    async def _take_snapshot(self) -> NavigationResult:
-        """Take accessibility snapshot of current page state."""
+    async def _take_snapshot(self, diff: bool = False) -> NavigationResult:
+        """Take accessibility snapshot of current page state.
+
+        Args:
+            diff: With ``diff_snapshots`` enabled, return only the changes
+                since the previous snapshot of the same URL
+        """
         page = self._require_page()
 
         title = await page.title()
@@ -188,11 +230,20 @@ class BrowserDriver:
         tree = AccessibilityNode.from_playwright_dict(tree_dict)
 
         # Generate semantic snapshot
-        snapshot_text, refmap = self._snapshot_generator.generate(tree, title=title, url=url)
+        generator = self._snapshot_generator
+        snapshot_text, refmap = generator.generate(tree, title=title, url=url)
 
         # Store refmap for future interactions
         self._refmap = refmap
 
+        changes = None
+        if diff and self._diff_snapshots and self._last_lines is not None and url == self._last_url:
+            changes = generator.diff(self._last_lines)
+        self._last_lines = generator.lines
+        self._last_url = url
+
+        if changes is not None:
+            return NavigationResult(snapshot=changes, refmap=refmap, is_diff=True)
         return NavigationResult(snapshot=snapshot_text, refmap=refmap)
 
     async def navigate(self, url: str) -> NavigationResult:
@@ -208,6 +259,8 @@ class BrowserDriver:
 
         await page.goto(url, wait_until="domcontentloaded")
 
+        # New page: start refs over and return the full snapshot
+        self._snapshot_generator.reset_refs()
         return await self._take_snapshot()
 
     async def click(self, ref: int) -> NavigationResult:
@@ -229,7 +282,7 @@ class BrowserDriver:
         await locator.click()
 
         # Return updated snapshot
-        return await self._take_snapshot()
+        return await self._take_snapshot(diff=True)
 
     async def type_text(self, ref: int, text: str) -> str:
         """Type text into an element by its reference number.
@@ -272,10 +325,10 @@ class BrowserDriver:
 
         await page.evaluate(f"window.scrollBy(0, {amount})")
 
-        return await self._take_snapshot()
+        return await self._take_snapshot(diff=True)
 
     async def snapshot(self) -> NavigationResult:
-        """Get current page snapshot without any interaction.
+        """Get the full current page snapshot without any interaction.
 
         Returns:
             NavigationResult with current page state
@@ -307,4 +360,4 @@ class BrowserDriver:
         return str(path_obj)
 
 
-__all__ = ["BrowserDriver", "NavigationResult"]
+__all__ = ["BrowserDriver", "NavigationResult", "launch_chromium"]
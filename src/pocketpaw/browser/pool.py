@@ -0,0 +1,203 @@
+# Shared browser process with pooled contexts
+# Changes: Initial creation — one Chromium per process, isolated contexts
+#          handed out from a warm pool with a cap
+#
+# Launching Chromium takes seconds and hundreds of MB. A browser context is a
+# cheap, isolated profile (own cookies, storage and cache) inside one browser,
+# so concurrent sessions share the process and each get their own context.
+"""Shared browser with pooled contexts."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+from .driver import BrowserDriver, launch_chromium
+
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, BrowserContext, Page, Playwright
+
+logger = logging.getLogger(__name__)
+
+
+class BrowserPool:
+    """One shared browser per headless mode, handing out isolated contexts.
+
+    ``acquire()`` returns a fresh context (taken from the warm pool when one
+    is ready) and waits while ``max_contexts`` are in use. Released contexts
+    are closed, never reused, so sessions can't see each other's state; the
+    warm pool is topped up in the background.
+
+    Usage:
+        pool = BrowserPool(max_contexts=16)
+        browser, context, page = await pool.acquire()
+        ...
+        await pool.release(context)
+    """
+
+    def __init__(
+        self,
+        max_contexts: int = 16,
+        warm_contexts: int = 1,
+        acquire_timeout: float = 60.0,
+    ) -> None:
+        """Initialize the pool (the browser is launched on first use).
+
+        Args:
+            max_contexts: Most contexts in use at once
+            warm_contexts: Pre-created contexts kept ready for new sessions
+            acquire_timeout: Seconds to wait for a free slot before failing
+        """
+        self.max_contexts = max(1, max_contexts)
+        self.warm_contexts = max(0, warm_contexts)
+        self.acquire_timeout = acquire_timeout
+        self._playwright: Playwright | None = None
+        self._browsers: dict[bool, Browser] = {}
+        self._warm: dict[bool, list[tuple[BrowserContext, Page]]] = {}
+        self._refills: dict[bool, asyncio.Task] = {}
+        self._active = 0
+        self._launch_lock = asyncio.Lock()
+        self._slots = asyncio.Condition()
+        self._last_release = time.monotonic()
+        self._launches = 0
+        self._contexts_created = 0
+        self._warm_hits = 0
+        self._waits = 0
+
+    async def acquire(self, headless: bool = True) -> tuple[Browser, BrowserContext, Page]:
+        """Borrow an isolated context (and its page) from the shared browser."""
+        async with self._slots:
+            if self._active >= self.max_contexts:
+                self._waits += 1
+                try:
+                    await asyncio.wait_for(
+                        self._slots.wait_for(lambda: self._active < self.max_contexts),
+                        timeout=self.acquire_timeout,
+                    )
+                except TimeoutError:
+                    raise RuntimeError(
+                        f"Browser pool exhausted: {self.max_contexts} sessions in use"
+                    ) from None
+            self._active += 1
+
+        try:
+            browser = await self._get_browser(headless)
+            warm = self._warm.setdefault(headless, [])
+            if warm:
+                context, page = warm.pop()
+                self._warm_hits += 1
+            else:
+                context, page = await self._new_context(browser)
+            self._schedule_refill(headless)
+            return browser, context, page
+        except BaseException:
+            await self._free_slot()
+            raise
+
+    async def release(self, context: BrowserContext) -> None:
+        """Close a borrowed context and free its slot."""
+        try:
+            await context.close()
+        except Exception as e:
+            logger.debug("Error closing browser context: %s", e)
+        finally:
+            self._last_release = time.monotonic()
+            await self._free_slot()
+
+    async def trim(self, idle_seconds: float) -> bool:
+        """Shut the browser down if no context has been in use for ``idle_seconds``.
+
+        Returns True if the browser was closed. The next ``acquire()``
+        launches it again.
+        """
+        if not self._browsers or self._active:
+            return False
+        if time.monotonic() - self._last_release < idle_seconds:
+            return False
+        await self.close()
+        return True
+
+    async def close(self) -> None:
+        """Close warm contexts, the browsers and Playwright."""
+        for task in self._refills.values():
+            task.cancel()
+        self._refills.clear()
+        async with self._launch_lock:
+            for warm in self._warm.values():
+                for context, _page in warm:
+                    try:
+                        await context.close()
+                    except Exception as e:
+                        logger.debug("Error closing warm browser context: %s", e)
+            self._warm.clear()
+            for browser in self._browsers.values():
+                try:
+                    await browser.close()
+                except Exception as e:
+                    logger.debug("Error closing browser: %s", e)
+            self._browsers.clear()
+            if self._playwright is not None:
+                await self._playwright.stop()
+                self._playwright = None
+
+    def stats(self) -> dict[str, Any]:
+        """Pool counters for monitoring."""
+        return {
+            "browsers": len(self._browsers),
+            "active_contexts": self._active,
+            "warm_contexts": sum(len(w) for w in self._warm.values()),
+            "max_contexts": self.max_contexts,
+            "browser_launches": self._launches,
+            "contexts_created": self._contexts_created,
+            "warm_hits": self._warm_hits,
+            "waits": self._waits,
+        }
+
+    async def _get_browser(self, headless: bool) -> Browser:
+        async with self._launch_lock:
+            browser = self._browsers.get(headless)
+            if browser is not None and browser.is_connected():
+                return browser
+            # First use, or the browser crashed: contexts from it are dead too
+            self._warm.pop(headless, None)
+            if self._playwright is None:
+                from playwright.async_api import async_playwright
+
+                self._playwright = await async_playwright().start()
+            browser = await launch_chromium(self._playwright, headless)
+            self._browsers[headless] = browser
+            self._launches += 1
+            return browser
+
+    async def _new_context(self, browser: Browser) -> tuple[BrowserContext, Page]:
+        context = await browser.new_context(viewport=BrowserDriver.DEFAULT_VIEWPORT)
+        page = await context.new_page()
+        self._contexts_created += 1
+        return context, page
+
+    def _schedule_refill(self, headless: bool) -> None:
+        task = self._refills.get(headless)
+        if self.warm_contexts and (task is None or task.done()):
+            self._refills[headless] = asyncio.create_task(self._refill(headless))
+
+    async def _refill(self, headless: bool) -> None:
+        try:
+            warm = self._warm.setdefault(headless, [])
+            while (
+                len(warm) < self.warm_contexts
+                and self._active + len(warm) < self.max_contexts
+                and headless in self._browsers
+            ):
+                warm.append(await self._new_context(self._browsers[headless]))
+        except Exception as e:
+            logger.debug("Failed to pre-create browser context: %s", e)
+
+    async def _free_slot(self) -> None:
+        async with self._slots:
+            self._active -= 1
+            self._slots.notify()
+
+
+__all__ = ["BrowserPool"]
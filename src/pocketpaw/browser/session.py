@@ -1,5 +1,8 @@
 # Browser session management
 # Changes: Initial creation with BrowserSession and BrowserSessionManager
+#          2026-10-19: Sessions share one browser through BrowserPool (capped,
+#          warm contexts); idle sessions are swept by cleanup_idle; stats();
+#          drivers return snapshot diffs when browser_snapshot_diffs is on
 #
 # Manages browser sessions with lifecycle handling, idle cleanup,
 # and singleton access pattern.
@@ -10,8 +13,10 @@ from __future__ import annotations
 import asyncio
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from typing import Any
 
 from .driver import BrowserDriver
+from .pool import BrowserPool
 
 
 @dataclass
@@ -48,6 +53,10 @@ class BrowserSessionManager:
     Sessions are identified by a session_id and can be reused
     across multiple tool invocations.
 
+    Each session gets its own browser context from a shared ``BrowserPool``
+    rather than its own browser process. Creating a session first sweeps
+    sessions idle for longer than ``idle_timeout`` via ``cleanup_idle``.
+
     Usage:
         manager = get_browser_session_manager()
         session = await manager.get_or_create("my-session")
@@ -55,8 +64,33 @@ class BrowserSessionManager:
         await manager.close_session("my-session")
     """
 
-    def __init__(self) -> None:
-        """Initialize the session manager."""
+    def __init__(
+        self,
+        pool: BrowserPool | None = None,
+        idle_timeout: int = 300,
+        diff_snapshots: bool = True,
+    ) -> None:
+        """Initialize the session manager.
+
+        Args:
+            pool: Shared browser pool (default: configured from settings,
+                along with idle_timeout and diff_snapshots)
+            idle_timeout: Seconds before an unused session is closed
+            diff_snapshots: Drivers return only page changes after click/scroll
+        """
+        if pool is None:
+            from pocketpaw.config import get_settings
+
+            settings = get_settings()
+            pool = BrowserPool(
+                max_contexts=settings.browser_max_contexts,
+                warm_contexts=settings.browser_warm_contexts,
+            )
+            idle_timeout = settings.browser_idle_timeout
+            diff_snapshots = settings.browser_snapshot_diffs
+        self._pool = pool
+        self.idle_timeout = idle_timeout
+        self.diff_snapshots = diff_snapshots
         self._sessions: dict[str, BrowserSession] = {}
         self._locks: dict[str, asyncio.Lock] = {}
         self._global_lock = asyncio.Lock()
@@ -78,6 +112,10 @@ class BrowserSessionManager:
         Returns:
             The browser session (existing or newly created)
         """
+        if session_id not in self._sessions:
+            # Free contexts held by abandoned sessions before taking a new one
+            await self.cleanup_idle(self.idle_timeout)
+
         lock = await self._get_lock(session_id)
 
         async with lock:
@@ -93,7 +131,9 @@ class BrowserSessionManager:
                     del self._sessions[session_id]
 
             # Create new session
-            driver = BrowserDriver(headless=headless)
+            driver = BrowserDriver(
+                headless=headless, pool=self._pool, diff_snapshots=self.diff_snapshots
+            )
             await driver.launch()
 
             session = BrowserSession(session_id=session_id, driver=driver)
@@ -120,6 +160,9 @@ class BrowserSessionManager:
     async def cleanup_idle(self, timeout_seconds: int = 300) -> int:
         """Close sessions that have been idle longer than timeout.
 
+        Also shuts the shared browser down once it has had no sessions for
+        ``timeout_seconds``.
+
         Args:
             timeout_seconds: How long a session can be idle (default 5 minutes)
 
@@ -139,13 +182,17 @@ class BrowserSessionManager:
         for session_id in sessions_to_close:
             await self.close_session(session_id)
 
+        if not self._sessions:
+            await self._pool.trim(timeout_seconds)
+
         return len(sessions_to_close)
 
     async def close_all(self) -> None:
-        """Close all sessions."""
+        """Close all sessions and the shared browser."""
         session_ids = list(self._sessions.keys())
         for session_id in session_ids:
             await self.close_session(session_id)
+        await self._pool.close()
 
     def list_sessions(self) -> list[str]:
         """Get list of active session IDs."""
@@ -155,6 +202,10 @@ class BrowserSessionManager:
         """Check if a session exists."""
         return session_id in self._sessions
 
+    def stats(self) -> dict[str, Any]:
+        """Session count plus browser pool counters."""
+        return {"sessions": len(self._sessions), **self._pool.stats()}
+
 
 # Singleton instance
 _manager_instance: BrowserSessionManager | None = None
@@ -1,5 +1,6 @@
 # Browser accessibility tree snapshot generator
 # Changes: Initial creation with RefMap, AccessibilityNode, and SnapshotGenerator
+#          2026-10-19: Stable refs across snapshots and line diffs between them
 #
 # Converts Playwright's accessibility tree into a semantic text format
 # with [ref=N] markers for LLM-based browser control.
@@ -7,6 +8,7 @@
 
 from __future__ import annotations
 
+import difflib
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -29,6 +31,11 @@ class RefMap:
         self.next_ref += 1
         return ref
 
+    def assign(self, ref: int, selector: str) -> None:
+        """Map an existing reference number (kept from an earlier snapshot)."""
+        self.refs[ref] = selector
+        self.next_ref = max(self.next_ref, ref + 1)
+
     def get_selector(self, ref: int) -> str | None:
         """Get selector by reference number."""
         return self.refs.get(ref)
@@ -125,9 +132,35 @@ class SnapshotGenerator:
     # Maximum length for element names before truncation
     MAX_NAME_LENGTH = 100
 
-    def __init__(self) -> None:
+    # Unchanged lines shown around each changed region of a diff
+    DIFF_CONTEXT = 1
+
+    def __init__(self, stable_refs: bool = False) -> None:
+        """Initialize the generator.
+
+        Args:
+            stable_refs: Keep an element's ref number across snapshots, so
+                unchanged elements render identically and can be diffed
+        """
         self._refmap: RefMap = RefMap()
         self._lines: list[str] = []
+        self._header_len = 0
+        self._stable_refs = stable_refs
+        # Stable mode: "<selector>#<occurrence>" -> ref, from the last snapshot
+        self._ref_keys: dict[str, int] = {}
+        self._new_ref_keys: dict[str, int] = {}
+        self._occurrences: dict[str, int] = {}
+        self._next_ref = 1
+
+    @property
+    def lines(self) -> list[str]:
+        """Element lines (without the page header) of the last snapshot."""
+        return self._lines[self._header_len :]
+
+    def reset_refs(self) -> None:
+        """Forget stable refs (e.g. after navigating to a new page)."""
+        self._ref_keys = {}
+        self._next_ref = 1
 
     def generate(
         self, tree: AccessibilityNode, title: str | None = None, url: str | None = None
@@ -152,12 +185,55 @@ class SnapshotGenerator:
             self._lines.append(f"URL: {url}")
         if title or url:
             self._lines.append("")
+        self._header_len = len(self._lines)
 
         # Process the tree
+        self._new_ref_keys = {}
+        self._occurrences = {}
         self._process_node(tree, indent=0)
+        if self._stable_refs:
+            self._ref_keys = self._new_ref_keys
 
         return "\n".join(self._lines), self._refmap
 
+    def diff(self, previous: list[str]) -> str | None:
+        """Describe how the last snapshot differs from ``previous`` lines.
+
+        Only changed regions (with a line of context) are listed; elements
+        keep their refs when generated with ``stable_refs``. Returns None
+        when most of the page changed and the full snapshot is the better
+        answer.
+        """
+        current = self.lines
+        header = self._lines[: self._header_len]
+        matcher = difflib.SequenceMatcher(a=previous, b=current, autojunk=False)
+        groups = list(matcher.get_grouped_opcodes(self.DIFF_CONTEXT))
+        if not groups:
+            return "\n".join([*header, "No changes since the last snapshot."])
+
+        out: list[str] = []
+        changed = 0
+        for group in groups:
+            out.append(f"@@ line {group[0][3] + 1} @@")
+            for tag, i1, i2, j1, j2 in group:
+                if tag == "equal":
+                    out.extend("    " + line for line in current[j1:j2])
+                    continue
+                out.extend("[-] " + line for line in previous[i1:i2])
+                out.extend("[+] " + line for line in current[j1:j2])
+                changed += (i2 - i1) + (j2 - j1)
+
+        if changed > len(current) // 2:
+            return None
+        return "\n".join(
+            [
+                *header,
+                "Changes since the last snapshot ([-] removed, [+] added; "
+                "other elements and refs are unchanged; use snapshot for the full page):",
+                *out,
+            ]
+        )
+
     def _process_node(self, node: AccessibilityNode, indent: int) -> None:
         """Recursively process a node and its children."""
         # Skip hidden elements
@@ -195,7 +271,7 @@ class SnapshotGenerator:
         # Generate selector and add ref for interactive elements
         if is_interactive:
             selector = self._generate_selector(node)
-            ref = self._refmap.add(selector)
+            ref = self._add_ref(selector)
             line_parts.append(f"[ref={ref}]")
 
         # Add relevant properties as attributes
@@ -211,6 +287,22 @@ class SnapshotGenerator:
         for child in node.children:
             self._process_node(child, indent + 1)
 
+    def _add_ref(self, selector: str) -> int:
+        """Ref for an element, reusing its number from the last snapshot in stable mode."""
+        if not self._stable_refs:
+            return self._refmap.add(selector)
+        # Elements with the same selector are told apart by document order
+        occurrence = self._occurrences.get(selector, 0)
+        self._occurrences[selector] = occurrence + 1
+        key = f"{selector}#{occurrence}"
+        ref = self._ref_keys.get(key)
+        if ref is None:
+            ref = self._next_ref
+            self._next_ref += 1
+        self._new_ref_keys[key] = ref
+        self._refmap.assign(ref, selector)
+        return ref
+
     def _truncate_name(self, name: str) -> str:
         """Truncate long names with ellipsis."""
         if len(name) > self.MAX_NAME_LENGTH:
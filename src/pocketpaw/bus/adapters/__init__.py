@@ -1,6 +1,7 @@
 """
 Channel adapter protocol for pluggable communication channels.
 Created: 2026-02-02
+Updated: 2026-10-19 - Adapters declare a preferred stream flush rate
 """
 
 import importlib
@@ -11,6 +12,7 @@ import sys
 from abc import ABC, abstractmethod
 from typing import Protocol
 
+from pocketpaw.bus.coalesce import register_stream_flush_rate
 from pocketpaw.bus.events import Channel, InboundMessage, OutboundMessage
 from pocketpaw.bus.queue import MessageBus
 
@@ -121,6 +123,11 @@ class ChannelAdapter(Protocol):
 class BaseChannelAdapter(ABC):
     """Base class for channel adapters with common functionality."""
 
+    # Preferred stream-chunk flush rate (see pocketpaw.bus.coalesce). None keeps
+    # the agent loop's default window.
+    stream_flush_interval: float | None = None
+    stream_flush_max_chars: int = 4000
+
     def __init__(self):
         self._bus: MessageBus | None = None
         self._running = False
@@ -135,6 +142,10 @@ class BaseChannelAdapter(ABC):
         """Start and subscribe to the bus."""
         self._bus = bus
         self._running = True
+        if self.stream_flush_interval is not None:
+            register_stream_flush_rate(
+                self.channel, self.stream_flush_interval, self.stream_flush_max_chars
+            )
         bus.subscribe_outbound(self.channel, self.send)
         try:
             await self._on_start()
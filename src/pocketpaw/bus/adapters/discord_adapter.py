@@ -17,6 +17,9 @@ DISCORD_MSG_LIMIT = 2000
 class DiscordAdapter(BaseChannelAdapter):
     """Adapter for Discord Bot API using discord.py."""
 
+    # Replies are live-edited at most every ~1.5s; more frequent chunks are wasted
+    stream_flush_interval = 1.0
+
     def __init__(
         self,
         token: str,
@@ -21,6 +21,10 @@ logger = logging.getLogger(__name__)
 class GoogleChatAdapter(BaseChannelAdapter):
     """Adapter for Google Chat (Workspace)."""
 
+    # Chunks are only buffered until stream end, so batch them aggressively
+    stream_flush_interval = 5.0
+    stream_flush_max_chars = 16000
+
     def __init__(
         self,
         mode: str = "webhook",
@@ -23,6 +23,10 @@ _EDIT_RATE_LIMIT = 1.5
 class MatrixAdapter(BaseChannelAdapter):
     """Adapter for Matrix via matrix-nio."""
 
+    # Chunks are only buffered until stream end, so batch them aggressively
+    stream_flush_interval = 5.0
+    stream_flush_max_chars = 16000
+
     def __init__(
         self,
         homeserver: str = "",
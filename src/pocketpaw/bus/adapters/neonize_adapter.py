@@ -62,6 +62,10 @@ def _tcp_probe(host: str, port: int, timeout: float) -> None:
 class NeonizeAdapter(BaseChannelAdapter):
     """WhatsApp adapter using neonize (WhatsApp Web multi-device protocol)."""
 
+    # Chunks are only buffered until stream end, so batch them aggressively
+    stream_flush_interval = 5.0
+    stream_flush_max_chars = 16000
+
     def __init__(self, db_path: str | None = None):
         super().__init__()
         self._client: Any = None
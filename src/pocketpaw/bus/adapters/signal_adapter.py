@@ -23,6 +23,10 @@ logger = logging.getLogger(__name__)
 class SignalAdapter(BaseChannelAdapter):
     """Adapter for Signal via signal-cli REST API."""
 
+    # Chunks are only buffered until stream end, so batch them aggressively
+    stream_flush_interval = 5.0
+    stream_flush_max_chars = 16000
+
     def __init__(
         self,
         api_url: str = "http://localhost:8080",
@@ -16,6 +16,9 @@ logger = logging.getLogger(__name__)
 class SlackAdapter(BaseChannelAdapter):
     """Adapter for Slack using Socket Mode (no public URL needed)."""
 
+    # Replies are live-edited at most every ~1.5s; more frequent chunks are wasted
+    stream_flush_interval = 1.0
+
     def __init__(
         self,
         bot_token: str,
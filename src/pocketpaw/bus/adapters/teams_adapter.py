@@ -24,6 +24,10 @@ _EDIT_RATE_LIMIT = 1.5
 class TeamsAdapter(BaseChannelAdapter):
     """Adapter for Microsoft Teams via Bot Framework SDK."""
 
+    # Chunks are only buffered until stream end, so batch them aggressively
+    stream_flush_interval = 5.0
+    stream_flush_max_chars = 16000
+
     def __init__(
         self,
         app_id: str = "",
@@ -37,6 +37,9 @@ logger = logging.getLogger(__name__)
 class TelegramAdapter(BaseChannelAdapter):
     """Adapter for Telegram Bot API."""
 
+    # Replies are live-edited at most every ~1.5s; more frequent chunks are wasted
+    stream_flush_interval = 1.0
+
     def __init__(self, token: str, allowed_user_id: int | None = None):
         super().__init__()
         self.token = token
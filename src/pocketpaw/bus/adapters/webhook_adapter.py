@@ -42,6 +42,10 @@ class WebhookAdapter(BaseChannelAdapter):
     future resolves and the HTTP handler returns the response to the caller.
     """
 
+    # Chunks are only buffered until stream end, so batch them aggressively
+    stream_flush_interval = 5.0
+    stream_flush_max_chars = 16000
+
     def __init__(self) -> None:
         super().__init__()
         # Pending sync futures: request_id -> Future[str]
@@ -19,6 +19,10 @@ WHATSAPP_API_BASE = f"https://graph.facebook.com/{WHATSAPP_API_VERSION}"
 class WhatsAppAdapter(BaseChannelAdapter):
     """Adapter for WhatsApp Business Cloud API."""
 
+    # Chunks are only buffered until stream end, so batch them aggressively
+    stream_flush_interval = 5.0
+    stream_flush_max_chars = 16000
+
     def __init__(
         self,
         access_token: str,
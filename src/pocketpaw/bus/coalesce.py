@@ -0,0 +1,134 @@
+"""
+Stream-chunk coalescing for the outbound path.
+Created: 2026-10-19
+
+Backends stream replies token by token. Publishing every delta fans out to
+all channel subscribers, and chat adapters turn that into a flood of edit or
+API calls. ``StreamCoalescer`` merges consecutive ``is_stream_chunk``
+messages for one reply and publishes them once per time/size window.
+
+Adapters declare how often they want stream updates with
+``register_stream_flush_rate()`` (``BaseChannelAdapter`` does this from its
+``stream_flush_interval`` / ``stream_flush_max_chars`` attributes).
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from pocketpaw.bus.events import Channel, OutboundMessage
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class StreamFlushRate:
+    """How often a channel wants coalesced stream chunks."""
+
+    interval: float  # seconds from the first buffered chunk to its flush
+    max_chars: int  # flush early once this much text is buffered
+
+
+# Adapter-declared preferences, keyed by channel
+_flush_rates: dict[Channel, StreamFlushRate] = {}
+
+
+def register_stream_flush_rate(channel: Channel, interval: float, max_chars: int) -> None:
+    """Declare the preferred stream flush rate for a channel."""
+    _flush_rates[channel] = StreamFlushRate(interval=interval, max_chars=max_chars)
+
+
+def get_stream_flush_rate(channel: Channel, default: StreamFlushRate) -> StreamFlushRate:
+    """The channel's declared flush rate, or ``default``."""
+    return _flush_rates.get(channel, default)
+
+
+class StreamCoalescer:
+    """Merges stream chunks of one reply before publishing them.
+
+    ``publish()`` buffers stream chunks and passes everything else through,
+    flushing the buffer first so ordering is preserved. Buffered text is
+    published when ``rate.max_chars`` is reached or ``rate.interval`` has
+    elapsed since the first buffered chunk, even if the backend is idle.
+    Call ``flush()`` when the reply is finished.
+    """
+
+    def __init__(
+        self,
+        publish: Callable[[OutboundMessage], Awaitable[None]],
+        rate: StreamFlushRate,
+    ):
+        self._publish = publish
+        self._rate = rate
+        self._pending: OutboundMessage | None = None
+        self._parts: list[str] = []
+        self._size = 0
+        self._timer: asyncio.TimerHandle | None = None
+        self._timer_task: asyncio.Task | None = None
+        # Serializes publishes so timer flushes can't reorder messages
+        self._lock = asyncio.Lock()
+
+    async def publish(self, message: OutboundMessage) -> None:
+        """Buffer a stream chunk, or flush and publish any other message."""
+        if not message.is_stream_chunk or message.media or self._rate.interval <= 0:
+            await self.flush()
+            await self._send(message)
+            return
+
+        if self._pending is not None and not self._mergeable(message):
+            await self.flush()
+
+        if self._pending is None:
+            self._pending = message
+            self._timer = asyncio.get_running_loop().call_later(self._rate.interval, self._on_timer)
+        self._parts.append(message.content)
+        self._size += len(message.content)
+
+        if self._size >= self._rate.max_chars:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Publish buffered chunks as one message."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._pending is None:
+            return
+
+        first = self._pending
+        merged = OutboundMessage(
+            channel=first.channel,
+            chat_id=first.chat_id,
+            content="".join(self._parts),
+            reply_to=first.reply_to,
+            metadata=first.metadata,
+            is_stream_chunk=True,
+        )
+        self._pending = None
+        self._parts = []
+        self._size = 0
+        await self._send(merged)
+
+    async def _send(self, message: OutboundMessage) -> None:
+        async with self._lock:
+            await self._publish(message)
+
+    def _mergeable(self, message: OutboundMessage) -> bool:
+        first = self._pending
+        return (
+            message.channel == first.channel
+            and message.chat_id == first.chat_id
+            and message.reply_to == first.reply_to
+            and message.metadata == first.metadata
+        )
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        self._timer_task = asyncio.create_task(self._flush_from_timer())
+
+    async def _flush_from_timer(self) -> None:
+        try:
+            await self.flush()
+        except Exception:
+            logger.exception("Failed to flush coalesced stream chunks")
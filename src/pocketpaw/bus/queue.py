@@ -1,16 +1,53 @@
 """
 Message bus for unified message routing.
 Created: 2026-02-02
+Updated: 2026-10-19 - Per-channel inbound queues with weighted fair scheduling,
+                      overflow policies and queue-depth metrics
 """
 
 import asyncio
 import logging
 from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 
 from pocketpaw.bus.events import Channel, InboundMessage, OutboundMessage, SystemEvent
 
 logger = logging.getLogger(__name__)
 
+# What publish_inbound does when a channel's queue is full
+OVERFLOW_POLICIES = ("block", "drop_new", "drop_oldest")
+
+
+@dataclass
+class ChannelQueuePolicy:
+    """Inbound queue settings for one channel.
+
+    - max_size: Pending messages allowed for the channel.
+    - weight: Share of consume_inbound() picks while several channels are
+      backlogged (weight 3 gets three messages per one of a weight-1 channel).
+    - overflow: "block" waits for room (only that channel's publishers wait),
+      "drop_new" discards the incoming message, "drop_oldest" evicts the
+      oldest pending one.
+    """
+
+    max_size: int = 1000
+    weight: int = 1
+    overflow: str = "block"
+
+
+class _ChannelQueue:
+    """Bounded inbound queue for one channel plus its counters."""
+
+    def __init__(self, policy: ChannelQueuePolicy):
+        self.policy = policy
+        self.queue: asyncio.Queue[InboundMessage] = asyncio.Queue(maxsize=policy.max_size)
+        # Smooth weighted round-robin credit
+        self.credit = 0
+        self.published = 0
+        self.consumed = 0
+        self.dropped = 0
+        self.high_water = 0
+
 
 class MessageBus:
     """
@@ -35,8 +72,19 @@ class MessageBus:
         msg = await bus.consume_inbound()
     """
 
-    def __init__(self, max_queue_size: int = 1000):
-        self._inbound: asyncio.Queue[InboundMessage] = asyncio.Queue(maxsize=max_queue_size)
+    def __init__(
+        self,
+        max_queue_size: int = 1000,
+        channel_policies: dict[Channel, ChannelQueuePolicy] | None = None,
+        overflow: str = "block",
+    ):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow!r}")
+        # Each channel gets its own queue so a flood on one never blocks the others
+        self._default_policy = ChannelQueuePolicy(max_size=max_queue_size, overflow=overflow)
+        self._channel_policies = dict(channel_policies or {})
+        self._inbound: dict[Channel, _ChannelQueue] = {}
+        self._inbound_available = asyncio.Event()
         self._outbound_subscribers: dict[
             Channel, list[Callable[[OutboundMessage], Awaitable[None]]]
         ] = {}
@@ -46,21 +94,99 @@ class MessageBus:
     # Inbound (Channel → Agent)
     # =========================================================================
 
+    def _channel_queue(self, channel: Channel) -> _ChannelQueue:
+        cq = self._inbound.get(channel)
+        if cq is None:
+            policy = self._channel_policies.get(channel, self._default_policy)
+            cq = self._inbound[channel] = _ChannelQueue(policy)
+        return cq
+
     async def publish_inbound(self, message: InboundMessage) -> None:
-        """Publish a message from a channel adapter."""
+        """Publish a message from a channel adapter.
+
+        Applies the channel's overflow policy when its queue is full; other
+        channels are unaffected.
+        """
         logger.debug(f"📥 Inbound: {message.channel.value}:{message.sender_id[:8]}...")
-        await self._inbound.put(message)
+        cq = self._channel_queue(message.channel)
+
+        if cq.queue.full():
+            if cq.policy.overflow == "drop_new":
+                cq.dropped += 1
+                logger.warning("Inbound queue full for %s, dropping message", message.channel.value)
+                return
+            if cq.policy.overflow == "drop_oldest":
+                cq.queue.get_nowait()
+                cq.dropped += 1
+                logger.warning(
+                    "Inbound queue full for %s, dropping oldest message", message.channel.value
+                )
 
-    async def consume_inbound(self, timeout: float = 1.0) -> InboundMessage | None:
-        """Consume the next inbound message (used by agent loop)."""
-        try:
-            return await asyncio.wait_for(self._inbound.get(), timeout=timeout)
-        except TimeoutError:
+        await cq.queue.put(message)
+        cq.published += 1
+        cq.high_water = max(cq.high_water, cq.queue.qsize())
+        self._inbound_available.set()
+
+    def _next_inbound(self) -> InboundMessage | None:
+        """Pick the next message by smooth weighted round-robin over channels."""
+        ready = [cq for cq in self._inbound.values() if not cq.queue.empty()]
+        if not ready:
             return None
 
-    def inbound_pending(self) -> int:
-        """Number of pending inbound messages."""
-        return self._inbound.qsize()
+        total = 0
+        chosen = ready[0]
+        for cq in ready:
+            cq.credit += cq.policy.weight
+            total += cq.policy.weight
+            if cq.credit > chosen.credit:
+                chosen = cq
+        chosen.credit -= total
+        chosen.consumed += 1
+        return chosen.queue.get_nowait()
+
+    async def consume_inbound(self, timeout: float = 1.0) -> InboundMessage | None:
+        """Consume the next inbound message (used by agent loop).
+
+        Backlogged channels are served in proportion to their weights.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            message = self._next_inbound()
+            if message is not None:
+                return message
+
+            self._inbound_available.clear()
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return None
+            try:
+                await asyncio.wait_for(self._inbound_available.wait(), timeout=remaining)
+            except TimeoutError:
+                return None
+
+    def inbound_pending(self, channel: Channel | None = None) -> int:
+        """Number of pending inbound messages (for one channel, or all)."""
+        if channel is not None:
+            cq = self._inbound.get(channel)
+            return cq.queue.qsize() if cq else 0
+        return sum(cq.queue.qsize() for cq in self._inbound.values())
+
+    def inbound_stats(self) -> dict[str, dict[str, int | str]]:
+        """Queue-depth metrics per channel that has seen inbound traffic."""
+        return {
+            channel.value: {
+                "pending": cq.queue.qsize(),
+                "max_size": cq.policy.max_size,
+                "weight": cq.policy.weight,
+                "overflow": cq.policy.overflow,
+                "published": cq.published,
+                "consumed": cq.consumed,
+                "dropped": cq.dropped,
+                "high_water": cq.high_water,
+            }
+            for channel, cq in self._inbound.items()
+        }
 
     # =========================================================================
     # Outbound (Agent → Channel)
@@ -149,11 +275,44 @@ class MessageBus:
 
     def clear(self) -> None:
         """Clear all queues (for testing/reset)."""
-        while not self._inbound.empty():
-            try:
-                self._inbound.get_nowait()
-            except asyncio.QueueEmpty:
-                break
+        for cq in self._inbound.values():
+            while not cq.queue.empty():
+                try:
+                    cq.queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+
+
+def _overflow_from_settings(settings) -> str:
+    """The configured overflow policy, or "block" (with a warning) if it is unknown."""
+    overflow = settings.bus_overflow_policy
+    if overflow not in OVERFLOW_POLICIES:
+        logger.warning(
+            "Unknown bus_overflow_policy %r (expected one of %s); using 'block'",
+            overflow,
+            ", ".join(OVERFLOW_POLICIES),
+        )
+        return "block"
+    return overflow
+
+
+def _channel_policies_from_settings(settings) -> dict[Channel, ChannelQueuePolicy]:
+    """Build per-channel policies from the bus_channel_* settings."""
+    policies: dict[Channel, ChannelQueuePolicy] = {}
+    names = set(settings.bus_channel_queue_limits) | set(settings.bus_channel_weights)
+    overflow = _overflow_from_settings(settings)
+    for name in names:
+        try:
+            channel = Channel(name)
+        except ValueError:
+            logger.warning("Ignoring queue settings for unknown channel %r", name)
+            continue
+        policies[channel] = ChannelQueuePolicy(
+            max_size=settings.bus_channel_queue_limits.get(name, settings.bus_channel_queue_size),
+            weight=max(1, settings.bus_channel_weights.get(name, 1)),
+            overflow=overflow,
+        )
+    return policies
 
 
 # Singleton instance
@@ -164,7 +323,14 @@ def get_message_bus() -> MessageBus:
     """Get the global message bus instance."""
     global _bus
     if _bus is None:
-        _bus = MessageBus()
+        from pocketpaw.config import get_settings
+
+        settings = get_settings()
+        _bus = MessageBus(
+            max_queue_size=settings.bus_channel_queue_size,
+            channel_policies=_channel_policies_from_settings(settings),
+            overflow=_overflow_from_settings(settings),
+        )
 
         from pocketpaw.lifecycle import register
 
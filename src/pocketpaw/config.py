@@ -14,6 +14,7 @@ import json
 import logging
 from functools import lru_cache
 from pathlib import Path
+from typing import Literal
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -109,6 +110,36 @@ class Settings(BaseSettings):
         description="Max tool-use turns per query in Claude SDK (safety net against runaway loops)",
     )
 
+    # PocketPaw Native Settings
+    native_tool_top_k: int = Field(
+        default=20,
+        description=(
+            "With more MCP tools than this, PocketPaw Native offers only the N most "
+            "relevant to each turn plus a load_tools meta-tool (0 = always offer all)"
+        ),
+    )
+    native_prompt_caching: bool = Field(
+        default=True,
+        description=(
+            "Mark the tool definitions and system prompt as cacheable (Anthropic prompt "
+            "caching) so agent-loop iterations don't re-bill the same prefix"
+        ),
+    )
+    native_streaming: bool = Field(
+        default=True,
+        description=(
+            "Stream PocketPaw Native LLM responses: show text as it is generated and "
+            "start tool calls as soon as each one is complete"
+        ),
+    )
+    native_tool_concurrency: int = Field(
+        default=4,
+        description=(
+            "Max tool calls from one model turn that PocketPaw Native runs at once "
+            "(1 = one at a time)"
+        ),
+    )
+
     # LLM Configuration
     llm_provider: str = Field(
         default="auto",
@@ -182,6 +213,46 @@ class Settings(BaseSettings):
         default=False,
         description="Auto-extract facts from conversations for file memory backend (uses Haiku)",
     )
+    file_memory_daily_horizon_days: int = Field(
+        default=30,
+        description=(
+            "Daily memory files older than this many days are loaded on first search "
+            "instead of at startup (file memory backend)"
+        ),
+    )
+
+    # Message Bus
+    bus_channel_queue_size: int = Field(
+        default=1000, description="Max pending inbound messages per channel"
+    )
+    bus_channel_queue_limits: dict[str, int] = Field(
+        default_factory=dict,
+        description="Per-channel overrides of bus_channel_queue_size, e.g. {'discord': 200}",
+    )
+    bus_channel_weights: dict[str, int] = Field(
+        default_factory=dict,
+        description=(
+            "Fair-scheduling weight per channel when several are backlogged "
+            "(default 1), e.g. {'websocket': 3}"
+        ),
+    )
+    bus_overflow_policy: str = Field(
+        default="block",
+        description=(
+            "When a channel's inbound queue is full: 'block' (wait), 'drop_new' or 'drop_oldest'"
+        ),
+    )
+
+    stream_coalesce_window_ms: int = Field(
+        default=50,
+        description=(
+            "Merge streamed reply chunks for this long before publishing them "
+            "(channels may declare their own rate; 0 disables)"
+        ),
+    )
+    stream_coalesce_max_chars: int = Field(
+        default=1000, description="Publish merged stream chunks early once this many chars"
+    )
 
     # Session History Compaction
     compaction_recent_window: int = Field(
@@ -196,6 +267,19 @@ class Settings(BaseSettings):
     compaction_llm_summarize: bool = Field(
         default=False, description="Use Haiku to summarize older messages (opt-in)"
     )
+    context_budget_unit: Literal["chars", "tokens"] = Field(
+        default="chars",
+        description=(
+            "Unit for history/memory context budgets: 'chars' or 'tokens' "
+            "(tokens use the model's tokenizer, or a local estimate)"
+        ),
+    )
+    compaction_token_budget: int = Field(
+        default=2000, description="Max total tokens for compacted history (token mode)"
+    )
+    memory_context_token_budget: int = Field(
+        default=2000, description="Max tokens of memory context in the system prompt (token mode)"
+    )
 
     # Tool Policy
     tool_profile: str = Field(
@@ -256,6 +340,14 @@ class Settings(BaseSettings):
     )
     tavily_api_key: str | None = Field(default=None, description="Tavily search API key")
     brave_search_api_key: str | None = Field(default=None, description="Brave Search API key")
+    web_search_cache_ttl: int = Field(
+        default=600,
+        description="Seconds to reuse a web search result for the same query (0 disables)",
+    )
+    web_search_disk_cache: bool = Field(
+        default=False,
+        description="Also keep cached web search results on disk across restarts",
+    )
     parallel_api_key: str | None = Field(default=None, description="Parallel AI API key")
     url_extract_provider: str = Field(
         default="auto", description="URL extract provider: 'auto', 'parallel', or 'local'"
@@ -291,6 +383,34 @@ class Settings(BaseSettings):
         default="claude-haiku-4-5-20251001",
         description="Model for LLM-based injection deep scan",
     )
+    guardian_allowlist: list[str] = Field(
+        default_factory=lambda: [
+            "ls",
+            "pwd",
+            "cat",
+            "head",
+            "tail",
+            "wc",
+            "grep",
+            "echo",
+            "which",
+            "whoami",
+            "date",
+            "uname",
+            "stat",
+            "du",
+            "df",
+            "git status",
+            "git log",
+            "git diff",
+            "git show",
+        ],
+        description="Read-only commands (or command prefixes) that skip the Guardian LLM check",
+    )
+    guardian_cache_ttl: int = Field(
+        default=3600,
+        description="Seconds to reuse a Guardian verdict for the same command (0 disables)",
+    )
 
     # Smart Model Routing
     smart_routing_enabled: bool = Field(
@@ -324,6 +444,39 @@ class Settings(BaseSettings):
         default="0 3 * * *", description="Cron schedule for self-audit (default: 3 AM daily)"
     )
 
+    # Mission Control
+    mission_control_backend: str = Field(
+        default="file",
+        description=(
+            "Mission Control storage backend: 'file' (JSON files) or 'sqlite' "
+            "(single indexed database; JSON data is imported on first use)"
+        ),
+    )
+    mission_control_persistence: str = Field(
+        default="wal",
+        description=(
+            "Mission Control file store persistence: 'wal' (append log + periodic "
+            "snapshots) or 'snapshot' (rewrite the JSON file on every change)"
+        ),
+    )
+    mission_control_snapshot_every: int = Field(
+        default=1000, description="Mission Control WAL mutations between snapshots"
+    )
+
+    # Audit Log
+    audit_rotate_mb: int = Field(
+        default=10, description="Rotate (and gzip) audit.jsonl once it reaches this size in MB"
+    )
+    audit_rotate_days: float = Field(
+        default=7, description="Rotate audit.jsonl once its oldest event is this many days old"
+    )
+    audit_fsync_interval: float = Field(
+        default=1.0,
+        description=(
+            "Max seconds between audit log fsyncs (0 = every write batch, negative = never)"
+        ),
+    )
+
     # Health Engine
     health_check_on_startup: bool = Field(
         default=True, description="Run health checks when PocketPaw starts"
@@ -431,6 +584,32 @@ class Settings(BaseSettings):
     web_host: str = Field(default="127.0.0.1", description="Web server host")
     web_port: int = Field(default=8888, description="Web server port")
 
+    # Skills
+    skills_poll_interval: float = Field(
+        default=10.0,
+        description="Seconds between skill directory rescans when file watching is unavailable",
+    )
+
+    # Browser
+    browser_max_contexts: int = Field(
+        default=16, description="Most browser sessions open at once (one shared browser)"
+    )
+    browser_warm_contexts: int = Field(
+        default=1, description="Browser contexts kept pre-created for new sessions"
+    )
+    browser_idle_timeout: int = Field(
+        default=300, description="Seconds before an unused browser session is closed"
+    )
+    browser_snapshot_diffs: bool = Field(
+        default=True,
+        description="Browser click/scroll return only what changed on the page",
+    )
+
+    # MCP
+    mcp_startup_concurrency: int = Field(
+        default=4, description="MCP servers started concurrently at startup"
+    )
+
     # MCP OAuth
     mcp_client_metadata_url: str = Field(
         default="",
@@ -491,6 +670,10 @@ class Settings(BaseSettings):
             "agent_backend": self.agent_backend,
             "claude_sdk_model": self.claude_sdk_model,
             "claude_sdk_max_turns": self.claude_sdk_max_turns,
+            "native_tool_top_k": self.native_tool_top_k,
+            "native_prompt_caching": self.native_prompt_caching,
+            "native_streaming": self.native_streaming,
+            "native_tool_concurrency": self.native_tool_concurrency,
             "memory_backend": self.memory_backend,
             "memory_use_inference": self.memory_use_inference,
             "mem0_llm_provider": self.mem0_llm_provider,
@@ -501,10 +684,20 @@ class Settings(BaseSettings):
             "mem0_ollama_base_url": self.mem0_ollama_base_url,
             "mem0_auto_learn": self.mem0_auto_learn,
             "file_auto_learn": self.file_auto_learn,
+            "file_memory_daily_horizon_days": self.file_memory_daily_horizon_days,
+            "bus_channel_queue_size": self.bus_channel_queue_size,
+            "bus_channel_queue_limits": self.bus_channel_queue_limits,
+            "bus_channel_weights": self.bus_channel_weights,
+            "bus_overflow_policy": self.bus_overflow_policy,
+            "stream_coalesce_window_ms": self.stream_coalesce_window_ms,
+            "stream_coalesce_max_chars": self.stream_coalesce_max_chars,
             "compaction_recent_window": self.compaction_recent_window,
             "compaction_char_budget": self.compaction_char_budget,
             "compaction_summary_chars": self.compaction_summary_chars,
             "compaction_llm_summarize": self.compaction_llm_summarize,
+            "context_budget_unit": self.context_budget_unit,
+            "compaction_token_budget": self.compaction_token_budget,
+            "memory_context_token_budget": self.memory_context_token_budget,
             "llm_provider": self.llm_provider,
             "ollama_host": self.ollama_host,
             "ollama_model": self.ollama_model,
@@ -535,6 +728,8 @@ class Settings(BaseSettings):
             "brave_search_api_key": (
                 self.brave_search_api_key or existing.get("brave_search_api_key")
             ),
+            "web_search_cache_ttl": self.web_search_cache_ttl,
+            "web_search_disk_cache": self.web_search_disk_cache,
             "parallel_api_key": self.parallel_api_key or existing.get("parallel_api_key"),
             "url_extract_provider": self.url_extract_provider,
             # Image Generation
@@ -561,6 +756,8 @@ class Settings(BaseSettings):
             "injection_scan_enabled": self.injection_scan_enabled,
             "injection_scan_llm": self.injection_scan_llm,
             "injection_scan_llm_model": self.injection_scan_llm_model,
+            "guardian_allowlist": self.guardian_allowlist,
+            "guardian_cache_ttl": self.guardian_cache_ttl,
             "localhost_auth_bypass": self.localhost_auth_bypass,
             "session_token_ttl_hours": self.session_token_ttl_hours,
             # Smart routing
@@ -574,6 +771,14 @@ class Settings(BaseSettings):
             # Self-audit
             "self_audit_enabled": self.self_audit_enabled,
             "self_audit_schedule": self.self_audit_schedule,
+            # Mission Control
+            "mission_control_backend": self.mission_control_backend,
+            "mission_control_persistence": self.mission_control_persistence,
+            "mission_control_snapshot_every": self.mission_control_snapshot_every,
+            # Audit log
+            "audit_rotate_mb": self.audit_rotate_mb,
+            "audit_rotate_days": self.audit_rotate_days,
+            "audit_fsync_interval": self.audit_fsync_interval,
             # OAuth
             "google_oauth_client_id": (
                 self.google_oauth_client_id or existing.get("google_oauth_client_id")
@@ -581,6 +786,15 @@ class Settings(BaseSettings):
             "google_oauth_client_secret": (
                 self.google_oauth_client_secret or existing.get("google_oauth_client_secret")
             ),
+            # Skills
+            "skills_poll_interval": self.skills_poll_interval,
+            # Browser
+            "browser_max_contexts": self.browser_max_contexts,
+            "browser_warm_contexts": self.browser_warm_contexts,
+            "browser_idle_timeout": self.browser_idle_timeout,
+            "browser_snapshot_diffs": self.browser_snapshot_diffs,
+            # MCP
+            "mcp_startup_concurrency": self.mcp_startup_concurrency,
             # MCP OAuth
             "mcp_client_metadata_url": self.mcp_client_metadata_url,
             # Voice/TTS
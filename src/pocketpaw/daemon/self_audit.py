@@ -34,7 +34,7 @@ def _check_stale_sessions(max_age_days: int = 30) -> tuple[bool, str]:
 
     now = datetime.now(tz=UTC)
     stale = []
-    for f in sessions_dir.glob("*.json"):
+    for f in [*sessions_dir.glob("*.json"), *sessions_dir.glob("*.jsonl")]:
         age = now - datetime.fromtimestamp(f.stat().st_mtime, tz=UTC)
         if age > timedelta(days=max_age_days):
             stale.append(f.stem)
@@ -3,6 +3,7 @@
 Lightweight FastAPI server that serves the frontend and handles WebSocket communication.
 
 Changes:
+  - 2026-10-19: MCP startup runs in a tracked task (failures logged, cancelled on shutdown).
   - 2026-02-17: Health heartbeat — periodic checks every 5 min via APScheduler, broadcasts health_update on status transitions.
   - 2026-02-17: Health Engine API (GET /api/health, POST /api/health/check, WS get_health/run_health_check).
   - 2026-02-06: WebSocket auth via first message instead of URL query param; accept wss://.
@@ -57,7 +58,7 @@ from pocketpaw.scheduler import get_scheduler
 from pocketpaw.security import get_audit_logger
 from pocketpaw.security.rate_limiter import api_limiter, auth_limiter, cleanup_all, ws_limiter
 from pocketpaw.security.session_tokens import create_session_token, verify_session_token
-from pocketpaw.skills import SkillExecutor, get_skill_loader
+from pocketpaw.skills import SkillExecutor, get_skill_loader, start_skill_watcher
 from pocketpaw.tunnel import get_tunnel_manager
 
 logger = logging.getLogger(__name__)
@@ -77,6 +78,15 @@ _settings_lock = asyncio.Lock()
 # Set by run_dashboard() so the startup event can open the browser once the server is ready
 _open_browser_url: str | None = None
 
+# Background MCP server startup (kept referenced so it isn't garbage-collected mid-run)
+_mcp_startup_task: asyncio.Task | None = None
+
+
+def _log_mcp_startup_result(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning("Failed to start MCP servers: %s", task.exception())
+
+
 # Get frontend directory
 FRONTEND_DIR = Path(__file__).parent / "frontend"
 TEMPLATES_DIR = FRONTEND_DIR / "templates"
@@ -359,6 +369,8 @@ async def _stop_channel_adapter(channel: str) -> bool:
 @app.on_event("startup")
 async def startup_event():
     """Start services on app startup."""
+    global _mcp_startup_task
+
     # Start Message Bus Integration
     bus = get_message_bus()
     await ws_adapter.start(bus)
@@ -367,6 +379,12 @@ async def startup_event():
     asyncio.create_task(agent_loop.start())
     logger.info("Agent Loop started")
 
+    # Keep the skill index current as skills are added or edited on disk
+    try:
+        start_skill_watcher()
+    except Exception as e:
+        logger.warning("Failed to start skill watcher: %s", e)
+
     # Auto-start all configured channel adapters
     settings = Settings.load()
     for ch in (
@@ -427,8 +445,11 @@ async def startup_event():
 
         set_ws_broadcast(_mcp_ws_broadcast)
 
+        # Connect in the background; servers with a warm tool cache
+        # advertise their tools right away
         mcp = get_mcp_manager()
-        await mcp.start_enabled_servers()
+        _mcp_startup_task = asyncio.create_task(mcp.start_enabled_servers())
+        _mcp_startup_task.add_done_callback(_log_mcp_startup_result)
     except Exception as e:
         logger.warning("Failed to start MCP servers: %s", e)
 
@@ -527,7 +548,10 @@ async def shutdown_event():
     scheduler = get_scheduler()
     scheduler.stop()
 
-    # Stop MCP servers
+    # Stop MCP servers (including any still starting)
+    if _mcp_startup_task is not None and not _mcp_startup_task.done():
+        _mcp_startup_task.cancel()
+        await asyncio.gather(_mcp_startup_task, return_exceptions=True)
     try:
         from pocketpaw.mcp.manager import get_mcp_manager
 
@@ -1357,6 +1381,13 @@ async def get_channels_status():
     return result
 
 
+@app.get("/api/bus/stats")
+async def get_bus_stats():
+    """Inbound queue depth and drop counters per channel."""
+    bus = get_message_bus()
+    return {"pending": bus.inbound_pending(), "channels": bus.inbound_stats()}
+
+
 @app.post("/api/channels/save")
 async def save_channel_config(request: Request):
     """Save token/config for a channel."""
@@ -2112,11 +2143,11 @@ async def websocket_endpoint(
         if len(parts) == 2 and parts[0] == "websocket":
             raw_id = parts[1]
             session_key = f"websocket:{raw_id}"
-            # Verify session file exists
-            session_file = (
-                Path.home() / ".pocketpaw" / "memory" / "sessions" / f"{resume_session}.json"
-            )
-            if session_file.exists():
+            # Verify session file exists (JSONL log or legacy JSON array)
+            sessions_dir = Path.home() / ".pocketpaw" / "memory" / "sessions"
+            if (sessions_dir / f"{resume_session}.jsonl").exists() or (
+                sessions_dir / f"{resume_session}.json"
+            ).exists():
                 chat_id = raw_id
                 resumed = True
 
@@ -2542,8 +2573,13 @@ async def websocket_endpoint(
 
                     engine = get_health_engine()
                     limit = data.get("limit", 20)
-                    search = data.get("search", "")
-                    errors = engine.get_recent_errors(limit=limit, search=search)
+                    errors = engine.get_recent_errors(
+                        limit=limit,
+                        search=data.get("search", ""),
+                        source=data.get("source", ""),
+                        since=data.get("since"),
+                        until=data.get("until"),
+                    )
                     await websocket.send_json({"type": "health_errors", "errors": errors})
                 except Exception as e:
                     await websocket.send_json(
@@ -2850,6 +2886,8 @@ async def search_sessions(q: str = Query(""), limit: int = 20):
     """Search sessions by content."""
     import json
 
+    from pocketpaw.memory.file_store import read_session_file
+
     if not q.strip():
         return {"sessions": []}
 
@@ -2857,17 +2895,15 @@ async def search_sessions(q: str = Query(""), limit: int = 20):
     manager = get_memory_manager()
     store = manager._store
 
-    if not hasattr(store, "sessions_path"):
+    if not hasattr(store, "_list_session_files"):
         return {"sessions": []}
 
     results = []
     index = store._load_session_index() if hasattr(store, "_load_session_index") else {}
 
-    for session_file in store.sessions_path.glob("*.json"):
-        if session_file.name.startswith("_") or session_file.name.endswith("_compaction.json"):
-            continue
+    for session_file in store._list_session_files():
         try:
-            data = json.loads(session_file.read_text())
+            data = read_session_file(session_file)
             for msg in data:
                 if query_lower in msg.get("content", "").lower():
                     safe_key = session_file.stem
@@ -3020,38 +3056,47 @@ async def delete_long_term_memory(entry_id: str):
     return {"ok": True}
 
 
+@app.post("/api/memory/long_term/delete")
+async def delete_long_term_memories(request: Request):
+    """Delete several long-term memory entries in one batch."""
+    data = await request.json()
+    ids = data.get("ids")
+    if not isinstance(ids, list) or not all(isinstance(i, str) for i in ids):
+        raise HTTPException(status_code=400, detail="'ids' must be a list of strings")
+    manager = get_memory_manager()
+    deleted = await manager.delete_many(ids)
+    return {"ok": True, "deleted": deleted}
+
+
 @app.get("/api/audit")
-async def get_audit_log(limit: int = 100):
-    """Get audit logs."""
+async def get_audit_log(
+    limit: int = 100,
+    severity: str | None = None,
+    action: str | None = None,
+    since: str | None = None,
+    until: str | None = None,
+):
+    """Get audit logs, newest first (rotated segments included)."""
     logger = get_audit_logger()
-    if not logger.log_path.exists():
-        return []
-
-    logs: list[dict] = []
     try:
-        with open(logger.log_path) as f:
-            lines = f.readlines()
-
-        for line in reversed(lines):
-            if len(logs) >= limit:
-                break
-            try:
-                logs.append(json.loads(line))
-            except Exception:
-                pass
+        return await asyncio.to_thread(
+            logger.query,
+            limit=limit,
+            since=since,
+            until=until,
+            severity=severity,
+            action=action,
+        )
     except Exception:
         return []
 
-    return logs
-
 
 @app.delete("/api/audit")
 async def clear_audit_log():
-    """Clear the audit log file."""
+    """Clear the audit log (active file and rotated segments)."""
     logger = get_audit_logger()
     try:
-        if logger.log_path.exists():
-            logger.log_path.write_text("")
+        await asyncio.to_thread(logger.clear)
         return {"ok": True}
     except Exception as e:
         from fastapi.responses import JSONResponse
@@ -3178,13 +3223,24 @@ async def get_health_status():
 
 
 @app.get("/api/health/errors")
-async def get_health_errors(limit: int = 20, search: str = ""):
-    """Get recent errors from the persistent error log."""
+async def get_health_errors(
+    limit: int = 20,
+    search: str = "",
+    source: str = "",
+    since: str | None = None,
+    until: str | None = None,
+):
+    """Get recent errors from the persistent error log.
+
+    ``since`` / ``until`` are ISO timestamps; ``source`` matches exactly.
+    """
     try:
         from pocketpaw.health import get_health_engine
 
         engine = get_health_engine()
-        return engine.get_recent_errors(limit=limit, search=search)
+        return engine.get_recent_errors(
+            limit=limit, search=search, source=source, since=since, until=until
+        )
     except Exception:
         return []
 
@@ -2,6 +2,7 @@
  * PocketPaw - Transparency Feature Module
  *
  * Created: 2026-02-05
+ * Updated: 2026-10-19 — Show cached input tokens in token_usage entries
  * Updated: 2026-02-17 — Route health_update events to Health feature module
  * Updated: 2026-02-12 — Added dw_ prefix routing for Deep Work events
  *
@@ -165,7 +166,9 @@ window.PocketPaw.Transparency = {
                     const inp = d.input_tokens || 0;
                     const out = d.output_tokens || 0;
                     const total = d.total_tokens || (inp + out);
-                    message = `<span class="text-white/40">Tokens: <b>${inp.toLocaleString()}</b> in · <b>${out.toLocaleString()}</b> out · <b>${total.toLocaleString()}</b> total</span>`;
+                    const cached = d.cache_read_input_tokens || 0;
+                    const cachedPart = cached ? ` · <b>${cached.toLocaleString()}</b> cached` : '';
+                    message = `<span class="text-white/40">Tokens: <b>${inp.toLocaleString()}</b> in · <b>${out.toLocaleString()}</b> out${cachedPart} · <b>${total.toLocaleString()}</b> total</span>`;
                     level = 'info';
                 } else {
                     message = `Unknown event: ${eventType}`;
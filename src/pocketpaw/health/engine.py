@@ -185,10 +185,19 @@ class HealthEngine:
             logger.warning("Failed to record error: %s", e)
             return ""
 
-    def get_recent_errors(self, limit: int = 20, search: str = "") -> list[dict]:
+    def get_recent_errors(
+        self,
+        limit: int = 20,
+        search: str = "",
+        source: str = "",
+        since: str | None = None,
+        until: str | None = None,
+    ) -> list[dict]:
         """Get recent errors from persistent store."""
         try:
-            return self._error_store.get_recent(limit=limit, search=search)
+            return self._error_store.get_recent(
+                limit=limit, search=search, source=source, since=since, until=until
+            )
         except Exception:
             return []
 
@@ -1,12 +1,21 @@
 # ErrorStore — persistent error log for PocketPaw health engine.
 # Created: 2026-02-17
+# Updated: 2026-10-19 — Reads tail the file in reverse blocks instead of loading it
+#   whole; a per-file offset index serves time-range and source filters; reads
+#   and clear() span the rotated errors.jsonl.N files; record() rotates at the
+#   size limit.
 # Persists errors to ~/.pocketpaw/health/errors.jsonl (append-only JSONL).
 
 from __future__ import annotations
 
 import json
 import logging
+import os
+import threading
 import uuid
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
 
@@ -16,6 +25,7 @@ logger = logging.getLogger(__name__)
 
 _MAX_ROTATION_FILES = 5
 _DEFAULT_MAX_SIZE_MB = 10
+_READ_BLOCK_SIZE = 64 * 1024
 
 
 def _get_health_dir() -> Path:
@@ -25,14 +35,66 @@ def _get_health_dir() -> Path:
     return d
 
 
+def _iter_lines_reversed(path: Path, block_size: int = _READ_BLOCK_SIZE) -> Iterator[bytes]:
+    """Yield the non-empty lines of a file, last line first, reading from the end."""
+    with path.open("rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        tail = b""
+        while pos > 0:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            lines = (f.read(step) + tail).split(b"\n")
+            # The first piece may continue in the previous block
+            tail = lines[0]
+            for line in reversed(lines[1:]):
+                if line.strip():
+                    yield line
+        if tail.strip():
+            yield tail
+
+
+def _normalize_timestamp(value: datetime | str | None) -> str | None:
+    """ISO UTC string comparable with stored timestamps, or None."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return value.astimezone(UTC).isoformat()
+
+
+@dataclass
+class _FileIndex:
+    """Byte offset, timestamp and source of every entry in one log file.
+
+    Entries are appended in time order, so ``timestamps`` is sorted and a
+    time range is two bisects. Built incrementally: only bytes appended since
+    the last read are parsed.
+    """
+
+    indexed_size: int = 0
+    offsets: list[int] = field(default_factory=list)
+    timestamps: list[str] = field(default_factory=list)
+    sources: list[str] = field(default_factory=list)
+
+
 class ErrorStore:
     """Append-only JSONL store for persistent error logging.
 
-    Errors survive page refresh and server restart.
+    Errors survive page refresh and server restart. Reads never load a whole
+    file: unfiltered reads tail it in reverse blocks, and time/source filters
+    go through an in-memory offset index. Older entries live in the rotated
+    errors.jsonl.1 ... errors.jsonl.5 files and are searched too.
     """
 
-    def __init__(self, path: Path | None = None):
+    def __init__(self, path: Path | None = None, max_size_mb: float = _DEFAULT_MAX_SIZE_MB):
         self._path = path or (_get_health_dir() / "errors.jsonl")
+        self._max_size_mb = max_size_mb
+        # Keyed by (st_dev, st_ino) so an index follows its file through rotation
+        self._indexes: dict[tuple[int, int], _FileIndex] = {}
+        self._lock = threading.Lock()
 
     @property
     def path(self) -> Path:
@@ -60,44 +122,42 @@ class ErrorStore:
         try:
             with self._path.open("a", encoding="utf-8") as f:
                 f.write(json.dumps(entry, default=str) + "\n")
+                size = f.tell()
+            if size > self._max_size_mb * 1024 * 1024:
+                self.rotate_if_needed(self._max_size_mb)
         except Exception as e:
             logger.warning("ErrorStore.record failed: %s", e)
         return error_id
 
-    def get_recent(self, limit: int = 20, search: str = "") -> list[dict]:
-        """Tail-read recent errors, optionally filtering by search string."""
-        if not self._path.exists():
-            return []
+    def get_recent(
+        self,
+        limit: int = 20,
+        search: str = "",
+        source: str = "",
+        since: datetime | str | None = None,
+        until: datetime | str | None = None,
+    ) -> list[dict]:
+        """Recent errors, newest first.
 
+        Args:
+            limit: Max entries to return
+            search: Case-insensitive text to match in message, source or traceback
+            source: Only entries whose source equals this
+            since: Only entries at or after this time (datetime or ISO string)
+            until: Only entries at or before this time (datetime or ISO string)
+        """
+        if limit <= 0:
+            return []
         try:
-            lines = self._path.read_text(encoding="utf-8").strip().splitlines()
+            since_ts = _normalize_timestamp(since)
+            until_ts = _normalize_timestamp(until)
+            if source or since_ts or until_ts:
+                return self._get_indexed(limit, search, source, since_ts, until_ts)
+            return self._get_tail(limit, search)
         except Exception as e:
             logger.warning("ErrorStore.get_recent failed: %s", e)
             return []
 
-        # Parse from newest to oldest
-        results: list[dict] = []
-        for line in reversed(lines):
-            if not line.strip():
-                continue
-            try:
-                entry = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-
-            if search:
-                haystack = (
-                    entry.get("message", "") + entry.get("source", "") + entry.get("traceback", "")
-                ).lower()
-                if search.lower() not in haystack:
-                    continue
-
-            results.append(entry)
-            if len(results) >= limit:
-                break
-
-        return results
-
     def rotate_if_needed(self, max_size_mb: float = _DEFAULT_MAX_SIZE_MB) -> bool:
         """Rotate errors.jsonl if it exceeds max_size_mb.
 
@@ -113,18 +173,150 @@ class ErrorStore:
 
         # Shift existing rotated files
         for i in range(_MAX_ROTATION_FILES, 0, -1):
-            old = self._path.with_suffix(f".jsonl.{i}")
-            new = self._path.with_suffix(f".jsonl.{i + 1}")
+            old = self._rotated_path(i)
+            new = self._rotated_path(i + 1)
             if i == _MAX_ROTATION_FILES and old.exists():
                 old.unlink()
             elif old.exists():
                 old.rename(new)
 
         # Move current to .1
-        self._path.rename(self._path.with_suffix(".jsonl.1"))
+        self._path.rename(self._rotated_path(1))
         return True
 
     def clear(self) -> None:
-        """Remove all stored errors (for testing)."""
-        if self._path.exists():
-            self._path.unlink()
+        """Remove all stored errors, including rotated files."""
+        for path in self._log_files():
+            path.unlink(missing_ok=True)
+        with self._lock:
+            self._indexes.clear()
+
+    # -- internals --
+
+    def _rotated_path(self, n: int) -> Path:
+        return self._path.with_suffix(f".jsonl.{n}")
+
+    def _log_files(self) -> list[Path]:
+        """Existing log files, newest first."""
+        candidates = [self._path] + [
+            self._rotated_path(i) for i in range(1, _MAX_ROTATION_FILES + 1)
+        ]
+        return [p for p in candidates if p.exists()]
+
+    def _get_tail(self, limit: int, search: str) -> list[dict]:
+        """Newest-first scan from the end of each file; stops at ``limit``."""
+        needle = search.lower()
+        # Cheap byte-level reject before json.loads, for needles that appear
+        # verbatim in the encoded line (JSON escapes quotes, backslashes,
+        # control and non-ASCII characters)
+        raw_needle = (
+            needle.encode()
+            if needle.isascii() and needle.isprintable() and not {'"', "\\"} & set(needle)
+            else b""
+        )
+        results: list[dict] = []
+        for path in self._log_files():
+            try:
+                for line in _iter_lines_reversed(path):
+                    if raw_needle and raw_needle not in line.lower():
+                        continue
+                    entry = self._parse(line)
+                    if entry is None or not self._matches(entry, needle):
+                        continue
+                    results.append(entry)
+                    if len(results) >= limit:
+                        return results
+            except FileNotFoundError:
+                # Rotated away mid-read; the next file holds the rest
+                continue
+        return results
+
+    def _get_indexed(
+        self,
+        limit: int,
+        search: str,
+        source: str,
+        since: str | None,
+        until: str | None,
+    ) -> list[dict]:
+        """Newest-first lookup through the offset indexes."""
+        needle = search.lower()
+        results: list[dict] = []
+        for path in self._log_files():
+            try:
+                with path.open("rb") as f:
+                    index = self._index_for(path, f)
+                    lo = bisect_left(index.timestamps, since) if since else 0
+                    hi = bisect_right(index.timestamps, until) if until else len(index.offsets)
+                    for i in range(hi - 1, lo - 1, -1):
+                        if source and index.sources[i] != source:
+                            continue
+                        f.seek(index.offsets[i])
+                        entry = self._parse(f.readline())
+                        if entry is None or not self._matches(entry, needle):
+                            continue
+                        results.append(entry)
+                        if len(results) >= limit:
+                            return results
+            except FileNotFoundError:
+                continue
+            if since and lo > 0:
+                # This file already reaches back past ``since``; older files can't match
+                break
+        return results
+
+    def _index_for(self, path: Path, f) -> _FileIndex:
+        """The offset index for an open log file, extended with any new entries."""
+        st = os.fstat(f.fileno())
+        key = (st.st_dev, st.st_ino)
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is None or st.st_size < index.indexed_size:
+                index = _FileIndex()
+            if st.st_size > index.indexed_size:
+                f.seek(index.indexed_size)
+                offset = index.indexed_size
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        # Partially written entry; picked up on a later read
+                        break
+                    entry = self._parse(line)
+                    if entry is not None:
+                        index.offsets.append(offset)
+                        index.timestamps.append(str(entry.get("timestamp", "")))
+                        index.sources.append(str(entry.get("source", "")))
+                    offset += len(line)
+                index.indexed_size = offset
+            self._indexes[key] = index
+            # Drop indexes of files that have been rotated out or cleared
+            if len(self._indexes) > _MAX_ROTATION_FILES + 1:
+                live = set()
+                for p in self._log_files():
+                    try:
+                        s = p.stat()
+                    except FileNotFoundError:
+                        continue
+                    live.add((s.st_dev, s.st_ino))
+                live.add(key)
+                for stale in set(self._indexes) - live:
+                    del self._indexes[stale]
+            return index
+
+    @staticmethod
+    def _parse(line: bytes) -> dict | None:
+        try:
+            entry = json.loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return None
+        return entry if isinstance(entry, dict) else None
+
+    @staticmethod
+    def _matches(entry: dict, needle: str) -> bool:
+        if not needle:
+            return True
+        haystack = (
+            str(entry.get("message", ""))
+            + str(entry.get("source", ""))
+            + str(entry.get("traceback", ""))
+        ).lower()
+        return needle in haystack
@@ -0,0 +1,195 @@
+"""Pluggable, cached token counting for context budgeting.
+
+Created: 2026-10-19
+
+Prompt pieces (memory context, compacted session history) can be budgeted in
+tokens instead of characters. ``get_tokenizer()`` returns a shared, cached
+tokenizer for a model:
+
+- a model-specific tokenizer when one is registered/available (``tiktoken``
+  for OpenAI models, if installed), otherwise
+- ``HeuristicTokenizer``, a dependency-free local estimate that accounts for
+  CJK and other non-Latin scripts costing more tokens per character.
+
+Register additional tokenizers with ``register_tokenizer(prefix, factory)``.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Protocol, runtime_checkable
+
+logger = logging.getLogger(__name__)
+
+# Number of distinct strings whose token counts are memoized per tokenizer
+_COUNT_CACHE_SIZE = 4096
+
+
+@runtime_checkable
+class Tokenizer(Protocol):
+    """Counts and truncates text in model tokens."""
+
+    name: str
+
+    def count(self, text: str) -> int:
+        """Number of tokens in ``text``."""
+        ...
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """Longest prefix of ``text`` that fits in ``max_tokens``."""
+        ...
+
+
+# Latin-ish words/numbers, CJK ideographs + kana + hangul (≈1 token per char),
+# other letters (Cyrillic, Arabic, Devanagari, ...), and lone symbols.
+_HEURISTIC_PATTERN = re.compile(
+    r"(?P<word>[A-Za-z0-9]+)"
+    r"|(?P<cjk>[぀-ヿ㐀-䶿一-鿿가-힯豈-﫿])"
+    r"|(?P<other>[^\W\d_A-Za-z]+)"
+    r"|(?P<symbol>[^\s])"
+)
+
+
+class HeuristicTokenizer:
+    """Local token estimate, no dependencies.
+
+    English words cost about one token per four characters, CJK characters
+    about one token each, other non-Latin letters about one per two
+    characters, and punctuation one token per symbol.
+    """
+
+    name = "heuristic"
+
+    @staticmethod
+    def _cost(match: re.Match[str]) -> int:
+        kind = match.lastgroup
+        length = match.end() - match.start()
+        if kind == "word":
+            return (length + 3) // 4
+        if kind == "other":
+            return (length + 1) // 2
+        return 1
+
+    def count(self, text: str) -> int:
+        return sum(self._cost(m) for m in _HEURISTIC_PATTERN.finditer(text))
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        if max_tokens <= 0:
+            return ""
+        used = 0
+        for m in _HEURISTIC_PATTERN.finditer(text):
+            used += self._cost(m)
+            if used > max_tokens:
+                return text[: m.start()]
+        return text
+
+
+class TiktokenTokenizer:
+    """Exact counts for OpenAI models via the optional ``tiktoken`` package."""
+
+    def __init__(self, model: str):
+        import tiktoken
+
+        try:
+            self._encoding = tiktoken.encoding_for_model(model)
+        except KeyError:
+            self._encoding = tiktoken.get_encoding("o200k_base")
+        self.name = f"tiktoken:{self._encoding.name}"
+
+    def count(self, text: str) -> int:
+        return len(self._encoding.encode(text, disallowed_special=()))
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        if max_tokens <= 0:
+            return ""
+        tokens = self._encoding.encode(text, disallowed_special=())
+        if len(tokens) <= max_tokens:
+            return text
+        return self._encoding.decode(tokens[:max_tokens])
+
+
+class CachedTokenizer:
+    """Wraps a tokenizer with an LRU cache of counts.
+
+    History messages are re-measured every turn, so repeated strings are
+    only tokenized once.
+    """
+
+    def __init__(self, inner: Tokenizer, cache_size: int = _COUNT_CACHE_SIZE):
+        self.inner = inner
+        self.name = inner.name
+        self._count = lru_cache(maxsize=cache_size)(inner.count)
+
+    def count(self, text: str) -> int:
+        return self._count(text)
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        return self.inner.truncate(text, max_tokens)
+
+    def cache_info(self):
+        """Hit/miss statistics of the count cache."""
+        return self._count.cache_info()
+
+
+def _tiktoken_factory(model: str) -> Tokenizer | None:
+    try:
+        return TiktokenTokenizer(model)
+    except ImportError:
+        return None
+
+
+# Model-name prefix → factory returning a tokenizer (or None if unavailable)
+_FACTORIES: dict[str, Callable[[str], Tokenizer | None]] = {
+    "gpt-": _tiktoken_factory,
+    "o1": _tiktoken_factory,
+    "o3": _tiktoken_factory,
+    "o4": _tiktoken_factory,
+}
+_tokenizers: dict[str, CachedTokenizer] = {}
+
+
+def register_tokenizer(prefix: str, factory: Callable[[str], Tokenizer | None]) -> None:
+    """Use ``factory(model)`` for models whose name starts with ``prefix``.
+
+    The factory may return None when its backing library is unavailable, in
+    which case the heuristic tokenizer is used.
+    """
+    _FACTORIES[prefix] = factory
+    _tokenizers.clear()
+
+
+def get_tokenizer(model: str | None = None) -> CachedTokenizer:
+    """Return the shared cached tokenizer for ``model`` (heuristic by default)."""
+    key = model or ""
+    tokenizer = _tokenizers.get(key)
+    if tokenizer is not None:
+        return tokenizer
+
+    inner: Tokenizer | None = None
+    if model:
+        # Longest matching prefix wins
+        for prefix in sorted(_FACTORIES, key=len, reverse=True):
+            if model.startswith(prefix):
+                try:
+                    inner = _FACTORIES[prefix](model)
+                except Exception:
+                    logger.debug("Tokenizer factory for %s failed", prefix, exc_info=True)
+                break
+
+    tokenizer = CachedTokenizer(inner or HeuristicTokenizer())
+    _tokenizers[key] = tokenizer
+    return tokenizer
+
+
+def get_tokenizer_for_settings(settings) -> CachedTokenizer:
+    """Tokenizer for the model the configured LLM provider resolves to."""
+    from pocketpaw.llm.client import resolve_llm_client
+
+    try:
+        model = resolve_llm_client(settings).model
+    except Exception:
+        model = None
+    return get_tokenizer(model)
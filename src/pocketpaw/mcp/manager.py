@@ -7,6 +7,9 @@ Singleton manager that handles:
 - Caching discovered tools for fast access
 
 Created: 2026-02-07
+Updated: 2026-10-19 — Enabled servers start concurrently (bounded by
+    mcp_startup_concurrency); tool lists are persisted per config hash and
+    advertised from that cache while a server is still connecting.
 """
 
 from __future__ import annotations
@@ -20,6 +23,7 @@ from typing import Any
 from urllib.parse import parse_qs, urlparse
 
 from pocketpaw.mcp.config import MCPServerConfig, load_mcp_config, save_mcp_config
+from pocketpaw.mcp.tool_cache import load_cached_tools, remove_cached_tools, save_cached_tools
 
 logger = logging.getLogger(__name__)
 
@@ -74,6 +78,9 @@ class _ServerState:
     tools: list[MCPToolInfo] = field(default_factory=list)
     error: str = ""
     connected: bool = False
+    # Set while a connection attempt is in flight; tools may come from the cache
+    connecting: bool = False
+    ready: asyncio.Event = field(default_factory=asyncio.Event)
 
 
 _UNHELPFUL_ERRORS = {
@@ -116,6 +123,14 @@ def _extract_root_error(exc: BaseException) -> str:
     return top
 
 
+def _tool_dicts(tools: list[MCPToolInfo]) -> list[dict]:
+    """Tool-cache representation of a server's tools."""
+    return [
+        {"name": t.name, "description": t.description, "input_schema": t.input_schema}
+        for t in tools
+    ]
+
+
 class MCPManager:
     """Manages MCP server connections and tool invocations."""
 
@@ -157,7 +172,23 @@ class MCPManager:
 
     def __init__(self) -> None:
         self._servers: dict[str, _ServerState] = {}
-        self._lock = asyncio.Lock()
+        # Per-server locks, so slow servers don't hold up each other
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    def _server_lock(self, name: str) -> asyncio.Lock:
+        lock = self._locks.get(name)
+        if lock is None:
+            lock = self._locks[name] = asyncio.Lock()
+        return lock
+
+    def _pending_state(self, config: MCPServerConfig) -> _ServerState:
+        """Register a connecting state for ``config``, seeded with cached tools."""
+        state = _ServerState(config=config, connecting=True)
+        cached = load_cached_tools(config)
+        if cached:
+            state.tools = [MCPToolInfo(server_name=config.name, **tool) for tool in cached]
+        self._servers[config.name] = state
+        return state
 
     @classmethod
     def _build_safe_env(cls, config_env: dict[str, str]) -> dict[str, str]:
@@ -261,112 +292,125 @@ class MCPManager:
 
         Returns True on success, False on failure.
         """
-        async with self._lock:
-            if config.name in self._servers and self._servers[config.name].connected:
+        async with self._server_lock(config.name):
+            state = self._servers.get(config.name)
+            if state is not None and state.connected:
                 logger.info("MCP server '%s' already connected", config.name)
                 return True
-
-            state = _ServerState(config=config)
-            self._servers[config.name] = state
-
-            # Build OAuth auth if needed
-            auth = None
-            if config.oauth:
-                try:
-                    auth = self._make_oauth_auth(config)
-                except Exception as e:
-                    state.error = f"OAuth setup failed: {e}"
-                    logger.error("OAuth setup failed for '%s': %s", config.name, e)
-                    return False
+            if state is None or not state.connecting:
+                state = self._pending_state(config)
 
             try:
-                timeout = config.timeout or 30
-                # OAuth flows need more time for user interaction
-                connect_timeout = 300 if config.oauth else timeout
+                return await self._connect(state)
+            finally:
+                state.connecting = False
+                if not state.connected:
+                    state.tools = []
+                state.ready.set()
+
+    async def _connect(self, state: _ServerState) -> bool:
+        """Connect ``state``'s server and discover its tools."""
+        config = state.config
+        # Build OAuth auth if needed
+        auth = None
+        if config.oauth:
+            try:
+                auth = self._make_oauth_auth(config)
+            except Exception as e:
+                state.error = f"OAuth setup failed: {e}"
+                logger.error("OAuth setup failed for '%s': %s", config.name, e)
+                return False
 
-                if config.transport == "stdio":
-                    await asyncio.wait_for(self._connect_stdio(state), timeout=timeout)
-                elif config.transport == "streamable-http":
+        try:
+            timeout = config.timeout or 30
+            # OAuth flows need more time for user interaction
+            connect_timeout = 300 if config.oauth else timeout
+
+            if config.transport == "stdio":
+                await asyncio.wait_for(self._connect_stdio(state), timeout=timeout)
+            elif config.transport == "streamable-http":
+                await self._connect_remote_with_timeout(
+                    state,
+                    connect_timeout,
+                    lambda s: self._connect_streamable_http(s, auth=auth),
+                )
+            elif config.transport == "sse":
+                await self._connect_remote_with_timeout(
+                    state,
+                    connect_timeout,
+                    lambda s: self._connect_sse(s, auth=auth),
+                )
+            elif config.transport == "http":
+                # Auto-detect: try Streamable HTTP first, fall back to SSE.
+                # Modern MCP servers use Streamable HTTP (POST-based);
+                # older ones use SSE (GET-based).
+                try:
                     await self._connect_remote_with_timeout(
                         state,
                         connect_timeout,
                         lambda s: self._connect_streamable_http(s, auth=auth),
                     )
-                elif config.transport == "sse":
+                except TimeoutError:
+                    raise  # Don't waste time retrying on timeout
+                except BaseException:
+                    await self._cleanup_state(state)
+                    state.session = state.client = None
+                    state.read_stream = state.write_stream = None
+                    logger.debug(
+                        "Streamable HTTP failed for '%s', trying SSE",
+                        config.name,
+                    )
                     await self._connect_remote_with_timeout(
                         state,
                         connect_timeout,
                         lambda s: self._connect_sse(s, auth=auth),
                     )
-                elif config.transport == "http":
-                    # Auto-detect: try Streamable HTTP first, fall back to SSE.
-                    # Modern MCP servers use Streamable HTTP (POST-based);
-                    # older ones use SSE (GET-based).
-                    try:
-                        await self._connect_remote_with_timeout(
-                            state,
-                            connect_timeout,
-                            lambda s: self._connect_streamable_http(
-                                s, auth=auth
-                            ),
-                        )
-                    except TimeoutError:
-                        raise  # Don't waste time retrying on timeout
-                    except BaseException:
-                        await self._cleanup_state(state)
-                        state = _ServerState(config=config)
-                        self._servers[config.name] = state
-                        logger.debug(
-                            "Streamable HTTP failed for '%s', trying SSE",
-                            config.name,
-                        )
-                        await self._connect_remote_with_timeout(
-                            state,
-                            connect_timeout,
-                            lambda s: self._connect_sse(s, auth=auth),
-                        )
-                else:
-                    state.error = f"Unknown transport: {config.transport}"
-                    logger.error(state.error)
-                    return False
-
-                # Discover tools (also bounded by timeout)
-                await asyncio.wait_for(self._discover_tools(state), timeout=timeout)
-                state.connected = True
-                logger.info(
-                    "MCP server '%s' started — %d tools",
-                    config.name,
-                    len(state.tools),
-                )
-                return True
-
-            except TimeoutError:
-                effective_timeout = 300 if config.oauth else (config.timeout or 30)
-                state.error = f"Connection timed out after {effective_timeout}s"
-                state.connected = False
-                await self._cleanup_state(state)
-                logger.error("MCP server '%s' timed out after %ds", config.name, effective_timeout)
+            else:
+                state.error = f"Unknown transport: {config.transport}"
+                logger.error(state.error)
                 return False
-            except BaseException as e:
-                # Catch BaseException to handle ExceptionGroup / BaseExceptionGroup
-                # from anyio TaskGroup failures in the MCP library.
-                root_msg = _extract_root_error(e)
-
-                # Provide actionable hint for OAuth registration failures
-                if config.oauth and "Registration failed" in root_msg:
-                    root_msg = (
-                        f"{root_msg}. "
-                        "This server doesn't support dynamic client registration. "
-                        "You can set mcp_client_metadata_url in Settings to a "
-                        "publicly-hosted CIMD JSON file, or configure the server "
-                        "with an API token instead of OAuth."
-                    )
 
-                state.error = root_msg
-                state.connected = False
-                await self._cleanup_state(state)
-                logger.error("Failed to start MCP server '%s': %s", config.name, root_msg)
-                return False
+            # Discover tools (also bounded by timeout)
+            cached = _tool_dicts(state.tools)
+            await asyncio.wait_for(self._discover_tools(state), timeout=timeout)
+            discovered = _tool_dicts(state.tools)
+            if discovered != cached:
+                save_cached_tools(config, discovered)
+            state.connected = True
+            logger.info(
+                "MCP server '%s' started — %d tools",
+                config.name,
+                len(state.tools),
+            )
+            return True
+
+        except TimeoutError:
+            effective_timeout = 300 if config.oauth else (config.timeout or 30)
+            state.error = f"Connection timed out after {effective_timeout}s"
+            state.connected = False
+            await self._cleanup_state(state)
+            logger.error("MCP server '%s' timed out after %ds", config.name, effective_timeout)
+            return False
+        except BaseException as e:
+            # Catch BaseException to handle ExceptionGroup / BaseExceptionGroup
+            # from anyio TaskGroup failures in the MCP library.
+            root_msg = _extract_root_error(e)
+
+            # Provide actionable hint for OAuth registration failures
+            if config.oauth and "Registration failed" in root_msg:
+                root_msg = (
+                    f"{root_msg}. "
+                    "This server doesn't support dynamic client registration. "
+                    "You can set mcp_client_metadata_url in Settings to a "
+                    "publicly-hosted CIMD JSON file, or configure the server "
+                    "with an API token instead of OAuth."
+                )
+
+            state.error = root_msg
+            state.connected = False
+            await self._cleanup_state(state)
+            logger.error("Failed to start MCP server '%s': %s", config.name, root_msg)
+            return False
 
     async def _connect_stdio(self, state: _ServerState) -> None:
         """Connect to an MCP server via stdio subprocess."""
@@ -492,7 +536,7 @@ class MCPManager:
 
     async def stop_server(self, name: str) -> bool:
         """Stop a running MCP server. Returns True if it was running."""
-        async with self._lock:
+        async with self._server_lock(name):
             state = self._servers.pop(name, None)
             if state is None:
                 return False
@@ -502,11 +546,12 @@ class MCPManager:
 
     async def stop_all(self) -> None:
         """Stop all running MCP servers."""
-        async with self._lock:
-            for name in list(self._servers):
-                state = self._servers.pop(name)
-                await self._cleanup_state(state)
-            logger.info("All MCP servers stopped")
+        for name in list(self._servers):
+            async with self._server_lock(name):
+                state = self._servers.pop(name, None)
+                if state is not None:
+                    await self._cleanup_state(state)
+        logger.info("All MCP servers stopped")
 
     async def _cleanup_state(self, state: _ServerState) -> None:
         """Clean up a server state's resources."""
@@ -530,10 +575,10 @@ class MCPManager:
         return list(state.tools)
 
     def get_all_tools(self) -> list[MCPToolInfo]:
-        """Return all tools from all connected servers."""
+        """Return all tools from connected servers and cached tools of connecting ones."""
         tools: list[MCPToolInfo] = []
         for state in self._servers.values():
-            if state.connected:
+            if state.connected or state.connecting:
                 tools.extend(state.tools)
         return tools
 
@@ -542,6 +587,9 @@ class MCPManager:
     ) -> str:
         """Call a tool on a connected MCP server, returning the text result."""
         state = self._servers.get(server_name)
+        if state is not None and state.connecting:
+            # Advertised from the tool cache; wait for the connection to finish
+            await state.ready.wait()
         if state is None or not state.connected or not state.session:
             return f"Error: MCP server '{server_name}' is not connected"
 
@@ -568,6 +616,7 @@ class MCPManager:
         for cfg in load_mcp_config():
             info: dict = {
                 "connected": False,
+                "connecting": False,
                 "tool_count": 0,
                 "error": "",
                 "transport": cfg.transport,
@@ -580,6 +629,7 @@ class MCPManager:
         for name, state in self._servers.items():
             info = {
                 "connected": state.connected,
+                "connecting": state.connecting,
                 "tool_count": len(state.tools),
                 "error": state.error,
                 "transport": state.config.transport,
@@ -591,12 +641,26 @@ class MCPManager:
         return result
 
     async def start_enabled_servers(self) -> None:
-        """Start all enabled servers from config."""
-        configs = load_mcp_config()
+        """Start all enabled servers from config, ``mcp_startup_concurrency`` at a time.
+
+        Servers with a warm tool cache advertise their tools before the
+        connection is up; ``call_tool`` waits for it to finish.
+        """
+        from pocketpaw.config import get_settings
+
+        configs = [c for c in load_mcp_config() if c.enabled]
         for config in configs:
-            if config.enabled:
+            if config.name not in self._servers:
+                self._pending_state(config)
+
+        semaphore = asyncio.Semaphore(max(1, int(get_settings().mcp_startup_concurrency)))
+
+        async def start(config: MCPServerConfig) -> None:
+            async with semaphore:
                 await self.start_server(config)
 
+        await asyncio.gather(*(start(config) for config in configs))
+
     def add_server_config(self, config: MCPServerConfig) -> None:
         """Add a server config and persist it."""
         configs = load_mcp_config()
@@ -612,6 +676,7 @@ class MCPManager:
         if len(new_configs) == len(configs):
             return False
         save_mcp_config(new_configs)
+        remove_cached_tools(name)
         return True
 
     def toggle_server_config(self, name: str) -> bool | None:
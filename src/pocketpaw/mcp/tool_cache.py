@@ -0,0 +1,82 @@
+"""MCP tool-schema cache — discovered tool lists persisted across restarts.
+
+Stored in ~/.pocketpaw/mcp_tool_cache.json, one entry per server tagged with
+a hash of the server's config. While a server is still connecting, its cached
+tools can be advertised to agents; a changed config invalidates the entry.
+
+Created: 2026-10-19
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from pocketpaw.config import get_config_dir
+
+if TYPE_CHECKING:
+    from pocketpaw.mcp.config import MCPServerConfig
+
+logger = logging.getLogger(__name__)
+
+MCP_TOOL_CACHE_FILENAME = "mcp_tool_cache.json"
+
+
+def _get_tool_cache_path() -> Path:
+    return get_config_dir() / MCP_TOOL_CACHE_FILENAME
+
+
+def config_hash(config: MCPServerConfig) -> str:
+    """Stable hash of everything that can change what a server exposes."""
+    data = config.to_dict()
+    data.pop("enabled", None)
+    return hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+
+
+def _load_all() -> dict:
+    path = _get_tool_cache_path()
+    if not path.exists():
+        return {}
+    try:
+        data = json.loads(path.read_text())
+        return data if isinstance(data, dict) else {}
+    except (json.JSONDecodeError, OSError) as e:
+        logger.warning("Failed to load MCP tool cache: %s", e)
+        return {}
+
+
+def load_cached_tools(config: MCPServerConfig) -> list[dict] | None:
+    """Cached tool dicts (name, description, input_schema) for a server, or None."""
+    entry = _load_all().get(config.name)
+    if not isinstance(entry, dict) or entry.get("config_hash") != config_hash(config):
+        return None
+    tools = entry.get("tools")
+    return tools if isinstance(tools, list) else None
+
+
+def save_cached_tools(config: MCPServerConfig, tools: list[dict]) -> None:
+    """Persist a server's discovered tools (atomic replace)."""
+    data = _load_all()
+    data[config.name] = {"config_hash": config_hash(config), "tools": tools}
+    path = _get_tool_cache_path()
+    tmp = path.with_suffix(".tmp")
+    try:
+        tmp.write_text(json.dumps(data))
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.warning("Failed to save MCP tool cache: %s", e)
+
+
+def remove_cached_tools(name: str) -> None:
+    """Drop a server's entry (e.g. when its config is removed)."""
+    data = _load_all()
+    if data.pop(name, None) is not None:
+        path = _get_tool_cache_path()
+        try:
+            path.write_text(json.dumps(data))
+        except OSError as e:
+            logger.warning("Failed to save MCP tool cache: %s", e)
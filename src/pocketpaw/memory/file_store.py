@@ -2,22 +2,41 @@
 # Created: 2026-02-02 - Memory System
 # Updated: 2026-02-09 - Fixed UUID collision, daily file loading, search, persistent delete
 # Updated: 2026-02-10 - Session index for fast listing, delete/rename support
+# Updated: 2026-10-19 - Append-only JSONL session logs with legacy JSON migration
+# Updated: 2026-10-19 - Incremental inverted index with BM25 ranking for search()
+# Updated: 2026-10-19 - Resident session index with debounced flush + crash recovery
+# Updated: 2026-10-19 - Persisted markdown parse cache, lazy loading of old daily files
+# Updated: 2026-10-19 - Per-source entry index, delete_many() with one rewrite per file
+# Updated: 2026-10-19 - get_session_since() cursor-based tail reads of session logs
+# Updated: 2026-10-19 - Tail cursors check the last consumed record id; clear_session()
+#   drops the compaction cache
+# Updated: 2026-10-19 - Deferred daily files kept in date order; search() loads them only
+#   when recent entries can't fill the limit
+# Updated: 2026-10-19 - Debounced session index flush task is kept and its failures logged
 #
 # Stores memories as markdown files for human readability:
 # - ~/.pocketpaw/memory/MEMORY.md     (long-term)
 # - ~/.pocketpaw/memory/2026-02-02.md (daily)
-# - ~/.pocketpaw/memory/sessions/     (session JSON files)
+# - ~/.pocketpaw/memory/_parse_cache.json (parsed markdown keyed by path/mtime/size)
+# - ~/.pocketpaw/memory/sessions/     (session JSONL logs, one message per line)
 # - ~/.pocketpaw/memory/sessions/_index.json (session metadata index)
+# - ~/.pocketpaw/memory/sessions/_index.dirty (present while the index has unflushed changes)
 
 import asyncio
 import json
+import logging
+import math
+import os
 import re
 import uuid
+from collections import Counter
 from datetime import UTC, date, datetime
 from pathlib import Path
 
 from pocketpaw.memory.protocol import MemoryEntry, MemoryType
 
+logger = logging.getLogger(__name__)
+
 
 def _ensure_utc(dt: datetime) -> datetime:
     """Ensure a datetime is timezone-aware (UTC)."""
@@ -140,6 +159,115 @@ _STOP_WORDS = frozenset(
 )
 
 
+# Daily files older than this many days are parsed on first use, not at startup
+_DAILY_HORIZON_DAYS = 30
+
+_PARSE_CACHE_VERSION = 1
+
+# Seconds to batch session index updates before writing _index.json
+_SESSION_INDEX_FLUSH_DELAY = 1.0
+
+# Session logs are compacted (torn lines dropped, duplicate ids collapsed)
+# after this many appends to the same session.
+_SESSION_COMPACT_EVERY = 500
+
+
+def _session_record(entry: MemoryEntry) -> dict:
+    """Serialize a session MemoryEntry into its on-disk record."""
+    return {
+        "id": entry.id,
+        "role": entry.role,
+        "content": entry.content,
+        "timestamp": entry.created_at.isoformat(),
+        "metadata": entry.metadata,
+    }
+
+
+def _session_entry_from_record(session_key: str, item: dict) -> MemoryEntry:
+    """Build a session MemoryEntry from its on-disk record."""
+    return MemoryEntry(
+        id=item["id"],
+        type=MemoryType.SESSION,
+        content=item["content"],
+        role=item.get("role"),
+        session_key=session_key,
+        created_at=_ensure_utc(datetime.fromisoformat(item["timestamp"])),
+        metadata=item.get("metadata", {}),
+    )
+
+
+def _line_ending_at(f, offset: int) -> bytes | None:
+    """The complete line whose newline ends at byte ``offset`` of ``f``."""
+    if offset <= 0:
+        return None
+    f.seek(offset - 1)
+    if f.read(1) != b"\n":
+        return None
+    parts: list[bytes] = []
+    pos = offset - 1
+    while pos > 0:
+        step = min(4096, pos)
+        pos -= step
+        f.seek(pos)
+        chunk = f.read(step)
+        newline = chunk.rfind(b"\n")
+        if newline != -1:
+            parts.append(chunk[newline + 1 :])
+            break
+        parts.append(chunk)
+    return b"".join(reversed(parts))
+
+
+def _record_id(line: bytes | None) -> str | None:
+    try:
+        record = json.loads(line) if line else None
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+    return record.get("id") if isinstance(record, dict) else None
+
+
+def _read_session_log(path: Path) -> tuple[list[dict], bool]:
+    """Read a JSONL session log.
+
+    Returns (records, clean). Unparseable lines (e.g. a torn final line after
+    a crash) are skipped and reported through ``clean=False``.
+    """
+    records: list[dict] = []
+    clean = True
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                clean = False
+                continue
+            if isinstance(record, dict):
+                records.append(record)
+            else:
+                clean = False
+    return records, clean
+
+
+def read_session_file(path: Path) -> list[dict]:
+    """Read session records from either a JSONL log or a legacy JSON array file."""
+    if path.suffix == ".jsonl":
+        return _read_session_log(path)[0]
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return data if isinstance(data, list) else []
+
+
+def _write_session_log(path: Path, records: list[dict]) -> None:
+    """Atomically (re)write a whole JSONL session log."""
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+    tmp.replace(path)
+
+
 def _make_deterministic_id(path: Path, header: str, body: str) -> str:
     """Generate a deterministic UUID5 from path, header, AND body content."""
     return str(uuid.uuid5(uuid.NAMESPACE_DNS, f"{path}:{header}:{body}"))
@@ -151,15 +279,94 @@ def _tokenize(text: str) -> set[str]:
     return words - _STOP_WORDS
 
 
+def _term_counts(text: str) -> Counter[str]:
+    """Like _tokenize, but keep per-term frequencies for ranking."""
+    return Counter(w for w in re.findall(r"[a-z0-9]+", text.lower()) if w not in _STOP_WORDS)
+
+
+class _BM25Index:
+    """Incremental inverted index (term -> {entry_id: term frequency}) with BM25 scoring.
+
+    Query cost is proportional to the postings of the query terms, not to the
+    number of indexed entries.
+    """
+
+    K1 = 1.5
+    B = 0.75
+
+    def __init__(self) -> None:
+        self._postings: dict[str, dict[str, int]] = {}
+        self._doc_terms: dict[str, Counter[str]] = {}
+        self._doc_lengths: dict[str, int] = {}
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._doc_lengths)
+
+    def add(self, entry: MemoryEntry) -> None:
+        """Index (or re-index) an entry's content and header."""
+        self.remove(entry.id)
+        terms = _term_counts(entry.content)
+        header = entry.metadata.get("header", "")
+        if header:
+            terms.update(_term_counts(header))
+        for term, tf in terms.items():
+            self._postings.setdefault(term, {})[entry.id] = tf
+        length = sum(terms.values())
+        self._doc_terms[entry.id] = terms
+        self._doc_lengths[entry.id] = length
+        self._total_length += length
+
+    def remove(self, entry_id: str) -> None:
+        """Drop an entry's postings."""
+        terms = self._doc_terms.pop(entry_id, None)
+        if terms is None:
+            return
+        for term in terms:
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            postings.pop(entry_id, None)
+            if not postings:
+                del self._postings[term]
+        self._total_length -= self._doc_lengths.pop(entry_id, 0)
+
+    def score(self, query_terms: set[str]) -> dict[str, float]:
+        """Return BM25 scores for every entry matching at least one query term."""
+        n_docs = len(self._doc_lengths)
+        if not n_docs:
+            return {}
+        avg_len = self._total_length / n_docs or 1.0
+        scores: dict[str, float] = {}
+        for term in query_terms:
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            df = len(postings)
+            idf = math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+            for entry_id, tf in postings.items():
+                norm = self.K1 * (1 - self.B + self.B * self._doc_lengths[entry_id] / avg_len)
+                scores[entry_id] = scores.get(entry_id, 0.0) + idf * tf * (self.K1 + 1) / (
+                    tf + norm
+                )
+        return scores
+
+
 class FileMemoryStore:
     """
     File-based memory store.
 
     Human-readable markdown for long-term and daily memories.
-    JSON for session memories (machine-readable).
+    Append-only JSONL logs for session memories (machine-readable). Legacy
+    ``<key>.json`` array files are migrated to ``<key>.jsonl`` on first write.
     """
 
-    def __init__(self, base_path: Path | None = None):
+    def __init__(
+        self,
+        base_path: Path | None = None,
+        session_index_flush_delay: float = _SESSION_INDEX_FLUSH_DELAY,
+        daily_horizon_days: int | None = _DAILY_HORIZON_DAYS,
+    ):
         self.base_path = base_path or (Path.home() / ".pocketpaw" / "memory")
         self.base_path.mkdir(parents=True, exist_ok=True)
 
@@ -172,13 +379,30 @@ class FileMemoryStore:
 
         # In-memory index for fast lookup
         self._index: dict[str, MemoryEntry] = {}
+        self._search_index = _BM25Index()
+        # source markdown path -> entry ids in file order (dict used as ordered set)
+        self._entries_by_source: dict[str, dict[str, None]] = {}
+
+        # Markdown parse cache + daily files deferred until a query needs them
+        self._daily_horizon_days = daily_horizon_days
+        self._deferred_daily_files: list[Path] = []
+        self._parse_cache: dict[str, dict] = {}
+        self._parse_cache_dirty = False
         self._session_write_locks: dict[str, asyncio.Lock] = {}
-        self._session_index_lock = asyncio.Lock()  # Protects _index.json read-modify-write
+        self._session_append_counts: dict[str, int] = {}
+        # Session index lives in memory; _index.json is flushed on a debounce timer
+        self._session_index: dict | None = None
+        self._session_index_dirty = False
+        self._session_index_flush_delay = session_index_flush_delay
+        self._session_index_flush_handle: asyncio.TimerHandle | None = None
+        self._session_index_flush_task: asyncio.Task | None = None
+        self._session_index_flush_lock = asyncio.Lock()
         self._alias_lock = asyncio.Lock()  # Protects _aliases.json read-modify-write
         self._load_index()
 
-        # Build session index on first run (migration)
-        if not self._index_path.exists():
+        # Build session index on first run (migration), or recover it if the
+        # previous process died with unflushed index updates
+        if not self._index_path.exists() or self._dirty_marker_path.exists():
             self.rebuild_session_index()
 
     # =========================================================================
@@ -190,7 +414,12 @@ class FileMemoryStore:
         """Path to the session index file."""
         return self.sessions_path / "_index.json"
 
-    def _load_session_index(self) -> dict:
+    @property
+    def _dirty_marker_path(self) -> Path:
+        """Marker file that exists while the on-disk index is behind memory."""
+        return self.sessions_path / "_index.dirty"
+
+    def _read_session_index_file(self) -> dict:
         """Read session index from disk. Returns empty dict if missing/corrupt."""
         if not self._index_path.exists():
             return {}
@@ -199,12 +428,92 @@ class FileMemoryStore:
         except (json.JSONDecodeError, OSError):
             return {}
 
-    def _save_session_index(self, index: dict) -> None:
-        """Atomic write of session index (write to .tmp then rename)."""
+    def _write_session_index_file(self, payload: str) -> None:
+        """Atomic write of serialized session index (write to .tmp then rename)."""
         tmp = self._index_path.with_suffix(".tmp")
-        tmp.write_text(json.dumps(index, indent=2), encoding="utf-8")
+        tmp.write_text(payload, encoding="utf-8")
         tmp.replace(self._index_path)
 
+    def _load_session_index(self) -> dict:
+        """Return the resident session index, loading it from disk on first use."""
+        if self._session_index is None:
+            self._session_index = self._read_session_index_file()
+        return self._session_index
+
+    def _save_session_index(self, index: dict) -> None:
+        """Replace the resident session index and write it through to disk."""
+        self._session_index = index
+        self._cancel_session_index_flush()
+        self._write_session_index_file(json.dumps(index, indent=2))
+        self._session_index_dirty = False
+        self._dirty_marker_path.unlink(missing_ok=True)
+
+    def _mark_session_index_dirty(self) -> None:
+        """Record an in-memory index change and schedule a debounced flush."""
+        if not self._session_index_dirty:
+            self._session_index_dirty = True
+            self._dirty_marker_path.touch()
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop (sync caller) — nothing to debounce against
+            self.flush_session_index()
+            return
+
+        if self._session_index_flush_handle is None:
+            self._session_index_flush_handle = loop.call_later(
+                self._session_index_flush_delay, self._start_session_index_flush
+            )
+
+    def _start_session_index_flush(self) -> None:
+        """Timer callback: run the flush as a task that is kept until it finishes."""
+        task = asyncio.ensure_future(self._flush_session_index_async())
+        self._session_index_flush_task = task
+        task.add_done_callback(self._session_index_flush_done)
+
+    def _session_index_flush_done(self, task: asyncio.Task) -> None:
+        if self._session_index_flush_task is task:
+            self._session_index_flush_task = None
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("Failed to flush session index: %s", task.exception())
+
+    def _cancel_session_index_flush(self) -> None:
+        if self._session_index_flush_handle is not None:
+            self._session_index_flush_handle.cancel()
+            self._session_index_flush_handle = None
+
+    async def _flush_session_index_async(self) -> None:
+        """Timer callback: snapshot the index on the loop, write it off-loop."""
+        self._session_index_flush_handle = None
+        async with self._session_index_flush_lock:
+            if not self._session_index_dirty:
+                return
+            payload = json.dumps(self._load_session_index(), indent=2)
+            self._session_index_dirty = False
+            try:
+                await asyncio.to_thread(self._write_session_index_file, payload)
+            except OSError as e:
+                # The dirty marker stays, so the next flush or startup repairs it
+                logger.warning("Failed to write session index: %s", e)
+                self._session_index_dirty = True
+                return
+            if not self._session_index_dirty:
+                self._dirty_marker_path.unlink(missing_ok=True)
+
+    def flush_session_index(self) -> None:
+        """Write pending session index changes to disk immediately."""
+        self._cancel_session_index_flush()
+        if not self._session_index_dirty:
+            return
+        self._write_session_index_file(json.dumps(self._load_session_index(), indent=2))
+        self._session_index_dirty = False
+        self._dirty_marker_path.unlink(missing_ok=True)
+
+    async def close(self) -> None:
+        """Flush buffered state before shutdown."""
+        self.flush_session_index()
+
     # =========================================================================
     # Session Aliases
     # =========================================================================
@@ -270,73 +579,101 @@ class FileMemoryStore:
                 keys.append(tgt)
 
         # Also include the source_key itself (the default/unaliased session)
-        safe_default = source_key.replace(":", "_").replace("/", "_")
-        default_file = self.sessions_path / f"{safe_default}.json"
-        if default_file.exists() and source_key not in keys:
+        if self._session_exists(source_key) and source_key not in keys:
             keys.append(source_key)
 
         return keys
 
     async def _update_session_index(
-        self, session_key: str, entry: MemoryEntry, session_data: list[dict]
+        self, session_key: str, entry: MemoryEntry, session_data: list[dict] | None = None
     ) -> None:
-        """Update a single entry in the session index after a message save."""
-        async with self._session_index_lock:
-            index = self._load_session_index()
-            safe_key = session_key.replace(":", "_").replace("/", "_")
-
-            # Extract channel from session_key (format: "channel:uuid")
-            parts = session_key.split(":", 1)
-            channel = parts[0] if len(parts) > 1 else "unknown"
-
-            # Find first user message for title
-            title = ""
-            for msg in session_data:
-                if msg.get("role") == "user" and msg.get("content", "").strip():
-                    title = msg["content"].strip()[:80]
-                    break
-            if not title:
-                title = "New Chat"
+        """Update a single entry in the session index after a message save.
 
-            # Last message preview
-            last_msg = session_data[-1] if session_data else {}
-            preview = last_msg.get("content", "")[:120]
-
-            # Timestamps
-            first_msg = session_data[0] if session_data else {}
-            created = first_msg.get("timestamp", datetime.now(tz=UTC).isoformat())
-            last_activity = last_msg.get("timestamp", datetime.now(tz=UTC).isoformat())
-
-            # Preserve existing title if user renamed it
-            existing = index.get(safe_key, {})
-            if existing.get("user_title"):
-                title = existing["user_title"]
-
-            index[safe_key] = {
-                "title": title,
-                "channel": channel,
-                "created": existing.get("created", created),
-                "last_activity": last_activity,
-                "message_count": len(session_data),
-                "preview": preview,
-            }
-            # Preserve user_title flag if set
-            if existing.get("user_title"):
-                index[safe_key]["user_title"] = existing["user_title"]
+        When ``session_data`` is omitted the existing index entry is updated
+        incrementally from ``entry`` so the hot path never re-reads the log.
+        The change is made in memory and flushed to ``_index.json`` later.
+        """
+        index = self._load_session_index()
+        safe_key = session_key.replace(":", "_").replace("/", "_")
+        existing = index.get(safe_key, {})
 
-            self._save_session_index(index)
+        if session_data is None and existing:
+            index[safe_key] = self._advance_session_meta(existing, entry)
+            self._mark_session_index_dirty()
+            return
+        if session_data is None:
+            session_data = self._read_session_records(session_key)
+
+        # Extract channel from session_key (format: "channel:uuid")
+        parts = session_key.split(":", 1)
+        channel = parts[0] if len(parts) > 1 else "unknown"
+
+        # Find first user message for title
+        title = ""
+        for msg in session_data:
+            if msg.get("role") == "user" and msg.get("content", "").strip():
+                title = msg["content"].strip()[:80]
+                break
+        if not title:
+            title = "New Chat"
+
+        # Last message preview
+        last_msg = session_data[-1] if session_data else {}
+        preview = last_msg.get("content", "")[:120]
+
+        # Timestamps
+        first_msg = session_data[0] if session_data else {}
+        created = first_msg.get("timestamp", datetime.now(tz=UTC).isoformat())
+        last_activity = last_msg.get("timestamp", datetime.now(tz=UTC).isoformat())
+
+        # Preserve existing title if user renamed it
+        if existing.get("user_title"):
+            title = existing["user_title"]
+
+        index[safe_key] = {
+            "title": title,
+            "channel": channel,
+            "created": existing.get("created", created),
+            "last_activity": last_activity,
+            "message_count": len(session_data),
+            "preview": preview,
+        }
+        # Preserve user_title flag if set
+        if existing.get("user_title"):
+            index[safe_key]["user_title"] = existing["user_title"]
+
+        self._mark_session_index_dirty()
+
+    @staticmethod
+    def _advance_session_meta(existing: dict, entry: MemoryEntry) -> dict:
+        """Return index metadata for a session after appending ``entry``."""
+        meta = dict(existing)
+        content = entry.content or ""
+        if (
+            not meta.get("user_title")
+            and meta.get("title", "New Chat") == "New Chat"
+            and entry.role == "user"
+            and content.strip()
+        ):
+            meta["title"] = content.strip()[:80]
+        meta["last_activity"] = entry.created_at.isoformat()
+        meta["message_count"] = meta.get("message_count", 0) + 1
+        meta["preview"] = content[:120]
+        return meta
 
     def rebuild_session_index(self) -> dict:
-        """Full directory scan to build index from all session files."""
-        index: dict = {}
-        for session_file in self.sessions_path.glob("*.json"):
-            if session_file.name.startswith("_") or session_file.name.endswith("_compaction.json"):
-                continue
+        """Full directory scan to build index from all session files.
 
+        User-assigned titles from the previous index are carried over, so this
+        doubles as crash recovery when ``_index.json`` missed unflushed updates.
+        """
+        previous = self._read_session_index_file()
+        index: dict = {}
+        for session_file in self._list_session_files():
             safe_key = session_file.stem
             try:
-                data = json.loads(session_file.read_text(encoding="utf-8"))
-                if not data or not isinstance(data, list):
+                data = read_session_file(session_file)
+                if not data:
                     continue
 
                 # Derive channel from safe_key (format: "channel_uuid")
@@ -361,6 +698,10 @@ class FileMemoryStore:
                     "message_count": len(data),
                     "preview": last_msg.get("content", "")[:120],
                 }
+                user_title = previous.get(safe_key, {}).get("user_title")
+                if user_title:
+                    index[safe_key]["title"] = user_title
+                    index[safe_key]["user_title"] = user_title
             except (json.JSONDecodeError, KeyError, OSError):
                 continue
 
@@ -370,60 +711,168 @@ class FileMemoryStore:
     async def delete_session(self, session_key: str) -> bool:
         """Delete a session file, compaction cache, and index entry."""
         safe_key = session_key.replace(":", "_").replace("/", "_")
-        session_file = self.sessions_path / f"{safe_key}.json"
+        session_files = [
+            f
+            for f in (self._get_session_file(safe_key), self._get_legacy_session_file(safe_key))
+            if f.exists()
+        ]
         compaction_file = self.sessions_path / f"{safe_key}_compaction.json"
 
-        if not session_file.exists():
+        if not session_files:
             return False
 
-        session_file.unlink()
+        for session_file in session_files:
+            session_file.unlink()
         if compaction_file.exists():
             compaction_file.unlink()
 
-        # Remove from index (protected by lock to prevent lost updates)
-        async with self._session_index_lock:
-            index = self._load_session_index()
-            index.pop(safe_key, None)
-            self._save_session_index(index)
+        # Remove from the resident index; flushed with the next batch
+        if self._load_session_index().pop(safe_key, None) is not None:
+            self._mark_session_index_dirty()
 
         # Clean up write lock
         self._session_write_locks.pop(session_key, None)
+        self._session_append_counts.pop(session_key, None)
 
         return True
 
     async def update_session_title(self, session_key: str, title: str) -> bool:
         """Update the title of a session in the index."""
         safe_key = session_key.replace(":", "_").replace("/", "_")
-        async with self._session_index_lock:
-            index = self._load_session_index()
-            if safe_key not in index:
-                return False
-            index[safe_key]["title"] = title
-            index[safe_key]["user_title"] = title  # Mark as user-renamed
-            self._save_session_index(index)
+        index = self._load_session_index()
+        if safe_key not in index:
+            return False
+        index[safe_key]["title"] = title
+        index[safe_key]["user_title"] = title  # Mark as user-renamed
+        self._mark_session_index_dirty()
         return True
 
+    @property
+    def _parse_cache_path(self) -> Path:
+        """Path to the persisted markdown parse cache."""
+        return self.base_path / "_parse_cache.json"
+
+    def _load_parse_cache(self) -> dict[str, dict]:
+        """Read the parse cache from disk. Returns empty dict if missing/corrupt/stale."""
+        if not self._parse_cache_path.exists():
+            return {}
+        try:
+            data = json.loads(self._parse_cache_path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != _PARSE_CACHE_VERSION:
+            return {}
+        return data.get("files", {})
+
+    def _save_parse_cache(self) -> None:
+        """Atomic write of the parse cache, if anything changed."""
+        if not self._parse_cache_dirty:
+            return
+        payload = {"version": _PARSE_CACHE_VERSION, "files": self._parse_cache}
+        tmp = self._parse_cache_path.with_suffix(".tmp")
+        try:
+            tmp.write_text(json.dumps(payload), encoding="utf-8")
+            tmp.replace(self._parse_cache_path)
+        except OSError:
+            return
+        self._parse_cache_dirty = False
+
     def _load_index(self) -> None:
-        """Load existing memories into index."""
+        """Load existing memories into index.
+
+        Long-term files and daily files within the horizon are indexed now;
+        older daily files are deferred until a query needs them.
+        """
+        self._parse_cache = self._load_parse_cache()
+        self._deferred_daily_files = []
+        known_files: set[str] = set()
+
         # Load long-term memories (root = owner/default)
         if self.long_term_file.exists():
+            known_files.add(str(self.long_term_file))
             self._parse_markdown_file(self.long_term_file, MemoryType.LONG_TERM)
 
         # Load per-user long-term memories
         users_dir = self.base_path / "users"
         if users_dir.exists():
             for user_mem in users_dir.glob("*/MEMORY.md"):
+                known_files.add(str(user_mem))
                 self._parse_markdown_file(user_mem, MemoryType.LONG_TERM)
 
-        # Load ALL daily files (not just today's)
+        # Daily files: recent ones now, older ones on demand
+        cutoff = None
+        if self._daily_horizon_days is not None:
+            cutoff = date.fromordinal(date.today().toordinal() - self._daily_horizon_days)
         for daily_file in sorted(
             self.base_path.glob("[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9].md")
         ):
-            self._parse_markdown_file(daily_file, MemoryType.DAILY)
+            known_files.add(str(daily_file))
+            try:
+                file_date = date.fromisoformat(daily_file.stem)
+            except ValueError:
+                file_date = None
+            if cutoff is not None and file_date is not None and file_date < cutoff:
+                self._deferred_daily_files.append(daily_file)
+            else:
+                self._parse_markdown_file(daily_file, MemoryType.DAILY)
+
+        # Forget cache entries for files that no longer exist
+        for stale in set(self._parse_cache) - known_files:
+            del self._parse_cache[stale]
+            self._parse_cache_dirty = True
+        self._save_parse_cache()
+
+    def _ensure_daily_loaded(self) -> None:
+        """Index any daily files deferred at startup."""
+        if not self._deferred_daily_files:
+            return
+        deferred, self._deferred_daily_files = self._deferred_daily_files, []
+        for daily_file in deferred:
+            if daily_file.exists():
+                self._parse_markdown_file(daily_file, MemoryType.DAILY)
+        self._save_parse_cache()
+
+        # Deferred files predate every loaded daily file: move their entries
+        # ahead of the first one so _index is in the same order as a full load
+        old_ids = {
+            entry_id
+            for daily_file in deferred
+            for entry_id in self._entries_by_source.get(str(daily_file), {})
+        }
+        if not old_ids:
+            return
+        old = {entry_id: self._index[entry_id] for entry_id in self._index if entry_id in old_ids}
+        reordered: dict[str, MemoryEntry] = {}
+        for entry_id, entry in self._index.items():
+            if entry_id in old_ids:
+                continue
+            if old and entry.type == MemoryType.DAILY:
+                reordered.update(old)
+                old = {}
+            reordered[entry_id] = entry
+        reordered.update(old)
+        self._index.clear()
+        self._index.update(reordered)
 
     def _parse_markdown_file(self, path: Path, memory_type: MemoryType) -> None:
-        """Parse a markdown file into memory entries."""
-        content = path.read_text(encoding="utf-8")
+        """Parse a markdown file into memory entries.
+
+        Sections are served from the parse cache when the file's mtime and
+        size are unchanged since it was last parsed.
+        """
+        key = str(path)
+        stat = path.stat()
+        cached = self._parse_cache.get(key)
+        if cached and cached["mtime_ns"] == stat.st_mtime_ns and cached["size"] == stat.st_size:
+            sections = cached["sections"]
+        else:
+            sections = self._split_markdown_sections(path)
+            self._parse_cache[key] = {
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "sections": sections,
+            }
+            self._parse_cache_dirty = True
 
         # Derive user_id from path for per-user memory files
         user_id = "default"
@@ -435,10 +884,27 @@ class FileMemoryStore:
         except (TypeError, ValueError):
             pass
 
-        # Split by headers (## or ###)
-        sections = re.split(r"\n(?=##+ )", content)
+        for entry_id, header, body, tags in sections:
+            metadata = {"header": header, "source": key}
+            if user_id != "default":
+                metadata["user_id"] = user_id
+            self._add_to_index(
+                MemoryEntry(
+                    id=entry_id,
+                    type=memory_type,
+                    content=body,
+                    tags=list(tags),
+                    metadata=metadata,
+                )
+            )
 
-        for section in sections:
+    def _split_markdown_sections(self, path: Path) -> list[list]:
+        """Split a markdown file into [entry_id, header, body, tags] sections."""
+        content = path.read_text(encoding="utf-8")
+        result: list[list] = []
+
+        # Split by headers (## or ###)
+        for section in re.split(r"\n(?=##+ )", content):
             if not section.strip():
                 continue
 
@@ -449,16 +915,29 @@ class FileMemoryStore:
 
             if body:
                 entry_id = _make_deterministic_id(path, header, body)
-                metadata = {"header": header, "source": str(path)}
-                if user_id != "default":
-                    metadata["user_id"] = user_id
-                self._index[entry_id] = MemoryEntry(
-                    id=entry_id,
-                    type=memory_type,
-                    content=body,
-                    tags=self._extract_tags(body),
-                    metadata=metadata,
-                )
+                result.append([entry_id, header, body, self._extract_tags(body)])
+        return result
+
+    def _add_to_index(self, entry: MemoryEntry) -> None:
+        """Register an entry in the id, search and per-source indexes."""
+        self._index[entry.id] = entry
+        self._search_index.add(entry)
+        source = entry.metadata.get("source")
+        if source:
+            self._entries_by_source.setdefault(source, {})[entry.id] = None
+
+    def _remove_from_index(self, entry_id: str) -> MemoryEntry | None:
+        """Drop an entry from the id, search and per-source indexes."""
+        self._search_index.remove(entry_id)
+        entry = self._index.pop(entry_id, None)
+        if entry is not None:
+            source = entry.metadata.get("source")
+            ids = self._entries_by_source.get(source) if source else None
+            if ids is not None:
+                ids.pop(entry_id, None)
+                if not ids:
+                    del self._entries_by_source[source]
+        return entry
 
     def _extract_tags(self, content: str) -> list[str]:
         """Extract #tags from content."""
@@ -481,10 +960,79 @@ class FileMemoryStore:
         return self.base_path / f"{d.isoformat()}.md"
 
     def _get_session_file(self, session_key: str) -> Path:
-        """Get the path for a session file."""
+        """Get the path for a session's append-only JSONL log."""
+        safe_key = session_key.replace(":", "_").replace("/", "_")
+        return self.sessions_path / f"{safe_key}.jsonl"
+
+    def _get_legacy_session_file(self, session_key: str) -> Path:
+        """Get the path for a pre-JSONL session file (a single JSON array)."""
         safe_key = session_key.replace(":", "_").replace("/", "_")
         return self.sessions_path / f"{safe_key}.json"
 
+    def _session_exists(self, session_key: str) -> bool:
+        """Check whether a session has history in either on-disk format."""
+        return (
+            self._get_session_file(session_key).exists()
+            or self._get_legacy_session_file(session_key).exists()
+        )
+
+    def _list_session_files(self) -> list[Path]:
+        """List session history files (JSONL logs and legacy JSON arrays)."""
+        files: list[Path] = []
+        for pattern in ("*.jsonl", "*.json"):
+            for session_file in self.sessions_path.glob(pattern):
+                if session_file.name.startswith("_") or session_file.name.endswith(
+                    "_compaction.json"
+                ):
+                    continue
+                files.append(session_file)
+        return files
+
+    def _read_session_records(self, session_key: str) -> list[dict]:
+        """Read all records for a session, preferring the JSONL log."""
+        log_file = self._get_session_file(session_key)
+        if log_file.exists():
+            return _read_session_log(log_file)[0]
+        legacy_file = self._get_legacy_session_file(session_key)
+        if legacy_file.exists():
+            try:
+                return read_session_file(legacy_file)
+            except (json.JSONDecodeError, OSError):
+                return []
+        return []
+
+    def _migrate_legacy_session(self, session_key: str) -> list[dict] | None:
+        """Convert a legacy ``<key>.json`` array into a JSONL log.
+
+        Returns the migrated records, or None when there was nothing to migrate.
+        """
+        legacy_file = self._get_legacy_session_file(session_key)
+        if not legacy_file.exists():
+            return None
+        try:
+            records = read_session_file(legacy_file)
+        except (json.JSONDecodeError, OSError):
+            records = []
+        log_file = self._get_session_file(session_key)
+        if log_file.exists():
+            records.extend(_read_session_log(log_file)[0])
+        _write_session_log(log_file, records)
+        legacy_file.unlink()
+        return records
+
+    def _compact_session_log(self, session_key: str) -> None:
+        """Rewrite a session log, dropping torn lines and collapsing duplicate ids."""
+        log_file = self._get_session_file(session_key)
+        if not log_file.exists():
+            return
+        records, clean = _read_session_log(log_file)
+        by_id: dict[str, dict] = {}
+        for record in records:
+            by_id[record.get("id") or str(uuid.uuid4())] = record
+        if clean and len(by_id) == len(records):
+            return
+        _write_session_log(log_file, list(by_id.values()))
+
     # =========================================================================
     # MemoryStoreProtocol Implementation
     # =========================================================================
@@ -496,7 +1044,7 @@ class FileMemoryStore:
             if not entry.id:
                 entry.id = str(uuid.uuid4())
             entry.updated_at = datetime.now(tz=UTC)
-            self._index[entry.id] = entry
+            self._add_to_index(entry)
             await self._save_session_entry(entry)
             return entry.id
 
@@ -517,7 +1065,7 @@ class FileMemoryStore:
         entry.id = det_id
         entry.metadata["source"] = str(target_path)
         entry.updated_at = datetime.now(tz=UTC)
-        self._index[entry.id] = entry
+        self._add_to_index(entry)
 
         # Persist to markdown
         await self._append_to_markdown(target_path, entry)
@@ -537,67 +1085,84 @@ class FileMemoryStore:
             f.write(section)
 
     async def _save_session_entry(self, entry: MemoryEntry) -> None:
-        """Save a session memory entry."""
+        """Append a session memory entry to its JSONL log."""
         if not entry.session_key:
             return
 
-        # Per-session lock to prevent concurrent read-modify-write corruption
+        # Per-session lock keeps appends, migration and compaction ordered
         if entry.session_key not in self._session_write_locks:
             self._session_write_locks[entry.session_key] = asyncio.Lock()
 
         async with self._session_write_locks[entry.session_key]:
-            session_file = self._get_session_file(entry.session_key)
+            session_key = entry.session_key
+            session_file = self._get_session_file(session_key)
+            record = _session_record(entry)
 
             # Run blocking file I/O in a thread to avoid freezing the event loop
-            def _read_and_append():
-                session_data = []
-                if session_file.exists():
-                    try:
-                        session_data = json.loads(session_file.read_text())
-                    except json.JSONDecodeError:
-                        pass
-                session_data.append(
-                    {
-                        "id": entry.id,
-                        "role": entry.role,
-                        "content": entry.content,
-                        "timestamp": entry.created_at.isoformat(),
-                        "metadata": entry.metadata,
-                    }
-                )
-                # Atomic write: tmp file + replace to prevent corruption on crash
-                tmp = session_file.with_suffix(".tmp")
-                tmp.write_text(json.dumps(session_data, indent=2))
-                tmp.replace(session_file)
-                return session_data
-
-            session_data = await asyncio.to_thread(_read_and_append)
+            def _append():
+                migrated = self._migrate_legacy_session(session_key)
+                line = (json.dumps(record) + "\n").encode("utf-8")
+                with open(session_file, "a+b") as f:
+                    # Start on a fresh line if a crash left a torn record behind
+                    f.seek(0, 2)
+                    if f.tell() > 0:
+                        f.seek(-1, 2)
+                        if f.read(1) != b"\n":
+                            line = b"\n" + line
+                    f.write(line)
+
+                count = self._session_append_counts.get(session_key, 0) + 1
+                if count >= _SESSION_COMPACT_EVERY:
+                    self._compact_session_log(session_key)
+                    count = 0
+                self._session_append_counts[session_key] = count
+
+                return migrated + [record] if migrated is not None else None
+
+            session_data = await asyncio.to_thread(_append)
 
             # Update session index
-            await self._update_session_index(entry.session_key, entry, session_data)
+            await self._update_session_index(session_key, entry, session_data)
 
     async def get(self, entry_id: str) -> MemoryEntry | None:
         """Get a memory entry by ID."""
+        if entry_id not in self._index:
+            self._ensure_daily_loaded()
         return self._index.get(entry_id)
 
     async def delete(self, entry_id: str) -> bool:
         """Delete a memory entry and rewrite source file."""
-        if entry_id not in self._index:
-            return False
+        return await self.delete_many([entry_id]) == 1
 
-        entry = self._index.pop(entry_id)
+    async def delete_many(self, entry_ids: list[str]) -> int:
+        """Delete several memory entries, rewriting each affected file once.
 
-        # Rewrite the source markdown file without this entry
-        source = entry.metadata.get("source")
-        if source:
+        Returns the number of entries that existed and were deleted.
+        """
+        if any(entry_id not in self._index for entry_id in entry_ids):
+            self._ensure_daily_loaded()
+
+        deleted = 0
+        affected_sources: dict[str, None] = {}
+        for entry_id in entry_ids:
+            entry = self._remove_from_index(entry_id)
+            if entry is None:
+                continue
+            deleted += 1
+            source = entry.metadata.get("source")
+            if source:
+                affected_sources[source] = None
+
+        # Rewrite each source markdown file without the deleted entries
+        for source in affected_sources:
             self._rewrite_markdown(Path(source))
 
-        return True
+        return deleted
 
     def _rewrite_markdown(self, path: Path) -> None:
         """Reconstruct a markdown file from remaining index entries for that file."""
-        source_str = str(path)
-        entries = [e for e in self._index.values() if e.metadata.get("source") == source_str]
+        entry_ids = self._entries_by_source.get(str(path), {})
+        entries = [self._index[entry_id] for entry_id in entry_ids]
 
         if not entries:
             # No entries left — remove file
@@ -623,35 +1188,46 @@ class FileMemoryStore:
         tags: list[str] | None = None,
         limit: int = 10,
     ) -> list[MemoryEntry]:
-        """Search memories using word-overlap scoring."""
-        candidates: list[tuple[float, MemoryEntry]] = []
-        query_words = _tokenize(query) if query else set()
+        """Search memories, ranking query matches with BM25 over the inverted index.
 
-        for entry in self._index.values():
-            # Type filter
-            if memory_type and entry.type != memory_type:
-                continue
+        Daily files beyond the load horizon are only parsed when the loaded
+        entries can't fill ``limit``.
+        """
 
-            # Tag filter
+        def _matches(entry: MemoryEntry) -> bool:
+            if memory_type and entry.type != memory_type:
+                return False
             if tags and not any(t in entry.tags for t in tags):
-                continue
+                return False
+            return True
 
-            # Query filter: word-overlap scoring
-            if query_words:
-                content_words = _tokenize(entry.content)
-                # Also include header in searchable text
-                header = entry.metadata.get("header", "")
-                if header:
-                    content_words |= _tokenize(header)
+        may_defer = memory_type in (None, MemoryType.DAILY)
+        query_words = _tokenize(query) if query else set()
+        if not query_words:
+            # Index order: deferred entries precede the first loaded daily one
+            results: list[MemoryEntry] = []
+            for entry in self._index.values():
+                if entry.type == MemoryType.DAILY and may_defer and self._deferred_daily_files:
+                    self._ensure_daily_loaded()
+                    return await self.search(query, memory_type, tags, limit)
+                if _matches(entry):
+                    results.append(entry)
+                    if len(results) >= limit:
+                        break
+            if len(results) < limit and may_defer and self._deferred_daily_files:
+                self._ensure_daily_loaded()
+                return await self.search(query, memory_type, tags, limit)
+            return results
 
-                overlap = query_words & content_words
-                if not overlap:
-                    continue
-                score = len(overlap) / len(query_words)
-            else:
-                score = 0.0
+        candidates: list[tuple[float, MemoryEntry]] = []
+        for entry_id, score in self._search_index.score(query_words).items():
+            entry = self._index.get(entry_id)
+            if entry is not None and _matches(entry):
+                candidates.append((score, entry))
 
-            candidates.append((score, entry))
+        if len(candidates) < limit and may_defer and self._deferred_daily_files:
+            self._ensure_daily_loaded()
+            return await self.search(query, memory_type, tags, limit)
 
         # Sort by score descending
         candidates.sort(key=lambda x: x[0], reverse=True)
@@ -664,61 +1240,125 @@ class FileMemoryStore:
         """Get all memories of a specific type.
 
         For LONG_TERM type, accepts optional user_id kwarg to scope retrieval.
+        DAILY returns the newest ``limit`` entries in chronological order;
+        daily files beyond the load horizon are only parsed when recent ones
+        don't fill ``limit``.
         """
         user_id = kwargs.get("user_id")
-        results = []
-        for e in self._index.values():
-            if e.type != memory_type:
-                continue
-            # Scope LONG_TERM to user_id if provided
-            if user_id and memory_type == MemoryType.LONG_TERM:
-                entry_uid = e.metadata.get("user_id", "default")
-                if entry_uid != user_id:
+        newest_first = memory_type == MemoryType.DAILY
+
+        def _collect() -> list[MemoryEntry]:
+            results = []
+            entries = self._index.values()
+            for e in reversed(entries) if newest_first else entries:
+                if e.type != memory_type:
                     continue
-            results.append(e)
-            if len(results) >= limit:
-                break
+                # Scope LONG_TERM to user_id if provided
+                if user_id and memory_type == MemoryType.LONG_TERM:
+                    entry_uid = e.metadata.get("user_id", "default")
+                    if entry_uid != user_id:
+                        continue
+                results.append(e)
+                if len(results) >= limit:
+                    break
+            return results
+
+        results = _collect()
+        if memory_type == MemoryType.DAILY and len(results) < limit and self._deferred_daily_files:
+            self._ensure_daily_loaded()
+            results = _collect()
+        if newest_first:
+            results.reverse()
         return results
 
     async def get_session(self, session_key: str) -> list[MemoryEntry]:
         """Get session history."""
-        session_file = self._get_session_file(session_key)
-
-        if not session_file.exists():
+        if not self._session_exists(session_key):
             return []
 
         try:
-            raw = await asyncio.to_thread(session_file.read_text)
-            data = json.loads(raw)
-            return [
-                MemoryEntry(
-                    id=item["id"],
-                    type=MemoryType.SESSION,
-                    content=item["content"],
-                    role=item.get("role"),
-                    session_key=session_key,
-                    created_at=_ensure_utc(datetime.fromisoformat(item["timestamp"])),
-                    metadata=item.get("metadata", {}),
-                )
-                for item in data
-            ]
-        except (json.JSONDecodeError, KeyError):
+            data = await asyncio.to_thread(self._read_session_records, session_key)
+            return [_session_entry_from_record(session_key, item) for item in data]
+        except (KeyError, ValueError, OSError):
             return []
 
+    async def get_session_since(
+        self, session_key: str, cursor: list[int] | None = None
+    ) -> tuple[list[MemoryEntry], list[int] | None] | None:
+        """Read session entries appended after ``cursor``.
+
+        ``cursor`` is the opaque value returned by a previous call (None reads
+        from the start). Returns ``(entries, new_cursor)``, or None when the
+        cursor no longer applies — the log was cleared, migrated or compacted,
+        or the session is still in the legacy JSON format — in which case the
+        caller should fall back to a full read. Besides the file identity the
+        cursor holds the id of the last record read, which must still end at
+        the cursor offset (a recreated log can reuse the inode).
+        """
+        log_file = self._get_session_file(session_key)
+
+        def _read_tail():
+            try:
+                f = open(log_file, "rb")
+            except FileNotFoundError:
+                if cursor is not None or self._get_legacy_session_file(session_key).exists():
+                    return None
+                return [], None
+            with f:
+                stat = os.fstat(f.fileno())
+                offset, last_id = 0, None
+                if cursor is not None:
+                    inode, offset, last_id = cursor
+                    if inode != stat.st_ino or offset > stat.st_size:
+                        return None
+                    if offset and _record_id(_line_ending_at(f, offset)) != last_id:
+                        return None
+                f.seek(offset)
+                data = f.read()
+            # Only consume complete lines; a write may be in progress
+            end = data.rfind(b"\n") + 1
+            records = []
+            for line in data[:end].splitlines():
+                try:
+                    record = json.loads(line)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    continue
+                if isinstance(record, dict):
+                    records.append(record)
+            if end:
+                last_id = _record_id(data[: end - 1].rsplit(b"\n", 1)[-1])
+            return records, [stat.st_ino, offset + end, last_id]
+
+        try:
+            result = await asyncio.to_thread(_read_tail)
+            if result is None:
+                return None
+            records, new_cursor = result
+            return [_session_entry_from_record(session_key, r) for r in records], new_cursor
+        except (KeyError, ValueError, OSError):
+            return None
+
     async def clear_session(self, session_key: str) -> int:
-        """Clear session history."""
-        session_file = self._get_session_file(session_key)
+        """Clear session history (and the compaction cache derived from it)."""
+        safe_key = session_key.replace(":", "_").replace("/", "_")
+        session_files = [
+            self._get_session_file(session_key),
+            self._get_legacy_session_file(session_key),
+        ]
+        compaction_file = self.sessions_path / f"{safe_key}_compaction.json"
 
         def _clear():
-            if session_file.exists():
+            count = 0
+            for session_file in session_files:
+                if not session_file.exists():
+                    continue
                 try:
-                    data = json.loads(session_file.read_text())
-                    count = len(data)
-                    session_file.unlink()
-                    return count
-                except json.JSONDecodeError:
-                    session_file.unlink()
-                    return 0
-            return 0
-
+                    count += len(read_session_file(session_file))
+                except (json.JSONDecodeError, OSError):
+                    pass
+                session_file.unlink()
+            compaction_file.unlink(missing_ok=True)
+            return count
+
+        self._session_append_counts.pop(session_key, None)
         return await asyncio.to_thread(_clear)
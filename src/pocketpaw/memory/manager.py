@@ -3,18 +3,38 @@
 # Updated: 2026-02-04 - Added Mem0 backend support
 # Updated: 2026-02-07 - Configurable providers, auto-learn, semantic context - Memory System
 # Updated: 2026-02-11 - Sender-scoped memory isolation
-
+# Updated: 2026-10-19 - close() flushes buffered store state on shutdown/reload
+# Updated: 2026-10-19 - Pass file_memory_daily_horizon_days through to FileMemoryStore
+# Updated: 2026-10-19 - delete_many() batch deletion facade
+# Updated: 2026-10-19 - Incremental Tier-1 compaction state, linear budget enforcement
+# Updated: 2026-10-19 - Token-budget mode for history and memory context (shared tokenizer)
+# Updated: 2026-10-19 - Tier-1 extract kept as sized lines, pruned to the history budget
+# Updated: 2026-10-19 - Tier-1 state keyed on budget + unit; per-session state is an LRU
+
+import asyncio
 import hashlib
+import json
 import logging
+from collections import OrderedDict
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+from pocketpaw.llm.tokenizer import Tokenizer, get_tokenizer, get_tokenizer_for_settings
 from pocketpaw.memory.file_store import FileMemoryStore
 from pocketpaw.memory.protocol import MemoryEntry, MemoryStoreProtocol, MemoryType
 
 logger = logging.getLogger(__name__)
 
+# Persist the incremental Tier-1 compaction state after this many newly
+# aged-out messages. Any persisted snapshot is self-consistent, so a restart
+# only replays the messages appended since the last write.
+_TIER1_PERSIST_EVERY = 20
+
+# Sessions whose Tier-1 state is kept in memory (least recently used dropped;
+# file-store sessions reload it from the compaction cache)
+_TIER1_MAX_SESSIONS = 256
+
 
 def create_memory_store(
     backend: str = "file",
@@ -29,6 +49,7 @@ def create_memory_store(
     ollama_base_url: str = "http://localhost:11434",
     anthropic_api_key: str | None = None,
     openai_api_key: str | None = None,
+    daily_horizon_days: int | None = None,
 ) -> MemoryStoreProtocol:
     """
     Factory function to create the appropriate memory store.
@@ -44,10 +65,15 @@ def create_memory_store(
         embedder_model: Embedding model name
         vector_store: Vector store ('qdrant' or 'chroma')
         ollama_base_url: Ollama base URL (when using ollama)
+        daily_horizon_days: Days of daily files the file store indexes at startup
 
     Returns:
         MemoryStoreProtocol implementation
     """
+    file_kwargs: dict[str, Any] = {}
+    if daily_horizon_days is not None:
+        file_kwargs["daily_horizon_days"] = daily_horizon_days
+
     if backend == "mem0":
         try:
             # Check if mem0 is actually available before creating store
@@ -77,10 +103,10 @@ def create_memory_store(
                 "mem0ai not installed, falling back to file backend. "
                 "Install with: pip install pocketpaw[memory]"
             )
-            return FileMemoryStore(base_path)
+            return FileMemoryStore(base_path, **file_kwargs)
     else:
         logger.info("Using file-based memory backend")
-        return FileMemoryStore(base_path)
+        return FileMemoryStore(base_path, **file_kwargs)
 
 
 class MemoryManager:
@@ -118,6 +144,8 @@ class MemoryManager:
         ollama_base_url: str = "http://localhost:11434",
         anthropic_api_key: str | None = None,
         openai_api_key: str | None = None,
+        daily_horizon_days: int | None = None,
+        tokenizer: Tokenizer | None = None,
     ):
         """
         Initialize memory manager.
@@ -134,6 +162,9 @@ class MemoryManager:
             embedder_model: Embedding model for mem0.
             vector_store: Vector store for mem0.
             ollama_base_url: Ollama base URL for mem0.
+            daily_horizon_days: Days of daily files the file store indexes at startup.
+            tokenizer: Tokenizer for token budgets. Defaults to the shared
+                heuristic tokenizer.
         """
         if store:
             self._store = store
@@ -151,8 +182,15 @@ class MemoryManager:
                 ollama_base_url=ollama_base_url,
                 anthropic_api_key=anthropic_api_key,
                 openai_api_key=openai_api_key,
+                daily_horizon_days=daily_horizon_days,
             )
 
+        # Per-session incremental Tier-1 compaction state (see get_compacted_history)
+        self._tier1_states: dict[str, dict[str, Any]] = {}
+        self._tier1_locks: OrderedDict[str, asyncio.Lock] = OrderedDict()
+
+        self.tokenizer: Tokenizer = tokenizer or get_tokenizer()
+
     # =========================================================================
     # User Scoping
     # =========================================================================
@@ -291,10 +329,14 @@ class MemoryManager:
         daily_limit: int = 20,
         entry_max_chars: int = 500,
         sender_id: str | None = None,
+        max_tokens: int | None = None,
     ) -> str:
         """
         Get memory context for injection into agent system prompt.
 
+        When ``max_tokens`` is given the context is budgeted in tokens
+        (via ``self.tokenizer``) instead of ``max_chars``.
+
         Returns a formatted string with relevant memories.
         """
         import asyncio
@@ -318,12 +360,17 @@ class MemoryManager:
             for entry in daily:
                 parts.append(f"- {entry.content[:entry_max_chars]}")
 
-        context = "\n".join(parts)
+        return self._truncate_context("\n".join(parts), max_chars, max_tokens)
+
+    def _truncate_context(self, context: str, max_chars: int, max_tokens: int | None) -> str:
+        """Cut context to the token budget if given, else to ``max_chars``."""
+        if max_tokens is not None:
+            if self.tokenizer.count(context) > max_tokens:
+                context = self.tokenizer.truncate(context, max_tokens) + "\n...(truncated)"
+            return context
 
-        # Truncate if too long
         if len(context) > max_chars:
             context = context[:max_chars] + "\n...(truncated)"
-
         return context
 
     async def get_compacted_history(
@@ -333,6 +380,7 @@ class MemoryManager:
         char_budget: int = 8000,
         summary_chars: int = 150,
         llm_summarize: bool = False,
+        token_budget: int | None = None,
     ) -> list[dict[str, str]]:
         """Get session history with compaction.
 
@@ -340,16 +388,62 @@ class MemoryManager:
         older messages into condensed one-liner extracts (Tier 1) or an
         LLM-generated summary (Tier 2, opt-in).
 
+        Tier 1 is incremental: the extract is kept per session (and persisted
+        in ``<session>_compaction.json`` for the file store), so each call only
+        processes messages appended since the previous one. One-liners that
+        no longer fit in the budget are dropped, oldest first.
+
         Args:
             session_key: The session identifier.
             recent_window: Number of recent messages to keep verbatim.
             char_budget: Max total characters for the returned history.
             summary_chars: Max chars per older message extract (Tier 1).
             llm_summarize: Use LLM to summarize older messages (Tier 2).
+            token_budget: Max total tokens for the returned history. When set,
+                replaces ``char_budget``.
 
         Returns:
             List of {"role": "...", "content": "..."} dicts.
         """
+        budget, tokenizer = self._select_budget(char_budget, token_budget)
+        if llm_summarize:
+            return await self._get_llm_compacted_history(
+                session_key, recent_window, budget, summary_chars, tokenizer
+            )
+
+        size_unit = tokenizer.name if tokenizer else "chars"
+        async with self._tier1_lock(session_key):
+            state = await self._advance_tier1_state(
+                session_key, recent_window, summary_chars, budget, size_unit
+            )
+            recent = [dict(m) for m in state["recent"]]
+            summary_block = self._tier1_summary(state, budget, tokenizer)
+
+        if not summary_block:
+            return self._enforce_budget(recent, budget, tokenizer)
+
+        compacted = [{"role": "user", "content": f"[Earlier conversation]\n{summary_block}"}]
+        compacted.extend(recent)
+
+        return self._enforce_budget(compacted, budget, tokenizer)
+
+    def _select_budget(
+        self, char_budget: int, token_budget: int | None
+    ) -> tuple[int, Tokenizer | None]:
+        """Token budget + tokenizer in token mode, else the char budget alone."""
+        if token_budget is None:
+            return char_budget, None
+        return token_budget, self.tokenizer
+
+    async def _get_llm_compacted_history(
+        self,
+        session_key: str,
+        recent_window: int,
+        char_budget: int,
+        summary_chars: int,
+        tokenizer: Tokenizer | None = None,
+    ) -> list[dict[str, str]]:
+        """Tier 2 compaction: LLM summary of older messages, Tier 1 on failure."""
         entries = await self._store.get_session(session_key)
         if not entries:
             return []
@@ -362,54 +456,246 @@ class MemoryManager:
         recent = all_messages[split_point:]
 
         if not older:
-            return self._enforce_budget(recent, char_budget)
+            return self._enforce_budget(recent, char_budget, tokenizer)
 
-        # Tier 2: Try LLM summary if enabled
-        summary_block: str | None = None
-        if llm_summarize:
-            summary_block = await self._get_or_create_llm_summary(
-                session_key, older, len(all_messages)
-            )
+        summary_block = await self._get_or_create_llm_summary(session_key, older, len(all_messages))
 
         # Tier 1 fallback: one-liner extracts
         if summary_block is None:
-            lines = []
-            for msg in older:
-                role = msg["role"].capitalize()
-                text = msg["content"].replace("\n", " ").strip()
-                if len(text) > summary_chars:
-                    # Truncate at word boundary
-                    truncated = text[:summary_chars].rsplit(" ", 1)[0]
-                    text = truncated + "..."
-                lines.append(f"{role}: {text}")
-            summary_block = "\n".join(lines)
+            summary_block = "\n".join(self._extract_line(m, summary_chars) for m in older)
 
         compacted = [{"role": "user", "content": f"[Earlier conversation]\n{summary_block}"}]
         compacted.extend(recent)
 
-        return self._enforce_budget(compacted, char_budget)
+        return self._enforce_budget(compacted, char_budget, tokenizer)
 
     @staticmethod
-    def _enforce_budget(messages: list[dict[str, str]], char_budget: int) -> list[dict[str, str]]:
-        """Drop oldest messages until total chars fit within budget.
+    def _extract_line(message: dict[str, str], summary_chars: int) -> str:
+        """Collapse one older message into a Tier-1 one-liner."""
+        role = message["role"].capitalize()
+        text = message["content"].replace("\n", " ").strip()
+        if len(text) > summary_chars:
+            # Truncate at word boundary
+            truncated = text[:summary_chars].rsplit(" ", 1)[0]
+            text = truncated + "..."
+        return f"{role}: {text}"
+
+    def _tier1_lock(self, session_key: str) -> asyncio.Lock:
+        """The session's Tier-1 lock; idle sessions beyond the LRU cap are forgotten."""
+        lock = self._tier1_locks.get(session_key)
+        if lock is None:
+            lock = self._tier1_locks[session_key] = asyncio.Lock()
+        self._tier1_locks.move_to_end(session_key)
+        if len(self._tier1_locks) > _TIER1_MAX_SESSIONS:
+            for key, old in list(self._tier1_locks.items())[:-1]:
+                if not old.locked():
+                    del self._tier1_locks[key]
+                    self._tier1_states.pop(key, None)
+                    break
+        return lock
+
+    async def _advance_tier1_state(
+        self,
+        session_key: str,
+        recent_window: int,
+        summary_chars: int,
+        budget: int,
+        size_unit: str,
+    ) -> dict[str, Any]:
+        """Bring a session's Tier-1 state up to date with newly stored messages.
+
+        State keys: ``lines`` (one-liners of aged-out messages) with their
+        cached ``sizes``, ``recent`` (the verbatim window), ``total``
+        (messages consumed), ``last_id``, ``cursor`` (file store tail cursor)
+        and the parameters it was built with. Lines are pruned to ``budget``
+        (measured in ``size_unit``), so any parameter change, including the
+        budget, rebuilds the state from scratch.
+        """
+        params = {
+            "recent_window": recent_window,
+            "summary_chars": summary_chars,
+            "budget": budget,
+            "size_unit": size_unit,
+        }
+        state = self._tier1_states.get(session_key)
+        if state is None:
+            state = await self._load_tier1_state(session_key)
+        if state is not None and any(state.get(k) != v for k, v in params.items()):
+            state = None
+
+        tail_reader = isinstance(self._store, FileMemoryStore)
+        cursor = None
+        if tail_reader:
+            result = None
+            if state is not None and state.get("cursor") is not None:
+                result = await self._store.get_session_since(session_key, state["cursor"])
+            if result is None:
+                state = None
+                result = await self._store.get_session_since(session_key)
+            if result is None:
+                # Legacy JSON session — no cursor until it is migrated
+                new_entries = await self._store.get_session(session_key)
+            else:
+                new_entries, cursor = result
+        else:
+            new_entries = await self._store.get_session(session_key)
+            if state is not None:
+                seen = state["total"]
+                if len(new_entries) >= seen and (
+                    seen == 0 or new_entries[seen - 1].id == state["last_id"]
+                ):
+                    new_entries = new_entries[seen:]
+                else:
+                    state = None
+
+        rebuilt = state is None
+        if state is None:
+            state = {**params, "lines": [], "sizes": [], "recent": [], "total": 0, "last_id": None}
+            state["aged_since_persist"] = 0
+
+        if new_entries:
+            state["recent"].extend(
+                {"role": e.role or "user", "content": e.content} for e in new_entries
+            )
+            state["total"] += len(new_entries)
+            state["last_id"] = new_entries[-1].id
+        if tail_reader:
+            state["cursor"] = cursor
+
+        overflow = len(state["recent"]) - recent_window
+        if overflow > 0:
+            aged = state["recent"][:overflow]
+            del state["recent"][:overflow]
+            state["lines"].extend(self._extract_line(m, summary_chars) for m in aged)
+            state["aged_since_persist"] = state.get("aged_since_persist", 0) + overflow
 
-        If a single message exceeds the budget, truncate it.
+        self._tier1_states[session_key] = state
+
+        if tail_reader and cursor is not None:
+            if rebuilt or state["aged_since_persist"] >= _TIER1_PERSIST_EVERY:
+                await self._persist_tier1_state(session_key, state)
+
+        return state
+
+    @staticmethod
+    def _tier1_summary(
+        state: dict[str, Any], budget: int, tokenizer: Tokenizer | None = None
+    ) -> str:
+        """Join the newest Tier-1 one-liners that fit beside the recent window.
+
+        Each line is measured once (sizes are cached in the state). Lines that
+        would not fit even in the whole budget are pruned from the state, so
+        the work per call is bounded by the budget, not the session length.
+        The state is only used with the budget and unit it was built for.
+        """
+        measure = tokenizer.count if tokenizer else len
+        lines, sizes = state["lines"], state["sizes"]
+        # +1 for the joining newline
+        sizes.extend(measure(line) + 1 for line in lines[len(sizes) :])
+
+        available = budget - measure("[Earlier conversation]\n")
+        available -= sum(measure(m["content"]) for m in state["recent"])
+        used = 0
+        start = keep = len(lines)
+        for i in range(len(lines) - 1, -1, -1):
+            used += sizes[i]
+            if used > budget:
+                break
+            keep = i
+            if used <= available:
+                start = i
+        del lines[:keep]
+        del sizes[:keep]
+        return "\n".join(lines[start - keep :])
+
+    def _compaction_cache_path(self, session_key: str) -> Path | None:
+        """Path of a session's ``_compaction.json`` (None for stores without one)."""
+        if not hasattr(self._store, "sessions_path"):
+            return None
+        safe_key = session_key.replace(":", "_").replace("/", "_")
+        return self._store.sessions_path / f"{safe_key}_compaction.json"
+
+    async def _load_tier1_state(self, session_key: str) -> dict[str, Any] | None:
+        """Load persisted Tier-1 state from the session's compaction cache."""
+        if not isinstance(self._store, FileMemoryStore):
+            return None
+        cache_path = self._compaction_cache_path(session_key)
+
+        def _read():
+            try:
+                return json.loads(cache_path.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError):
+                return None
+
+        cache = await asyncio.to_thread(_read)
+        state = cache.get("tier1") if isinstance(cache, dict) else None
+        if not isinstance(state, dict) or not isinstance(state.get("lines"), list):
+            return None
+        if not isinstance(state.get("sizes"), list) or len(state["sizes"]) > len(state["lines"]):
+            state["sizes"] = []
+        state["aged_since_persist"] = 0
+        return state
+
+    async def _persist_tier1_state(self, session_key: str, state: dict[str, Any]) -> None:
+        """Write Tier-1 state into the compaction cache, keeping the LLM summary fields."""
+        cache_path = self._compaction_cache_path(session_key)
+        if cache_path is None:
+            return
+        snapshot = {k: v for k, v in state.items() if k != "aged_since_persist"}
+        for key in ("lines", "sizes", "recent"):
+            snapshot[key] = list(state[key])
+        state["aged_since_persist"] = 0
+
+        def _write():
+            try:
+                cache = json.loads(cache_path.read_text(encoding="utf-8"))
+                if not isinstance(cache, dict):
+                    cache = {}
+            except (OSError, json.JSONDecodeError):
+                cache = {}
+            cache["tier1"] = snapshot
+            tmp = cache_path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(cache), encoding="utf-8")
+            tmp.replace(cache_path)
+
+        try:
+            await asyncio.to_thread(_write)
+        except OSError:
+            logger.debug("Failed to persist compaction state for %s", session_key, exc_info=True)
+
+    @staticmethod
+    def _enforce_budget(
+        messages: list[dict[str, str]],
+        char_budget: int,
+        tokenizer: Tokenizer | None = None,
+    ) -> list[dict[str, str]]:
+        """Drop oldest messages until total size fits within budget.
+
+        Size is measured in chars, or in tokens when a ``tokenizer`` is
+        given (``char_budget`` is then a token budget). If a single message
+        exceeds the budget, truncate it. Runs in one pass over the messages.
         """
-        total = sum(len(m["content"]) for m in messages)
+        measure = tokenizer.count if tokenizer else len
+        sizes = [measure(m["content"]) for m in messages]
+        total = sum(sizes)
         if total <= char_budget:
             return messages
 
         # Drop from oldest until within budget
-        result = list(messages)
-        while len(result) > 1 and sum(len(m["content"]) for m in result) > char_budget:
-            result.pop(0)
+        start = 0
+        while len(messages) - start > 1 and total > char_budget:
+            total -= sizes[start]
+            start += 1
+        result = messages[start:]
 
         # If single remaining message still exceeds budget, truncate it
-        if result and len(result[0]["content"]) > char_budget:
-            result[0] = {
-                "role": result[0]["role"],
-                "content": result[0]["content"][:char_budget],
-            }
+        if result and sizes[start] > char_budget:
+            content = result[0]["content"]
+            if tokenizer is None:
+                content = content[:char_budget]
+            else:
+                content = tokenizer.truncate(content, char_budget)
+            result[0] = {"role": result[0]["role"], "content": content}
 
         return result
 
@@ -425,16 +711,13 @@ class MemoryManager:
         """
         try:
             # Need sessions_path from the store (FileMemoryStore has it, Mem0 may not)
-            if not hasattr(self._store, "sessions_path"):
+            cache_path = self._compaction_cache_path(session_key)
+            if cache_path is None:
                 return None
 
-            safe_key = session_key.replace(":", "_").replace("/", "_")
-            cache_path: Path = self._store.sessions_path / f"{safe_key}_compaction.json"
-
             # Check cache
+            cache: dict[str, Any] = {}
             if cache_path.exists():
-                import json
-
                 cache = json.loads(cache_path.read_text())
                 if cache.get("watermark") == current_total:
                     return cache["summary"]
@@ -468,19 +751,15 @@ class MemoryManager:
             )
             summary = response.content[0].text
 
-            # Write cache
-            import json
-
-            cache_path.write_text(
-                json.dumps(
-                    {
-                        "watermark": current_total,
-                        "summary": summary,
-                        "older_count": len(older_entries),
-                    },
-                    indent=2,
-                )
+            # Write cache (keeping any Tier-1 state stored alongside)
+            cache.update(
+                {
+                    "watermark": current_total,
+                    "summary": summary,
+                    "older_count": len(older_entries),
+                }
             )
+            cache_path.write_text(json.dumps(cache, indent=2))
 
             return summary
 
@@ -572,7 +851,11 @@ class MemoryManager:
             return {}
 
     async def get_semantic_context(
-        self, query: str, limit: int = 5, sender_id: str | None = None
+        self,
+        query: str,
+        limit: int = 5,
+        sender_id: str | None = None,
+        max_tokens: int | None = None,
     ) -> str:
         """Get semantically relevant memory context for a user query.
 
@@ -584,6 +867,7 @@ class MemoryManager:
             query: The user's current message/query.
             limit: Max memories to include.
             sender_id: Sender ID for memory scoping.
+            max_tokens: Token budget for the context (token mode).
 
         Returns:
             Formatted context string for system prompt injection.
@@ -598,7 +882,10 @@ class MemoryManager:
                         memory_text = item.get("memory", "")
                         if memory_text:
                             parts.append(f"- {memory_text}")
-                    return "\n".join(parts)
+                    context = "\n".join(parts)
+                    if max_tokens is not None:
+                        context = self._truncate_context(context, 0, max_tokens)
+                    return context
             except Exception:
                 logger.debug(
                     "Semantic search failed, falling back to standard context",
@@ -606,14 +893,16 @@ class MemoryManager:
                 )
 
         # Fall back to standard context
-        return await self.get_context_for_agent(sender_id=sender_id)
+        return await self.get_context_for_agent(sender_id=sender_id, max_tokens=max_tokens)
 
     async def clear_session(self, session_key: str) -> int:
         """Clear session history."""
+        self._tier1_states.pop(session_key, None)
         return await self._store.clear_session(session_key)
 
     async def delete_session(self, session_key: str) -> bool:
         """Delete a session entirely (file, compaction cache, index entry)."""
+        self._tier1_states.pop(session_key, None)
         if hasattr(self._store, "delete_session"):
             return await self._store.delete_session(session_key)
         # Fallback: clear is the best we can do
@@ -686,6 +975,26 @@ class MemoryManager:
         sessions.sort(key=lambda s: s["last_activity"], reverse=True)
         return sessions
 
+    async def delete_many(self, entry_ids: list[str]) -> int:
+        """Delete several memories, returning how many were removed.
+
+        Uses the store's batch delete when available (the file store then
+        rewrites each affected markdown file once).
+        """
+        if hasattr(self._store, "delete_many"):
+            return await self._store.delete_many(entry_ids)
+        deleted = 0
+        for entry_id in entry_ids:
+            if await self._store.delete(entry_id):
+                deleted += 1
+        return deleted
+
+    async def close(self) -> None:
+        """Flush buffered store state (e.g. the file store's session index)."""
+        close = getattr(self._store, "close", None)
+        if close is not None:
+            await close()
+
 
 # Singleton
 _manager: MemoryManager | None = None
@@ -708,6 +1017,10 @@ def get_memory_manager(force_reload: bool = False) -> MemoryManager:
     if _manager is None or force_reload:
         from pocketpaw.config import get_settings
 
+        # Persist anything the outgoing store still buffers before replacing it
+        if _manager is not None and hasattr(_manager._store, "flush_session_index"):
+            _manager._store.flush_session_index()
+
         settings = get_settings()
         _manager = MemoryManager(
             backend=settings.memory_backend,
@@ -720,6 +1033,8 @@ def get_memory_manager(force_reload: bool = False) -> MemoryManager:
             ollama_base_url=settings.mem0_ollama_base_url,
             anthropic_api_key=settings.anthropic_api_key,
             openai_api_key=settings.openai_api_key,
+            daily_horizon_days=settings.file_memory_daily_horizon_days,
+            tokenizer=get_tokenizer_for_settings(settings),
         )
 
         from pocketpaw.lifecycle import register
@@ -728,6 +1043,6 @@ def get_memory_manager(force_reload: bool = False) -> MemoryManager:
             global _manager
             _manager = None
 
-        register("memory_manager", reset=_reset)
+        register("memory_manager", shutdown=_manager.close, reset=_reset)
 
     return _manager
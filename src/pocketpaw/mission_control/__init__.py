@@ -87,6 +87,7 @@ from pocketpaw.mission_control.models import (
     TaskPriority,
     TaskStatus,
 )
+from pocketpaw.mission_control.sqlite_store import SQLiteMissionControlStore
 
 # Store
 from pocketpaw.mission_control.store import (
@@ -111,6 +112,7 @@ __all__ = [
     "Notification",
     # Store
     "FileMissionControlStore",
+    "SQLiteMissionControlStore",
     "get_mission_control_store",
     "reset_mission_control_store",
     # Manager
@@ -1,6 +1,8 @@
 """Mission Control API endpoints.
 
 Created: 2026-02-05
+Updated: 2026-10-19 — GET /tasks and GET /activity accept an offset for pagination;
+  GET /tasks "count" is the total number of matching tasks.
 Updated: 2026-02-12 — POST /tasks now accepts optional project_id to associate
   a new task with a Deep Work project. Enriched project list/get responses with
   folder_path and file_count for sidebar project browser.
@@ -267,8 +269,13 @@ async def list_tasks(
     assignee_id: str | None = None,
     tags: str | None = None,
     limit: int = 100,
+    offset: int = 0,
 ) -> dict[str, Any]:
-    """List tasks with optional filters."""
+    """List tasks with optional filters (paginated with limit/offset).
+
+    ``tasks`` holds the requested page; ``count`` is the total number of tasks
+    matching the filters, regardless of ``limit`` and ``offset``.
+    """
     manager = get_mission_control_manager()
 
     # Parse tags from comma-separated string
@@ -279,11 +286,14 @@ async def list_tasks(
         status=status_enum,
         assignee_id=assignee_id,
         tags=tag_list,
+        limit=limit,
+        offset=offset,
     )
+    count = await manager.count_tasks(status=status_enum, assignee_id=assignee_id, tags=tag_list)
 
     return {
-        "tasks": [t.to_dict() for t in tasks[:limit]],
-        "count": len(tasks),
+        "tasks": [t.to_dict() for t in tasks],
+        "count": count,
     }
 
 
@@ -607,8 +617,9 @@ async def get_activity_feed(
     agent_id: str | None = None,
     task_id: str | None = None,
     limit: int = 50,
+    offset: int = 0,
 ) -> dict[str, Any]:
-    """Get the activity feed."""
+    """Get the activity feed (paginated with limit/offset)."""
     manager = get_mission_control_manager()
 
     if agent_id or task_id:
@@ -616,9 +627,10 @@ async def get_activity_feed(
             agent_id=agent_id,
             task_id=task_id,
             limit=limit,
+            offset=offset,
         )
     else:
-        activities = await manager.get_activity_feed(limit)
+        activities = await manager.get_activity_feed(limit, offset)
 
     return {
         "activities": [a.to_dict() for a in activities],
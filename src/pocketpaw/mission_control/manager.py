@@ -1,6 +1,9 @@
 """Mission Control manager.
 
 Created: 2026-02-05
+Updated: 2026-10-19 — get_project_tasks() uses the store's project_id filter.
+Updated: 2026-10-19 — list_tasks()/get_activity_feed() accept limit/offset.
+Updated: 2026-10-19 — count_tasks() for the total behind a paginated list_tasks().
 Updated: 2026-02-12 — Added project directory management:
   - create_project() now creates ~/pocketpaw-projects/{id}/ on disk
   - delete_project() now removes the project directory via shutil.rmtree()
@@ -280,9 +283,20 @@ class MissionControlManager:
         status: TaskStatus | None = None,
         assignee_id: str | None = None,
         tags: list[str] | None = None,
+        limit: int = 100,
+        offset: int = 0,
     ) -> list[Task]:
         """List tasks with optional filters."""
-        return await self._store.list_tasks(status, assignee_id, tags)
+        return await self._store.list_tasks(status, assignee_id, tags, limit=limit, offset=offset)
+
+    async def count_tasks(
+        self,
+        status: TaskStatus | None = None,
+        assignee_id: str | None = None,
+        tags: list[str] | None = None,
+    ) -> int:
+        """Count tasks matching the ``list_tasks`` filters (ignores pagination)."""
+        return await self._store.count_tasks(status, assignee_id, tags)
 
     async def assign_task(self, task_id: str, agent_ids: list[str]) -> bool:
         """Assign a task to agents.
@@ -652,8 +666,7 @@ class MissionControlManager:
         Returns:
             List of tasks with matching project_id
         """
-        all_tasks = await self._store.list_tasks(limit=0)
-        return [t for t in all_tasks if t.project_id == project_id]
+        return await self._store.list_tasks(project_id=project_id, limit=0)
 
     async def get_project_progress(self, project_id: str) -> dict[str, Any]:
         """Get progress summary for a project.
@@ -749,9 +762,9 @@ class MissionControlManager:
     # Activity & Notification Operations
     # =========================================================================
 
-    async def get_activity_feed(self, limit: int = 50) -> list[Activity]:
+    async def get_activity_feed(self, limit: int = 50, offset: int = 0) -> list[Activity]:
         """Get the activity feed (most recent first)."""
-        return await self._store.get_activity_feed(limit)
+        return await self._store.get_activity_feed(limit, offset)
 
     async def get_notifications_for_agent(
         self, agent_id: str, unread_only: bool = False
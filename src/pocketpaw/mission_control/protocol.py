@@ -2,13 +2,17 @@
 
 Created: 2026-02-05
 Updated: 2026-02-12 — Added Project method signatures for Deep Work orchestration.
+Updated: 2026-10-19 — list_tasks() accepts project_id.
+Updated: 2026-10-19 — List methods accept an offset for pagination.
+Updated: 2026-10-19 — count_tasks() (total matches for list_tasks() filters).
 
 Defines the interface for Mission Control storage backends.
 
 Following PocketPaw's protocol-first design pattern (like MemoryStoreProtocol),
 this allows for swappable storage implementations:
 - FileStore: JSON files (default, simple)
-- Future: SQLite, PostgreSQL, Convex, etc.
+- SQLiteStore: single SQLite database (large histories)
+- Future: PostgreSQL, Convex, etc.
 """
 
 from __future__ import annotations
@@ -56,6 +60,7 @@ class MissionControlStoreProtocol(Protocol):
         self,
         status: str | None = None,
         limit: int = 100,
+        offset: int = 0,
     ) -> list[Project]:
         """List projects, optionally filtered by status."""
         ...
@@ -87,7 +92,9 @@ class MissionControlStoreProtocol(Protocol):
         """Get an agent by their session key."""
         ...
 
-    async def list_agents(self, status: str | None = None, limit: int = 100) -> list[AgentProfile]:
+    async def list_agents(
+        self, status: str | None = None, limit: int = 100, offset: int = 0
+    ) -> list[AgentProfile]:
         """List agents, optionally filtered by status."""
         ...
 
@@ -120,10 +127,22 @@ class MissionControlStoreProtocol(Protocol):
         assignee_id: str | None = None,
         tags: list[str] | None = None,
         limit: int = 100,
+        project_id: str | None = None,
+        offset: int = 0,
     ) -> list[Task]:
         """List tasks with optional filters."""
         ...
 
+    async def count_tasks(
+        self,
+        status: TaskStatus | None = None,
+        assignee_id: str | None = None,
+        tags: list[str] | None = None,
+        project_id: str | None = None,
+    ) -> int:
+        """Count tasks matching the ``list_tasks`` filters (ignores pagination)."""
+        ...
+
     async def delete_task(self, task_id: str) -> bool:
         """Delete a task. Returns True if deleted."""
         ...
@@ -151,7 +170,9 @@ class MissionControlStoreProtocol(Protocol):
         """Get a message by ID."""
         ...
 
-    async def get_messages_for_task(self, task_id: str, limit: int = 100) -> list[Message]:
+    async def get_messages_for_task(
+        self, task_id: str, limit: int = 100, offset: int = 0
+    ) -> list[Message]:
         """Get all messages for a task, ordered by created_at."""
         ...
 
@@ -175,11 +196,12 @@ class MissionControlStoreProtocol(Protocol):
         agent_id: str | None = None,
         task_id: str | None = None,
         limit: int = 50,
+        offset: int = 0,
     ) -> list[Activity]:
         """Get recent activities, optionally filtered."""
         ...
 
-    async def get_activity_feed(self, limit: int = 50) -> list[Activity]:
+    async def get_activity_feed(self, limit: int = 50, offset: int = 0) -> list[Activity]:
         """Get the activity feed (most recent first)."""
         ...
 
@@ -204,6 +226,7 @@ class MissionControlStoreProtocol(Protocol):
         task_id: str | None = None,
         tags: list[str] | None = None,
         limit: int = 100,
+        offset: int = 0,
     ) -> list[Document]:
         """List documents with optional filters."""
         ...
@@ -234,7 +257,7 @@ class MissionControlStoreProtocol(Protocol):
         ...
 
     async def get_notifications_for_agent(
-        self, agent_id: str, unread_only: bool = False, limit: int = 50
+        self, agent_id: str, unread_only: bool = False, limit: int = 50, offset: int = 0
     ) -> list[Notification]:
         """Get notifications for a specific agent."""
         ...
@@ -0,0 +1,829 @@
+"""SQLite-backed Mission Control store.
+
+Created: 2026-10-19
+
+Implements MissionControlStoreProtocol on a single SQLite database, for
+long-running instances whose history no longer fits comfortably in memory
+(``FileMissionControlStore`` keeps every record resident and loads all JSON
+files at startup).
+
+Storage layout:
+~/.pocketpaw/mission_control/
+    mission_control.db  # One table per entity type (+ tag/assignee link tables)
+
+Design notes:
+- Each row stores the full record as JSON plus the columns used for
+  filtering/sorting, which are indexed
+- WAL journal mode: readers don't block the writer
+- Queries are paginated (limit/offset) in SQL, nothing is loaded wholesale
+- Blocking sqlite3 calls run in a worker thread (asyncio.to_thread) behind a
+  lock, so the event loop is never blocked on disk I/O
+- ``import_from_json()`` copies an existing JSON store in one transaction
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from pocketpaw.deep_work.models import Project
+
+from pocketpaw.mission_control.models import (
+    Activity,
+    AgentProfile,
+    AgentStatus,
+    Document,
+    Message,
+    Notification,
+    Task,
+    TaskStatus,
+    now_iso,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+
+CREATE TABLE IF NOT EXISTS agents (
+    id TEXT PRIMARY KEY,
+    name_lower TEXT NOT NULL,
+    session_key TEXT,
+    status TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_agents_name ON agents(name_lower);
+CREATE INDEX IF NOT EXISTS idx_agents_session ON agents(session_key);
+
+CREATE TABLE IF NOT EXISTS tasks (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    project_id TEXT,
+    updated_at TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status, updated_at);
+CREATE INDEX IF NOT EXISTS idx_tasks_project ON tasks(project_id, updated_at);
+CREATE INDEX IF NOT EXISTS idx_tasks_updated ON tasks(updated_at);
+CREATE TABLE IF NOT EXISTS task_assignees (
+    task_id TEXT NOT NULL,
+    agent_id TEXT NOT NULL,
+    PRIMARY KEY (task_id, agent_id)
+);
+CREATE INDEX IF NOT EXISTS idx_task_assignees_agent ON task_assignees(agent_id);
+CREATE TABLE IF NOT EXISTS task_tags (
+    task_id TEXT NOT NULL,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (task_id, tag)
+);
+CREATE INDEX IF NOT EXISTS idx_task_tags_tag ON task_tags(tag);
+
+CREATE TABLE IF NOT EXISTS messages (
+    id TEXT PRIMARY KEY,
+    task_id TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_messages_task ON messages(task_id, created_at);
+
+CREATE TABLE IF NOT EXISTS activities (
+    id TEXT PRIMARY KEY,
+    agent_id TEXT,
+    task_id TEXT,
+    created_at TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_activities_created ON activities(created_at);
+CREATE INDEX IF NOT EXISTS idx_activities_agent ON activities(agent_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_activities_task ON activities(task_id, created_at);
+
+CREATE TABLE IF NOT EXISTS documents (
+    id TEXT PRIMARY KEY,
+    type TEXT NOT NULL,
+    task_id TEXT,
+    version INTEGER NOT NULL,
+    updated_at TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_documents_task ON documents(task_id, updated_at);
+CREATE INDEX IF NOT EXISTS idx_documents_updated ON documents(updated_at);
+CREATE TABLE IF NOT EXISTS document_tags (
+    document_id TEXT NOT NULL,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (document_id, tag)
+);
+CREATE INDEX IF NOT EXISTS idx_document_tags_tag ON document_tags(tag);
+
+CREATE TABLE IF NOT EXISTS notifications (
+    id TEXT PRIMARY KEY,
+    agent_id TEXT NOT NULL,
+    delivered INTEGER NOT NULL,
+    read INTEGER NOT NULL,
+    created_at TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_notifications_agent ON notifications(agent_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_notifications_delivered ON notifications(delivered, created_at);
+
+CREATE TABLE IF NOT EXISTS projects (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_projects_status ON projects(status, updated_at);
+CREATE INDEX IF NOT EXISTS idx_projects_updated ON projects(updated_at);
+"""
+
+_TABLES = (
+    "agents",
+    "tasks",
+    "task_assignees",
+    "task_tags",
+    "messages",
+    "activities",
+    "documents",
+    "document_tags",
+    "notifications",
+    "projects",
+)
+
+
+def _page(limit: int, offset: int) -> tuple[str, list[Any]]:
+    """LIMIT/OFFSET clause; limit 0 means no limit."""
+    return " LIMIT ? OFFSET ?", [limit if limit else -1, offset]
+
+
+def _task_filter(
+    status: TaskStatus | None,
+    assignee_id: str | None,
+    tags: list[str] | None,
+    project_id: str | None,
+) -> tuple[str, list[Any]]:
+    """WHERE clause (empty without filters) for the task list/count queries."""
+    where: list[str] = []
+    params: list[Any] = []
+    if status:
+        where.append("status = ?")
+        params.append(status.value)
+    if project_id:
+        where.append("project_id = ?")
+        params.append(project_id)
+    if assignee_id:
+        where.append("id IN (SELECT task_id FROM task_assignees WHERE agent_id = ?)")
+        params.append(assignee_id)
+    if tags:
+        marks = ", ".join("?" for _ in tags)
+        where.append(f"id IN (SELECT task_id FROM task_tags WHERE tag IN ({marks}))")
+        params.extend(tags)
+    return (" WHERE " + " AND ".join(where) if where else ""), params
+
+
+class SQLiteMissionControlStore:
+    """SQLite implementation of Mission Control storage.
+
+    Only the rows a query asks for are read, so memory use and startup time
+    don't grow with history.
+    """
+
+    def __init__(self, db_path: Path | None = None):
+        """Initialize the store.
+
+        Args:
+            db_path: Database file. Defaults to
+                ~/.pocketpaw/mission_control/mission_control.db
+        """
+        if db_path is None:
+            db_path = Path.home() / ".pocketpaw" / "mission_control" / "mission_control.db"
+
+        self.db_path = db_path
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    # =========================================================================
+    # Connection Helpers
+    # =========================================================================
+
+    def _call(self, fn: Callable[[sqlite3.Connection], T]) -> T:
+        """Run ``fn`` in a transaction on the (locked) connection."""
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                result = fn(self._conn)
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+            return result
+
+    async def _run(self, fn: Callable[[sqlite3.Connection], T]) -> T:
+        return await asyncio.to_thread(self._call, fn)
+
+    async def _fetch(self, sql: str, params: Iterable[Any] = ()) -> list[str]:
+        """Return the ``data`` column of each matching row."""
+        params = list(params)
+        return await self._run(lambda c: [row[0] for row in c.execute(sql, params)])
+
+    async def _fetch_one(self, sql: str, params: Iterable[Any] = ()) -> str | None:
+        rows = await self._fetch(sql, params)
+        return rows[0] if rows else None
+
+    async def _delete(self, *statements: tuple[str, str]) -> bool:
+        """Run DELETE statements (table, id); True if the first removed a row."""
+
+        def _do(c: sqlite3.Connection) -> bool:
+            deleted = False
+            for i, (sql, record_id) in enumerate(statements):
+                cur = c.execute(sql, (record_id,))
+                if i == 0:
+                    deleted = cur.rowcount > 0
+            return deleted
+
+        return await self._run(_do)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    # =========================================================================
+    # Row Writers (sync, inside a transaction)
+    # =========================================================================
+
+    @staticmethod
+    def _put_agent(c: sqlite3.Connection, agent: AgentProfile) -> None:
+        c.execute(
+            "INSERT OR REPLACE INTO agents (id, name_lower, session_key, status, data) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (
+                agent.id,
+                agent.name.lower(),
+                agent.session_key,
+                agent.status.value,
+                json.dumps(agent.to_dict()),
+            ),
+        )
+
+    @staticmethod
+    def _put_task(c: sqlite3.Connection, task: Task) -> None:
+        c.execute(
+            "INSERT OR REPLACE INTO tasks (id, status, project_id, updated_at, data) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (
+                task.id,
+                task.status.value,
+                task.project_id,
+                task.updated_at,
+                json.dumps(task.to_dict()),
+            ),
+        )
+        c.execute("DELETE FROM task_assignees WHERE task_id = ?", (task.id,))
+        c.executemany(
+            "INSERT OR IGNORE INTO task_assignees (task_id, agent_id) VALUES (?, ?)",
+            [(task.id, agent_id) for agent_id in task.assignee_ids],
+        )
+        c.execute("DELETE FROM task_tags WHERE task_id = ?", (task.id,))
+        c.executemany(
+            "INSERT OR IGNORE INTO task_tags (task_id, tag) VALUES (?, ?)",
+            [(task.id, tag) for tag in task.tags],
+        )
+
+    @staticmethod
+    def _put_message(c: sqlite3.Connection, message: Message) -> None:
+        c.execute(
+            "INSERT OR REPLACE INTO messages (id, task_id, created_at, data) VALUES (?, ?, ?, ?)",
+            (message.id, message.task_id, message.created_at, json.dumps(message.to_dict())),
+        )
+
+    @staticmethod
+    def _put_activity(c: sqlite3.Connection, activity: Activity) -> None:
+        c.execute(
+            "INSERT OR REPLACE INTO activities (id, agent_id, task_id, created_at, data) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (
+                activity.id,
+                activity.agent_id,
+                activity.task_id,
+                activity.created_at,
+                json.dumps(activity.to_dict()),
+            ),
+        )
+
+    @staticmethod
+    def _put_document(c: sqlite3.Connection, document: Document) -> None:
+        c.execute(
+            "INSERT OR REPLACE INTO documents (id, type, task_id, version, updated_at, data) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                document.id,
+                document.type.value,
+                document.task_id,
+                document.version,
+                document.updated_at,
+                json.dumps(document.to_dict()),
+            ),
+        )
+        c.execute("DELETE FROM document_tags WHERE document_id = ?", (document.id,))
+        c.executemany(
+            "INSERT OR IGNORE INTO document_tags (document_id, tag) VALUES (?, ?)",
+            [(document.id, tag) for tag in document.tags],
+        )
+
+    @staticmethod
+    def _put_notification(c: sqlite3.Connection, notification: Notification) -> None:
+        c.execute(
+            "INSERT OR REPLACE INTO notifications "
+            "(id, agent_id, delivered, read, created_at, data) VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                notification.id,
+                notification.agent_id,
+                int(notification.delivered),
+                int(notification.read),
+                notification.created_at,
+                json.dumps(notification.to_dict()),
+            ),
+        )
+
+    @staticmethod
+    def _put_project(c: sqlite3.Connection, project: Project) -> None:
+        c.execute(
+            "INSERT OR REPLACE INTO projects (id, status, updated_at, data) VALUES (?, ?, ?, ?)",
+            (project.id, project.status.value, project.updated_at, json.dumps(project.to_dict())),
+        )
+
+    # =========================================================================
+    # Agent Operations
+    # =========================================================================
+
+    async def save_agent(self, agent: AgentProfile) -> str:
+        """Save or update an agent profile."""
+        agent.updated_at = now_iso()
+        await self._run(lambda c: self._put_agent(c, agent))
+        return agent.id
+
+    async def get_agent(self, agent_id: str) -> AgentProfile | None:
+        """Get an agent by ID."""
+        data = await self._fetch_one("SELECT data FROM agents WHERE id = ?", (agent_id,))
+        return AgentProfile.from_dict(json.loads(data)) if data else None
+
+    async def get_agent_by_name(self, name: str) -> AgentProfile | None:
+        """Get an agent by name (case-insensitive)."""
+        data = await self._fetch_one(
+            "SELECT data FROM agents WHERE name_lower = ? LIMIT 1", (name.lower(),)
+        )
+        return AgentProfile.from_dict(json.loads(data)) if data else None
+
+    async def get_agent_by_session_key(self, session_key: str) -> AgentProfile | None:
+        """Get an agent by their session key."""
+        data = await self._fetch_one(
+            "SELECT data FROM agents WHERE session_key = ? LIMIT 1", (session_key,)
+        )
+        return AgentProfile.from_dict(json.loads(data)) if data else None
+
+    async def list_agents(
+        self, status: str | None = None, limit: int = 100, offset: int = 0
+    ) -> list[AgentProfile]:
+        """List agents, optionally filtered by status."""
+        sql = "SELECT data FROM agents"
+        params: list[Any] = []
+        if status:
+            sql += " WHERE status = ?"
+            params.append(status)
+        page, page_params = _page(limit, offset)
+        sql += " ORDER BY name_lower" + page
+        rows = await self._fetch(sql, params + page_params)
+        return [AgentProfile.from_dict(json.loads(d)) for d in rows]
+
+    async def delete_agent(self, agent_id: str) -> bool:
+        """Delete an agent."""
+        return await self._delete(("DELETE FROM agents WHERE id = ?", agent_id))
+
+    async def update_agent_heartbeat(self, agent_id: str) -> bool:
+        """Update an agent's last_heartbeat to now."""
+        agent = await self.get_agent(agent_id)
+        if agent:
+            agent.last_heartbeat = now_iso()
+            agent.status = AgentStatus.IDLE  # Reset to idle after heartbeat
+            await self._run(lambda c: self._put_agent(c, agent))
+            return True
+        return False
+
+    # =========================================================================
+    # Task Operations
+    # =========================================================================
+
+    async def save_task(self, task: Task) -> str:
+        """Save or update a task."""
+        task.updated_at = now_iso()
+        await self._run(lambda c: self._put_task(c, task))
+        return task.id
+
+    async def get_task(self, task_id: str) -> Task | None:
+        """Get a task by ID."""
+        data = await self._fetch_one("SELECT data FROM tasks WHERE id = ?", (task_id,))
+        return Task.from_dict(json.loads(data)) if data else None
+
+    async def list_tasks(
+        self,
+        status: TaskStatus | None = None,
+        assignee_id: str | None = None,
+        tags: list[str] | None = None,
+        limit: int = 100,
+        project_id: str | None = None,
+        offset: int = 0,
+    ) -> list[Task]:
+        """List tasks with optional filters (most recently updated first).
+
+        Args:
+            limit: Max results. 0 means no limit.
+            offset: Number of matching tasks to skip (pagination).
+        """
+        where, params = _task_filter(status, assignee_id, tags, project_id)
+        page, page_params = _page(limit, offset)
+        sql = "SELECT data FROM tasks" + where + " ORDER BY updated_at DESC" + page
+        rows = await self._fetch(sql, params + page_params)
+        return [Task.from_dict(json.loads(d)) for d in rows]
+
+    async def count_tasks(
+        self,
+        status: TaskStatus | None = None,
+        assignee_id: str | None = None,
+        tags: list[str] | None = None,
+        project_id: str | None = None,
+    ) -> int:
+        """Count tasks matching the ``list_tasks`` filters (ignores pagination)."""
+        where, params = _task_filter(status, assignee_id, tags, project_id)
+        return int(await self._fetch_one("SELECT COUNT(*) FROM tasks" + where, params) or 0)
+
+    async def delete_task(self, task_id: str) -> bool:
+        """Delete a task."""
+        return await self._delete(
+            ("DELETE FROM tasks WHERE id = ?", task_id),
+            ("DELETE FROM task_assignees WHERE task_id = ?", task_id),
+            ("DELETE FROM task_tags WHERE task_id = ?", task_id),
+        )
+
+    async def get_tasks_for_agent(self, agent_id: str) -> list[Task]:
+        """Get all tasks assigned to an agent."""
+        return await self.list_tasks(assignee_id=agent_id, limit=0)
+
+    async def get_blocked_tasks(self) -> list[Task]:
+        """Get all tasks with BLOCKED status."""
+        return await self.list_tasks(status=TaskStatus.BLOCKED, limit=0)
+
+    # =========================================================================
+    # Message Operations
+    # =========================================================================
+
+    async def save_message(self, message: Message) -> str:
+        """Save a message."""
+        await self._run(lambda c: self._put_message(c, message))
+        return message.id
+
+    async def get_message(self, message_id: str) -> Message | None:
+        """Get a message by ID."""
+        data = await self._fetch_one("SELECT data FROM messages WHERE id = ?", (message_id,))
+        return Message.from_dict(json.loads(data)) if data else None
+
+    async def get_messages_for_task(
+        self, task_id: str, limit: int = 100, offset: int = 0
+    ) -> list[Message]:
+        """Get all messages for a task, ordered by created_at."""
+        page, page_params = _page(limit, offset)
+        rows = await self._fetch(
+            "SELECT data FROM messages WHERE task_id = ? ORDER BY created_at" + page,
+            [task_id, *page_params],
+        )
+        return [Message.from_dict(json.loads(d)) for d in rows]
+
+    async def delete_message(self, message_id: str) -> bool:
+        """Delete a message."""
+        return await self._delete(("DELETE FROM messages WHERE id = ?", message_id))
+
+    # =========================================================================
+    # Activity Operations
+    # =========================================================================
+
+    async def save_activity(self, activity: Activity) -> str:
+        """Save an activity entry."""
+        await self._run(lambda c: self._put_activity(c, activity))
+        return activity.id
+
+    async def get_activities(
+        self,
+        agent_id: str | None = None,
+        task_id: str | None = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> list[Activity]:
+        """Get recent activities, optionally filtered."""
+        where: list[str] = []
+        params: list[Any] = []
+        if agent_id:
+            where.append("agent_id = ?")
+            params.append(agent_id)
+        if task_id:
+            where.append("task_id = ?")
+            params.append(task_id)
+
+        sql = "SELECT data FROM activities"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        page, page_params = _page(limit, offset)
+        sql += " ORDER BY created_at DESC" + page
+        rows = await self._fetch(sql, params + page_params)
+        return [Activity.from_dict(json.loads(d)) for d in rows]
+
+    async def get_activity_feed(self, limit: int = 50, offset: int = 0) -> list[Activity]:
+        """Get the activity feed (most recent first)."""
+        return await self.get_activities(limit=limit, offset=offset)
+
+    # =========================================================================
+    # Document Operations
+    # =========================================================================
+
+    async def save_document(self, document: Document) -> str:
+        """Save or update a document."""
+
+        def _do(c: sqlite3.Connection) -> None:
+            # Increment version if updating existing doc
+            row = c.execute("SELECT version FROM documents WHERE id = ?", (document.id,)).fetchone()
+            if row:
+                document.version = row[0] + 1
+            document.updated_at = now_iso()
+            self._put_document(c, document)
+
+        await self._run(_do)
+        return document.id
+
+    async def get_document(self, document_id: str) -> Document | None:
+        """Get a document by ID."""
+        data = await self._fetch_one("SELECT data FROM documents WHERE id = ?", (document_id,))
+        return Document.from_dict(json.loads(data)) if data else None
+
+    async def list_documents(
+        self,
+        type: str | None = None,
+        task_id: str | None = None,
+        tags: list[str] | None = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> list[Document]:
+        """List documents with optional filters."""
+        where: list[str] = []
+        params: list[Any] = []
+        if type:
+            where.append("type = ?")
+            params.append(type)
+        if task_id:
+            where.append("task_id = ?")
+            params.append(task_id)
+        if tags:
+            marks = ", ".join("?" for _ in tags)
+            where.append(
+                f"id IN (SELECT document_id FROM document_tags WHERE tag IN ({marks}))",
+            )
+            params.extend(tags)
+
+        sql = "SELECT data FROM documents"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        page, page_params = _page(limit, offset)
+        sql += " ORDER BY updated_at DESC" + page
+        rows = await self._fetch(sql, params + page_params)
+        return [Document.from_dict(json.loads(d)) for d in rows]
+
+    async def delete_document(self, document_id: str) -> bool:
+        """Delete a document."""
+        return await self._delete(
+            ("DELETE FROM documents WHERE id = ?", document_id),
+            ("DELETE FROM document_tags WHERE document_id = ?", document_id),
+        )
+
+    # =========================================================================
+    # Notification Operations
+    # =========================================================================
+
+    async def save_notification(self, notification: Notification) -> str:
+        """Save a notification."""
+        await self._run(lambda c: self._put_notification(c, notification))
+        return notification.id
+
+    async def get_notification(self, notification_id: str) -> Notification | None:
+        """Get a notification by ID."""
+        data = await self._fetch_one(
+            "SELECT data FROM notifications WHERE id = ?", (notification_id,)
+        )
+        return Notification.from_dict(json.loads(data)) if data else None
+
+    async def get_undelivered_notifications(
+        self, agent_id: str | None = None
+    ) -> list[Notification]:
+        """Get notifications that haven't been delivered yet."""
+        sql = "SELECT data FROM notifications WHERE delivered = 0"
+        params: list[Any] = []
+        if agent_id:
+            sql += " AND agent_id = ?"
+            params.append(agent_id)
+        rows = await self._fetch(sql + " ORDER BY created_at", params)
+        return [Notification.from_dict(json.loads(d)) for d in rows]
+
+    async def get_notifications_for_agent(
+        self, agent_id: str, unread_only: bool = False, limit: int = 50, offset: int = 0
+    ) -> list[Notification]:
+        """Get notifications for a specific agent."""
+        sql = "SELECT data FROM notifications WHERE agent_id = ?"
+        if unread_only:
+            sql += " AND read = 0"
+        page, page_params = _page(limit, offset)
+        rows = await self._fetch(sql + " ORDER BY created_at DESC" + page, [agent_id, *page_params])
+        return [Notification.from_dict(json.loads(d)) for d in rows]
+
+    async def _update_notification(
+        self, notification_id: str, update: Callable[[Notification], None]
+    ) -> bool:
+        notification = await self.get_notification(notification_id)
+        if notification:
+            update(notification)
+            await self._run(lambda c: self._put_notification(c, notification))
+            return True
+        return False
+
+    async def mark_notification_delivered(self, notification_id: str) -> bool:
+        """Mark a notification as delivered."""
+
+        def _update(n: Notification) -> None:
+            n.delivered = True
+            n.delivered_at = now_iso()
+
+        return await self._update_notification(notification_id, _update)
+
+    async def mark_notification_read(self, notification_id: str) -> bool:
+        """Mark a notification as read."""
+
+        def _update(n: Notification) -> None:
+            n.read = True
+
+        return await self._update_notification(notification_id, _update)
+
+    async def delete_notification(self, notification_id: str) -> bool:
+        """Delete a notification."""
+        return await self._delete(("DELETE FROM notifications WHERE id = ?", notification_id))
+
+    # =========================================================================
+    # Project Operations
+    # =========================================================================
+
+    async def save_project(self, project: Project) -> str:
+        """Save or update a project."""
+        project.updated_at = now_iso()
+        await self._run(lambda c: self._put_project(c, project))
+        return project.id
+
+    async def get_project(self, project_id: str) -> Project | None:
+        """Get a project by ID."""
+        from pocketpaw.deep_work.models import Project as _Project
+
+        data = await self._fetch_one("SELECT data FROM projects WHERE id = ?", (project_id,))
+        return _Project.from_dict(json.loads(data)) if data else None
+
+    async def list_projects(
+        self,
+        status: str | None = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> list[Project]:
+        """List projects, optionally filtered by status."""
+        from pocketpaw.deep_work.models import Project as _Project
+
+        sql = "SELECT data FROM projects"
+        params: list[Any] = []
+        if status:
+            sql += " WHERE status = ?"
+            params.append(status)
+        page, page_params = _page(limit, offset)
+        rows = await self._fetch(sql + " ORDER BY updated_at DESC" + page, params + page_params)
+        return [_Project.from_dict(json.loads(d)) for d in rows]
+
+    async def delete_project(self, project_id: str) -> bool:
+        """Delete a project."""
+        return await self._delete(("DELETE FROM projects WHERE id = ?", project_id))
+
+    # =========================================================================
+    # Utility Operations
+    # =========================================================================
+
+    async def get_stats(self) -> dict[str, Any]:
+        """Get statistics about the Mission Control state."""
+        from pocketpaw.deep_work.models import ProjectStatus
+
+        def _do(c: sqlite3.Connection) -> dict[str, Any]:
+            def count(table: str, where: str = "") -> int:
+                return c.execute(f"SELECT COUNT(*) FROM {table} {where}").fetchone()[0]
+
+            def by_status(table: str, statuses: Iterable[Any]) -> dict[str, int]:
+                counts = dict(c.execute(f"SELECT status, COUNT(*) FROM {table} GROUP BY status"))
+                return {s.value: counts.get(s.value, 0) for s in statuses}
+
+            return {
+                "agents": {
+                    "total": count("agents"),
+                    "by_status": by_status("agents", AgentStatus),
+                },
+                "tasks": {
+                    "total": count("tasks"),
+                    "by_status": by_status("tasks", TaskStatus),
+                },
+                "messages": {"total": count("messages")},
+                "activities": {"total": count("activities")},
+                "documents": {"total": count("documents")},
+                "notifications": {
+                    "total": count("notifications"),
+                    "undelivered": count("notifications", "WHERE delivered = 0"),
+                    "unread": count("notifications", "WHERE read = 0"),
+                },
+                "projects": {
+                    "total": count("projects"),
+                    "by_status": by_status("projects", ProjectStatus),
+                },
+            }
+
+        return await self._run(_do)
+
+    async def clear_all(self) -> None:
+        """Clear all data. Use with caution!"""
+
+        def _do(c: sqlite3.Connection) -> None:
+            for table in _TABLES:
+                c.execute(f"DELETE FROM {table}")
+
+        await self._run(_do)
+        logger.warning("Mission Control data cleared!")
+
+    # =========================================================================
+    # Import
+    # =========================================================================
+
+    def import_from_json(self, json_dir: Path) -> dict[str, int]:
+        """Copy every record of a JSON Mission Control store into this database.
+
+        Reads the directory with ``FileMissionControlStore`` (so a pending
+        append log is included) and inserts everything in one transaction,
+        keeping the original timestamps. Existing rows with the same IDs are
+        replaced, so re-running is safe.
+
+        Returns:
+            Number of records imported per entity type.
+        """
+        from pocketpaw.mission_control.store import FileMissionControlStore
+
+        source = FileMissionControlStore(json_dir)
+        sources = {
+            "agents": (source._agents, self._put_agent),
+            "tasks": (source._tasks, self._put_task),
+            "messages": (source._messages, self._put_message),
+            "activities": (source._activities, self._put_activity),
+            "documents": (source._documents, self._put_document),
+            "notifications": (source._notifications, self._put_notification),
+            "projects": (source._projects, self._put_project),
+        }
+
+        def _do(c: sqlite3.Connection) -> dict[str, int]:
+            counts = {}
+            for kind, (records, put) in sources.items():
+                for record in records.values():
+                    put(c, record)
+                counts[kind] = len(records)
+            c.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('imported_from_json', ?)",
+                (now_iso(),),
+            )
+            return counts
+
+        try:
+            counts = self._call(_do)
+        finally:
+            source.close()
+        logger.info(f"Imported Mission Control JSON store into SQLite: {counts}")
+        return counts
+
+    def has_imported_json(self) -> bool:
+        """Whether ``import_from_json()`` has already run on this database."""
+        row = self._call(
+            lambda c: c.execute("SELECT 1 FROM meta WHERE key = 'imported_from_json'").fetchone()
+        )
+        return row is not None
@@ -2,6 +2,12 @@
 
 Created: 2026-02-05
 Updated: 2026-02-12 — Added Project entity for Deep Work orchestration layer.
+Updated: 2026-10-19 — Secondary indexes (task status/assignee/project, per-task
+    messages, time-sorted activity log) and append-log persistence with snapshots.
+Updated: 2026-10-19 — List methods take an offset; get_mission_control_store()
+    selects the file or SQLite backend from settings.
+Updated: 2026-10-19 — WAL snapshots are written in a worker thread; a torn
+    last log line is repaired on load.
 
 Implements MissionControlStoreProtocol using JSON files.
 
@@ -14,23 +20,35 @@ Storage layout:
     documents.json      # All documents
     notifications.json  # All notifications
     projects.json       # All Deep Work projects
+    wal.jsonl           # Mutations since the last snapshot ("wal" persistence)
+    wal.rotated.jsonl   # Mutations covered by a snapshot still being written
 
 Design notes:
 - Single JSON file per entity type for simplicity
-- In-memory index for fast lookups (like FileMemoryStore)
+- In-memory index for fast lookups (like FileMemoryStore), plus secondary
+  indexes so filtered reads don't scan every record
+- "wal" persistence (default): each mutation appends one line to wal.jsonl;
+  every ``snapshot_every`` mutations (and on close) the JSON files are
+  rewritten and the log truncated. Loading replays the log over the snapshot.
+  Inside an event loop the log is rotated and the JSON files are written in a
+  worker thread, so a snapshot doesn't stall other coroutines.
+- "snapshot" persistence: rewrite the entity's JSON file on every mutation
 - Atomic writes using temp file + rename
-- Suitable for personal use (< 10k records per type)
 """
 
 from __future__ import annotations
 
+import asyncio
+import bisect
 import json
 import logging
+import threading
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from pocketpaw.deep_work.models import Project
+    from pocketpaw.mission_control.sqlite_store import SQLiteMissionControlStore
 
 from pocketpaw.mission_control.models import (
     Activity,
@@ -46,6 +64,26 @@ from pocketpaw.mission_control.models import (
 
 logger = logging.getLogger(__name__)
 
+# Entity kinds, in load order; each maps to <kind>.json and self._<kind>
+_KINDS = ("agents", "tasks", "messages", "activities", "documents", "notifications", "projects")
+
+PERSISTENCE_MODES = ("wal", "snapshot")
+_DEFAULT_SNAPSHOT_EVERY = 1000
+
+
+def _insort(keys: list[tuple[str, str]], key: tuple[str, str]) -> None:
+    """Insert into a sorted key list (appends are the common, O(1) case)."""
+    if not keys or keys[-1] <= key:
+        keys.append(key)
+    else:
+        bisect.insort(keys, key)
+
+
+def _remove_sorted(keys: list[tuple[str, str]], key: tuple[str, str]) -> None:
+    i = bisect.bisect_left(keys, key)
+    if i < len(keys) and keys[i] == key:
+        del keys[i]
+
 
 class FileMissionControlStore:
     """File-based implementation of Mission Control storage.
@@ -54,17 +92,29 @@ class FileMissionControlStore:
     for fast lookups. Suitable for personal/small team use.
     """
 
-    def __init__(self, base_path: Path | None = None):
+    def __init__(
+        self,
+        base_path: Path | None = None,
+        persistence: str = "wal",
+        snapshot_every: int = _DEFAULT_SNAPSHOT_EVERY,
+    ):
         """Initialize the store.
 
         Args:
             base_path: Directory for storage files. Defaults to ~/.pocketpaw/mission_control/
+            persistence: "wal" (append-log + periodic snapshots) or "snapshot"
+                (rewrite the JSON file on every mutation).
+            snapshot_every: WAL mode: mutations between snapshots.
         """
         if base_path is None:
             base_path = Path.home() / ".pocketpaw" / "mission_control"
+        if persistence not in PERSISTENCE_MODES:
+            raise ValueError(f"Unknown persistence mode: {persistence!r}")
 
         self.base_path = base_path
         self.base_path.mkdir(parents=True, exist_ok=True)
+        self._persistence = persistence
+        self._snapshot_every = max(1, snapshot_every)
 
         # File paths
         self._agents_file = self.base_path / "agents.json"
@@ -74,6 +124,15 @@ class FileMissionControlStore:
         self._documents_file = self.base_path / "documents.json"
         self._notifications_file = self.base_path / "notifications.json"
         self._projects_file = self.base_path / "projects.json"
+        self._wal_file = self.base_path / "wal.jsonl"
+        self._wal_rotated_file = self.base_path / "wal.rotated.jsonl"
+        self._wal_handle: Any = None
+        self._wal_records = 0
+        # Background snapshots: the lock serializes JSON writes; a synchronous
+        # snapshot bumps the generation so an older background one is dropped.
+        self._snapshot_task: asyncio.Task | None = None
+        self._snapshot_lock = threading.Lock()
+        self._snapshot_generation = 0
 
         # In-memory indexes
         self._agents: dict[str, AgentProfile] = {}
@@ -84,6 +143,18 @@ class FileMissionControlStore:
         self._notifications: dict[str, Notification] = {}
         self._projects: dict[str, Project] = {}
 
+        # Secondary indexes. Task entries reflect the last *saved* state; the
+        # keys used are remembered so a re-save can remove the stale ones.
+        self._tasks_by_status: dict[TaskStatus, set[str]] = {}
+        self._tasks_by_assignee: dict[str, set[str]] = {}
+        self._tasks_by_project: dict[str, set[str]] = {}
+        self._tasks_by_updated: list[tuple[str, str]] = []  # (updated_at, id)
+        self._task_keys: dict[str, tuple[TaskStatus, tuple[str, ...], str | None, str]] = {}
+        self._messages_by_task: dict[str, list[tuple[str, str]]] = {}  # (created_at, id)
+        self._activity_log: list[tuple[str, str]] = []  # (created_at, id)
+        self._activities_by_agent: dict[str, list[tuple[str, str]]] = {}
+        self._activities_by_task: dict[str, list[tuple[str, str]]] = {}
+
         # Load existing data
         self._load_all()
 
@@ -153,12 +224,229 @@ class FileMissionControlStore:
             project = _Project.from_dict(data)
             self._projects[project.id] = project
 
+        self._replay_wal()
+        self._rebuild_indexes()
+        if self._wal_rotated_file.exists():
+            # A background snapshot didn't finish; fold both logs into one now
+            self.snapshot()
+
         logger.info(
             f"Mission Control loaded: {len(self._agents)} agents, "
             f"{len(self._tasks)} tasks, {len(self._messages)} messages, "
             f"{len(self._projects)} projects"
         )
 
+    def _model_for(self, kind: str) -> Any:
+        from pocketpaw.deep_work.models import Project as _Project
+
+        return {
+            "agents": AgentProfile,
+            "tasks": Task,
+            "messages": Message,
+            "activities": Activity,
+            "documents": Document,
+            "notifications": Notification,
+            "projects": _Project,
+        }[kind]
+
+    def _replay_wal(self) -> None:
+        """Apply mutations logged since the last snapshot."""
+        self._wal_records = self._replay_wal_file(self._wal_rotated_file)
+        self._wal_records += self._replay_wal_file(self._wal_file)
+
+    def _replay_wal_file(self, path: Path) -> int:
+        if not path.exists():
+            return 0
+        try:
+            data = path.read_bytes()
+        except OSError as e:
+            logger.error(f"Error loading {path}: {e}")
+            return 0
+        lines = data.split(b"\n")
+        applied = 0
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                self._apply_wal_record(json.loads(line))
+                applied += 1
+            except (ValueError, KeyError, AttributeError):
+                logger.warning("Skipping unreadable Mission Control WAL record")
+        if lines[-1].strip():
+            # No trailing newline: the last append was cut short by a crash.
+            # Drop the fragment so the next append doesn't glue onto it.
+            try:
+                with open(path, "r+b") as f:
+                    f.truncate(len(data) - len(lines[-1]))
+            except OSError as e:
+                logger.error(f"Error repairing {path}: {e}")
+            else:
+                logger.warning("Removed torn last line from Mission Control WAL")
+        return applied
+
+    def _apply_wal_record(self, record: dict[str, Any]) -> None:
+        records: dict[str, Any] = getattr(self, f"_{record['kind']}")
+        if record["op"] == "put":
+            obj = self._model_for(record["kind"]).from_dict(record["data"])
+            records[obj.id] = obj
+        else:
+            records.pop(record["id"], None)
+
+    def _rebuild_indexes(self) -> None:
+        for task in self._tasks.values():
+            self._index_task(task)
+        for message in self._messages.values():
+            self._index_message(message)
+        for activity in self._activities.values():
+            self._index_activity(activity)
+
+    # -------------------------------------------------------------------------
+    # Index maintenance
+    # -------------------------------------------------------------------------
+
+    def _index_task(self, task: Task) -> None:
+        self._unindex_task(task.id)
+        keys = (task.status, tuple(task.assignee_ids), task.project_id, task.updated_at)
+        self._task_keys[task.id] = keys
+        self._tasks_by_status.setdefault(task.status, set()).add(task.id)
+        for agent_id in task.assignee_ids:
+            self._tasks_by_assignee.setdefault(agent_id, set()).add(task.id)
+        if task.project_id:
+            self._tasks_by_project.setdefault(task.project_id, set()).add(task.id)
+        _insort(self._tasks_by_updated, (task.updated_at, task.id))
+
+    def _unindex_task(self, task_id: str) -> None:
+        keys = self._task_keys.pop(task_id, None)
+        if keys is None:
+            return
+        status, assignees, project_id, updated_at = keys
+        self._tasks_by_status.get(status, set()).discard(task_id)
+        for agent_id in assignees:
+            self._tasks_by_assignee.get(agent_id, set()).discard(task_id)
+        if project_id:
+            self._tasks_by_project.get(project_id, set()).discard(task_id)
+        _remove_sorted(self._tasks_by_updated, (updated_at, task_id))
+
+    def _index_message(self, message: Message) -> None:
+        _insort(
+            self._messages_by_task.setdefault(message.task_id, []),
+            (message.created_at, message.id),
+        )
+
+    def _unindex_message(self, message: Message) -> None:
+        _remove_sorted(
+            self._messages_by_task.get(message.task_id, []), (message.created_at, message.id)
+        )
+
+    def _index_activity(self, activity: Activity) -> None:
+        key = (activity.created_at, activity.id)
+        _insort(self._activity_log, key)
+        if activity.agent_id:
+            _insort(self._activities_by_agent.setdefault(activity.agent_id, []), key)
+        if activity.task_id:
+            _insort(self._activities_by_task.setdefault(activity.task_id, []), key)
+
+    def _unindex_activity(self, activity: Activity) -> None:
+        key = (activity.created_at, activity.id)
+        _remove_sorted(self._activity_log, key)
+        if activity.agent_id:
+            _remove_sorted(self._activities_by_agent.get(activity.agent_id, []), key)
+        if activity.task_id:
+            _remove_sorted(self._activities_by_task.get(activity.task_id, []), key)
+
+    # -------------------------------------------------------------------------
+    # Persistence
+    # -------------------------------------------------------------------------
+
+    def _record_put(self, kind: str, obj: Any) -> None:
+        """Persist a created/updated record."""
+        if self._persistence == "snapshot":
+            getattr(self, f"_persist_{kind}")()
+        else:
+            self._append_wal({"op": "put", "kind": kind, "data": obj.to_dict()})
+
+    def _record_delete(self, kind: str, record_id: str) -> None:
+        """Persist a deletion."""
+        if self._persistence == "snapshot":
+            getattr(self, f"_persist_{kind}")()
+        else:
+            self._append_wal({"op": "del", "kind": kind, "id": record_id})
+
+    def _append_wal(self, record: dict[str, Any]) -> None:
+        try:
+            if self._wal_handle is None:
+                self._wal_handle = open(self._wal_file, "a", encoding="utf-8")
+            self._wal_handle.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self._wal_handle.flush()
+        except OSError as e:
+            logger.error(f"Error appending to {self._wal_file}: {e}")
+            return
+        self._wal_records += 1
+        if self._wal_records >= self._snapshot_every:
+            self._schedule_snapshot()
+
+    def _schedule_snapshot(self) -> None:
+        """Snapshot in a worker thread, or inline when no event loop is running."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.snapshot()
+            return
+        if self._snapshot_task is not None and not self._snapshot_task.done():
+            return  # Retried on the next append once the running one is done
+        data = self._snapshot_data()
+        # Later mutations go to a fresh log; the rotated one is dropped once
+        # the snapshot that covers it is on disk.
+        self._close_wal()
+        try:
+            self._wal_file.replace(self._wal_rotated_file)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.error(f"Error rotating {self._wal_file}: {e}")
+            self.snapshot()
+            return
+        self._wal_records = 0
+        self._snapshot_task = loop.create_task(
+            asyncio.to_thread(self._write_snapshot, data, self._snapshot_generation)
+        )
+
+    def _snapshot_data(self) -> dict[str, list[dict[str, Any]]]:
+        return {kind: [r.to_dict() for r in getattr(self, f"_{kind}").values()] for kind in _KINDS}
+
+    def _write_snapshot(self, data: dict[str, list[dict[str, Any]]], generation: int) -> None:
+        with self._snapshot_lock:
+            if generation != self._snapshot_generation:
+                return  # Superseded by a later synchronous snapshot
+            for kind, records in data.items():
+                self._save_json(getattr(self, f"_{kind}_file"), records)
+            self._wal_rotated_file.unlink(missing_ok=True)
+
+    def _close_wal(self) -> None:
+        if self._wal_handle is not None:
+            self._wal_handle.close()
+            self._wal_handle = None
+
+    def snapshot(self) -> None:
+        """Write every entity file and truncate the append log."""
+        data = self._snapshot_data()
+        with self._snapshot_lock:
+            self._snapshot_generation += 1
+            for kind, records in data.items():
+                self._save_json(getattr(self, f"_{kind}_file"), records)
+            self._close_wal()
+            # Snapshot files are complete, so the logged mutations are redundant
+            self._wal_file.unlink(missing_ok=True)
+            self._wal_rotated_file.unlink(missing_ok=True)
+        self._wal_records = 0
+
+    def close(self) -> None:
+        """Snapshot pending WAL mutations and release the log file."""
+        if self._wal_records or self._wal_rotated_file.exists():
+            self.snapshot()
+        else:
+            self._close_wal()
+
     def _persist_agents(self) -> None:
         """Persist agents to file."""
         data = [a.to_dict() for a in self._agents.values()]
@@ -202,7 +490,7 @@ class FileMissionControlStore:
         """Save or update an agent profile."""
         agent.updated_at = now_iso()
         self._agents[agent.id] = agent
-        self._persist_agents()
+        self._record_put("agents", agent)
         return agent.id
 
     async def get_agent(self, agent_id: str) -> AgentProfile | None:
@@ -224,20 +512,22 @@ class FileMissionControlStore:
                 return agent
         return None
 
-    async def list_agents(self, status: str | None = None, limit: int = 100) -> list[AgentProfile]:
+    async def list_agents(
+        self, status: str | None = None, limit: int = 100, offset: int = 0
+    ) -> list[AgentProfile]:
         """List agents, optionally filtered by status."""
         agents = list(self._agents.values())
         if status:
             agents = [a for a in agents if a.status.value == status]
         # Sort by name
         agents.sort(key=lambda a: a.name.lower())
-        return agents[:limit]
+        return agents[offset : offset + limit]
 
     async def delete_agent(self, agent_id: str) -> bool:
         """Delete an agent."""
         if agent_id in self._agents:
             del self._agents[agent_id]
-            self._persist_agents()
+            self._record_delete("agents", agent_id)
             return True
         return False
 
@@ -247,7 +537,7 @@ class FileMissionControlStore:
         if agent:
             agent.last_heartbeat = now_iso()
             agent.status = AgentStatus.IDLE  # Reset to idle after heartbeat
-            self._persist_agents()
+            self._record_put("agents", agent)
             return True
         return False
 
@@ -259,7 +549,8 @@ class FileMissionControlStore:
         """Save or update a task."""
         task.updated_at = now_iso()
         self._tasks[task.id] = task
-        self._persist_tasks()
+        self._index_task(task)
+        self._record_put("tasks", task)
         return task.id
 
     async def get_task(self, task_id: str) -> Task | None:
@@ -272,44 +563,91 @@ class FileMissionControlStore:
         assignee_id: str | None = None,
         tags: list[str] | None = None,
         limit: int = 100,
+        project_id: str | None = None,
+        offset: int = 0,
     ) -> list[Task]:
         """List tasks with optional filters.
 
         Args:
             limit: Max results. 0 means no limit.
+            offset: Number of matching tasks to skip (pagination).
         """
-        tasks = list(self._tasks.values())
-
-        if status:
-            tasks = [t for t in tasks if t.status == status]
-
-        if assignee_id:
-            tasks = [t for t in tasks if assignee_id in t.assignee_ids]
-
-        if tags:
-            tasks = [t for t in tasks if any(tag in t.tags for tag in tags)]
+        candidates = self._task_candidates(status, assignee_id, project_id)
+
+        def matches(t: Task) -> bool:
+            return not tags or any(tag in t.tags for tag in tags)
+
+        if candidates is None:
+            # Walk the updated_at index newest-first, stopping at the limit
+            tasks = []
+            skipped = 0
+            for _, task_id in reversed(self._tasks_by_updated):
+                task = self._tasks[task_id]
+                if not matches(task):
+                    continue
+                if skipped < offset:
+                    skipped += 1
+                    continue
+                tasks.append(task)
+                if limit and len(tasks) >= limit:
+                    break
+            return tasks
+
+        tasks = [self._tasks[i] for i in candidates if i in self._tasks]
+        tasks = [t for t in tasks if matches(t)]
 
         # Sort by updated_at (most recent first)
         tasks.sort(key=lambda t: t.updated_at, reverse=True)
-        return tasks[:limit] if limit else tasks
+        return tasks[offset : offset + limit] if limit else tasks[offset:]
+
+    async def count_tasks(
+        self,
+        status: TaskStatus | None = None,
+        assignee_id: str | None = None,
+        tags: list[str] | None = None,
+        project_id: str | None = None,
+    ) -> int:
+        """Count tasks matching the ``list_tasks`` filters (ignores pagination)."""
+        candidates = self._task_candidates(status, assignee_id, project_id)
+        ids = self._tasks.keys() if candidates is None else candidates
+        tasks = (self._tasks[i] for i in ids if i in self._tasks)
+        return sum(1 for t in tasks if not tags or any(tag in t.tags for tag in tags))
+
+    def _task_candidates(
+        self, status: TaskStatus | None, assignee_id: str | None, project_id: str | None
+    ) -> set[str] | None:
+        """Narrow to the smallest indexed candidate set (None: no indexed filter)."""
+        candidates: set[str] | None = None
+        for key, index in (
+            (status, self._tasks_by_status),
+            (assignee_id, self._tasks_by_assignee),
+            (project_id, self._tasks_by_project),
+        ):
+            if key:
+                ids = index.get(key, set())
+                candidates = ids if candidates is None else candidates & ids
+        return candidates
 
     async def delete_task(self, task_id: str) -> bool:
         """Delete a task."""
         if task_id in self._tasks:
             del self._tasks[task_id]
-            self._persist_tasks()
+            self._unindex_task(task_id)
+            self._record_delete("tasks", task_id)
             return True
         return False
 
     async def get_tasks_for_agent(self, agent_id: str) -> list[Task]:
         """Get all tasks assigned to an agent."""
-        tasks = [t for t in self._tasks.values() if agent_id in t.assignee_ids]
-        tasks.sort(key=lambda t: t.updated_at, reverse=True)
-        return tasks
+        return await self.list_tasks(assignee_id=agent_id, limit=0)
 
     async def get_blocked_tasks(self) -> list[Task]:
         """Get all tasks with BLOCKED status."""
-        return [t for t in self._tasks.values() if t.status == TaskStatus.BLOCKED]
+        ids = self._tasks_by_status.get(TaskStatus.BLOCKED, set())
+        # The status index is a set; sort for a stable (creation) order
+        tasks = [self._tasks[i] for i in ids if i in self._tasks]
+        tasks.sort(key=lambda t: (t.created_at, t.id))
+        return tasks
 
     # =========================================================================
     # Message Operations
@@ -317,25 +655,31 @@ class FileMissionControlStore:
 
     async def save_message(self, message: Message) -> str:
         """Save a message."""
+        existing = self._messages.get(message.id)
+        if existing is not None:
+            self._unindex_message(existing)
         self._messages[message.id] = message
-        self._persist_messages()
+        self._index_message(message)
+        self._record_put("messages", message)
         return message.id
 
     async def get_message(self, message_id: str) -> Message | None:
         """Get a message by ID."""
         return self._messages.get(message_id)
 
-    async def get_messages_for_task(self, task_id: str, limit: int = 100) -> list[Message]:
+    async def get_messages_for_task(
+        self, task_id: str, limit: int = 100, offset: int = 0
+    ) -> list[Message]:
         """Get all messages for a task, ordered by created_at."""
-        messages = [m for m in self._messages.values() if m.task_id == task_id]
-        messages.sort(key=lambda m: m.created_at)
-        return messages[:limit]
+        keys = self._messages_by_task.get(task_id, [])
+        return [self._messages[message_id] for _, message_id in keys[offset : offset + limit]]
 
     async def delete_message(self, message_id: str) -> bool:
         """Delete a message."""
-        if message_id in self._messages:
-            del self._messages[message_id]
-            self._persist_messages()
+        message = self._messages.pop(message_id, None)
+        if message is not None:
+            self._unindex_message(message)
+            self._record_delete("messages", message_id)
             return True
         return False
 
@@ -345,8 +689,12 @@ class FileMissionControlStore:
 
     async def save_activity(self, activity: Activity) -> str:
         """Save an activity entry."""
+        existing = self._activities.get(activity.id)
+        if existing is not None:
+            self._unindex_activity(existing)
         self._activities[activity.id] = activity
-        self._persist_activities()
+        self._index_activity(activity)
+        self._record_put("activities", activity)
         return activity.id
 
     async def get_activities(
@@ -354,25 +702,34 @@ class FileMissionControlStore:
         agent_id: str | None = None,
         task_id: str | None = None,
         limit: int = 50,
+        offset: int = 0,
     ) -> list[Activity]:
         """Get recent activities, optionally filtered."""
-        activities = list(self._activities.values())
-
-        if agent_id:
-            activities = [a for a in activities if a.agent_id == agent_id]
-
         if task_id:
-            activities = [a for a in activities if a.task_id == task_id]
-
-        # Sort by created_at (most recent first)
-        activities.sort(key=lambda a: a.created_at, reverse=True)
-        return activities[:limit]
-
-    async def get_activity_feed(self, limit: int = 50) -> list[Activity]:
+            keys = self._activities_by_task.get(task_id, [])
+        elif agent_id:
+            keys = self._activities_by_agent.get(agent_id, [])
+        else:
+            keys = self._activity_log
+
+        # Newest first, stopping once the limit is reached
+        activities = []
+        skipped = 0
+        for _, activity_id in reversed(keys):
+            activity = self._activities[activity_id]
+            if agent_id and activity.agent_id != agent_id:
+                continue
+            if skipped < offset:
+                skipped += 1
+                continue
+            activities.append(activity)
+            if len(activities) >= limit:
+                break
+        return activities
+
+    async def get_activity_feed(self, limit: int = 50, offset: int = 0) -> list[Activity]:
         """Get the activity feed (most recent first)."""
-        activities = list(self._activities.values())
-        activities.sort(key=lambda a: a.created_at, reverse=True)
-        return activities[:limit]
+        return await self.get_activities(limit=limit, offset=offset)
 
     # =========================================================================
     # Document Operations
@@ -386,7 +743,7 @@ class FileMissionControlStore:
             document.version = existing.version + 1
         document.updated_at = now_iso()
         self._documents[document.id] = document
-        self._persist_documents()
+        self._record_put("documents", document)
         return document.id
 
     async def get_document(self, document_id: str) -> Document | None:
@@ -399,6 +756,7 @@ class FileMissionControlStore:
         task_id: str | None = None,
         tags: list[str] | None = None,
         limit: int = 100,
+        offset: int = 0,
     ) -> list[Document]:
         """List documents with optional filters."""
         documents = list(self._documents.values())
@@ -414,13 +772,13 @@ class FileMissionControlStore:
 
         # Sort by updated_at (most recent first)
         documents.sort(key=lambda d: d.updated_at, reverse=True)
-        return documents[:limit]
+        return documents[offset : offset + limit]
 
     async def delete_document(self, document_id: str) -> bool:
         """Delete a document."""
         if document_id in self._documents:
             del self._documents[document_id]
-            self._persist_documents()
+            self._record_delete("documents", document_id)
             return True
         return False
 
@@ -431,7 +789,7 @@ class FileMissionControlStore:
     async def save_notification(self, notification: Notification) -> str:
         """Save a notification."""
         self._notifications[notification.id] = notification
-        self._persist_notifications()
+        self._record_put("notifications", notification)
         return notification.id
 
     async def get_notification(self, notification_id: str) -> Notification | None:
@@ -449,14 +807,14 @@ class FileMissionControlStore:
         return notifications
 
     async def get_notifications_for_agent(
-        self, agent_id: str, unread_only: bool = False, limit: int = 50
+        self, agent_id: str, unread_only: bool = False, limit: int = 50, offset: int = 0
     ) -> list[Notification]:
         """Get notifications for a specific agent."""
         notifications = [n for n in self._notifications.values() if n.agent_id == agent_id]
         if unread_only:
             notifications = [n for n in notifications if not n.read]
         notifications.sort(key=lambda n: n.created_at, reverse=True)
-        return notifications[:limit]
+        return notifications[offset : offset + limit]
 
     async def mark_notification_delivered(self, notification_id: str) -> bool:
         """Mark a notification as delivered."""
@@ -464,7 +822,7 @@ class FileMissionControlStore:
         if notification:
             notification.delivered = True
             notification.delivered_at = now_iso()
-            self._persist_notifications()
+            self._record_put("notifications", notification)
             return True
         return False
 
@@ -473,7 +831,7 @@ class FileMissionControlStore:
         notification = self._notifications.get(notification_id)
         if notification:
             notification.read = True
-            self._persist_notifications()
+            self._record_put("notifications", notification)
             return True
         return False
 
@@ -481,7 +839,7 @@ class FileMissionControlStore:
         """Delete a notification."""
         if notification_id in self._notifications:
             del self._notifications[notification_id]
-            self._persist_notifications()
+            self._record_delete("notifications", notification_id)
             return True
         return False
 
@@ -493,7 +851,7 @@ class FileMissionControlStore:
         """Save or update a project."""
         project.updated_at = now_iso()
         self._projects[project.id] = project
-        self._persist_projects()
+        self._record_put("projects", project)
         return project.id
 
     async def get_project(self, project_id: str) -> Project | None:
@@ -504,6 +862,7 @@ class FileMissionControlStore:
         self,
         status: str | None = None,
         limit: int = 100,
+        offset: int = 0,
     ) -> list[Project]:
         """List projects, optionally filtered by status."""
         projects = list(self._projects.values())
@@ -511,13 +870,13 @@ class FileMissionControlStore:
             projects = [p for p in projects if p.status.value == status]
         # Sort by updated_at (most recent first)
         projects.sort(key=lambda p: p.updated_at, reverse=True)
-        return projects[:limit]
+        return projects[offset : offset + limit]
 
     async def delete_project(self, project_id: str) -> bool:
         """Delete a project."""
         if project_id in self._projects:
             del self._projects[project_id]
-            self._persist_projects()
+            self._record_delete("projects", project_id)
             return True
         return False
 
@@ -529,7 +888,7 @@ class FileMissionControlStore:
         """Get statistics about the Mission Control state."""
         task_counts = {}
         for status in TaskStatus:
-            task_counts[status.value] = len([t for t in self._tasks.values() if t.status == status])
+            task_counts[status.value] = len(self._tasks_by_status.get(status, ()))
 
         agent_counts = {}
         for status in AgentStatus:
@@ -578,13 +937,17 @@ class FileMissionControlStore:
         self._notifications.clear()
         self._projects.clear()
 
-        self._persist_agents()
-        self._persist_tasks()
-        self._persist_messages()
-        self._persist_activities()
-        self._persist_documents()
-        self._persist_notifications()
-        self._persist_projects()
+        self._tasks_by_status.clear()
+        self._tasks_by_assignee.clear()
+        self._tasks_by_project.clear()
+        self._tasks_by_updated.clear()
+        self._task_keys.clear()
+        self._messages_by_task.clear()
+        self._activity_log.clear()
+        self._activities_by_agent.clear()
+        self._activities_by_task.clear()
+
+        self.snapshot()
 
         logger.warning("Mission Control data cleared!")
 
@@ -593,25 +956,65 @@ class FileMissionControlStore:
 # Factory Function
 # =========================================================================
 
-_store_instance: FileMissionControlStore | None = None
+_store_instance: FileMissionControlStore | SQLiteMissionControlStore | None = None
+
+# JSON files whose presence means there is file-store data to import
+_JSON_FILES = tuple(f"{kind}.json" for kind in _KINDS) + ("wal.jsonl", "wal.rotated.jsonl")
+
 
+def _open_sqlite_store(base_path: Path | None) -> SQLiteMissionControlStore:
+    """Open the SQLite store, importing the JSON store the first time."""
+    from pocketpaw.mission_control.sqlite_store import SQLiteMissionControlStore
 
-def get_mission_control_store(base_path: Path | None = None) -> FileMissionControlStore:
+    if base_path is None:
+        base_path = Path.home() / ".pocketpaw" / "mission_control"
+    store = SQLiteMissionControlStore(base_path / "mission_control.db")
+    if not store.has_imported_json() and any((base_path / f).exists() for f in _JSON_FILES):
+        store.import_from_json(base_path)
+    return store
+
+
+def get_mission_control_store(
+    base_path: Path | None = None,
+) -> FileMissionControlStore | SQLiteMissionControlStore:
     """Get or create the Mission Control store singleton.
 
+    The backend is chosen by ``settings.mission_control_backend``: "file"
+    (default) or "sqlite".
+
     Args:
         base_path: Optional custom storage path. Only used on first call.
 
     Returns:
-        The FileMissionControlStore instance.
+        The FileMissionControlStore or SQLiteMissionControlStore instance.
     """
     global _store_instance
     if _store_instance is None:
-        _store_instance = FileMissionControlStore(base_path)
+        from pocketpaw.config import get_settings
+
+        settings = get_settings()
+        if settings.mission_control_backend == "sqlite":
+            _store_instance = _open_sqlite_store(base_path)
+        else:
+            _store_instance = FileMissionControlStore(
+                base_path,
+                persistence=settings.mission_control_persistence,
+                snapshot_every=settings.mission_control_snapshot_every,
+            )
+
+        from pocketpaw.lifecycle import register
+
+        register(
+            "mission_control_store",
+            shutdown=_store_instance.close,
+            reset=reset_mission_control_store,
+        )
     return _store_instance
 
 
 def reset_mission_control_store() -> None:
     """Reset the store singleton (for testing)."""
     global _store_instance
+    if _store_instance is not None:
+        _store_instance.close()
     _store_instance = None
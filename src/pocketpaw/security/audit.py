@@ -1,15 +1,24 @@
 """
 Audit Logging System.
 Created: 2026-02-02
+Updated: 2026-10-19 - Background writer, size/age rotation with gzip, sidecar index + query()
+Updated: 2026-10-19 - Block-level offsets in the index; query() seeks to matching blocks
 
 This module provides a secure, append-only audit log for all critical agent actions.
 It is designed to be immutable and persistent.
 """
 
+import atexit
+import gzip
 import json
 import logging
+import os
+import queue
+import threading
+import time
 import uuid
-from collections.abc import Callable
+import zlib
+from collections.abc import Callable, Iterator
 from dataclasses import asdict, dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
@@ -20,6 +29,12 @@ from pocketpaw.config import get_settings
 
 logger = logging.getLogger("audit")
 
+# Writer thread exits after this long without events (restarted on demand)
+_WRITER_IDLE_SECONDS = 5.0
+_WRITER_BATCH_SIZE = 1000
+# Events per block of the query index (the unit query() seeks to and reads)
+_INDEX_BLOCK_EVENTS = 1000
+
 
 class AuditSeverity(str, Enum):
     INFO = "info"  # Normal operation (e.g. reading a file)
@@ -66,10 +81,34 @@ class AuditEvent:
 class AuditLogger:
     """
     Append-only audit logger.
-    Writes to ~/.pocketpaw/audit.log in JSONL format.
+    Writes to ~/.pocketpaw/audit.jsonl in JSONL format.
+
+    Events are queued and written by a background thread, so ``log()`` never
+    does file I/O on the caller's thread (unless the queue is full, in which
+    case it writes inline rather than dropping the event). The writer fsyncs
+    at most every ``fsync_interval`` seconds (0 = after every batch, negative
+    = leave it to the OS) and exits when idle.
+
+    The active file is rotated once it exceeds ``rotate_bytes`` or its first
+    event is older than ``rotate_days``; rotated segments are gzip-compressed
+    next to it (``audit-<timestamp>.jsonl.gz``). A sidecar index
+    (``audit.index.json``) records each segment's time range and the
+    severities/actions it contains, so ``query()`` only opens segments that
+    can match. Files are further split into blocks of ``_INDEX_BLOCK_EVENTS``
+    events with the same stats plus a byte offset (each block is its own
+    gzip member in a segment), so only matching blocks are read and parsed.
     """
 
-    def __init__(self, log_path: Path | None = None):
+    def __init__(
+        self,
+        log_path: Path | None = None,
+        *,
+        buffered: bool = True,
+        max_queue_size: int = 10_000,
+        fsync_interval: float = 1.0,
+        rotate_bytes: int = 10 * 1024 * 1024,
+        rotate_days: float = 7,
+    ):
         if log_path:
             self.log_path = log_path
         else:
@@ -80,9 +119,28 @@ class AuditLogger:
             base_dir = Path.home() / ".pocketpaw"
             base_dir.mkdir(parents=True, exist_ok=True)
             self.log_path = base_dir / "audit.jsonl"
+            fsync_interval = settings.audit_fsync_interval
+            rotate_bytes = settings.audit_rotate_mb * 1024 * 1024
+            rotate_days = settings.audit_rotate_days
+
+        self.index_path = self.log_path.with_name(f"{self.log_path.stem}.index.json")
+        self._buffered = buffered
+        self._fsync_interval = fsync_interval
+        self._rotate_bytes = rotate_bytes
+        self._rotate_days = rotate_days
 
         self._callbacks: list[Callable[[dict], None]] = []
 
+        self._queue: queue.Queue[str] = queue.Queue(maxsize=max_queue_size)
+        self._writer: threading.Thread | None = None
+        self._writer_lock = threading.Lock()
+        # Guards the active file, rotation and the sidecar index
+        self._file_lock = threading.RLock()
+        self._file: Any = None
+        self._last_fsync = 0.0
+        # Stats of the active file, loaded on first write
+        self._active: dict[str, Any] | None = None
+
     def on_log(self, callback: Callable[[dict], None]) -> None:
         """Register a callback to be called after each audit log write."""
         self._callbacks.append(callback)
@@ -91,8 +149,16 @@ class AuditLogger:
         """Write an event to the audit log."""
         try:
             event_dict = asdict(event)
-            with open(self.log_path, "a", encoding="utf-8") as f:
-                f.write(json.dumps(event_dict) + "\n")
+            line = json.dumps(event_dict) + "\n"
+            if self._buffered:
+                try:
+                    self._queue.put_nowait(line)
+                    self._ensure_writer()
+                except queue.Full:
+                    # Backpressure: never drop audit events, write inline instead
+                    self._write_batch([line])
+            else:
+                self._write_batch([line])
             for cb in self._callbacks:
                 try:
                     cb(event_dict)
@@ -121,6 +187,306 @@ class AuditLogger:
         self.log(event)
         return event.id
 
+    # =========================================================================
+    # Background writer
+    # =========================================================================
+
+    def _ensure_writer(self) -> None:
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._run_writer, name="audit-writer", daemon=True
+                )
+                self._writer.start()
+
+    def _run_writer(self) -> None:
+        while True:
+            try:
+                first = self._queue.get(timeout=_WRITER_IDLE_SECONDS)
+            except queue.Empty:
+                with self._writer_lock:
+                    if self._queue.empty():
+                        self._writer = None
+                        self._close_file()
+                        return
+                continue
+
+            batch = [first]
+            while len(batch) < _WRITER_BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._write_batch(batch)
+            except Exception as e:
+                logger.critical(f"FAILED TO WRITE AUDIT LOG: {e} ({len(batch)} events)")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _write_batch(self, lines: list[str]) -> None:
+        with self._file_lock:
+            active = self._active_stats()
+            if self._should_rotate(active):
+                self._rotate()
+                active = self._active_stats()
+
+            if self._file is None:
+                self._file = open(self.log_path, "ab")
+            offset = self._file.tell()
+            data = [line.encode("utf-8") for line in lines]
+            self._file.write(b"".join(data))
+            self._file.flush()
+            for line, raw in zip(lines, data):
+                _add_to_stats(active, json.loads(line), offset)
+                offset += len(raw)
+
+            now = time.monotonic()
+            if self._fsync_interval >= 0 and now - self._last_fsync >= self._fsync_interval:
+                os.fsync(self._file.fileno())
+                self._last_fsync = now
+
+    def _close_file(self) -> None:
+        with self._file_lock:
+            if self._file is not None:
+                try:
+                    self._file.flush()
+                    if self._fsync_interval >= 0:
+                        os.fsync(self._file.fileno())
+                finally:
+                    self._file.close()
+                    self._file = None
+
+    def flush(self, timeout: float | None = None) -> None:
+        """Block until queued events are written (and fsynced)."""
+        if timeout is None:
+            self._queue.join()
+        else:
+            deadline = time.monotonic() + timeout
+            while self._queue.unfinished_tasks and time.monotonic() < deadline:
+                time.sleep(0.01)
+        with self._file_lock:
+            if self._file is not None and self._fsync_interval >= 0:
+                self._file.flush()
+                os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        """Write everything still queued and close the log file."""
+        self.flush(timeout=5.0)
+        self._close_file()
+
+    # =========================================================================
+    # Rotation + sidecar index
+    # =========================================================================
+
+    def _active_stats(self) -> dict[str, Any]:
+        """Stats for the active file (scanned once, then kept incrementally)."""
+        if self._active is None:
+            stats = _new_stats(blocks=True)
+            if self.log_path.exists():
+                with open(self.log_path, "rb") as f:
+                    offset = 0
+                    for line in f:
+                        event = _parse_line(line)
+                        if event is not None:
+                            _add_to_stats(stats, event, offset)
+                        offset += len(line)
+            self._active = stats
+        return self._active
+
+    def _should_rotate(self, active: dict[str, Any]) -> bool:
+        if not active["count"]:
+            return False
+        if self._rotate_bytes > 0:
+            try:
+                if self.log_path.stat().st_size >= self._rotate_bytes:
+                    return True
+            except OSError:
+                return False
+        if self._rotate_days > 0 and active["start"]:
+            try:
+                started = datetime.fromisoformat(active["start"])
+            except ValueError:
+                return False
+            age = datetime.now(tz=UTC) - started
+            return age.total_seconds() >= self._rotate_days * 86400
+        return False
+
+    def _rotate(self) -> None:
+        """Compress the active file into a segment and record it in the index.
+
+        Each index block becomes its own gzip member, so the block can be
+        decompressed on its own from its offset in the segment.
+        """
+        self._close_file()
+        active = self._active_stats()
+        stamp = datetime.now(tz=UTC).strftime("%Y%m%dT%H%M%S%f")
+        segment = self.log_path.with_name(f"{self.log_path.stem}-{stamp}.jsonl.gz")
+        blocks = []
+        with open(self.log_path, "rb") as src, open(segment, "wb") as dst:
+            for block, end in _with_ends(active["blocks"]):
+                src.seek(block["offset"])
+                data = src.read() if end is None else src.read(end - block["offset"])
+                blocks.append({**block, "offset": dst.tell()})
+                dst.write(gzip.compress(data))
+        self.log_path.unlink()
+
+        index = self._load_index()
+        index.append({"file": segment.name, **active, "blocks": blocks})
+        self._save_index(index)
+        self._active = _new_stats(blocks=True)
+
+    def _load_index(self) -> list[dict[str, Any]]:
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+            return data.get("segments", [])
+        except (OSError, ValueError):
+            return []
+
+    def _save_index(self, segments: list[dict[str, Any]]) -> None:
+        tmp = self.index_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"segments": segments}), encoding="utf-8")
+        tmp.replace(self.index_path)
+
+    # =========================================================================
+    # Query
+    # =========================================================================
+
+    def query(
+        self,
+        limit: int = 100,
+        since: datetime | str | None = None,
+        until: datetime | str | None = None,
+        severity: AuditSeverity | str | None = None,
+        action: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Return matching events, newest first.
+
+        Index blocks (of the active file and of each rotated segment) whose
+        time range, severities or actions rule out a match are skipped; the
+        rest are read by seeking to their offset.
+        """
+        # Stored timestamps are UTC ISO strings, so compare in that form
+        since_s = since.astimezone(UTC).isoformat() if isinstance(since, datetime) else since
+        until_s = until.astimezone(UTC).isoformat() if isinstance(until, datetime) else until
+        severity_s = severity.value if isinstance(severity, AuditSeverity) else severity
+
+        def matches(event: dict[str, Any]) -> bool:
+            ts = event.get("timestamp", "")
+            return (
+                (since_s is None or ts >= since_s)
+                and (until_s is None or ts <= until_s)
+                and (severity_s is None or event.get("severity") == severity_s)
+                and (action is None or event.get("action") == action)
+            )
+
+        def may_match(stats: dict[str, Any]) -> bool:
+            return (
+                (until_s is None or not stats["start"] or stats["start"] <= until_s)
+                and (severity_s is None or severity_s in stats["severities"])
+                and (action is None or action in stats["actions"])
+            )
+
+        results: list[dict[str, Any]] = []
+
+        def scan(path: Path, blocks: list[dict[str, Any]], compressed: bool) -> bool:
+            """Collect matches from ``blocks``, newest first; True once ``limit`` is hit."""
+            with open(path, "rb") as f:
+                for block, end in reversed(list(_with_ends(blocks))):
+                    if since_s is not None and block["end"] and block["end"] < since_s:
+                        break  # blocks are chronological; everything older is out of range
+                    if not may_match(block):
+                        continue
+                    f.seek(block["offset"])
+                    data = f.read() if end is None else f.read(end - block["offset"])
+                    if compressed:
+                        data = gzip.decompress(data)
+                    for line in reversed(data.splitlines()):
+                        event = _parse_line(line)
+                        if event is not None and matches(event):
+                            results.append(event)
+                            if len(results) >= limit:
+                                return True
+            return False
+
+        if self._buffered:
+            self.flush(timeout=1.0)
+
+        with self._file_lock:
+            active = self._active_stats()
+            if self.log_path.exists() and scan(self.log_path, active["blocks"], False):
+                return results
+            segments = self._load_index()
+
+        for seg in reversed(segments):
+            if since_s is not None and seg["end"] and seg["end"] < since_s:
+                break  # segments are chronological; everything older is out of range
+            if not may_match(seg):
+                continue
+            path = self.log_path.with_name(seg["file"])
+            # Segments written before block indexing are read as one block
+            blocks = seg.get("blocks") or [{**seg, "offset": 0}]
+            try:
+                if scan(path, blocks, True):
+                    return results
+            except (OSError, EOFError, zlib.error):
+                continue
+        return results
+
+    def clear(self) -> None:
+        """Delete the active log, all rotated segments and the index."""
+        self.flush(timeout=1.0)
+        with self._file_lock:
+            self._close_file()
+            for seg in self._load_index():
+                self.log_path.with_name(seg["file"]).unlink(missing_ok=True)
+            self.index_path.unlink(missing_ok=True)
+            if self.log_path.exists():
+                self.log_path.write_text("")
+            self._active = _new_stats(blocks=True)
+
+
+def _new_stats(blocks: bool = False) -> dict[str, Any]:
+    stats: dict[str, Any] = {"start": "", "end": "", "count": 0, "severities": {}, "actions": {}}
+    if blocks:
+        stats["blocks"] = []
+    return stats
+
+
+def _add_to_stats(stats: dict[str, Any], event: dict[str, Any], offset: int | None = None) -> None:
+    """Count ``event`` in ``stats`` (and in its current block, given the line offset)."""
+    if offset is not None:
+        blocks = stats["blocks"]
+        if not blocks or blocks[-1]["count"] >= _INDEX_BLOCK_EVENTS:
+            # The first block starts at 0 so unparseable leading lines are kept
+            blocks.append({"offset": offset if blocks else 0, **_new_stats()})
+        _add_to_stats(blocks[-1], event)
+    ts = event.get("timestamp", "")
+    if ts:
+        if not stats["start"] or ts < stats["start"]:
+            stats["start"] = ts
+        if ts > stats["end"]:
+            stats["end"] = ts
+    stats["count"] += 1
+    for key, field_name in (("severities", "severity"), ("actions", "action")):
+        value = str(event.get(field_name, ""))
+        stats[key][value] = stats[key].get(value, 0) + 1
+
+
+def _parse_line(line: bytes) -> dict[str, Any] | None:
+    try:
+        event = json.loads(line)
+    except ValueError:
+        return None
+    return event if isinstance(event, dict) else None
+
+
+def _with_ends(blocks: list[dict[str, Any]]) -> Iterator[tuple[dict[str, Any], int | None]]:
+    """Pair each block with the next one's offset (None for the last: read to EOF)."""
+    ends = [block["offset"] for block in blocks[1:]]
+    yield from zip(blocks, [*ends, None])
+
 
 # Singleton
 _audit_logger: AuditLogger | None = None
@@ -130,4 +496,14 @@ def get_audit_logger() -> AuditLogger:
     global _audit_logger
     if _audit_logger is None:
         _audit_logger = AuditLogger()
+
+        from pocketpaw.lifecycle import register
+
+        def _reset():
+            global _audit_logger
+            _audit_logger = None
+
+        register("audit_logger", shutdown=_audit_logger.close, reset=_reset)
+        # Queued events must reach disk even without a graceful shutdown
+        atexit.register(_audit_logger.close)
     return _audit_logger
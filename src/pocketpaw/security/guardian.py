@@ -1,18 +1,46 @@
 """
 Guardian Agent - AI Security Filter.
 Created: 2026-02-02
+Updated: 2026-10-19 - Allowlisted read-only commands skip the LLM, LLM verdicts
+are cached per normalized command (cleared when the policy changes), and
+stats() counts how often the LLM is consulted.
 
 This module provides a secondary LLM check for dangerous actions.
 """
 
+import hashlib
 import logging
+import shlex
+import time
+from collections import OrderedDict
 
 from pocketpaw.config import get_settings
 from pocketpaw.security.audit import AuditEvent, AuditSeverity, get_audit_logger
-from pocketpaw.security.rails import COMPILED_DANGEROUS_PATTERNS
+from pocketpaw.security.rails import COMPILED_DANGEROUS_PATTERNS, DANGEROUS_PATTERNS
 
 logger = logging.getLogger("guardian")
 
+# Shell syntax that chains, redirects, substitutes or expands. A command
+# containing any of these never takes the allowlist fast path: with ``$``
+# expansion, what runs depends on the environment rather than the text.
+_SHELL_METACHARACTERS = (";", "&", ">", "<", "`", "$", "\n", "\r")
+# Flags that make otherwise read-only commands write files (git log --output=...)
+_WRITE_FLAGS = ("--output",)
+_MAX_CACHED_VERDICTS = 1024
+
+
+def normalize_command(command: str) -> str:
+    """Canonical form of a command for verdict caching.
+
+    Runs of whitespace between plain words collapse to one space. Commands
+    with quoting, escapes or ``$`` are only stripped, since rewriting those
+    could change what the shell runs.
+    """
+    command = command.strip()
+    if any(c in command for c in "\"'\\$"):
+        return command
+    return " ".join(command.split())
+
 
 class GuardianAgent:
     """
@@ -46,6 +74,84 @@ Respond with valid JSON only:
         self.settings = get_settings()
         self.client = None
         self._audit = get_audit_logger()
+        # normalized command -> (expires_at, is_safe, reason)
+        self._verdicts: OrderedDict[str, tuple[float, bool, str]] = OrderedDict()
+        self._policy: str | None = None
+        self._checks = 0
+        self._allowlisted = 0
+        self._cache_hits = 0
+        self._llm_calls = 0
+        self._local_checks = 0
+
+    def stats(self) -> dict:
+        """How commands were decided (the LLM is only consulted for ``llm_calls``)."""
+        return {
+            "checks": self._checks,
+            "allowlisted": self._allowlisted,
+            "cache_hits": self._cache_hits,
+            "llm_calls": self._llm_calls,
+            "local_checks": self._local_checks,
+            "cached_verdicts": len(self._verdicts),
+        }
+
+    def _allowlist_match(self, command: str) -> list[str] | None:
+        """Allowlist entries covering every stage of a simple pipeline, or None.
+
+        Only plain commands and ``|`` pipelines qualify; anything matching
+        COMPILED_DANGEROUS_PATTERNS is never fast-pathed.
+        """
+        if any(m in command for m in _SHELL_METACHARACTERS):
+            return None
+        if any(pattern.search(command) for pattern in COMPILED_DANGEROUS_PATTERNS):
+            return None
+        allowlist = [entry.split() for entry in self.settings.guardian_allowlist if entry.strip()]
+        matched: list[str] = []
+        for stage in command.split("|"):
+            try:
+                tokens = shlex.split(stage)
+            except ValueError:
+                return None
+            if not tokens or any(t.startswith(_WRITE_FLAGS) for t in tokens):
+                return None
+            entry = next((e for e in allowlist if tokens[: len(e)] == e), None)
+            if entry is None:
+                return None
+            matched.append(" ".join(entry))
+        return matched
+
+    def _policy_fingerprint(self) -> str:
+        """Changes whenever anything that decides a verdict changes."""
+        parts = [
+            self.SYSTEM_PROMPT,
+            self.settings.anthropic_model,
+            *sorted(self.settings.guardian_allowlist),
+            *DANGEROUS_PATTERNS,
+        ]
+        return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+    def _cached_verdict(self, key: str) -> tuple[bool, str] | None:
+        policy = self._policy_fingerprint()
+        if policy != self._policy:
+            self._verdicts.clear()
+            self._policy = policy
+        entry = self._verdicts.get(key)
+        if entry is None:
+            return None
+        expires_at, is_safe, reason = entry
+        if time.monotonic() >= expires_at:
+            del self._verdicts[key]
+            return None
+        self._verdicts.move_to_end(key)
+        return is_safe, reason
+
+    def _cache_verdict(self, key: str, is_safe: bool, reason: str) -> None:
+        ttl = self.settings.guardian_cache_ttl
+        if ttl <= 0:
+            return
+        self._verdicts[key] = (time.monotonic() + ttl, is_safe, reason)
+        self._verdicts.move_to_end(key)
+        while len(self._verdicts) > _MAX_CACHED_VERDICTS:
+            self._verdicts.popitem(last=False)
 
     async def _ensure_client(self):
         if not self.client:
@@ -72,9 +178,51 @@ Respond with valid JSON only:
         Check if a command is safe.
         Returns: (is_safe, reason)
         """
+        # Re-read settings so allowlist / TTL / model changes apply (and
+        # invalidate cached verdicts) without a restart
+        self.settings = get_settings()
+        self._checks += 1
+
+        allowlisted = self._allowlist_match(command)
+        if allowlisted is not None:
+            self._allowlisted += 1
+            reason = f"Read-only command on the Guardian allowlist ({', '.join(allowlisted)})"
+            self._audit.log(
+                AuditEvent.create(
+                    severity=AuditSeverity.INFO,
+                    actor="guardian",
+                    action="allowlist_check",
+                    target="shell",
+                    status="allow",
+                    reason=reason,
+                    command=command,
+                )
+            )
+            return True, reason
+
+        cache_key = normalize_command(command)
+        cached = self._cached_verdict(cache_key)
+        if cached is not None:
+            self._cache_hits += 1
+            is_safe, reason = cached
+            self._audit.log(
+                AuditEvent.create(
+                    severity=AuditSeverity.INFO if is_safe else AuditSeverity.ALERT,
+                    actor="guardian",
+                    action="scan_result",
+                    target="shell",
+                    status="allow" if is_safe else "block",
+                    reason=reason,
+                    command=command,
+                    cached=True,
+                )
+            )
+            return is_safe, reason
+
         await self._ensure_client()
 
         if not self.client:
+            self._local_checks += 1
             # No API key — fall back to a strict local pattern check so that
             # known-dangerous commands are still blocked.  This is fail-closed:
             # the local check denies anything matching a dangerous pattern.
@@ -111,6 +259,7 @@ Respond with valid JSON only:
         )
 
         try:
+            self._llm_calls += 1
             response = await self.client.messages.create(
                 model=self.settings.anthropic_model,  # Use same model or faster one
                 max_tokens=100,
@@ -132,6 +281,7 @@ Respond with valid JSON only:
             reason = result.get("reason", "Unknown")
 
             is_safe = status == "SAFE"
+            self._cache_verdict(cache_key, is_safe, reason)
 
             # Audit Result
             self._audit.log(
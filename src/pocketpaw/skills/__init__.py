@@ -7,10 +7,13 @@ Loads skills from ~/.agents/skills/ and ~/.pocketpaw/skills/
 
 from .loader import SkillLoader, get_skill_loader, load_all_skills
 from .executor import SkillExecutor
+from .watcher import SkillWatcher, start_skill_watcher
 
 __all__ = [
     "SkillLoader",
     "get_skill_loader",
     "load_all_skills",
     "SkillExecutor",
+    "SkillWatcher",
+    "start_skill_watcher",
 ]
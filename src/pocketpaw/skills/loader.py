@@ -7,10 +7,17 @@ Skills are loaded from:
 
 Skills follow the AgentSkills spec: a directory with SKILL.md containing
 YAML frontmatter and markdown instructions.
+
+Updated: 2026-10-19 — Parsed skills are indexed by path with mtime/size and
+    the index is persisted, so a reload only re-parses changed SKILL.md files.
+    search() ranks name, description and content matches.
 """
 
+import json
 import logging
+import os
 import re
+import threading
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
@@ -117,19 +124,64 @@ def parse_skill_md(skill_path: Path) -> Optional[Skill]:
     )
 
 
+# Fields of Skill stored in the persisted index (path is the index key)
+_INDEX_FIELDS = (
+    "name",
+    "description",
+    "content",
+    "user_invocable",
+    "disable_model_invocation",
+    "argument_hint",
+    "allowed_tools",
+    "metadata",
+)
+_INDEX_VERSION = 1
+
+
+@dataclass
+class _IndexEntry:
+    """A SKILL.md file as last seen on disk (skill is None if it failed to parse)."""
+
+    mtime_ns: int
+    size: int
+    skill: Skill | None
+
+
+def _entry_to_json(entry: _IndexEntry) -> dict:
+    skill = entry.skill
+    return {
+        "mtime_ns": entry.mtime_ns,
+        "size": entry.size,
+        "skill": None if skill is None else {f: getattr(skill, f) for f in _INDEX_FIELDS},
+    }
+
+
+def _entry_from_json(path: str, data: dict) -> _IndexEntry:
+    skill_data = data.get("skill")
+    skill = None if skill_data is None else Skill(path=Path(path), **skill_data)
+    return _IndexEntry(mtime_ns=data["mtime_ns"], size=data["size"], skill=skill)
+
+
 class SkillLoader:
     """
     Loads skills from configured paths.
 
-    Supports hot-reloading when skills change on disk.
+    Supports hot-reloading when skills change on disk. Reloads are
+    incremental: a SKILL.md whose mtime and size are unchanged is not
+    read again, and with ``index_path`` the parsed skills survive restarts.
     """
 
-    def __init__(self, extra_paths: Optional[list[Path]] = None):
+    def __init__(
+        self,
+        extra_paths: Optional[list[Path]] = None,
+        index_path: Path | None = None,
+    ):
         """
         Initialize the skill loader.
 
         Args:
             extra_paths: Additional paths to search for skills
+            index_path: JSON file to persist the parsed-skill index in
         """
         self.paths = SKILL_PATHS.copy()
         if extra_paths:
@@ -137,6 +189,13 @@ class SkillLoader:
 
         self._skills: dict[str, Skill] = {}
         self._loaded = False
+        self._index_path = index_path
+        self._entries: dict[str, _IndexEntry] = {}
+        self._index_read = False
+        # Lowercased (name, description, content) per skill, for search()
+        self._search_text: dict[str, tuple[str, str, str]] = {}
+        # Reloads may run in a worker thread (SkillWatcher)
+        self._scan_lock = threading.Lock()
 
     def load(self, force: bool = False) -> dict[str, Skill]:
         """
@@ -151,7 +210,17 @@ class SkillLoader:
         if self._loaded and not force:
             return self._skills
 
-        self._skills = {}
+        with self._scan_lock:
+            return self._scan()
+
+    def _scan(self) -> dict[str, Skill]:
+        """Walk the skill paths, re-parsing only new or changed SKILL.md files."""
+        if not self._index_read:
+            self._read_index()
+
+        entries: dict[str, _IndexEntry] = {}
+        skills: dict[str, Skill] = {}
+        parsed = 0
 
         for base_path in self.paths:
             if not base_path.exists():
@@ -165,20 +234,69 @@ class SkillLoader:
                     continue
 
                 skill_md = item / "SKILL.md"
-                if not skill_md.exists():
+                try:
+                    stat = skill_md.stat()
+                except OSError:
                     continue
 
-                skill = parse_skill_md(skill_md)
-                if skill:
+                key = str(skill_md)
+                entry = self._entries.get(key)
+                if entry is None or (entry.mtime_ns, entry.size) != (
+                    stat.st_mtime_ns,
+                    stat.st_size,
+                ):
+                    entry = _IndexEntry(stat.st_mtime_ns, stat.st_size, parse_skill_md(skill_md))
+                    parsed += 1
+                entries[key] = entry
+
+                if entry.skill:
                     # Later paths override earlier (priority order)
-                    self._skills[skill.name] = skill
-                    logger.debug(f"Loaded skill: {skill.name}")
+                    skills[entry.skill.name] = entry.skill
+                    logger.debug(f"Loaded skill: {entry.skill.name}")
+
+        changed = parsed > 0 or entries.keys() != self._entries.keys()
+        self._entries = entries
+        self._skills = skills
+        if changed:
+            self._search_text = {}
+            self._write_index()
 
         self._loaded = True
-        logger.info(f"Loaded {len(self._skills)} skills")
+        logger.info(f"Loaded {len(self._skills)} skills ({parsed} parsed)")
 
         return self._skills
 
+    def _read_index(self) -> None:
+        """Load the persisted index, if any (a bad index is just ignored)."""
+        self._index_read = True
+        if self._index_path is None or not self._index_path.exists():
+            return
+        try:
+            data = json.loads(self._index_path.read_text(encoding="utf-8"))
+            if data.get("version") != _INDEX_VERSION:
+                return
+            self._entries = {
+                path: _entry_from_json(path, entry) for path, entry in data["entries"].items()
+            }
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable skill index {self._index_path}: {e}")
+            self._entries = {}
+
+    def _write_index(self) -> None:
+        """Persist the index (atomic replace)."""
+        if self._index_path is None:
+            return
+        data = {
+            "version": _INDEX_VERSION,
+            "entries": {path: _entry_to_json(entry) for path, entry in self._entries.items()},
+        }
+        tmp = self._index_path.with_suffix(".tmp")
+        try:
+            tmp.write_text(json.dumps(data, default=str), encoding="utf-8")
+            os.replace(tmp, self._index_path)
+        except OSError as e:
+            logger.warning(f"Failed to save skill index: {e}")
+
     def reload(self) -> dict[str, Skill]:
         """Force reload all skills."""
         return self.load(force=True)
@@ -213,20 +331,50 @@ class SkillLoader:
         return [s for s in self._skills.values() if s.user_invocable]
 
     def search(self, query: str = "") -> list[Skill]:
-        """Search user-invocable skills by name and description.
+        """Search user-invocable skills by name, description and content.
+
+        Every whitespace-separated term must appear (case-insensitive
+        substring) in one of the fields. Results are ranked: an exact name
+        beats a name match, which beats a description match, which beats a
+        content match.
 
         Args:
-            query: Case-insensitive substring to match against name + description.
-                   Empty string returns all invocable skills.
+            query: Search terms. Empty string returns all invocable skills.
 
         Returns:
-            List of matching Skill objects.
+            List of matching Skill objects, best first.
         """
         invocable = self.get_invocable()
-        if not query:
+        terms = query.lower().split()
+        if not terms:
             return invocable
-        q = query.lower()
-        return [s for s in invocable if q in s.name.lower() or q in s.description.lower()]
+
+        ranked: list[tuple[int, str, Skill]] = []
+        for skill in invocable:
+            name, description, content = self._searchable(skill)
+            score = 0
+            for term in terms:
+                if term == name:
+                    score += 10
+                elif term in name:
+                    score += 4
+                elif term in description:
+                    score += 2
+                elif term in content:
+                    score += 1
+                else:
+                    break
+            else:
+                ranked.append((-score, skill.name, skill))
+        ranked.sort(key=lambda item: item[:2])
+        return [skill for _, _, skill in ranked]
+
+    def _searchable(self, skill: Skill) -> tuple[str, str, str]:
+        text = self._search_text.get(skill.name)
+        if text is None or text[0] != skill.name.lower():
+            text = (skill.name.lower(), skill.description.lower(), skill.content.lower())
+            self._search_text[skill.name] = text
+        return text
 
     def list_names(self) -> list[str]:
         """Get list of all skill names."""
@@ -244,7 +392,9 @@ def get_skill_loader() -> SkillLoader:
     """Get the singleton SkillLoader instance."""
     global _skill_loader
     if _skill_loader is None:
-        _skill_loader = SkillLoader()
+        from pocketpaw.config import get_config_dir
+
+        _skill_loader = SkillLoader(index_path=get_config_dir() / "skill_index.json")
     return _skill_loader
 
 
@@ -0,0 +1,111 @@
+"""
+SkillWatcher - Keep the skill index current as skills change on disk.
+
+Uses watchfiles (inotify on Linux, FSEvents / ReadDirectoryChangesW elsewhere)
+when it is installed, and polls the skill directories otherwise. Each change
+triggers an incremental SkillLoader reload, which only re-parses the SKILL.md
+files whose mtime or size changed.
+
+Created: 2026-10-19
+"""
+
+import asyncio
+import logging
+
+from .loader import SkillLoader, get_skill_loader
+
+logger = logging.getLogger(__name__)
+
+
+class SkillWatcher:
+    """Background task that reloads a SkillLoader when its directories change."""
+
+    def __init__(self, loader: SkillLoader, poll_interval: float = 10.0):
+        """
+        Initialize the watcher.
+
+        Args:
+            loader: The loader to keep current
+            poll_interval: Seconds between rescans when watchfiles is unavailable
+        """
+        self.loader = loader
+        self.poll_interval = poll_interval
+        self._task: asyncio.Task | None = None
+        self._stop = asyncio.Event()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start watching (no-op if already running)."""
+        if self.running:
+            return
+        self._stop = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop watching."""
+        self._stop.set()
+        if self._task is not None:
+            try:
+                await self._task
+            except Exception:
+                logger.debug("Skill watcher ended with an error", exc_info=True)
+            self._task = None
+
+    async def _run(self) -> None:
+        await asyncio.to_thread(self.loader.reload)
+
+        try:
+            from watchfiles import awatch
+        except ImportError:
+            awatch = None
+
+        paths = [p for p in self.loader.paths if p.exists()]
+        if awatch is not None and paths:
+            logger.info(f"Watching {len(paths)} skill directories for changes")
+            try:
+                async for _changes in awatch(*paths, stop_event=self._stop):
+                    await self._reload()
+                return
+            except Exception as e:
+                # e.g. inotify watch limit reached
+                logger.warning(f"Skill file watching failed, polling instead: {e}")
+
+        while not self._stop.is_set():
+            try:
+                await asyncio.wait_for(self._stop.wait(), timeout=self.poll_interval)
+            except TimeoutError:
+                await self._reload()
+
+    async def _reload(self) -> None:
+        try:
+            await asyncio.to_thread(self.loader.reload)
+        except Exception:
+            logger.exception("Skill reload failed")
+
+
+# Singleton instance
+_skill_watcher: SkillWatcher | None = None
+
+
+def start_skill_watcher() -> SkillWatcher:
+    """Start the singleton SkillWatcher for the global SkillLoader."""
+    global _skill_watcher
+    if _skill_watcher is None:
+        from pocketpaw.config import get_settings
+
+        _skill_watcher = SkillWatcher(
+            get_skill_loader(), poll_interval=get_settings().skills_poll_interval
+        )
+
+        from pocketpaw.lifecycle import register
+
+        def _reset():
+            global _skill_watcher
+            _skill_watcher = None
+
+        register("skill_watcher", shutdown=_skill_watcher.stop, reset=_reset)
+    _skill_watcher.start()
+    return _skill_watcher
@@ -1,5 +1,6 @@
 # Browser automation tool for AI agent control
 # Changes: Initial creation with BrowserTool class
+#          2026-10-19: Describe snapshot diffs returned by click/scroll
 #
 # Provides browser automation capabilities through Playwright with semantic
 # accessibility tree snapshots for LLM-based browser control.
@@ -41,7 +42,10 @@ class BrowserTool(BaseTool):
         return (
             "Control a web browser to navigate pages, click elements, fill forms, "
             "and capture screenshots. Uses semantic accessibility snapshots with "
-            "[ref=N] markers for element identification."
+            "[ref=N] markers for element identification. After click and scroll, "
+            "only the changed parts of the page may be returned ([-] removed, "
+            "[+] added); refs of unchanged elements stay valid. Use the snapshot "
+            "action to see the full page."
         )
 
     @property
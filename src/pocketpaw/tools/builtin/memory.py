@@ -154,11 +154,7 @@ class ForgetTool(BaseTool):
             if not results:
                 return f"No memories found matching: {query}"
 
-            deleted = 0
-            for entry in results:
-                ok = await manager._store.delete(entry.id)
-                if ok:
-                    deleted += 1
+            deleted = await manager.delete_many([entry.id for entry in results])
 
             return f"Forgot {deleted} memory(ies) matching: {query}"
 
@@ -1,18 +1,51 @@
 # URL Extract tool — fetch clean content from URLs via Parallel AI or local fallback.
 # Created: 2026-02-06
+# Updated: 2026-10-19 — Local fetches run concurrently over the shared HTTP
+#   client, HTML conversion runs in a worker thread, and converted pages are
+#   cached with ETag/Last-Modified revalidation.
 
+import asyncio
 import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import Any
 
 import httpx
 
 from pocketpaw.config import get_settings
+from pocketpaw.tools.http_client import get_http_client
 from pocketpaw.tools.protocol import BaseTool
 
 logger = logging.getLogger(__name__)
 
 _PARALLEL_EXTRACT_URL = "https://api.parallel.ai/v1beta/extract"
 _MAX_CONTENT_CHARS = 50_000
+# Covers a "deep" research run (10 sources) in one wave
+_MAX_CONCURRENT_FETCHES = 10
+# Cached pages are served without a request for this long, then revalidated
+_CACHE_TTL_SECONDS = 300
+_CACHE_MAX_ENTRIES = 128
+
+
+@dataclass
+class _CachedPage:
+    title: str
+    content: str
+    fetched_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+# url -> converted page, least recently used first
+_page_cache: OrderedDict[str, _CachedPage] = OrderedDict()
+
+
+def _cache_put(url: str, page: _CachedPage) -> None:
+    _page_cache[url] = page
+    _page_cache.move_to_end(url)
+    while len(_page_cache) > _CACHE_MAX_ENTRIES:
+        _page_cache.popitem(last=False)
 
 
 class UrlExtractTool(BaseTool):
@@ -79,21 +112,20 @@ class UrlExtractTool(BaseTool):
             )
 
         try:
-            async with httpx.AsyncClient(timeout=30) as client:
-                resp = await client.post(
-                    _PARALLEL_EXTRACT_URL,
-                    headers={
-                        "x-api-key": api_key,
-                        "parallel-beta": "search-extract-2025-10-10",
-                        "Content-Type": "application/json",
-                    },
-                    json={
-                        "urls": urls,
-                        "full_content": True,
-                    },
-                )
-                resp.raise_for_status()
-                data = resp.json()
+            resp = await get_http_client().post(
+                _PARALLEL_EXTRACT_URL,
+                headers={
+                    "x-api-key": api_key,
+                    "parallel-beta": "search-extract-2025-10-10",
+                    "Content-Type": "application/json",
+                },
+                json={
+                    "urls": urls,
+                    "full_content": True,
+                },
+            )
+            resp.raise_for_status()
+            data = resp.json()
 
             results = data.get("results", [])
             errors = data.get("errors", [])
@@ -116,47 +148,28 @@ class UrlExtractTool(BaseTool):
 
     async def _extract_local(self, urls: list[str]) -> str:
         try:
-            import html2text
+            import html2text  # noqa: F401
         except ImportError:
             return self._error(
                 "html2text not installed. Install with: pip install 'pocketpaw[extract]'"
             )
 
-        converter = html2text.HTML2Text()
-        converter.ignore_links = False
-        converter.ignore_images = True
-        converter.body_width = 0
+        client = get_http_client()
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_FETCHES)
 
-        results = []
-        async with httpx.AsyncClient(timeout=30, follow_redirects=True) as client:
-            for url in urls:
+        async def fetch(url: str) -> dict:
+            async with semaphore:
                 try:
-                    resp = await client.get(url)
-                    resp.raise_for_status()
-
-                    content_type = resp.headers.get("content-type", "")
-                    if "text/html" in content_type:
-                        text = converter.handle(resp.text)
-                    else:
-                        text = resp.text
-
-                    results.append(
-                        {
-                            "url": url,
-                            "title": _extract_title(resp.text)
-                            if "text/html" in content_type
-                            else url,
-                            "full_content": text[:_MAX_CONTENT_CHARS],
-                        }
-                    )
+                    page = await _fetch_page(client, url)
+                    return {"url": url, "title": page.title, "full_content": page.content}
                 except Exception as e:
-                    results.append(
-                        {
-                            "url": url,
-                            "title": url,
-                            "full_content": f"Error fetching URL: {e}",
-                        }
-                    )
+                    return {
+                        "url": url,
+                        "title": url,
+                        "full_content": f"Error fetching URL: {e}",
+                    }
+
+        results = await asyncio.gather(*(fetch(url) for url in urls))
 
         if not results:
             return self._error("No content extracted from the provided URLs.")
@@ -181,6 +194,56 @@ class UrlExtractTool(BaseTool):
         return "\n".join(lines)
 
 
+async def _fetch_page(client: httpx.AsyncClient, url: str) -> _CachedPage:
+    """Fetch and convert one page, going through the page cache."""
+    cached = _page_cache.get(url)
+    if cached is not None and time.monotonic() - cached.fetched_at < _CACHE_TTL_SECONDS:
+        _page_cache.move_to_end(url)
+        return cached
+
+    headers = {}
+    if cached is not None:
+        if cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+
+    resp = await client.get(url, headers=headers)
+    if resp.status_code == 304 and cached is not None:
+        cached.fetched_at = time.monotonic()
+        _page_cache.move_to_end(url)
+        return cached
+    resp.raise_for_status()
+
+    body = resp.text
+    if "text/html" in resp.headers.get("content-type", ""):
+        # html2text on a large page takes long enough to stall the event loop
+        title, text = await asyncio.to_thread(_convert_html, body)
+    else:
+        title, text = url, body
+
+    page = _CachedPage(
+        title=title,
+        content=text[:_MAX_CONTENT_CHARS],
+        fetched_at=time.monotonic(),
+        etag=resp.headers.get("etag"),
+        last_modified=resp.headers.get("last-modified"),
+    )
+    _cache_put(url, page)
+    return page
+
+
+def _convert_html(html: str) -> tuple[str, str]:
+    """Title and markdown text of an HTML page."""
+    import html2text
+
+    converter = html2text.HTML2Text()
+    converter.ignore_links = False
+    converter.ignore_images = True
+    converter.body_width = 0
+    return _extract_title(html), converter.handle(html)
+
+
 def _extract_title(html: str) -> str:
     """Extract <title> from HTML, falling back to 'Untitled'."""
     import re
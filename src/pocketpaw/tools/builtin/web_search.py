@@ -1,6 +1,9 @@
 # Web Search tool — search the web via Tavily or Brave APIs.
 # Created: 2026-02-06
 # Part of Phase 1 Quick Wins
+# Updated: 2026-10-19 — Results go through the shared search cache (with
+#   single-flight for identical in-flight queries) and requests use the shared
+#   HTTP client.
 
 import logging
 from typing import Any
@@ -8,7 +11,9 @@ from typing import Any
 import httpx
 
 from pocketpaw.config import get_settings
+from pocketpaw.tools.http_client import get_http_client
 from pocketpaw.tools.protocol import BaseTool
+from pocketpaw.tools.search_cache import get_search_cache
 
 logger = logging.getLogger(__name__)
 
@@ -62,16 +67,24 @@ class WebSearchTool(BaseTool):
         provider = settings.web_search_provider
 
         if provider == "tavily":
-            return await self._search_tavily(query, num_results, settings.tavily_api_key)
+            search, api_key = self._search_tavily, settings.tavily_api_key
         elif provider == "brave":
-            return await self._search_brave(query, num_results, settings.brave_search_api_key)
+            search, api_key = self._search_brave, settings.brave_search_api_key
         elif provider == "parallel":
-            return await self._search_parallel(query, num_results, settings.parallel_api_key)
+            search, api_key = self._search_parallel, settings.parallel_api_key
         else:
             return self._error(
                 f"Unknown search provider '{provider}'. Use 'tavily', 'brave', or 'parallel'."
             )
 
+        return await get_search_cache().get_or_fetch(
+            provider,
+            query,
+            num_results,
+            lambda: search(query, num_results, api_key),
+            cacheable=lambda result: not result.startswith("Error"),
+        )
+
     async def _search_tavily(self, query: str, num_results: int, api_key: str | None) -> str:
         if not api_key:
             return self._error(
@@ -80,18 +93,18 @@ class WebSearchTool(BaseTool):
             )
 
         try:
-            async with httpx.AsyncClient(timeout=15) as client:
-                resp = await client.post(
-                    _TAVILY_URL,
-                    json={
-                        "api_key": api_key,
-                        "query": query,
-                        "max_results": num_results,
-                        "include_answer": False,
-                    },
-                )
-                resp.raise_for_status()
-                data = resp.json()
+            resp = await get_http_client().post(
+                _TAVILY_URL,
+                timeout=15,
+                json={
+                    "api_key": api_key,
+                    "query": query,
+                    "max_results": num_results,
+                    "include_answer": False,
+                },
+            )
+            resp.raise_for_status()
+            data = resp.json()
 
             results = data.get("results", [])
             if not results:
@@ -112,17 +125,17 @@ class WebSearchTool(BaseTool):
             )
 
         try:
-            async with httpx.AsyncClient(timeout=15) as client:
-                resp = await client.get(
-                    _BRAVE_URL,
-                    params={"q": query, "count": num_results},
-                    headers={
-                        "X-Subscription-Token": api_key,
-                        "Accept": "application/json",
-                    },
-                )
-                resp.raise_for_status()
-                data = resp.json()
+            resp = await get_http_client().get(
+                _BRAVE_URL,
+                timeout=15,
+                params={"q": query, "count": num_results},
+                headers={
+                    "X-Subscription-Token": api_key,
+                    "Accept": "application/json",
+                },
+            )
+            resp.raise_for_status()
+            data = resp.json()
 
             web_results = data.get("web", {}).get("results", [])
             if not web_results:
@@ -152,21 +165,21 @@ class WebSearchTool(BaseTool):
             )
 
         try:
-            async with httpx.AsyncClient(timeout=15) as client:
-                resp = await client.post(
-                    _PARALLEL_SEARCH_URL,
-                    headers={
-                        "x-api-key": api_key,
-                        "parallel-beta": "search-extract-2025-10-10",
-                        "Content-Type": "application/json",
-                    },
-                    json={
-                        "search_queries": [query],
-                        "max_results": num_results,
-                    },
-                )
-                resp.raise_for_status()
-                data = resp.json()
+            resp = await get_http_client().post(
+                _PARALLEL_SEARCH_URL,
+                timeout=15,
+                headers={
+                    "x-api-key": api_key,
+                    "parallel-beta": "search-extract-2025-10-10",
+                    "Content-Type": "application/json",
+                },
+                json={
+                    "search_queries": [query],
+                    "max_results": num_results,
+                },
+            )
+            resp.raise_for_status()
+            data = resp.json()
 
             results = data.get("results", [])
             if not results:
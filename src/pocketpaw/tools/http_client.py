@@ -0,0 +1,74 @@
+"""Shared HTTP client for web-facing tools.
+
+Created: 2026-10-19
+
+Tools that fetch pages or call search APIs used to open a fresh
+``httpx.AsyncClient`` per call, paying DNS, TCP and TLS setup every time.
+``get_http_client()`` returns one process-wide client with keep-alive
+connection pooling, using HTTP/2 when the optional ``h2`` package is
+installed (``pip install 'httpx[http2]'``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+_TIMEOUT = 30.0
+_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20, keepalive_expiry=30)
+
+_client: httpx.AsyncClient | None = None
+# Connections belong to the loop that opened them; a client from another
+# (e.g. finished) loop is not reused.
+_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared client (follows redirects, 30s timeout).
+
+    Callers must not close it or use it as a context manager.
+    """
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = httpx.AsyncClient(
+            timeout=_TIMEOUT,
+            follow_redirects=True,
+            limits=_LIMITS,
+            http2=_http2_available(),
+        )
+        _client_loop = loop
+
+        from pocketpaw.lifecycle import register
+
+        register("http_client", shutdown=close_http_client, reset=_reset)
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared client (app shutdown)."""
+    global _client, _client_loop
+    client, _client, _client_loop = _client, None, None
+    if client is not None and not client.is_closed:
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.debug("Error closing shared HTTP client: %s", e)
+
+
+def _reset() -> None:
+    global _client, _client_loop
+    _client = None
+    _client_loop = None
@@ -0,0 +1,183 @@
+"""Tool retrieval — pick the tools relevant to a turn from a large catalog.
+
+Created: 2026-10-19
+
+Every connected MCP server adds its tools to every LLM request. With several
+servers installed that is hundreds of schemas per call. ``ToolIndex`` indexes
+tool names, descriptions and parameter schemas once (BM25 over word terms), and
+``search()`` ranks them against the user's message so a backend can send only
+the top-K, plus the ``load_tools`` meta-tool for the model to fetch more.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from collections import Counter
+from typing import Any
+
+# Name of the meta-tool that lets the model load tools not offered up front
+LOAD_TOOLS_NAME = "load_tools"
+
+# Words too common in tool descriptions / chat messages to carry signal
+_STOP_WORDS = frozenset(
+    {
+        "a",
+        "an",
+        "and",
+        "are",
+        "as",
+        "be",
+        "by",
+        "can",
+        "do",
+        "for",
+        "from",
+        "get",
+        "i",
+        "in",
+        "is",
+        "it",
+        "me",
+        "my",
+        "of",
+        "on",
+        "or",
+        "please",
+        "the",
+        "this",
+        "to",
+        "tool",
+        "use",
+        "what",
+        "with",
+        "you",
+    }
+)
+
+_CAMEL_BOUNDARY = re.compile(r"(?<=[a-z0-9])(?=[A-Z])")
+_WORD = re.compile(r"[a-z0-9]+")
+
+
+def _terms(text: str) -> list[str]:
+    """Split identifiers and prose into lowercase terms (naive plural folding)."""
+    words = _WORD.findall(_CAMEL_BOUNDARY.sub(" ", text).lower())
+    return [
+        w[:-1] if len(w) > 3 and w.endswith("s") and not w.endswith("ss") else w
+        for w in words
+        if w not in _STOP_WORDS
+    ]
+
+
+def _schema_text(schema: Any) -> str:
+    """Property names and descriptions of a JSON schema, flattened."""
+    if not isinstance(schema, dict):
+        return ""
+    parts: list[str] = []
+    for name, prop in (schema.get("properties") or {}).items():
+        parts.append(name)
+        if isinstance(prop, dict):
+            parts.append(str(prop.get("description", "")))
+            parts.append(_schema_text(prop))
+    return " ".join(parts)
+
+
+class ToolIndex:
+    """Static BM25 index over tool definitions (Anthropic format dicts).
+
+    Names count three times and descriptions twice relative to schema text,
+    since a match on what the tool *is* matters more than on a parameter.
+    """
+
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(self, tools: list[dict]):
+        self._tools = {t["name"]: t for t in tools}
+        self._postings: dict[str, dict[str, int]] = {}
+        self._lengths: dict[str, int] = {}
+        for tool in tools:
+            terms = Counter(_terms(tool["name"]) * 3)
+            terms.update(_terms(tool.get("description", "")) * 2)
+            terms.update(_terms(_schema_text(tool.get("input_schema"))))
+            for term, tf in terms.items():
+                self._postings.setdefault(term, {})[tool["name"]] = tf
+            self._lengths[tool["name"]] = sum(terms.values())
+        self._avg_length = (sum(self._lengths.values()) / len(self._lengths)) if tools else 1.0
+
+    def __len__(self) -> int:
+        return len(self._tools)
+
+    def get(self, name: str) -> dict | None:
+        return self._tools.get(name)
+
+    def search(self, query: str, limit: int, exclude: set[str] | None = None) -> list[str]:
+        """Names of the ``limit`` best-matching tools, best first."""
+        n_docs = len(self._tools)
+        scores: dict[str, float] = {}
+        for term in set(_terms(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (n_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+            for name, tf in postings.items():
+                norm = self.K1 * (1 - self.B + self.B * self._lengths[name] / self._avg_length)
+                scores[name] = scores.get(name, 0.0) + idf * tf * (self.K1 + 1) / (tf + norm)
+        ranked = sorted(
+            (name for name in scores if not exclude or name not in exclude),
+            key=lambda name: (-scores[name], name),
+        )
+        return ranked[:limit]
+
+
+def load_tools_definition(servers: list[str]) -> dict:
+    """Anthropic-format definition of the ``load_tools`` meta-tool."""
+    available = ", ".join(servers) if servers else "none"
+    return {
+        "name": LOAD_TOOLS_NAME,
+        "description": (
+            "Only the tools most relevant to this conversation are loaded. If you need "
+            "a capability you don't see (e.g. from a connected service), call this with "
+            "a short description of it; matching tools become available on your next "
+            f"step. Connected tool servers: {available}."
+        ),
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "What the tool should do, e.g. 'create a GitHub issue'",
+                }
+            },
+            "required": ["query"],
+        },
+    }
+
+
+class ToolSelection:
+    """Tools offered during one conversation turn.
+
+    Starts with the top-K matches for the turn's text; ``load()`` (the
+    ``load_tools`` meta-tool) adds more. The selection only grows, so the
+    tool list stays stable between iterations of the turn.
+    """
+
+    def __init__(self, index: ToolIndex, query: str, top_k: int):
+        self._index = index
+        self._top_k = top_k
+        self.names: set[str] = set(index.search(query, top_k))
+
+    def tools(self) -> list[dict]:
+        """Selected tool definitions, sorted by name."""
+        return [self._index.get(name) for name in sorted(self.names)]
+
+    def load(self, query: str) -> str:
+        """Add the best matches for ``query``; returns a summary for the model."""
+        found = self._index.search(query, self._top_k, exclude=self.names)
+        if not found:
+            return f"No additional tools match '{query}'."
+        self.names.update(found)
+        lines = [
+            f"- {name}: {self._index.get(name).get('description', '')[:200]}" for name in found
+        ]
+        return "Loaded tools (available from your next step):\n" + "\n".join(lines)
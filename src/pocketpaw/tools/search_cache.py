@@ -0,0 +1,242 @@
+"""Web search result cache with single-flight de-duplication.
+
+Created: 2026-10-19
+
+Search APIs are paid per call and take 0.5-2s, and the same query is often
+repeated within minutes: by another session, or by ``ResearchTool`` right
+after the agent searched it. ``SearchCache`` keys results by provider,
+normalized query and result count. It keeps them in a memory LRU and
+optionally in ~/.pocketpaw/cache/search/. Concurrent identical searches
+share one API call.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+from pocketpaw.config import get_config_dir
+
+logger = logging.getLogger(__name__)
+
+_MAX_DISK_ENTRIES = 1000
+
+
+def normalize_query(query: str) -> str:
+    """Case- and whitespace-insensitive form of a search query."""
+    return " ".join(query.casefold().split())
+
+
+class SearchCache:
+    """Memory LRU (plus optional disk tier) of formatted search results.
+
+    Usage:
+        cache = SearchCache(ttl=600)
+        text = await cache.get_or_fetch("tavily", query, 5, fetch)
+    """
+
+    def __init__(
+        self,
+        ttl: float = 600,
+        max_entries: int = 256,
+        disk_dir: Path | None = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl: Seconds a result stays valid (0 disables caching)
+            max_entries: Size of the memory LRU
+            disk_dir: Directory for the on-disk tier, or None for memory only
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.disk_dir = disk_dir
+        # key -> (expires_at monotonic, result)
+        self._memory: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future[str]] = {}
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._coalesced = 0
+
+    async def get_or_fetch(
+        self,
+        provider: str,
+        query: str,
+        num_results: int,
+        fetch: Callable[[], Awaitable[str]],
+        cacheable: Callable[[str], bool] = lambda result: True,
+    ) -> str:
+        """Return a cached result or run ``fetch`` (once per concurrent key).
+
+        Results for which ``cacheable`` returns False (e.g. API errors) are
+        returned to every waiter but not stored.
+        """
+        if self.ttl <= 0:
+            return await fetch()
+
+        key = self._key(provider, query, num_results)
+        cached = self._get(key)
+        if cached is not None:
+            return cached
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self._coalesced += 1
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                # The leading call was cancelled, not this one: fetch ourselves
+                task = asyncio.current_task()
+                if pending.cancelled() and task is not None and not task.cancelling():
+                    return await self.get_or_fetch(provider, query, num_results, fetch, cacheable)
+                raise
+
+        self._misses += 1
+        future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await fetch()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Waiters receive the exception; don't warn if there are none
+            future.exception()
+            raise
+        else:
+            if cacheable(result):
+                self._put(key, result)
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss counters for monitoring."""
+        lookups = self._hits + self._disk_hits + self._misses + self._coalesced
+        return {
+            "entries": len(self._memory),
+            "hits": self._hits,
+            "disk_hits": self._disk_hits,
+            "misses": self._misses,
+            "coalesced": self._coalesced,
+            "hit_rate": (lookups - self._misses) / lookups if lookups else 0.0,
+        }
+
+    def clear(self) -> None:
+        """Drop all cached results (memory and disk)."""
+        self._memory.clear()
+        if self.disk_dir is not None and self.disk_dir.exists():
+            for path in self.disk_dir.glob("*.json"):
+                path.unlink(missing_ok=True)
+
+    # -- internals --
+
+    @staticmethod
+    def _key(provider: str, query: str, num_results: int) -> str:
+        raw = f"{provider}\0{normalize_query(query)}\0{num_results}"
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def _get(self, key: str) -> str | None:
+        entry = self._memory.get(key)
+        if entry is not None:
+            expires_at, result = entry
+            if time.monotonic() < expires_at:
+                self._memory.move_to_end(key)
+                self._hits += 1
+                return result
+            del self._memory[key]
+
+        disk = self._disk_get(key)
+        if disk is not None:
+            expires_at, result = disk
+            self._memory_put(key, time.monotonic() + (expires_at - time.time()), result)
+            self._disk_hits += 1
+            return result
+        return None
+
+    def _put(self, key: str, result: str) -> None:
+        self._memory_put(key, time.monotonic() + self.ttl, result)
+        self._disk_put(key, time.time() + self.ttl, result)
+
+    def _memory_put(self, key: str, expires_at: float, result: str) -> None:
+        self._memory[key] = (expires_at, result)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _disk_get(self, key: str) -> tuple[float, str] | None:
+        if self.disk_dir is None:
+            return None
+        path = self.disk_dir / f"{key}.json"
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            expires_at, result = float(data["expires_at"]), str(data["result"])
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug("Unreadable search cache entry %s: %s", path.name, e)
+            path.unlink(missing_ok=True)
+            return None
+        if expires_at <= time.time():
+            path.unlink(missing_ok=True)
+            return None
+        return expires_at, result
+
+    def _disk_put(self, key: str, expires_at: float, result: str) -> None:
+        if self.disk_dir is None:
+            return
+        try:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+            path = self.disk_dir / f"{key}.json"
+            tmp = path.with_suffix(".tmp")
+            tmp.write_text(json.dumps({"expires_at": expires_at, "result": result}))
+            tmp.replace(path)
+            self._disk_prune()
+        except OSError as e:
+            logger.warning("Failed to write search cache entry: %s", e)
+
+    def _disk_prune(self) -> None:
+        files = list(self.disk_dir.glob("*.json"))
+        if len(files) <= _MAX_DISK_ENTRIES:
+            return
+        files.sort(key=lambda p: p.stat().st_mtime)
+        for path in files[: len(files) - _MAX_DISK_ENTRIES]:
+            path.unlink(missing_ok=True)
+
+
+# Singleton
+_cache: SearchCache | None = None
+
+
+def get_search_cache() -> SearchCache:
+    """Get the shared search cache, configured from settings."""
+    global _cache
+    if _cache is None:
+        from pocketpaw.config import get_settings
+
+        settings = get_settings()
+        _cache = SearchCache(
+            ttl=settings.web_search_cache_ttl,
+            disk_dir=(
+                get_config_dir() / "cache" / "search" if settings.web_search_disk_cache else None
+            ),
+        )
+
+        from pocketpaw.lifecycle import register
+
+        def _reset():
+            global _cache
+            _cache = None
+
+        register("search_cache", reset=_reset)
+    return _cache
@@ -0,0 +1,162 @@
+"""Tests for the buffered, rotating audit log writer and its indexed query."""
+
+import gzip
+import json
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+from pocketpaw.security import audit as audit_module
+from pocketpaw.security.audit import AuditEvent, AuditLogger, AuditSeverity
+
+
+def _event(action: str = "tool_use", severity: AuditSeverity = AuditSeverity.INFO, **ctx):
+    return AuditEvent.create(
+        severity=severity, actor="agent", action=action, target="t", status="ok", **ctx
+    )
+
+
+class TestBufferedWriter:
+    def test_events_written_after_flush(self, tmp_path):
+        audit = AuditLogger(log_path=tmp_path / "audit.jsonl")
+        ids = [audit.log_tool_use("shell", {"i": i}) for i in range(50)]
+        audit.flush()
+
+        lines = (tmp_path / "audit.jsonl").read_text().splitlines()
+        assert [json.loads(line)["id"] for line in lines] == ids
+        audit.close()
+
+    def test_callbacks_fire_immediately(self, tmp_path):
+        audit = AuditLogger(log_path=tmp_path / "audit.jsonl")
+        seen = []
+        audit.on_log(seen.append)
+        audit.log(_event())
+        assert len(seen) == 1
+        audit.close()
+
+    def test_full_queue_writes_inline(self, tmp_path):
+        audit = AuditLogger(log_path=tmp_path / "audit.jsonl", max_queue_size=1)
+        for _ in range(20):
+            audit.log(_event())
+        audit.close()
+        assert len((tmp_path / "audit.jsonl").read_text().splitlines()) == 20
+
+    def test_unbuffered_writes_synchronously(self, tmp_path):
+        audit = AuditLogger(log_path=tmp_path / "audit.jsonl", buffered=False)
+        audit.log(_event())
+        assert (tmp_path / "audit.jsonl").read_text().count("\n") == 1
+        audit.close()
+
+
+class TestRotation:
+    def test_size_rotation_compresses_and_indexes(self, tmp_path):
+        audit = AuditLogger(log_path=tmp_path / "audit.jsonl", buffered=False, rotate_bytes=2000)
+        for i in range(60):
+            audit.log(_event(action="shell" if i % 2 else "read_file"))
+        audit.close()
+
+        segments = sorted(tmp_path.glob("audit-*.jsonl.gz"))
+        assert segments
+        with gzip.open(segments[0], "rt") as f:
+            assert json.loads(f.readline())["action"] in ("shell", "read_file")
+
+        index = json.loads((tmp_path / "audit.index.json").read_text())["segments"]
+        assert len(index) == len(segments)
+        assert set(index[0]["actions"]) == {"shell", "read_file"}
+        total = sum(seg["count"] for seg in index)
+        active = (tmp_path / "audit.jsonl").read_text().count("\n")
+        assert total + active == 60
+
+    def test_age_rotation(self, tmp_path):
+        log_path = tmp_path / "audit.jsonl"
+        old = _event()
+        old.timestamp = (datetime.now(tz=UTC) - timedelta(days=10)).isoformat()
+        log_path.write_text(json.dumps({**old.__dict__, "severity": "info"}) + "\n")
+
+        audit = AuditLogger(log_path=log_path, buffered=False, rotate_days=7)
+        audit.log(_event())
+        audit.close()
+
+        assert len(list(tmp_path.glob("audit-*.jsonl.gz"))) == 1
+        assert log_path.read_text().count("\n") == 1
+
+
+class TestQuery:
+    def _populated(self, tmp_path) -> AuditLogger:
+        audit = AuditLogger(log_path=tmp_path / "audit.jsonl", buffered=False, rotate_bytes=3000)
+        for i in range(100):
+            severity = AuditSeverity.ALERT if i == 3 else AuditSeverity.INFO
+            audit.log(_event(action=f"act{i % 4}", severity=severity, n=i))
+        return audit
+
+    def test_newest_first_across_segments(self, tmp_path):
+        audit = self._populated(tmp_path)
+        assert len(list(tmp_path.glob("audit-*.jsonl.gz"))) > 1
+
+        results = audit.query(limit=100)
+        assert [e["context"]["n"] for e in results] == list(range(99, -1, -1))
+        assert [e["context"]["n"] for e in audit.query(limit=3)] == [99, 98, 97]
+
+    def test_filters_use_segment_index(self, tmp_path):
+        audit = self._populated(tmp_path)
+
+        alerts = audit.query(severity=AuditSeverity.ALERT)
+        assert [e["context"]["n"] for e in alerts] == [3]
+
+        act1 = audit.query(action="act1", limit=1000)
+        assert len(act1) == 25
+        assert all(e["action"] == "act1" for e in act1)
+
+        assert audit.query(action="missing") == []
+
+    def test_time_range(self, tmp_path):
+        audit = AuditLogger(log_path=tmp_path / "audit.jsonl", buffered=False)
+        audit.log(_event())
+        future = datetime.now(tz=UTC) + timedelta(hours=1)
+        assert audit.query(since=future) == []
+        assert len(audit.query(until=future)) == 1
+
+    def test_clear_removes_segments(self, tmp_path):
+        audit = self._populated(tmp_path)
+        audit.clear()
+        assert audit.query() == []
+        assert not list(tmp_path.glob("audit-*.jsonl.gz"))
+        assert not (tmp_path / "audit.index.json").exists()
+
+    def test_query_reads_only_matching_blocks(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(audit_module, "_INDEX_BLOCK_EVENTS", 10)
+        audit = AuditLogger(log_path=tmp_path / "audit.jsonl", buffered=False, rotate_bytes=20_000)
+        for i in range(150):
+            severity = AuditSeverity.ALERT if i == 3 else AuditSeverity.INFO
+            audit.log(_event(severity=severity, n=i))
+
+        index = json.loads((tmp_path / "audit.index.json").read_text())["segments"]
+        assert len(index[0]["blocks"]) > 1
+
+        with patch.object(audit_module.gzip, "decompress", wraps=gzip.decompress) as unzip:
+            alerts = audit.query(severity=AuditSeverity.ALERT)
+        assert [e["context"]["n"] for e in alerts] == [3]
+        assert unzip.call_count == 1
+
+        results = audit.query(limit=200)
+        assert [e["context"]["n"] for e in results] == list(range(149, -1, -1))
+
+    def test_active_blocks_rebuilt_on_restart(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(audit_module, "_INDEX_BLOCK_EVENTS", 10)
+        first = AuditLogger(log_path=tmp_path / "audit.jsonl", buffered=False)
+        for i in range(25):
+            first.log(_event(n=i))
+        first.close()
+
+        audit = AuditLogger(log_path=tmp_path / "audit.jsonl", buffered=False)
+        assert [e["context"]["n"] for e in audit.query(limit=3)] == [24, 23, 22]
+        assert [b["count"] for b in audit._active["blocks"]] == [10, 10, 5]
+
+    def test_segment_without_blocks_still_queried(self, tmp_path):
+        audit = self._populated(tmp_path)
+        index_path = tmp_path / "audit.index.json"
+        index = json.loads(index_path.read_text())
+        for seg in index["segments"]:
+            del seg["blocks"]
+        index_path.write_text(json.dumps(index))
+
+        assert [e["context"]["n"] for e in audit.query(severity=AuditSeverity.ALERT)] == [3]
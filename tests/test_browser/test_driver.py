@@ -389,3 +389,48 @@ class TestBrowserDriverProperties:
         """Should return None when not launched."""
         driver = BrowserDriver()
         assert driver.current_url is None
+
+
+class TestBrowserDriverSnapshotDiffs:
+    """Tests for diff_snapshots mode."""
+
+    @pytest.fixture(autouse=True)
+    def _playwright(self):
+        import sys
+
+        with patch.dict(sys.modules, {"playwright": MagicMock()}):
+            yield
+
+    def _driver(self, trees: list) -> BrowserDriver:
+        driver = BrowserDriver(diff_snapshots=True)
+        driver._page = AsyncMock()
+        driver._page.url = "https://example.com"
+        driver._page.title = AsyncMock(return_value="Example")
+        driver._page.accessibility.snapshot = AsyncMock(side_effect=trees)
+        driver._page.locator = MagicMock(return_value=AsyncMock())
+        return driver
+
+    @pytest.mark.asyncio
+    async def test_click_returns_diff_and_snapshot_full(self):
+        """Should return only changes after click, and the full page on demand."""
+        links = [{"role": "link", "name": f"Link {i}"} for i in range(10)]
+        before = {"role": "WebArea", "name": "", "children": links}
+        after = {
+            "role": "WebArea",
+            "name": "",
+            "children": [*links, {"role": "alert", "name": "Saved"}],
+        }
+        driver = self._driver([before, after, after])
+
+        full = await driver.navigate("https://example.com")
+        assert not full.is_diff
+
+        clicked = await driver.click(ref=3)
+        assert clicked.is_diff
+        assert '[+] - alert "Saved"' in clicked.snapshot
+        assert "Link 0" not in clicked.snapshot
+        assert clicked.refmap.get_selector(3) == 'role=link[name="Link 2"]'
+
+        again = await driver.snapshot()
+        assert not again.is_diff
+        assert "Link 0" in again.snapshot
@@ -0,0 +1,141 @@
+# Browser pool tests
+# Changes: Initial creation with shared-browser / context-pool tests
+"""Tests for the shared browser pool."""
+
+import asyncio
+import sys
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from pocketpaw.browser.pool import BrowserPool
+from pocketpaw.browser.session import BrowserSessionManager
+
+
+def _mock_browser() -> MagicMock:
+    browser = MagicMock()
+    browser.is_connected.return_value = True
+    browser.close = AsyncMock()
+
+    async def new_context(**kwargs):
+        context = MagicMock()
+        context.close = AsyncMock()
+        context.new_page = AsyncMock(return_value=MagicMock())
+        return context
+
+    browser.new_context = AsyncMock(side_effect=new_context)
+    return browser
+
+
+@pytest.fixture
+def browser():
+    browser = _mock_browser()
+    playwright = MagicMock()
+    playwright.stop = AsyncMock()
+    async_api = MagicMock()
+    async_api.async_playwright.return_value.start = AsyncMock(return_value=playwright)
+    with (
+        patch("pocketpaw.browser.pool.launch_chromium", AsyncMock(return_value=browser)) as launch,
+        patch.dict(sys.modules, {"playwright": MagicMock(), "playwright.async_api": async_api}),
+    ):
+        browser.launch = launch
+        yield browser
+
+
+class TestBrowserPool:
+    """Tests for BrowserPool."""
+
+    @pytest.mark.asyncio
+    async def test_contexts_share_one_browser(self, browser):
+        """Should launch the browser once and hand out separate contexts."""
+        pool = BrowserPool(max_contexts=4, warm_contexts=0)
+
+        b1, c1, _ = await pool.acquire()
+        b2, c2, _ = await pool.acquire()
+
+        assert b1 is b2 is browser
+        assert c1 is not c2
+        assert browser.launch.call_count == 1
+        assert pool.stats()["active_contexts"] == 2
+
+        await pool.release(c1)
+        c1.close.assert_called_once()
+        assert pool.stats()["active_contexts"] == 1
+
+    @pytest.mark.asyncio
+    async def test_warm_context_reused(self, browser):
+        """Should serve the next acquire from the warm pool."""
+        pool = BrowserPool(max_contexts=4, warm_contexts=1)
+
+        await pool.acquire()
+        await asyncio.sleep(0)  # let the refill run
+        assert pool.stats()["warm_contexts"] == 1
+
+        await pool.acquire()
+        assert pool.stats()["warm_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cap_waits_for_release(self, browser):
+        """Should block at max_contexts until a context is released."""
+        pool = BrowserPool(max_contexts=1, warm_contexts=0, acquire_timeout=1)
+        _, context, _ = await pool.acquire()
+
+        waiter = asyncio.create_task(pool.acquire())
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+
+        await pool.release(context)
+        await waiter
+        assert pool.stats()["waits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cap_timeout(self, browser):
+        """Should fail when no slot frees up in time."""
+        pool = BrowserPool(max_contexts=1, warm_contexts=0, acquire_timeout=0.01)
+        await pool.acquire()
+
+        with pytest.raises(RuntimeError, match="exhausted"):
+            await pool.acquire()
+
+    @pytest.mark.asyncio
+    async def test_trim_closes_idle_browser(self, browser):
+        """Should shut the browser down once nothing has used it for a while."""
+        pool = BrowserPool(warm_contexts=0)
+        _, context, _ = await pool.acquire()
+        assert not await pool.trim(0)  # still in use
+
+        await pool.release(context)
+        assert await pool.trim(0)
+        browser.close.assert_called_once()
+        assert pool.stats()["browsers"] == 0
+
+
+class TestPooledSessions:
+    """Tests for BrowserSessionManager on top of the pool."""
+
+    @pytest.mark.asyncio
+    async def test_sessions_borrow_from_pool(self, browser):
+        """Should give each session its own context from one browser."""
+        manager = BrowserSessionManager(pool=BrowserPool(warm_contexts=0))
+
+        s1 = await manager.get_or_create("a")
+        s2 = await manager.get_or_create("b")
+
+        assert s1.driver._context is not s2.driver._context
+        assert manager.stats()["sessions"] == 2
+        assert manager.stats()["active_contexts"] == 2
+        assert browser.launch.call_count == 1
+
+        await manager.close_session("a")
+        assert manager.stats()["active_contexts"] == 1
+
+    @pytest.mark.asyncio
+    async def test_new_session_sweeps_idle_ones(self, browser):
+        """Should close idle sessions through cleanup_idle before creating one."""
+        manager = BrowserSessionManager(pool=BrowserPool(warm_contexts=0), idle_timeout=0)
+        await manager.get_or_create("old")
+        await asyncio.sleep(0.01)
+
+        await manager.get_or_create("new")
+
+        assert manager.list_sessions() == ["new"]
@@ -444,3 +444,70 @@ class TestSnapshotFromPlaywrightTree:
         nav_list = node.children[0].children[0]
         assert nav_list.role == "list"
         assert len(nav_list.children) == 2
+
+
+def _page(*names: str, extra: str | None = None) -> AccessibilityNode:
+    children = [AccessibilityNode(role="link", name=n) for n in names]
+    if extra:
+        children.insert(1, AccessibilityNode(role="heading", name=extra))
+    return AccessibilityNode(role="WebArea", name="", children=children)
+
+
+class TestStableRefsAndDiffs:
+    """Tests for stable refs across snapshots and snapshot diffs."""
+
+    def test_refs_stable_across_snapshots(self):
+        """Should keep an element's ref when other elements appear."""
+        gen = SnapshotGenerator(stable_refs=True)
+        _, first = gen.generate(_page("Home", "About", "Blog"))
+        _, second = gen.generate(_page("Home", "New", "About", "Blog"))
+
+        assert second.refs == first.refs | {4: 'role=link[name="New"]'}
+        assert second.get_selector(2) == 'role=link[name="About"]'
+        assert second.get_selector(4) == 'role=link[name="New"]'
+
+    def test_removed_refs_dropped(self):
+        """Should not keep refs for elements that disappeared."""
+        gen = SnapshotGenerator(stable_refs=True)
+        gen.generate(_page("Home", "About"))
+        _, refmap = gen.generate(_page("Home"))
+        assert refmap.get_selector(2) is None
+
+    def test_duplicate_names_keep_their_refs(self):
+        """Should tell same-named elements apart by order."""
+        gen = SnapshotGenerator(stable_refs=True)
+        text1, _ = gen.generate(_page("More", "More"))
+        text2, _ = gen.generate(_page("More", "More"))
+        assert text1 == text2
+        assert "[ref=1]" in text1 and "[ref=2]" in text1
+
+    def test_diff_lists_only_changes(self):
+        """Should return changed regions with context."""
+        names = [f"Item {i}" for i in range(20)]
+        gen = SnapshotGenerator(stable_refs=True)
+        gen.generate(_page(*names), title="Shop")
+        previous = gen.lines
+        gen.generate(_page(*names, extra="Added to cart"), title="Shop")
+
+        diff = gen.diff(previous)
+
+        assert diff.startswith("Page: Shop")
+        assert '[+] - heading "Added to cart"' in diff
+        assert 'link "Item 0" [ref=1]' in diff  # context line
+        assert "Item 10" not in diff
+
+    def test_diff_no_changes(self):
+        """Should say so when nothing changed."""
+        gen = SnapshotGenerator(stable_refs=True)
+        gen.generate(_page("A", "B"))
+        previous = gen.lines
+        gen.generate(_page("A", "B"))
+        assert gen.diff(previous) == "No changes since the last snapshot."
+
+    def test_diff_falls_back_when_most_changed(self):
+        """Should return None when the page mostly changed."""
+        gen = SnapshotGenerator(stable_refs=True)
+        gen.generate(_page("A", "B", "C"))
+        previous = gen.lines
+        gen.generate(_page("X", "Y", "Z"))
+        assert gen.diff(previous) is None
@@ -225,3 +225,99 @@ async def test_broadcast_excludes_new_channels():
     assert sub_discord.call_count == 1
     assert sub_slack.call_count == 0  # Excluded
     assert sub_whatsapp.call_count == 1
+
+
+def _inbound(channel: Channel, content: str) -> InboundMessage:
+    return InboundMessage(channel=channel, sender_id="u", chat_id="c", content=content)
+
+
+@pytest.mark.asyncio
+async def test_full_channel_does_not_block_others():
+    import asyncio
+
+    bus = MessageBus(max_queue_size=2)
+    for i in range(2):
+        await bus.publish_inbound(_inbound(Channel.DISCORD, f"d{i}"))
+
+    # Discord is full and blocks; Telegram still gets through immediately
+    blocked = asyncio.create_task(bus.publish_inbound(_inbound(Channel.DISCORD, "d2")))
+    await asyncio.wait_for(bus.publish_inbound(_inbound(Channel.TELEGRAM, "t0")), timeout=1)
+    assert not blocked.done()
+    assert bus.inbound_pending(Channel.TELEGRAM) == 1
+
+    await bus.consume_inbound()
+    await asyncio.wait_for(blocked, timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_consume_interleaves_channels_fairly():
+    bus = MessageBus()
+    for i in range(5):
+        await bus.publish_inbound(_inbound(Channel.DISCORD, f"d{i}"))
+    await bus.publish_inbound(_inbound(Channel.TELEGRAM, "t0"))
+
+    first_two = [(await bus.consume_inbound()).channel for _ in range(2)]
+    assert Channel.TELEGRAM in first_two
+
+
+@pytest.mark.asyncio
+async def test_channel_weights():
+    from pocketpaw.bus.queue import ChannelQueuePolicy
+
+    bus = MessageBus(channel_policies={Channel.WEBSOCKET: ChannelQueuePolicy(weight=3)})
+    for i in range(8):
+        await bus.publish_inbound(_inbound(Channel.WEBSOCKET, f"w{i}"))
+        await bus.publish_inbound(_inbound(Channel.DISCORD, f"d{i}"))
+
+    picks = [(await bus.consume_inbound()).channel for _ in range(8)]
+    assert picks.count(Channel.WEBSOCKET) == 6
+    assert picks.count(Channel.DISCORD) == 2
+
+
+@pytest.mark.asyncio
+async def test_overflow_policies_and_stats():
+    from pocketpaw.bus.queue import ChannelQueuePolicy
+
+    bus = MessageBus(
+        channel_policies={
+            Channel.DISCORD: ChannelQueuePolicy(max_size=2, overflow="drop_new"),
+            Channel.SLACK: ChannelQueuePolicy(max_size=2, overflow="drop_oldest"),
+        }
+    )
+    for i in range(4):
+        await bus.publish_inbound(_inbound(Channel.DISCORD, f"d{i}"))
+        await bus.publish_inbound(_inbound(Channel.SLACK, f"s{i}"))
+
+    contents = set()
+    while (msg := await bus.consume_inbound(timeout=0.01)) is not None:
+        contents.add(msg.content)
+    assert contents == {"d0", "d1", "s2", "s3"}
+
+    stats = bus.inbound_stats()
+    assert stats["discord"]["dropped"] == 2
+    assert stats["slack"]["dropped"] == 2
+    assert stats["slack"]["high_water"] == 2
+    assert stats["slack"]["consumed"] == 2
+    assert bus.inbound_pending() == 0
+
+
+def test_unknown_overflow_policy_rejected():
+    with pytest.raises(ValueError):
+        MessageBus(overflow="explode")
+
+
+def test_invalid_overflow_setting_falls_back_to_block():
+    from types import SimpleNamespace
+
+    from pocketpaw.bus.queue import _channel_policies_from_settings, _overflow_from_settings
+
+    settings = SimpleNamespace(
+        bus_overflow_policy="explode",
+        bus_channel_queue_size=10,
+        bus_channel_queue_limits={"discord": 5},
+        bus_channel_weights={},
+    )
+    assert _overflow_from_settings(settings) == "block"
+    policies = _channel_policies_from_settings(settings)
+    assert policies[Channel.DISCORD].overflow == "block"
+    MessageBus(overflow=_overflow_from_settings(settings))
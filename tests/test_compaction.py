@@ -156,6 +156,27 @@ class TestBudgetEnforcement:
         total = sum(len(m["content"]) for m in result)
         assert total <= 2000
 
+    async def test_token_budget_counts_tokens(self):
+        """token_budget measures history with the manager's tokenizer."""
+        entries = _make_entries(20, content_len=200)
+        mgr = _make_manager(entries)
+        result = await mgr.get_compacted_history(
+            "test", recent_window=5, char_budget=100, token_budget=300
+        )
+        total = sum(mgr.tokenizer.count(m["content"]) for m in result)
+        assert total <= 300
+        # The char budget is ignored in token mode
+        assert sum(len(m["content"]) for m in result) > 100
+
+    async def test_token_budget_truncates_single_message(self):
+        from pocketpaw.llm.tokenizer import get_tokenizer
+
+        tokenizer = get_tokenizer()
+        messages = [{"role": "user", "content": "word " * 500}]
+        result = MemoryManager._enforce_budget(messages, 50, tokenizer)
+        assert len(result) == 1
+        assert tokenizer.count(result[0]["content"]) <= 50
+
 
 # ─── Tier 2: LLM summary ────────────────────────────────────────────────
 
@@ -250,6 +271,168 @@ class TestTier2LLMSummary:
         assert "User:" in result[0]["content"]
 
 
+# ─── Incremental Tier 1 ─────────────────────────────────────────────────
+
+
+async def _add_messages(mgr: MemoryManager, key: str, start: int, count: int) -> None:
+    for i in range(start, start + count):
+        role = "user" if i % 2 == 0 else "assistant"
+        await mgr.add_to_session(key, role, f"Message {i}: " + "y" * 40)
+
+
+def _full_recompute(mgr: MemoryManager, key: str, **kwargs):
+    """Reference result computed from scratch by a fresh manager."""
+    return MemoryManager(store=mgr._store).get_compacted_history(key, **kwargs)
+
+
+class TestIncrementalTier1:
+    async def test_matches_full_recompute_across_turns(self, tmp_path):
+        from pocketpaw.memory.file_store import FileMemoryStore
+
+        mgr = MemoryManager(store=FileMemoryStore(base_path=tmp_path))
+        kwargs = {"recent_window": 4, "char_budget": 50000, "summary_chars": 30}
+        for turn in range(6):
+            await _add_messages(mgr, "websocket:inc", turn * 3, 3)
+            result = await mgr.get_compacted_history("websocket:inc", **kwargs)
+            assert result == await _full_recompute(mgr, "websocket:inc", **kwargs)
+
+    async def test_only_new_messages_processed(self, tmp_path):
+        from pocketpaw.memory.file_store import FileMemoryStore
+
+        mgr = MemoryManager(store=FileMemoryStore(base_path=tmp_path))
+        await _add_messages(mgr, "websocket:new", 0, 30)
+        await mgr.get_compacted_history("websocket:new", recent_window=5)
+
+        await _add_messages(mgr, "websocket:new", 30, 2)
+        with patch.object(
+            MemoryManager, "_extract_line", wraps=MemoryManager._extract_line
+        ) as extract:
+            await mgr.get_compacted_history("websocket:new", recent_window=5)
+        assert extract.call_count == 2
+
+    async def test_state_persisted_and_reused(self, tmp_path):
+        from pocketpaw.memory.file_store import FileMemoryStore
+
+        store = FileMemoryStore(base_path=tmp_path)
+        mgr = MemoryManager(store=store)
+        await _add_messages(mgr, "websocket:p", 0, 25)
+        expected = await mgr.get_compacted_history("websocket:p", recent_window=5)
+
+        cache = json.loads((store.sessions_path / "websocket_p_compaction.json").read_text())
+        assert cache["tier1"]["total"] == 25
+
+        fresh = MemoryManager(store=store)
+        with patch.object(MemoryManager, "_extract_line") as extract:
+            result = await fresh.get_compacted_history("websocket:p", recent_window=5)
+        extract.assert_not_called()
+        assert result == expected
+
+    async def test_clear_resets_state(self, tmp_path):
+        from pocketpaw.memory.file_store import FileMemoryStore
+
+        mgr = MemoryManager(store=FileMemoryStore(base_path=tmp_path))
+        await _add_messages(mgr, "websocket:c", 0, 12)
+        await mgr.get_compacted_history("websocket:c", recent_window=5)
+
+        await mgr.clear_session("websocket:c")
+        await _add_messages(mgr, "websocket:c", 100, 2)
+        result = await mgr.get_compacted_history("websocket:c", recent_window=5)
+        assert [m["content"][:11] for m in result] == ["Message 100", "Message 101"]
+
+    async def test_clear_drops_compaction_cache(self, tmp_path):
+        from pocketpaw.memory.file_store import FileMemoryStore
+
+        store = FileMemoryStore(base_path=tmp_path)
+        mgr = MemoryManager(store=store)
+        await _add_messages(mgr, "websocket:cc", 0, 12)
+        await mgr.get_compacted_history("websocket:cc", recent_window=5)
+        cache_file = store.sessions_path / "websocket_cc_compaction.json"
+        assert cache_file.exists()
+
+        await mgr.clear_session("websocket:cc")
+        assert not cache_file.exists()
+
+    async def test_cursor_rejected_when_log_rewritten_in_place(self, tmp_path):
+        from pocketpaw.memory.file_store import FileMemoryStore
+
+        store = FileMemoryStore(base_path=tmp_path)
+        mgr = MemoryManager(store=store)
+        await _add_messages(mgr, "websocket:ino", 0, 3)
+        _, cursor = await store.get_session_since("websocket:ino")
+
+        # Same inode, different (longer) contents
+        log_file = store._get_session_file("websocket:ino")
+        lines = log_file.read_bytes().splitlines(keepends=True)
+        replaced = [line.replace(b'"id": "', b'"id": "other-') for line in lines]
+        with open(log_file, "r+b") as f:
+            f.truncate(0)
+            f.write(b"".join(replaced * 2))
+
+        assert await store.get_session_since("websocket:ino", cursor) is None
+
+    async def test_extract_pruned_to_budget(self):
+        mgr = _make_manager(_make_entries(200, content_len=50))
+        result = await mgr.get_compacted_history("test", recent_window=4, char_budget=1000)
+
+        assert sum(len(m["content"]) for m in result) <= 1000
+        summary = result[0]["content"].splitlines()
+        assert summary[0] == "[Earlier conversation]"
+        # The newest aged-out messages are kept, the oldest dropped
+        assert summary[-1].startswith("Assistant: Message 195")
+        state = mgr._tier1_states["test"]
+        assert sum(state["sizes"]) <= 1000
+        assert len(state["lines"]) < 196
+
+    async def test_larger_budget_recovers_pruned_lines(self):
+        mgr = _make_manager(_make_entries(200, content_len=50))
+        await mgr.get_compacted_history("test", recent_window=10, char_budget=1500)
+        result = await mgr.get_compacted_history("test", recent_window=10, char_budget=20000)
+
+        fresh = await _make_manager(_make_entries(200, content_len=50)).get_compacted_history(
+            "test", recent_window=10, char_budget=20000
+        )
+        assert result == fresh
+        assert len(result[0]["content"].splitlines()) == 191
+
+    async def test_unit_change_rebuilds(self):
+        mgr = _make_manager(_make_entries(200, content_len=50))
+        await mgr.get_compacted_history("test", recent_window=10, char_budget=1500)
+        result = await mgr.get_compacted_history(
+            "test", recent_window=10, char_budget=1500, token_budget=5000
+        )
+        fresh = await _make_manager(_make_entries(200, content_len=50)).get_compacted_history(
+            "test", recent_window=10, char_budget=1500, token_budget=5000
+        )
+        assert result == fresh
+
+    async def test_session_state_bounded(self):
+        from pocketpaw.memory import manager as manager_module
+
+        mgr = _make_manager(_make_entries(3))
+        with patch.object(manager_module, "_TIER1_MAX_SESSIONS", 4):
+            for i in range(10):
+                await mgr.get_compacted_history(f"s{i}")
+        assert list(mgr._tier1_locks) == ["s6", "s7", "s8", "s9"]
+        assert set(mgr._tier1_states) == {"s6", "s7", "s8", "s9"}
+
+    async def test_non_file_store_detects_rewritten_history(self):
+        mgr = _make_manager(_make_entries(15))
+        await mgr.get_compacted_history("test", recent_window=10, char_budget=50000)
+
+        replaced = _make_entries(3)
+        for e in replaced:
+            e.id = f"new-{e.id}"
+        mgr._store.get_session = AsyncMock(return_value=replaced)
+        result = await mgr.get_compacted_history("test", recent_window=10, char_budget=50000)
+        assert [m["content"] for m in result] == [e.content for e in replaced]
+
+    async def test_window_change_rebuilds(self):
+        mgr = _make_manager(_make_entries(15))
+        await mgr.get_compacted_history("test", recent_window=10, char_budget=50000)
+        result = await mgr.get_compacted_history("test", recent_window=3, char_budget=50000)
+        assert len(result) == 4
+
+
 # ─── Backward compatibility ─────────────────────────────────────────────
 
 
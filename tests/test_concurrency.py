@@ -380,9 +380,9 @@ async def test_file_memory_store_session_lock(tmp_path):
 
     await asyncio.gather(*[save_entry(i) for i in range(10)])
 
-    # Verify session file is valid JSON with all 10 entries
+    # Verify the session log holds all 10 entries, one valid JSON record per line
     session_file = store._get_session_file(session_key)
-    data = json.loads(session_file.read_text())
+    data = [json.loads(line) for line in session_file.read_text().splitlines()]
     assert len(data) == 10
     contents = {item["content"] for item in data}
     assert contents == {f"message {i}" for i in range(10)}
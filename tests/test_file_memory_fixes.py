@@ -236,6 +236,62 @@ class TestFuzzySearch:
         assert "Google" in results[0].content
 
 
+class TestBM25Search:
+    """Search ranks through the incremental inverted index."""
+
+    async def _save(self, store, content, header="Memory", tags=None):
+        return await store.save(
+            MemoryEntry(
+                id="",
+                type=MemoryType.LONG_TERM,
+                content=content,
+                tags=tags or [],
+                metadata={"header": header},
+            )
+        )
+
+    async def test_rare_term_outranks_common_term(self, tmp_store):
+        for i in range(5):
+            await self._save(tmp_store, f"User likes python snippet {i}")
+        await self._save(tmp_store, "User likes rust")
+
+        results = await tmp_store.search("python rust")
+        assert "rust" in results[0].content
+
+    async def test_term_frequency_boosts_score(self, tmp_store):
+        await self._save(tmp_store, "coffee in the morning, tea at night")
+        await self._save(tmp_store, "coffee coffee coffee all day")
+
+        results = await tmp_store.search("coffee")
+        assert results[0].content.startswith("coffee coffee")
+
+    async def test_delete_removes_postings(self, tmp_store):
+        entry_id = await self._save(tmp_store, "Allergic to peanuts")
+        assert await tmp_store.search("peanuts")
+
+        await tmp_store.delete(entry_id)
+        assert await tmp_store.search("peanuts") == []
+        assert "peanuts" not in tmp_store._search_index._postings
+
+    async def test_index_rebuilt_from_disk(self, tmp_path):
+        store = FileMemoryStore(base_path=tmp_path)
+        await self._save(store, "Works at Acme Corp", header="Job")
+
+        reloaded = FileMemoryStore(base_path=tmp_path)
+        assert len(reloaded._search_index) == len(reloaded._index)
+        results = await reloaded.search("acme job")
+        assert len(results) == 1
+
+    async def test_filters_apply_to_ranked_results(self, tmp_store):
+        await self._save(tmp_store, "Prefers vim", tags=["editor"])
+        await tmp_store.save(MemoryEntry(id="", type=MemoryType.DAILY, content="Opened vim today"))
+
+        results = await tmp_store.search("vim", memory_type=MemoryType.DAILY)
+        assert [r.content for r in results] == ["Opened vim today"]
+        results = await tmp_store.search("vim", tags=["editor"])
+        assert [r.content for r in results] == ["Prefers vim"]
+
+
 # ===========================================================================
 # TestDailyFileIndexing
 # ===========================================================================
@@ -269,6 +325,94 @@ class TestDailyFileIndexing:
         assert len(daily_entries) == 3
 
 
+class TestLazyDailyLoading:
+    """Old daily files are deferred; parsed markdown is cached by mtime/size."""
+
+    def _write_daily(self, base, days_ago, text):
+        d = date.today() - timedelta(days=days_ago)
+        path = base / f"{d.isoformat()}.md"
+        path.write_text(f"## Note\n\n{text}\n")
+        return path
+
+    async def test_old_daily_files_deferred_until_search(self, tmp_path):
+        self._write_daily(tmp_path, 0, "Recent standup")
+        old = self._write_daily(tmp_path, 90, "Ancient quarterly review")
+
+        store = FileMemoryStore(base_path=tmp_path, daily_horizon_days=30)
+        assert store._deferred_daily_files == [old]
+        assert all("Ancient" not in e.content for e in store._index.values())
+
+        results = await store.search("quarterly review")
+        assert len(results) == 1
+        assert store._deferred_daily_files == []
+
+    async def test_get_by_type_loads_deferred_only_when_short(self, tmp_path):
+        self._write_daily(tmp_path, 1, "Yesterday note")
+        self._write_daily(tmp_path, 60, "Old note")
+        store = FileMemoryStore(base_path=tmp_path, daily_horizon_days=30)
+
+        assert len(await store.get_by_type(MemoryType.DAILY, limit=1)) == 1
+        assert store._deferred_daily_files
+
+        assert len(await store.get_by_type(MemoryType.DAILY, limit=10)) == 2
+        assert not store._deferred_daily_files
+
+    async def test_search_filled_by_recent_skips_deferred(self, tmp_path):
+        self._write_daily(tmp_path, 0, "Standup notes")
+        self._write_daily(tmp_path, 1, "Standup again")
+        self._write_daily(tmp_path, 90, "Standup long ago")
+        store = FileMemoryStore(base_path=tmp_path, daily_horizon_days=30)
+
+        assert len(await store.search("standup", limit=2)) == 2
+        assert store._deferred_daily_files
+
+        assert len(await store.search("standup", limit=3)) == 3
+        assert not store._deferred_daily_files
+
+    async def test_order_independent_of_load_state(self, tmp_path):
+        for days_ago in (0, 40, 5, 90):
+            self._write_daily(tmp_path, days_ago, f"Note from {days_ago} days ago")
+        full = FileMemoryStore(base_path=tmp_path, daily_horizon_days=None)
+        lazy = FileMemoryStore(base_path=tmp_path, daily_horizon_days=30)
+
+        newest = [e.content for e in await lazy.get_by_type(MemoryType.DAILY, limit=2)]
+        assert newest == ["Note from 5 days ago", "Note from 0 days ago"]
+        assert newest == [e.content for e in await full.get_by_type(MemoryType.DAILY, limit=2)]
+
+        everything = await lazy.get_by_type(MemoryType.DAILY, limit=10)
+        assert [e.content for e in everything] == [
+            e.content for e in await full.get_by_type(MemoryType.DAILY, limit=10)
+        ]
+        assert [e.content for e in await lazy.search(limit=2)] == [
+            e.content for e in await full.search(limit=2)
+        ]
+
+    async def test_long_term_search_skips_deferred(self, tmp_path):
+        self._write_daily(tmp_path, 60, "Old note")
+        store = FileMemoryStore(base_path=tmp_path, daily_horizon_days=30)
+        await store.search("note", memory_type=MemoryType.LONG_TERM)
+        assert store._deferred_daily_files
+
+    async def test_unchanged_files_not_reparsed(self, tmp_path):
+        self._write_daily(tmp_path, 0, "Cached note")
+        FileMemoryStore(base_path=tmp_path)
+        assert (tmp_path / "_parse_cache.json").exists()
+
+        with patch.object(FileMemoryStore, "_split_markdown_sections") as split:
+            store = FileMemoryStore(base_path=tmp_path)
+        split.assert_not_called()
+        assert [e.content for e in await store.get_by_type(MemoryType.DAILY)] == ["Cached note"]
+
+    async def test_modified_file_reparsed(self, tmp_path):
+        path = self._write_daily(tmp_path, 0, "Before edit")
+        FileMemoryStore(base_path=tmp_path)
+        path.write_text("## Note\n\nAfter a longer edit\n")
+
+        store = FileMemoryStore(base_path=tmp_path)
+        contents = [e.content for e in await store.get_by_type(MemoryType.DAILY)]
+        assert contents == ["After a longer edit"]
+
+
 # ===========================================================================
 # TestDeduplication
 # ===========================================================================
@@ -408,6 +552,58 @@ class TestPersistentDelete:
         assert not store.long_term_file.exists()
 
 
+class TestDeleteMany:
+    """Batch deletes rewrite each affected markdown file once."""
+
+    async def _save_facts(self, store, n, user_id="default"):
+        ids = []
+        for i in range(n):
+            ids.append(
+                await store.save(
+                    MemoryEntry(
+                        id="",
+                        type=MemoryType.LONG_TERM,
+                        content=f"{user_id} fact {i}",
+                        metadata={"header": "Memory", "user_id": user_id},
+                    )
+                )
+            )
+        return ids
+
+    async def test_rewrites_each_file_once(self, tmp_path):
+        store = FileMemoryStore(base_path=tmp_path)
+        owner_ids = await self._save_facts(store, 5)
+        alice_ids = await self._save_facts(store, 3, user_id="alice")
+
+        with patch.object(store, "_rewrite_markdown", wraps=store._rewrite_markdown) as rewrite:
+            deleted = await store.delete_many(owner_ids[:4] + alice_ids[:2] + ["missing"])
+
+        assert deleted == 6
+        assert rewrite.call_count == 2
+
+        reloaded = FileMemoryStore(base_path=tmp_path)
+        contents = {e.content for e in await reloaded.get_by_type(MemoryType.LONG_TERM)}
+        assert contents == {"default fact 4", "alice fact 2"}
+
+    async def test_source_index_tracks_entries(self, tmp_path):
+        store = FileMemoryStore(base_path=tmp_path)
+        ids = await self._save_facts(store, 3)
+        source = str(store.long_term_file)
+        assert list(store._entries_by_source[source]) == ids
+
+        await store.delete_many(ids)
+        assert source not in store._entries_by_source
+        assert not store.long_term_file.exists()
+
+    async def test_manager_delete_many_falls_back_to_delete(self):
+        store = MagicMock(spec=["delete"])
+        store.delete = AsyncMock(side_effect=[True, False, True])
+        manager = MemoryManager(store=store)
+
+        assert await manager.delete_many(["a", "b", "c"]) == 2
+        assert store.delete.await_count == 3
+
+
 # ===========================================================================
 # TestForgetTool
 # ===========================================================================
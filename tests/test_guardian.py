@@ -0,0 +1,124 @@
+# Tests for security/guardian.py — allowlist fast path and verdict cache
+# Created: 2026-10-19
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from pocketpaw.config import Settings
+from pocketpaw.security.guardian import GuardianAgent, normalize_command
+
+
+def _llm_reply(status: str, reason: str = "because") -> SimpleNamespace:
+    text = f'{{"status": "{status}", "reason": "{reason}"}}'
+    return SimpleNamespace(content=[SimpleNamespace(text=text)])
+
+
+@pytest.fixture
+def settings():
+    return Settings(anthropic_api_key="test-key")
+
+
+@pytest.fixture
+def guardian(settings):
+    with (
+        patch("pocketpaw.security.guardian.get_settings", side_effect=lambda: settings),
+        patch("pocketpaw.security.guardian.get_audit_logger"),
+    ):
+        agent = GuardianAgent()
+        agent.client = MagicMock()
+        agent.client.messages.create = AsyncMock(return_value=_llm_reply("SAFE"))
+        yield agent
+
+
+class TestAllowlistFastPath:
+    @pytest.mark.parametrize(
+        "command",
+        ["ls -la", "git status", "cat README.md | grep -n paw", "git log --oneline -5"],
+    )
+    async def test_read_only_commands_skip_llm(self, guardian, command):
+        is_safe, reason = await guardian.check_command(command)
+        assert is_safe
+        assert "allowlist" in reason
+        guardian.client.messages.create.assert_not_called()
+        assert guardian.stats()["allowlisted"] == 1
+
+    @pytest.mark.parametrize(
+        "command",
+        [
+            "ls; rm -rf build",
+            "cat secrets > /tmp/out",
+            "cat file | sh",
+            "echo $(whoami)",
+            "echo $ANTHROPIC_API_KEY",
+            "cat ${HOME}/.ssh/id_rsa",
+            "ls `pwd`",
+            "git push",
+            "git log --output=/tmp/x",
+            "cat a || rm b",
+            "ls && rm b",
+            "rm -rf /",
+            "echo 'unterminated",
+        ],
+    )
+    async def test_other_commands_go_to_llm(self, guardian, command):
+        await guardian.check_command(command)
+        assert guardian.client.messages.create.await_count == 1
+        assert guardian.stats()["allowlisted"] == 0
+
+    async def test_dangerous_pattern_never_fast_pathed(self, guardian, settings):
+        settings.guardian_allowlist = ["echo"]
+        await guardian.check_command("echo shutdown now")
+        assert guardian.client.messages.create.await_count == 1
+
+    async def test_allowlist_is_configurable(self, guardian, settings):
+        settings.guardian_allowlist = []
+        await guardian.check_command("ls")
+        assert guardian.client.messages.create.await_count == 1
+
+
+class TestVerdictCache:
+    async def test_repeated_command_uses_cached_verdict(self, guardian):
+        guardian.client.messages.create.return_value = _llm_reply("DANGEROUS", "deletes")
+        first = await guardian.check_command("rm  notes.txt")
+        second = await guardian.check_command("rm notes.txt")
+        assert first == second == (False, "deletes")
+        assert guardian.stats() == {
+            "checks": 2,
+            "allowlisted": 0,
+            "cache_hits": 1,
+            "llm_calls": 1,
+            "local_checks": 0,
+            "cached_verdicts": 1,
+        }
+
+    async def test_policy_change_invalidates(self, guardian, settings):
+        await guardian.check_command("make build")
+        settings.anthropic_model = "another-model"
+        await guardian.check_command("make build")
+        assert guardian.client.messages.create.await_count == 2
+
+    async def test_expired_verdict_rechecked(self, guardian):
+        with patch("pocketpaw.security.guardian.time.monotonic", return_value=0.0):
+            await guardian.check_command("make build")
+        with patch("pocketpaw.security.guardian.time.monotonic", return_value=3601.0):
+            await guardian.check_command("make build")
+        assert guardian.client.messages.create.await_count == 2
+
+    async def test_zero_ttl_disables_cache(self, guardian, settings):
+        settings.guardian_cache_ttl = 0
+        await guardian.check_command("make build")
+        await guardian.check_command("make build")
+        assert guardian.client.messages.create.await_count == 2
+
+    async def test_llm_errors_not_cached(self, guardian):
+        guardian.client.messages.create.side_effect = [RuntimeError("timeout"), _llm_reply("SAFE")]
+        assert (await guardian.check_command("make build"))[0] is False
+        assert (await guardian.check_command("make build"))[0] is True
+
+
+def test_normalize_command():
+    assert normalize_command("  git   commit -a ") == "git commit -a"
+    # Quoted arguments are left alone: whitespace inside them is significant
+    assert normalize_command('grep "a  b" f') == 'grep "a  b" f'
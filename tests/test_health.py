@@ -224,6 +224,74 @@ class TestErrorStore:
         results = store.get_recent()
         assert len(results) == 2
 
+    def test_reverse_reader_crosses_block_boundaries(self, tmp_path):
+        from pocketpaw.health.store import _iter_lines_reversed
+
+        path = tmp_path / "lines.txt"
+        path.write_bytes(b"".join(f"line-{i:03d}\n".encode() for i in range(100)))
+        lines = list(_iter_lines_reversed(path, block_size=7))
+        assert lines == [f"line-{i:03d}".encode() for i in range(99, -1, -1)]
+
+    def test_get_recent_spans_rotated_files(self, tmp_path):
+        store = ErrorStore(path=tmp_path / "errors.jsonl")
+        store.record(message="old error")
+        store.rotate_if_needed(max_size_mb=0)
+        store.record(message="new error")
+
+        assert [e["message"] for e in store.get_recent()] == ["new error", "old error"]
+        assert [e["message"] for e in store.get_recent(search="old")] == ["old error"]
+
+    def test_record_rotates_at_size_limit(self, tmp_path):
+        store = ErrorStore(path=tmp_path / "errors.jsonl", max_size_mb=0.001)
+        for i in range(20):
+            store.record(message=f"Error number {i}" * 10)
+        assert (tmp_path / "errors.jsonl.1").exists()
+        assert len(store.get_recent(limit=100)) == 20
+
+    def test_get_recent_search_non_ascii(self, store):
+        store.record(message="Échec de connexion")
+        assert len(store.get_recent(search="échec")) == 1
+
+    def test_get_recent_source_filter(self, store):
+        store.record(message="a", source="auth")
+        store.record(message="b", source="storage")
+        store.record(message="c", source="auth")
+
+        results = store.get_recent(source="auth")
+        assert [e["message"] for e in results] == ["c", "a"]
+
+    def test_get_recent_time_range(self, store):
+        store.path.parent.mkdir(parents=True, exist_ok=True)
+        with store.path.open("w") as f:
+            for hour in range(6):
+                entry = {"message": f"h{hour}", "timestamp": f"2026-10-19T0{hour}:00:00+00:00"}
+                f.write(json.dumps(entry) + "\n")
+
+        results = store.get_recent(since="2026-10-19T02:00:00+00:00", until="2026-10-19T04:00:00")
+        assert [e["message"] for e in results] == ["h4", "h3", "h2"]
+
+    def test_index_extends_with_new_entries(self, store):
+        store.record(message="first", source="x")
+        assert len(store.get_recent(source="x")) == 1
+        store.record(message="second", source="x")
+        assert [e["message"] for e in store.get_recent(source="x")] == ["second", "first"]
+
+    def test_index_survives_rotation(self, tmp_path):
+        store = ErrorStore(path=tmp_path / "errors.jsonl")
+        store.record(message="before", source="x")
+        assert len(store.get_recent(source="x")) == 1
+        store.rotate_if_needed(max_size_mb=0)
+        store.record(message="after", source="x")
+        assert [e["message"] for e in store.get_recent(source="x")] == ["after", "before"]
+
+    def test_clear_removes_rotated_files(self, tmp_path):
+        store = ErrorStore(path=tmp_path / "errors.jsonl")
+        store.record(message="old")
+        store.rotate_if_needed(max_size_mb=0)
+        store.clear()
+        assert not (tmp_path / "errors.jsonl.1").exists()
+        assert store.get_recent() == []
+
 
 # =============================================================================
 # Individual health checks (config)
@@ -3,12 +3,25 @@
 All MCP SDK imports are mocked since mcp is an optional dependency.
 """
 
+import asyncio
 import json
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, patch
 
+import pytest
+
 from pocketpaw.mcp.config import MCPServerConfig, load_mcp_config, save_mcp_config
 from pocketpaw.mcp.manager import MCPManager, MCPToolInfo, get_mcp_manager
+from pocketpaw.mcp.tool_cache import load_cached_tools, save_cached_tools
+
+
+@pytest.fixture(autouse=True)
+def _tool_cache(tmp_path, monkeypatch):
+    """Keep the MCP tool cache out of the real config dir."""
+    monkeypatch.setattr(
+        "pocketpaw.mcp.tool_cache._get_tool_cache_path", lambda: tmp_path / "tool_cache.json"
+    )
+
 
 # ======================================================================
 # MCPServerConfig tests
@@ -473,3 +486,118 @@ class TestGetMCPManager:
         b = get_mcp_manager()
         assert a is b
         mod._manager = None  # cleanup
+
+
+# ======================================================================
+# Concurrent startup and tool cache
+# ======================================================================
+
+
+class TestConcurrentStartup:
+    @patch("pocketpaw.mcp.manager.load_mcp_config")
+    async def test_servers_start_concurrently_within_limit(self, mock_load, monkeypatch):
+        monkeypatch.setattr(
+            "pocketpaw.config.get_settings",
+            lambda: SimpleNamespace(mcp_startup_concurrency=2),
+        )
+        mock_load.return_value = [MCPServerConfig(name=f"s{i}") for i in range(5)]
+        mgr = MCPManager()
+        running = 0
+        peak = 0
+
+        async def connect(state):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.02)
+            running -= 1
+            state.session = AsyncMock()
+
+        with (
+            patch.object(mgr, "_connect_stdio", side_effect=connect),
+            patch.object(mgr, "_discover_tools", new_callable=AsyncMock),
+        ):
+            await mgr.start_enabled_servers()
+
+        assert peak == 2
+        assert all(state.connected for state in mgr._servers.values())
+
+    async def test_discovered_tools_cached_by_config(self):
+        mgr = MCPManager()
+        cfg = MCPServerConfig(name="fs", command="npx")
+
+        async def discover(state):
+            state.tools = [MCPToolInfo(server_name="fs", name="read", description="Read")]
+
+        with (
+            patch.object(mgr, "_connect_stdio", new_callable=AsyncMock),
+            patch.object(mgr, "_discover_tools", side_effect=discover),
+        ):
+            assert await mgr.start_server(cfg)
+
+        assert load_cached_tools(cfg) == [
+            {"name": "read", "description": "Read", "input_schema": {}}
+        ]
+        # A different command invalidates the entry
+        assert load_cached_tools(MCPServerConfig(name="fs", command="uvx")) is None
+
+    @patch("pocketpaw.mcp.manager.load_mcp_config")
+    async def test_cached_tools_advertised_while_connecting(self, mock_load, monkeypatch):
+        monkeypatch.setattr(
+            "pocketpaw.config.get_settings",
+            lambda: SimpleNamespace(mcp_startup_concurrency=4),
+        )
+        cfg = MCPServerConfig(name="slow")
+        mock_load.return_value = [cfg]
+        save_cached_tools(cfg, [{"name": "ping", "description": "", "input_schema": {}}])
+        mgr = MCPManager()
+        release = asyncio.Event()
+        session = AsyncMock()
+        session.call_tool = AsyncMock(
+            return_value=SimpleNamespace(content=[SimpleNamespace(text="pong")])
+        )
+
+        async def connect(state):
+            await release.wait()
+            state.session = session
+
+        async def discover(state):
+            state.tools = [MCPToolInfo(server_name="slow", name="ping")]
+
+        with (
+            patch.object(mgr, "_connect_stdio", side_effect=connect),
+            patch.object(mgr, "_discover_tools", side_effect=discover),
+        ):
+            startup = asyncio.create_task(mgr.start_enabled_servers())
+            await asyncio.sleep(0)
+            assert [t.name for t in mgr.get_all_tools()] == ["ping"]
+
+            call = asyncio.create_task(mgr.call_tool("slow", "ping"))
+            await asyncio.sleep(0.01)
+            assert not call.done()  # waits for the connection
+
+            release.set()
+            assert await call == "pong"
+            await startup
+
+    async def test_failed_start_drops_cached_tools(self):
+        cfg = MCPServerConfig(name="bad", transport="grpc")
+        save_cached_tools(cfg, [{"name": "x", "description": "", "input_schema": {}}])
+        mgr = MCPManager()
+        assert not await mgr.start_server(cfg)
+        assert mgr.get_all_tools() == []
+
+
+class TestDashboardStartupTask:
+    async def test_startup_failure_is_logged(self, caplog):
+        from pocketpaw import dashboard
+
+        async def boom():
+            raise RuntimeError("no servers for you")
+
+        task = asyncio.create_task(boom())
+        task.add_done_callback(dashboard._log_mcp_startup_result)
+        await asyncio.gather(task, return_exceptions=True)
+        await asyncio.sleep(0)
+
+        assert "Failed to start MCP servers: no servers for you" in caplog.text
@@ -3,6 +3,7 @@
 # Tests data models, store, and manager for multi-agent orchestration
 
 import tempfile
+import threading
 from pathlib import Path
 
 import pytest
@@ -276,6 +277,166 @@ class TestFileMissionControlStore:
         assert retrieved.name == "Persistent"
 
 
+class TestStoreIndexesAndWal:
+    """Secondary indexes and append-log persistence."""
+
+    @pytest.mark.asyncio
+    async def test_task_indexes_follow_updates(self, store):
+        task = Task(title="Move me", status=TaskStatus.INBOX, assignee_ids=["a1"])
+        await store.save_task(task)
+        assert [t.id for t in await store.list_tasks(status=TaskStatus.INBOX)] == [task.id]
+
+        task.status = TaskStatus.IN_PROGRESS
+        task.assignee_ids = ["a2"]
+        task.project_id = "p1"
+        await store.save_task(task)
+
+        assert await store.list_tasks(status=TaskStatus.INBOX) == []
+        assert await store.get_tasks_for_agent("a1") == []
+        assert [t.id for t in await store.get_tasks_for_agent("a2")] == [task.id]
+        in_project = await store.list_tasks(project_id="p1", status=TaskStatus.IN_PROGRESS)
+        assert [t.id for t in in_project] == [task.id]
+
+        await store.delete_task(task.id)
+        assert await store.list_tasks(assignee_id="a2") == []
+        assert (await store.get_stats())["tasks"]["by_status"]["in_progress"] == 0
+
+    @pytest.mark.asyncio
+    async def test_unfiltered_list_is_newest_first_and_limited(self, store):
+        tasks = [Task(title=f"T{i}") for i in range(5)]
+        for task in tasks:
+            await store.save_task(task)
+        await store.save_task(tasks[0])  # touch: becomes most recent
+
+        listed = await store.list_tasks(limit=3)
+        assert [t.title for t in listed] == ["T0", "T4", "T3"]
+
+    @pytest.mark.asyncio
+    async def test_messages_and_activities_by_key(self, store):
+        for i in range(3):
+            await store.save_message(Message(task_id="t1", content=f"m{i}"))
+            await store.save_message(Message(task_id="t2", content=f"other{i}"))
+            await store.save_activity(Activity(agent_id="a1", task_id="t1", message=f"x{i}"))
+            await store.save_activity(Activity(agent_id="a2", message=f"y{i}"))
+
+        assert [m.content for m in await store.get_messages_for_task("t1")] == ["m0", "m1", "m2"]
+        assert [a.message for a in await store.get_activities(task_id="t1", limit=2)] == [
+            "x2",
+            "x1",
+        ]
+        assert [a.message for a in await store.get_activities(agent_id="a2")] == [
+            "y2",
+            "y1",
+            "y0",
+        ]
+        assert await store.get_activities(agent_id="a2", task_id="t1") == []
+        assert len(await store.get_activity_feed(limit=4)) == 4
+
+    @pytest.mark.asyncio
+    async def test_wal_replayed_on_load(self, temp_store_path):
+        store1 = FileMissionControlStore(temp_store_path)
+        task = Task(title="Logged")
+        await store1.save_task(task)
+        gone = Task(title="Deleted")
+        await store1.save_task(gone)
+        await store1.delete_task(gone.id)
+
+        # Mutations live in the append log, not the snapshot
+        assert (temp_store_path / "wal.jsonl").exists()
+        assert not (temp_store_path / "tasks.json").exists()
+
+        store2 = FileMissionControlStore(temp_store_path)
+        assert (await store2.get_task(task.id)).title == "Logged"
+        assert await store2.get_task(gone.id) is None
+        assert [t.id for t in await store2.list_tasks()] == [task.id]
+
+    @pytest.mark.asyncio
+    async def test_snapshot_truncates_wal(self, temp_store_path):
+        store1 = FileMissionControlStore(temp_store_path, snapshot_every=3)
+        for i in range(4):
+            await store1.save_activity(Activity(message=f"a{i}"))
+
+        # Third mutation triggered a snapshot; one record logged after it
+        await store1._snapshot_task
+        assert (temp_store_path / "activities.json").exists()
+        assert not (temp_store_path / "wal.rotated.jsonl").exists()
+        assert len((temp_store_path / "wal.jsonl").read_text().splitlines()) == 1
+
+        store1.close()
+        assert not (temp_store_path / "wal.jsonl").exists()
+        store2 = FileMissionControlStore(temp_store_path)
+        assert len(await store2.get_activity_feed()) == 4
+
+    @pytest.mark.asyncio
+    async def test_blocked_tasks_in_creation_order(self, temp_store_path):
+        store = FileMissionControlStore(temp_store_path)
+        tasks = [
+            Task(title=f"b{i}", status=TaskStatus.BLOCKED, created_at=f"2026-01-{i + 10}")
+            for i in range(8)
+        ]
+        for task in reversed(tasks):
+            await store.save_task(task)
+
+        assert [t.title for t in await store.get_blocked_tasks()] == [t.title for t in tasks]
+
+    @pytest.mark.asyncio
+    async def test_torn_wal_line_ignored(self, temp_store_path):
+        store1 = FileMissionControlStore(temp_store_path)
+        await store1.save_task(Task(title="Kept"))
+        with open(temp_store_path / "wal.jsonl", "a") as f:
+            f.write('{"op": "put", "kind": "tas')
+
+        store2 = FileMissionControlStore(temp_store_path)
+        assert [t.title for t in await store2.list_tasks()] == ["Kept"]
+
+        # The fragment is cut off, so the next append starts on its own line
+        await store2.save_task(Task(title="After"))
+        store3 = FileMissionControlStore(temp_store_path)
+        assert sorted(t.title for t in await store3.list_tasks()) == ["After", "Kept"]
+
+    @pytest.mark.asyncio
+    async def test_snapshot_runs_off_the_event_loop(self, temp_store_path):
+        store1 = FileMissionControlStore(temp_store_path, snapshot_every=2)
+        loop_thread = threading.get_ident()
+        writer_threads = []
+        save_json = store1._save_json
+
+        def record_thread(path, data):
+            writer_threads.append(threading.get_ident())
+            save_json(path, data)
+
+        store1._save_json = record_thread
+        await store1.save_activity(Activity(message="a0"))
+        await store1.save_activity(Activity(message="a1"))
+        await store1.save_activity(Activity(message="a2"))
+        await store1._snapshot_task
+
+        assert writer_threads and loop_thread not in writer_threads
+        assert len((temp_store_path / "wal.jsonl").read_text().splitlines()) == 1
+
+    @pytest.mark.asyncio
+    async def test_unfinished_background_snapshot_recovered(self, temp_store_path):
+        store1 = FileMissionControlStore(temp_store_path)
+        await store1.save_task(Task(title="Rotated"))
+        # Simulate a crash after rotation, before the snapshot was written
+        (temp_store_path / "wal.jsonl").replace(temp_store_path / "wal.rotated.jsonl")
+        store1._wal_handle.close()
+        store1._wal_handle = None
+        await store1.save_task(Task(title="Fresh"))
+
+        store2 = FileMissionControlStore(temp_store_path)
+        assert sorted(t.title for t in await store2.list_tasks()) == ["Fresh", "Rotated"]
+        assert not (temp_store_path / "wal.rotated.jsonl").exists()
+        assert (temp_store_path / "tasks.json").exists()
+
+    @pytest.mark.asyncio
+    async def test_snapshot_mode_writes_json(self, temp_store_path):
+        store1 = FileMissionControlStore(temp_store_path, persistence="snapshot")
+        await store1.save_task(Task(title="Direct"))
+        assert (temp_store_path / "tasks.json").exists()
+        assert not (temp_store_path / "wal.jsonl").exists()
+
+
 # ============================================================================
 # Manager Tests
 # ============================================================================
@@ -305,6 +305,14 @@ class TestTaskAPI:
         for task in response.json()["tasks"]:
             assert task["status"] == "inbox"
 
+    def test_task_count_is_total_matches(self, client):
+        for i in range(5):
+            client.post("/api/mission-control/tasks", json={"title": f"Task {i}"})
+
+        data = client.get("/api/mission-control/tasks", params={"limit": 2, "offset": 1}).json()
+        assert len(data["tasks"]) == 2
+        assert data["count"] == 5
+
 
 # ============================================================================
 # Message API Tests
@@ -0,0 +1,221 @@
+# Tests for the SQLite Mission Control store
+# Created: 2026-10-19
+# CRUD parity with the file store, filters, pagination, JSON import and
+# backend selection in get_mission_control_store().
+
+import tempfile
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from pocketpaw.mission_control import (
+    Activity,
+    AgentProfile,
+    AgentStatus,
+    Document,
+    FileMissionControlStore,
+    Message,
+    MissionControlManager,
+    Notification,
+    SQLiteMissionControlStore,
+    Task,
+    TaskStatus,
+    get_mission_control_store,
+    reset_mission_control_store,
+)
+
+
+@pytest.fixture
+def temp_store_path():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+@pytest.fixture
+def store(temp_store_path):
+    store = SQLiteMissionControlStore(temp_store_path / "mc.db")
+    yield store
+    store.close()
+
+
+class TestSQLiteStore:
+    async def test_wal_mode(self, store):
+        assert store._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    async def test_agent_crud(self, store):
+        agent = AgentProfile(name="Jarvis", role="Lead", session_key="s-1")
+        await store.save_agent(agent)
+
+        assert (await store.get_agent(agent.id)).name == "Jarvis"
+        assert (await store.get_agent_by_name("jarvis")).id == agent.id
+        assert (await store.get_agent_by_session_key("s-1")).id == agent.id
+
+        agent.status = AgentStatus.ACTIVE
+        await store.save_agent(agent)
+        assert [a.id for a in await store.list_agents(status="active")] == [agent.id]
+
+        assert await store.update_agent_heartbeat(agent.id)
+        assert (await store.get_agent(agent.id)).status == AgentStatus.IDLE
+
+        assert await store.delete_agent(agent.id)
+        assert not await store.delete_agent(agent.id)
+        assert await store.get_agent(agent.id) is None
+
+    async def test_task_filters(self, store):
+        a = Task(title="A", assignee_ids=["ag1"], tags=["x"], project_id="p1")
+        b = Task(title="B", assignee_ids=["ag2"], tags=["y"], status=TaskStatus.BLOCKED)
+        for task in (a, b):
+            await store.save_task(task)
+
+        assert [t.id for t in await store.list_tasks()] == [b.id, a.id]
+        assert [t.id for t in await store.list_tasks(status=TaskStatus.BLOCKED)] == [b.id]
+        assert [t.id for t in await store.get_tasks_for_agent("ag1")] == [a.id]
+        assert [t.id for t in await store.list_tasks(tags=["x", "z"])] == [a.id]
+        assert [t.id for t in await store.list_tasks(project_id="p1")] == [a.id]
+        assert [t.id for t in await store.get_blocked_tasks()] == [b.id]
+        assert await store.count_tasks() == 2
+        assert await store.count_tasks(assignee_id="ag1", tags=["x"]) == 1
+        assert await store.count_tasks(status=TaskStatus.BLOCKED, tags=["x"]) == 0
+
+        # Re-saving replaces the assignee/tag rows
+        a.assignee_ids = ["ag2"]
+        await store.save_task(a)
+        assert await store.get_tasks_for_agent("ag1") == []
+
+        assert await store.delete_task(a.id)
+        assert await store.list_tasks(assignee_id="ag2") == [b]
+
+    async def test_task_pagination(self, store):
+        tasks = [Task(title=f"t{i}") for i in range(5)]
+        for task in tasks:
+            await store.save_task(task)
+        newest_first = [t.id for t in reversed(tasks)]
+
+        page = await store.list_tasks(limit=2, offset=2)
+        assert [t.id for t in page] == newest_first[2:4]
+        assert len(await store.list_tasks(limit=0)) == 5
+        assert len(await store.list_tasks(limit=0, offset=3)) == 2
+        assert await store.count_tasks() == 5
+
+    async def test_messages_and_activities(self, store):
+        for i in range(3):
+            await store.save_message(
+                Message(task_id="t1", content=f"m{i}", created_at=f"2026-01-0{i + 1}")
+            )
+            await store.save_activity(
+                Activity(
+                    agent_id="a1", task_id="t1", message=f"a{i}", created_at=f"2026-01-0{i + 1}"
+                )
+            )
+        await store.save_activity(Activity(agent_id="a2", message="other", created_at="2026-02-01"))
+
+        messages = await store.get_messages_for_task("t1", limit=2, offset=1)
+        assert [m.content for m in messages] == ["m1", "m2"]
+
+        assert [a.message for a in await store.get_activity_feed(limit=2)] == ["other", "a2"]
+        assert [a.message for a in await store.get_activity_feed(limit=2, offset=2)] == [
+            "a1",
+            "a0",
+        ]
+        assert len(await store.get_activities(agent_id="a1", task_id="t1")) == 3
+        assert await store.get_activities(agent_id="a2", task_id="t1") == []
+
+    async def test_document_version_and_notifications(self, store):
+        doc = Document(title="Spec", content="v1", tags=["design"])
+        await store.save_document(doc)
+        await store.save_document(doc)
+        assert (await store.get_document(doc.id)).version == 2
+        assert [d.id for d in await store.list_documents(tags=["design"])] == [doc.id]
+
+        note = Notification(agent_id="a1", content="hi")
+        await store.save_notification(note)
+        assert [n.id for n in await store.get_undelivered_notifications("a1")] == [note.id]
+        assert await store.mark_notification_delivered(note.id)
+        assert await store.mark_notification_read(note.id)
+        assert await store.get_undelivered_notifications() == []
+        assert await store.get_notifications_for_agent("a1", unread_only=True) == []
+
+    async def test_stats_and_clear(self, store):
+        await store.save_agent(AgentProfile(name="A"))
+        await store.save_task(Task(title="T", status=TaskStatus.DONE))
+        await store.save_notification(Notification(agent_id="a", content="n"))
+
+        stats = await store.get_stats()
+        assert stats["agents"]["total"] == 1
+        assert stats["tasks"]["by_status"]["done"] == 1
+        assert stats["tasks"]["by_status"]["inbox"] == 0
+        assert stats["notifications"]["undelivered"] == 1
+
+        await store.clear_all()
+        assert (await store.get_stats())["tasks"]["total"] == 0
+
+    async def test_works_with_manager(self, store):
+        manager = MissionControlManager(store)
+        agent = await manager.create_agent(name="Jarvis", role="Lead")
+        task = await manager.create_task(title="Research", assignee_ids=[agent.id])
+
+        assert [t.id for t in await manager.list_tasks(limit=1)] == [task.id]
+        assert await manager.get_activity_feed()
+
+
+class TestJsonImport:
+    async def test_import_from_json(self, temp_store_path):
+        source = FileMissionControlStore(temp_store_path)
+        task = Task(title="Old", tags=["legacy"])
+        await source.save_task(task)
+        await source.save_activity(Activity(message="did things", task_id=task.id))
+        source.close()
+
+        db = SQLiteMissionControlStore(temp_store_path / "mission_control.db")
+        assert not db.has_imported_json()
+        counts = db.import_from_json(temp_store_path)
+
+        assert counts["tasks"] == 1 and counts["activities"] == 1
+        assert db.has_imported_json()
+        imported = await db.get_task(task.id)
+        assert imported.title == "Old"
+        assert imported.updated_at == task.updated_at
+        assert [t.id for t in await db.list_tasks(tags=["legacy"])] == [task.id]
+
+        # Idempotent
+        db.import_from_json(temp_store_path)
+        assert (await db.get_stats())["tasks"]["total"] == 1
+        db.close()
+
+
+class TestBackendSelection:
+    @pytest.fixture(autouse=True)
+    def _reset(self):
+        reset_mission_control_store()
+        yield
+        reset_mission_control_store()
+
+    def _settings(self, backend):
+        settings = MagicMock()
+        settings.mission_control_backend = backend
+        settings.mission_control_persistence = "wal"
+        settings.mission_control_snapshot_every = 1000
+        return settings
+
+    def test_file_backend_default(self, temp_store_path):
+        with patch("pocketpaw.config.get_settings", return_value=self._settings("file")):
+            store = get_mission_control_store(temp_store_path)
+        assert isinstance(store, FileMissionControlStore)
+
+    async def test_sqlite_backend_imports_json_once(self, temp_store_path):
+        source = FileMissionControlStore(temp_store_path)
+        await source.save_task(Task(title="Migrated"))
+        source.close()
+
+        with patch("pocketpaw.config.get_settings", return_value=self._settings("sqlite")):
+            store = get_mission_control_store(temp_store_path)
+        assert isinstance(store, SQLiteMissionControlStore)
+        assert [t.title for t in await store.list_tasks()] == ["Migrated"]
+
+        # Deleted rows stay deleted on the next start
+        await store.delete_task((await store.list_tasks())[0].id)
+        reset_mission_control_store()
+        with patch("pocketpaw.config.get_settings", return_value=self._settings("sqlite")):
+            store = get_mission_control_store(temp_store_path)
+        assert await store.list_tasks() == []
@@ -0,0 +1,130 @@
+"""Tests for the PocketPaw Native agent loop: concurrent tool execution."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from pocketpaw.agents.pocketpaw_native import PocketPawOrchestrator
+from pocketpaw.config import Settings
+
+
+def _tool(tool_id: str, name: str, **tool_input) -> SimpleNamespace:
+    return SimpleNamespace(type="tool_use", id=tool_id, name=name, input=tool_input)
+
+
+def _make_orchestrator(responses: list, **overrides) -> PocketPawOrchestrator:
+    overrides.setdefault("native_streaming", False)
+    settings = Settings(anthropic_api_key="test-key", tool_profile="full", **overrides)
+    with patch.object(PocketPawOrchestrator, "_initialize"):
+        orch = PocketPawOrchestrator(settings)
+    orch._llm = SimpleNamespace(
+        model="claude-test",
+        provider="anthropic",
+        is_anthropic=True,
+        is_ollama=False,
+        is_openai_compatible=False,
+        is_gemini=False,
+    )
+    orch._client = MagicMock()
+    orch._client.messages.create = AsyncMock(side_effect=responses)
+    orch._get_filtered_tools = lambda: []
+    return orch
+
+
+def _turns(*tool_blocks) -> list:
+    return [
+        SimpleNamespace(content=list(tool_blocks), stop_reason="tool_use", usage=None),
+        SimpleNamespace(
+            content=[SimpleNamespace(type="text", text="done")],
+            stop_reason="end_turn",
+            usage=None,
+        ),
+    ]
+
+
+async def _collect(orch: PocketPawOrchestrator) -> list:
+    return [event async for event in orch.chat("hi")]
+
+
+class TestParallelExecution:
+    async def test_independent_tools_overlap(self):
+        orch = _make_orchestrator(
+            _turns(_tool("a", "read_file"), _tool("b", "list_dir"), _tool("c", "recall"))
+        )
+
+        log = []
+
+        async def slow_tool(name, tool_input):
+            log.append(("start", name))
+            await asyncio.sleep(0.05)
+            log.append(("end", name))
+            return f"result-{name}"
+
+        orch._execute_tool = slow_tool
+        events = await _collect(orch)
+
+        # Every call started before the first one finished
+        assert [kind for kind, _ in log[:3]] == ["start"] * 3
+        assert [e.metadata["name"] for e in events if e.type == "tool_result"] == [
+            "read_file",
+            "list_dir",
+            "recall",
+        ]
+
+    async def test_results_sent_back_in_call_order(self):
+        orch = _make_orchestrator(_turns(_tool("a", "read_file"), _tool("b", "list_dir")))
+        delays = {"read_file": 0.1, "list_dir": 0.0}
+
+        async def tool(name, tool_input):
+            await asyncio.sleep(delays[name])
+            return name
+
+        orch._execute_tool = tool
+        await _collect(orch)
+
+        followup = orch._client.messages.create.call_args_list[1].kwargs["messages"]
+        results = followup[-2]["content"]
+        assert [(r["tool_use_id"], r["content"]) for r in results] == [
+            ("a", "read_file"),
+            ("b", "list_dir"),
+        ]
+
+    async def test_serial_tool_does_not_overlap(self):
+        orch = _make_orchestrator(
+            _turns(_tool("a", "read_file"), _tool("b", "write_file"), _tool("c", "read_file"))
+        )
+        running = 0
+        overlaps = []
+
+        async def tool(name, tool_input):
+            nonlocal running
+            running += 1
+            if name == "write_file":
+                overlaps.append(running)
+            await asyncio.sleep(0.05)
+            running -= 1
+            return name
+
+        orch._execute_tool = tool
+        await _collect(orch)
+        assert overlaps == [1]
+
+    async def test_concurrency_limit(self):
+        orch = _make_orchestrator(
+            _turns(*(_tool(str(i), "read_file") for i in range(6))),
+            native_tool_concurrency=2,
+        )
+        running = 0
+        peak = 0
+
+        async def tool(name, tool_input):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.02)
+            running -= 1
+            return name
+
+        orch._execute_tool = tool
+        await _collect(orch)
+        assert peak == 2
@@ -0,0 +1,96 @@
+"""Tests for PocketPaw Native prompt caching and the cached tool list."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from pocketpaw.agents.pocketpaw_native import PocketPawOrchestrator
+from pocketpaw.config import Settings
+
+
+def _make_orchestrator(responses: list, **overrides) -> PocketPawOrchestrator:
+    overrides.setdefault("native_streaming", False)
+    settings = Settings(anthropic_api_key="test-key", tool_profile="full", **overrides)
+    with patch.object(PocketPawOrchestrator, "_initialize"):
+        orch = PocketPawOrchestrator(settings)
+    orch._llm = SimpleNamespace(
+        model="claude-test",
+        provider="anthropic",
+        is_anthropic=True,
+        is_ollama=False,
+        is_openai_compatible=False,
+        is_gemini=False,
+    )
+    orch._client = MagicMock()
+    orch._client.messages.create = AsyncMock(side_effect=responses)
+    orch._get_filtered_tools = lambda: []
+    return orch
+
+
+async def _collect(orch: PocketPawOrchestrator) -> list:
+    return [event async for event in orch.chat("hi")]
+
+
+class TestPromptCaching:
+    async def test_cache_breakpoints_and_cached_usage(self):
+        usage = SimpleNamespace(
+            input_tokens=20,
+            output_tokens=5,
+            cache_read_input_tokens=3000,
+            cache_creation_input_tokens=0,
+        )
+        response = SimpleNamespace(
+            content=[SimpleNamespace(type="text", text="hi")], stop_reason="end_turn", usage=usage
+        )
+        orch = _make_orchestrator([response])
+        orch._get_filtered_tools = lambda: [{"name": "a"}, {"name": "b"}]
+
+        events = await _collect(orch)
+
+        kwargs = orch._client.messages.create.call_args.kwargs
+        assert [b.get("cache_control") for b in kwargs["system"]] == [{"type": "ephemeral"}] * 2
+        assert kwargs["system"][1]["text"].startswith("You are PocketPaw")
+        assert kwargs["tools"] == [
+            {"name": "a"},
+            {"name": "b", "cache_control": {"type": "ephemeral"}},
+        ]
+        metadata = next(e for e in events if e.type == "token_usage").metadata
+        assert metadata["cache_read_input_tokens"] == 3000
+        assert metadata["total_tokens"] == 3025
+
+    async def test_disabled_sends_plain_prompt(self):
+        response = SimpleNamespace(content=[], stop_reason="end_turn", usage=None)
+        orch = _make_orchestrator([response], native_prompt_caching=False)
+        orch._get_filtered_tools = lambda: [{"name": "a"}]
+
+        await _collect(orch)
+
+        kwargs = orch._client.messages.create.call_args.kwargs
+        assert isinstance(kwargs["system"], str)
+        assert kwargs["tools"] == [{"name": "a"}]
+
+    def test_tool_list_rebuilt_only_when_mcp_tools_change(self):
+        orch = _make_orchestrator([])
+        del orch._get_filtered_tools  # use the real method
+        mcp = [{"name": "mcp_b__x", "description": "", "input_schema": {}}]
+        orch._get_mcp_tools = lambda: list(mcp)
+
+        first = orch._get_filtered_tools()
+        assert orch._get_filtered_tools() is first
+        assert orch._converted(first, "openai") is orch._converted(first, "openai")
+
+        mcp.insert(0, {"name": "mcp_a__y", "description": "", "input_schema": {}})
+        second = orch._get_filtered_tools()
+        assert second is not first
+        # MCP tools are sorted so the prefix is stable regardless of server order
+        assert [t["name"] for t in second][-2:] == ["mcp_a__y", "mcp_b__x"]
+
+    def test_openai_cached_tokens_reported(self):
+        from pocketpaw.agents.pocketpaw_native import _openai_usage
+
+        usage = SimpleNamespace(
+            prompt_tokens=5000,
+            completion_tokens=10,
+            total_tokens=5010,
+            prompt_tokens_details=SimpleNamespace(cached_tokens=4096),
+        )
+        assert _openai_usage(usage)["cache_read_input_tokens"] == 4096
@@ -0,0 +1,194 @@
+"""Tests for PocketPaw Native response streaming (Anthropic and OpenAI-compatible)."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import anthropic
+import openai
+import pytest
+
+from pocketpaw.agents.pocketpaw_native import PocketPawOrchestrator
+from pocketpaw.config import Settings
+
+
+def _make_orchestrator(responses: list, **overrides) -> PocketPawOrchestrator:
+    overrides.setdefault("native_streaming", False)
+    settings = Settings(anthropic_api_key="test-key", tool_profile="full", **overrides)
+    with patch.object(PocketPawOrchestrator, "_initialize"):
+        orch = PocketPawOrchestrator(settings)
+    orch._llm = SimpleNamespace(
+        model="claude-test",
+        provider="anthropic",
+        is_anthropic=True,
+        is_ollama=False,
+        is_openai_compatible=False,
+        is_gemini=False,
+    )
+    orch._client = MagicMock()
+    orch._client.messages.create = AsyncMock(side_effect=responses)
+    orch._get_filtered_tools = lambda: []
+    return orch
+
+
+async def _collect(orch: PocketPawOrchestrator) -> list:
+    return [event async for event in orch.chat("hi")]
+
+
+class _AnthropicStream(anthropic.AsyncStream):
+    """AsyncStream over canned events, pausing between them."""
+
+    def __init__(self, events: list, log: list):
+        self._events = events
+        self._log = log
+
+    async def __aiter__(self):
+        for event in self._events:
+            await asyncio.sleep(0.01)
+            yield event
+        self._log.append("stream-end")
+
+    async def close(self):
+        self._log.append("closed")
+
+
+class _OpenAIStream(openai.AsyncStream):
+    def __init__(self, chunks: list):
+        self._chunks = chunks
+
+    async def __aiter__(self):
+        for chunk in self._chunks:
+            yield chunk
+
+
+def _ev(type_: str, **fields) -> SimpleNamespace:
+    return SimpleNamespace(type=type_, **fields)
+
+
+def _anthropic_tool_turn() -> list:
+    return [
+        _ev("message_start", message=SimpleNamespace(usage=SimpleNamespace(input_tokens=10))),
+        _ev("content_block_start", index=0, content_block=_ev("text", text="")),
+        _ev("content_block_delta", index=0, delta=_ev("text_delta", text="Let me ")),
+        _ev("content_block_delta", index=0, delta=_ev("text_delta", text="look.")),
+        _ev("content_block_stop", index=0),
+        _ev(
+            "content_block_start",
+            index=1,
+            content_block=_ev("tool_use", id="t1", name="read_file", input={}),
+        ),
+        _ev("content_block_delta", index=1, delta=_ev("input_json_delta", partial_json='{"pa')),
+        _ev(
+            "content_block_delta", index=1, delta=_ev("input_json_delta", partial_json='th": "a"}')
+        ),
+        _ev("content_block_stop", index=1),
+        _ev(
+            "message_delta",
+            delta=SimpleNamespace(stop_reason="tool_use"),
+            usage=SimpleNamespace(output_tokens=5),
+        ),
+        _ev("message_stop"),
+    ]
+
+
+class TestStreaming:
+    async def test_anthropic_text_deltas_and_early_tool_start(self):
+        log = []
+        final = [
+            _ev("content_block_start", index=0, content_block=_ev("text", text="")),
+            _ev("content_block_delta", index=0, delta=_ev("text_delta", text="Done")),
+            _ev("content_block_stop", index=0),
+            _ev(
+                "message_delta",
+                delta=SimpleNamespace(stop_reason="end_turn"),
+                usage=SimpleNamespace(output_tokens=1),
+            ),
+        ]
+        orch = _make_orchestrator(
+            [_AnthropicStream(_anthropic_tool_turn(), log), _AnthropicStream(final, [])],
+            native_streaming=True,
+        )
+
+        async def tool(name, tool_input):
+            log.append(("tool", name, tool_input))
+            return "contents"
+
+        orch._execute_tool = tool
+        events = await _collect(orch)
+
+        assert [e.content for e in events if e.type == "message"] == ["Let me ", "look.", "Done"]
+        # The tool ran while the rest of the response was still streaming
+        assert log == [("tool", "read_file", {"path": "a"}), "stream-end", "closed"]
+        usage = next(e for e in events if e.type == "token_usage").metadata
+        assert usage == {"input_tokens": 10, "output_tokens": 5, "total_tokens": 15}
+
+        # [user, assistant (text + tool_use), user (tool_result), final assistant]
+        history = orch._client.messages.create.call_args_list[1].kwargs["messages"]
+        assistant = history[1]["content"]
+        assert [b.type for b in assistant] == ["text", "tool_use"]
+        assert assistant[1].input == {"path": "a"}
+        assert history[2]["content"][0] == {
+            "type": "tool_result",
+            "tool_use_id": "t1",
+            "content": "contents",
+        }
+
+    async def test_anthropic_stream_closed_when_consumer_stops_early(self):
+        log = []
+        orch = _make_orchestrator([_AnthropicStream(_anthropic_tool_turn(), log)])
+
+        items = orch._stream_anthropic(timeout=5, model="m", messages=[])
+        assert await items.__anext__() == ("text", "Let me ")
+        await items.aclose()
+
+        assert log == ["closed"]
+
+    async def test_anthropic_stream_closed_on_timeout(self):
+        log = []
+        orch = _make_orchestrator([_AnthropicStream(_anthropic_tool_turn(), log)])
+
+        with pytest.raises(asyncio.TimeoutError):
+            async for _ in orch._stream_anthropic(timeout=0.001, model="m", messages=[]):
+                pass
+
+        assert log == ["closed"]
+
+    async def test_openai_compatible_stream(self):
+        def chunk(content=None, tool_calls=None, finish=None):
+            delta = SimpleNamespace(content=content, tool_calls=tool_calls)
+            choice = SimpleNamespace(delta=delta, finish_reason=finish)
+            return SimpleNamespace(choices=[choice], usage=None)
+
+        def call(index, id_=None, name=None, args=None):
+            return SimpleNamespace(
+                index=index, id=id_, function=SimpleNamespace(name=name, arguments=args)
+            )
+
+        chunks = [
+            chunk(content="Hi"),
+            chunk(tool_calls=[call(0, "c0", "read_file", '{"path":')]),
+            chunk(tool_calls=[call(0, args=' "x"}')]),
+            chunk(tool_calls=[call(1, "c1", "list_dir", "{}")]),
+            chunk(finish="tool_calls"),
+        ]
+        orch = _make_orchestrator([], native_streaming=True)
+        orch._llm.is_openai_compatible = True
+        orch._client.chat.completions.create = AsyncMock(return_value=_OpenAIStream(chunks))
+
+        items = [
+            item
+            async for item in orch._stream_openai_compatible(
+                model="m", system_prompt="s", tools=[], messages=[], timeout=5
+            )
+        ]
+
+        assert items[0] == ("text", "Hi")
+        tool_items = [payload for kind, payload in items if kind == "tool_use"]
+        assert [(b.id, b.name, b.input) for b in tool_items] == [
+            ("c0", "read_file", {"path": "x"}),
+            ("c1", "list_dir", {}),
+        ]
+        kind, response = items[-1]
+        assert kind == "response"
+        assert response.stop_reason == "tool_use"
+        assert [b.type for b in response.content] == ["text", "tool_use", "tool_use"]
@@ -0,0 +1,143 @@
+# Tests for the web search result cache
+# Created: 2026-10-19
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from pocketpaw.tools.search_cache import SearchCache, normalize_query
+
+
+def _counting_fetch(result: str = "results", delay: float = 0.0):
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(delay)
+        return result
+
+    return fetch, calls
+
+
+def test_normalize_query():
+    assert normalize_query("  Python   DOCS\n") == "python docs"
+
+
+async def test_normalized_repeat_is_a_hit():
+    cache = SearchCache(ttl=60)
+    fetch, calls = _counting_fetch()
+    await cache.get_or_fetch("tavily", "Python docs", 5, fetch)
+    assert await cache.get_or_fetch("tavily", "python   DOCS", 5, fetch) == "results"
+    assert len(calls) == 1
+    assert cache.stats()["hits"] == 1
+
+
+async def test_key_includes_provider_and_count():
+    cache = SearchCache(ttl=60)
+    fetch, calls = _counting_fetch()
+    await cache.get_or_fetch("tavily", "q", 5, fetch)
+    await cache.get_or_fetch("brave", "q", 5, fetch)
+    await cache.get_or_fetch("tavily", "q", 10, fetch)
+    assert len(calls) == 3
+
+
+async def test_concurrent_identical_queries_share_one_call():
+    cache = SearchCache(ttl=60)
+    fetch, calls = _counting_fetch(delay=0.02)
+    results = await asyncio.gather(*(cache.get_or_fetch("tavily", "q", 5, fetch) for _ in range(5)))
+    assert results == ["results"] * 5
+    assert len(calls) == 1
+    assert cache.stats()["coalesced"] == 4
+
+
+async def test_uncacheable_result_not_stored():
+    cache = SearchCache(ttl=60)
+    fetch, calls = _counting_fetch("Error: quota")
+    for _ in range(2):
+        await cache.get_or_fetch(
+            "tavily", "q", 5, fetch, cacheable=lambda r: not r.startswith("Error")
+        )
+    assert len(calls) == 2
+
+
+async def test_fetch_exception_reaches_waiters():
+    cache = SearchCache(ttl=60)
+
+    async def boom():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("down")
+
+    results = await asyncio.gather(
+        cache.get_or_fetch("tavily", "q", 5, boom),
+        cache.get_or_fetch("tavily", "q", 5, boom),
+        return_exceptions=True,
+    )
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert cache._inflight == {}
+
+
+async def test_expired_entry_refetched():
+    cache = SearchCache(ttl=60)
+    fetch, calls = _counting_fetch()
+    with patch("pocketpaw.tools.search_cache.time.monotonic", return_value=1000.0):
+        await cache.get_or_fetch("tavily", "q", 5, fetch)
+    with patch("pocketpaw.tools.search_cache.time.monotonic", return_value=1061.0):
+        await cache.get_or_fetch("tavily", "q", 5, fetch)
+    assert len(calls) == 2
+
+
+async def test_zero_ttl_disables_cache():
+    cache = SearchCache(ttl=0)
+    fetch, calls = _counting_fetch()
+    await cache.get_or_fetch("tavily", "q", 5, fetch)
+    await cache.get_or_fetch("tavily", "q", 5, fetch)
+    assert len(calls) == 2
+
+
+async def test_disk_tier_survives_restart(tmp_path):
+    fetch, calls = _counting_fetch("from api")
+    await SearchCache(ttl=60, disk_dir=tmp_path).get_or_fetch("tavily", "q", 5, fetch)
+
+    restarted = SearchCache(ttl=60, disk_dir=tmp_path)
+    assert await restarted.get_or_fetch("tavily", "q", 5, AsyncMock()) == "from api"
+    assert len(calls) == 1
+    assert restarted.stats()["disk_hits"] == 1
+
+    restarted.clear()
+    assert list(tmp_path.glob("*.json")) == []
+
+
+async def test_memory_lru_bounded():
+    cache = SearchCache(ttl=60, max_entries=2)
+    for q in ("a", "b", "c"):
+        await cache.get_or_fetch("tavily", q, 5, _counting_fetch()[0])
+    assert cache.stats()["entries"] == 2
+
+
+@pytest.mark.parametrize("provider", ["tavily", "parallel"])
+async def test_web_search_tool_uses_cache(provider):
+    from unittest.mock import MagicMock
+
+    from pocketpaw.tools.builtin.web_search import WebSearchTool
+
+    resp = MagicMock()
+    resp.raise_for_status = MagicMock()
+    resp.json.return_value = {"results": [{"title": "T", "url": "https://t", "content": "c"}]}
+    client = MagicMock(post=AsyncMock(return_value=resp))
+    settings = MagicMock(web_search_provider=provider, tavily_api_key="k", parallel_api_key="k")
+
+    with (
+        patch("pocketpaw.tools.builtin.web_search.get_settings", return_value=settings),
+        patch("pocketpaw.tools.builtin.web_search.get_http_client", return_value=client),
+        patch(
+            "pocketpaw.tools.builtin.web_search.get_search_cache",
+            return_value=SearchCache(ttl=60),
+        ),
+    ):
+        tool = WebSearchTool()
+        first = await tool.execute(query="Cached query")
+        second = await tool.execute(query="cached QUERY")
+
+    assert first == second
+    assert client.post.await_count == 1
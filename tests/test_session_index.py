@@ -429,3 +429,190 @@ class TestWebSocketSessionSwitching:
         finally:
             if session_file.exists():
                 session_file.unlink()
+
+
+# =========================================================================
+# A3: Append-only JSONL session logs
+# =========================================================================
+
+
+def _session_entry(session_key: str, content: str, role: str = "user") -> MemoryEntry:
+    return MemoryEntry(
+        id="",
+        type=MemoryType.SESSION,
+        content=content,
+        role=role,
+        session_key=session_key,
+    )
+
+
+class TestJsonlSessionLog:
+    async def test_save_appends_one_line_per_message(self, store):
+        for i in range(3):
+            await store.save(_session_entry("websocket:log1", f"msg {i}"))
+
+        log_file = store.sessions_path / "websocket_log1.jsonl"
+        lines = log_file.read_text().splitlines()
+        assert len(lines) == 3
+        assert [json.loads(line)["content"] for line in lines] == ["msg 0", "msg 1", "msg 2"]
+        assert not (store.sessions_path / "websocket_log1.json").exists()
+
+    async def test_legacy_json_migrated_on_write(self, populated_store):
+        store, sessions = populated_store
+        safe_key, info = next(iter(sessions.items()))
+
+        await store.save(_session_entry(info["session_key"], "after migration", "assistant"))
+
+        assert not (store.sessions_path / f"{safe_key}.json").exists()
+        history = await store.get_session(info["session_key"])
+        assert [e.content for e in history] == [
+            *(m["content"] for m in info["data"]),
+            "after migration",
+        ]
+        index = store._load_session_index()
+        assert index[safe_key]["message_count"] == 3
+        assert index[safe_key]["title"] == info["data"][0]["content"]
+
+    async def test_legacy_json_readable_without_migration(self, populated_store):
+        store, sessions = populated_store
+        info = next(iter(sessions.values()))
+        history = await store.get_session(info["session_key"])
+        assert len(history) == 2
+
+    async def test_torn_line_is_skipped_and_not_glued(self, store):
+        await store.save(_session_entry("websocket:torn", "first"))
+        log_file = store.sessions_path / "websocket_torn.jsonl"
+        with open(log_file, "a") as f:
+            f.write('{"id": "partial", "content": "cut')
+
+        await store.save(_session_entry("websocket:torn", "second"))
+
+        history = await store.get_session("websocket:torn")
+        assert [e.content for e in history] == ["first", "second"]
+
+    async def test_periodic_compaction(self, store, monkeypatch):
+        monkeypatch.setattr("pocketpaw.memory.file_store._SESSION_COMPACT_EVERY", 3)
+        await store.save(_session_entry("websocket:cmp", "one"))
+        log_file = store.sessions_path / "websocket_cmp.jsonl"
+        with open(log_file, "a") as f:
+            f.write("garbage\n")
+
+        await store.save(_session_entry("websocket:cmp", "two"))
+        await store.save(_session_entry("websocket:cmp", "three"))
+
+        lines = log_file.read_text().splitlines()
+        assert [json.loads(line)["content"] for line in lines] == ["one", "two", "three"]
+
+    async def test_index_updated_incrementally(self, store):
+        await store.save(_session_entry("websocket:inc", "", "assistant"))
+        await store.save(_session_entry("websocket:inc", "Plan my trip"))
+        await store.save(_session_entry("websocket:inc", "Sure!", "assistant"))
+
+        item = store._load_session_index()["websocket_inc"]
+        assert item["title"] == "Plan my trip"
+        assert item["message_count"] == 3
+        assert item["preview"] == "Sure!"
+
+    async def test_clear_and_delete_jsonl(self, store):
+        await store.save(_session_entry("websocket:gone", "a"))
+        await store.save(_session_entry("websocket:gone", "b"))
+        assert await store.clear_session("websocket:gone") == 2
+        assert await store.get_session("websocket:gone") == []
+
+        await store.save(_session_entry("websocket:gone", "c"))
+        assert await store.delete_session("websocket_gone") is True
+        assert not store._session_exists("websocket:gone")
+
+    async def test_rebuild_reads_both_formats(self, populated_store):
+        store, sessions = populated_store
+        await store.save(_session_entry("websocket:fresh", "new style"))
+        index = store.rebuild_session_index()
+        assert len(index) == len(sessions) + 1
+        assert index["websocket_fresh"]["message_count"] == 1
+
+
+# =========================================================================
+# A4: Resident session index with debounced flush
+# =========================================================================
+
+
+class TestDebouncedSessionIndex:
+    async def test_updates_batched_until_flush(self, tmp_path):
+        store = FileMemoryStore(base_path=tmp_path, session_index_flush_delay=60)
+        for i in range(3):
+            await store.save(_session_entry("websocket:batch", f"msg {i}"))
+
+        # Resident index is current, disk is not yet
+        assert store._load_session_index()["websocket_batch"]["message_count"] == 3
+        assert "websocket_batch" not in json.loads(store._index_path.read_text())
+        assert store._dirty_marker_path.exists()
+
+        await store.close()
+        on_disk = json.loads(store._index_path.read_text())
+        assert on_disk["websocket_batch"]["message_count"] == 3
+        assert not store._dirty_marker_path.exists()
+
+    async def test_flush_fires_after_delay(self, tmp_path):
+        import asyncio
+
+        store = FileMemoryStore(base_path=tmp_path, session_index_flush_delay=0.01)
+        await store.save(_session_entry("websocket:timer", "hello"))
+
+        for _ in range(100):
+            if not store._dirty_marker_path.exists():
+                break
+            await asyncio.sleep(0.01)
+
+        on_disk = json.loads(store._index_path.read_text())
+        assert on_disk["websocket_timer"]["message_count"] == 1
+        assert not store._dirty_marker_path.exists()
+
+    async def test_crash_recovery_rebuilds_index(self, tmp_path):
+        store = FileMemoryStore(base_path=tmp_path, session_index_flush_delay=60)
+        await store.save(_session_entry("websocket:keep", "first"))
+        await store.close()
+        await store.update_session_title("websocket_keep", "Renamed")
+        await store.close()
+
+        await store.save(_session_entry("websocket:keep", "second"))
+        await store.save(_session_entry("websocket:lost", "never flushed"))
+        store._cancel_session_index_flush()  # simulate a crash: no flush
+
+        recovered = FileMemoryStore(base_path=tmp_path)
+        index = recovered._load_session_index()
+        assert index["websocket_keep"]["message_count"] == 2
+        assert index["websocket_keep"]["title"] == "Renamed"
+        assert index["websocket_lost"]["message_count"] == 1
+        assert not recovered._dirty_marker_path.exists()
+
+    async def test_failed_flush_is_logged(self, tmp_path, caplog):
+        import asyncio
+
+        store = FileMemoryStore(base_path=tmp_path, session_index_flush_delay=0.01)
+
+        def fail(payload):
+            raise OSError("disk full")
+
+        store._write_session_index_file = fail
+        await store.save(_session_entry("websocket:fail", "hello"))
+        for _ in range(100):
+            if "disk full" in caplog.text and store._session_index_flush_task is None:
+                break
+            await asyncio.sleep(0.01)
+
+        assert "disk full" in caplog.text
+        assert store._dirty_marker_path.exists()
+        assert store._session_index_flush_task is None
+
+    async def test_flush_task_exception_is_logged(self, tmp_path, caplog):
+        import asyncio
+
+        store = FileMemoryStore(base_path=tmp_path, session_index_flush_delay=0.01)
+        store._load_session_index = lambda: {"bad": object()}  # not JSON-serializable
+        store._mark_session_index_dirty()
+        for _ in range(100):
+            if "Failed to flush session index" in caplog.text:
+                break
+            await asyncio.sleep(0.01)
+
+        assert "Failed to flush session index" in caplog.text
@@ -2,8 +2,11 @@
 Tests for the Skills module.
 """
 
-import pytest
+import asyncio
 from pathlib import Path
+from unittest.mock import patch
+
+import pytest
 from pocketpaw.skills.loader import (
     Skill,
     SkillLoader,
@@ -228,3 +231,88 @@ class TestSkillLoaderIntegration:
 
         # Should find at least one skill if the directory exists
         assert len(skills) >= 0  # May be empty but shouldn't error
+
+
+def _write_skill(base: Path, name: str, description: str = "A skill") -> Path:
+    skill_dir = base / name
+    skill_dir.mkdir(parents=True, exist_ok=True)
+    path = skill_dir / "SKILL.md"
+    path.write_text(f"---\nname: {name}\ndescription: {description}\n---\n\nDo {name}.\n")
+    return path
+
+
+class TestSkillIndex:
+    """Test incremental reloads and the persisted skill index."""
+
+    @pytest.fixture
+    def skills_dir(self, tmp_path):
+        skills_dir = tmp_path / "skills"
+        for i in range(3):
+            _write_skill(skills_dir, f"skill-{i}")
+        return skills_dir
+
+    def _loader(self, skills_dir, tmp_path):
+        loader = SkillLoader(extra_paths=[skills_dir], index_path=tmp_path / "index.json")
+        loader.paths = [skills_dir]
+        return loader
+
+    def test_reload_parses_only_changed_files(self, skills_dir, tmp_path):
+        loader = self._loader(skills_dir, tmp_path)
+        loader.load()
+
+        path = _write_skill(skills_dir, "skill-1", description="Changed and longer")
+        with patch("pocketpaw.skills.loader.parse_skill_md", wraps=parse_skill_md) as parse:
+            skills = loader.reload()
+
+        assert [c.args[0] for c in parse.call_args_list] == [path]
+        assert skills["skill-1"].description == "Changed and longer"
+
+    def test_removed_skill_dropped(self, skills_dir, tmp_path):
+        import shutil
+
+        loader = self._loader(skills_dir, tmp_path)
+        loader.load()
+        shutil.rmtree(skills_dir / "skill-2")
+        assert "skill-2" not in loader.reload()
+
+    def test_index_persists_across_loaders(self, skills_dir, tmp_path):
+        self._loader(skills_dir, tmp_path).load()
+
+        with patch("pocketpaw.skills.loader.parse_skill_md") as parse:
+            skills = self._loader(skills_dir, tmp_path).load()
+
+        parse.assert_not_called()
+        assert skills["skill-0"].content == "Do skill-0."
+        assert skills["skill-0"].path == skills_dir / "skill-0" / "SKILL.md"
+
+    def test_corrupt_index_ignored(self, skills_dir, tmp_path):
+        (tmp_path / "index.json").write_text("{not json")
+        assert len(self._loader(skills_dir, tmp_path).load()) == 3
+
+
+class TestSkillWatcher:
+    """Test the background skill watcher."""
+
+    async def test_polling_picks_up_new_skill(self, tmp_path):
+        import sys
+
+        from pocketpaw.skills.watcher import SkillWatcher
+
+        skills_dir = tmp_path / "skills"
+        _write_skill(skills_dir, "first")
+        loader = SkillLoader(extra_paths=[skills_dir])
+        loader.paths = [skills_dir]
+
+        with patch.dict(sys.modules, {"watchfiles": None}):  # force the polling fallback
+            watcher = SkillWatcher(loader, poll_interval=0.01)
+            watcher.start()
+            await asyncio.sleep(0.05)
+            _write_skill(skills_dir, "second")
+            for _ in range(100):
+                await asyncio.sleep(0.01)
+                if loader.get("second"):
+                    break
+            await watcher.stop()
+
+        assert loader.get("second") is not None
+        assert not watcher.running
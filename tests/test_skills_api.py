@@ -415,3 +415,21 @@ class TestMCPPresetNeedsArgs:
         for p in get_all_presets():
             # Every preset should have a bool needs_args
             assert isinstance(p.needs_args, bool), f"Preset {p.id} needs_args is not bool"
+
+
+class TestSkillSearchRanking:
+    def test_ranked_by_field(self):
+        loader = SkillLoader(extra_paths=[])
+        loader._loaded = True
+        loader._skills = {
+            name: Skill(name=name, description=desc, content=content, path=Path("/x"))
+            for name, desc, content in [
+                ("notes", "Take notes", "markdown"),
+                ("deploy", "Ship to production", "uses git tags"),
+                ("git", "Git helpers", "branches"),
+                ("changelog", "Summarize git history", "release notes"),
+            ]
+        }
+        assert [s.name for s in loader.search("git")] == ["git", "changelog", "deploy"]
+        # Every term must match
+        assert [s.name for s in loader.search("git release")] == ["changelog"]
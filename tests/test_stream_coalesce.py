@@ -0,0 +1,99 @@
+# Tests for stream-chunk coalescing on the outbound path
+# Created: 2026-10-19
+
+import asyncio
+from unittest.mock import AsyncMock
+
+from pocketpaw.bus.coalesce import (
+    StreamCoalescer,
+    StreamFlushRate,
+    get_stream_flush_rate,
+    register_stream_flush_rate,
+)
+from pocketpaw.bus.events import Channel, OutboundMessage
+
+
+def _chunk(text: str, chat_id: str = "c1") -> OutboundMessage:
+    return OutboundMessage(
+        channel=Channel.WEBSOCKET, chat_id=chat_id, content=text, is_stream_chunk=True
+    )
+
+
+def _end(chat_id: str = "c1") -> OutboundMessage:
+    return OutboundMessage(
+        channel=Channel.WEBSOCKET, chat_id=chat_id, content="", is_stream_end=True
+    )
+
+
+async def test_chunks_merged_until_stream_end():
+    publish = AsyncMock()
+    stream = StreamCoalescer(publish, StreamFlushRate(interval=10, max_chars=1000))
+
+    for word in ("Hello", " ", "world"):
+        await stream.publish(_chunk(word))
+    publish.assert_not_called()
+
+    await stream.publish(_end())
+    sent = [c.args[0] for c in publish.call_args_list]
+    assert len(sent) == 2
+    assert sent[0].content == "Hello world"
+    assert sent[0].is_stream_chunk
+    assert sent[1].is_stream_end
+
+
+async def test_flush_on_size():
+    publish = AsyncMock()
+    stream = StreamCoalescer(publish, StreamFlushRate(interval=10, max_chars=10))
+
+    for _ in range(5):
+        await stream.publish(_chunk("abcd"))
+    contents = [c.args[0].content for c in publish.call_args_list]
+    assert contents == ["abcdabcdabcd"]
+
+    await stream.flush()
+    assert publish.call_args_list[-1].args[0].content == "abcdabcd"
+
+
+async def test_flush_on_interval_when_idle():
+    publish = AsyncMock()
+    stream = StreamCoalescer(publish, StreamFlushRate(interval=0.01, max_chars=1000))
+
+    await stream.publish(_chunk("partial"))
+    await asyncio.sleep(0.05)
+    publish.assert_awaited_once()
+    assert publish.call_args.args[0].content == "partial"
+
+
+async def test_different_targets_not_merged():
+    publish = AsyncMock()
+    stream = StreamCoalescer(publish, StreamFlushRate(interval=10, max_chars=1000))
+
+    await stream.publish(_chunk("a", chat_id="c1"))
+    await stream.publish(_chunk("b", chat_id="c2"))
+    await stream.flush()
+    assert [(c.args[0].chat_id, c.args[0].content) for c in publish.call_args_list] == [
+        ("c1", "a"),
+        ("c2", "b"),
+    ]
+
+
+async def test_zero_interval_passes_through():
+    publish = AsyncMock()
+    stream = StreamCoalescer(publish, StreamFlushRate(interval=0, max_chars=1000))
+
+    await stream.publish(_chunk("a"))
+    await stream.publish(_chunk("b"))
+    assert publish.await_count == 2
+
+
+def test_adapter_declared_rate():
+    default = StreamFlushRate(interval=0.05, max_chars=1000)
+    assert get_stream_flush_rate(Channel.TEAMS, default) is default
+
+    register_stream_flush_rate(Channel.TEAMS, 5.0, 16000)
+    try:
+        assert get_stream_flush_rate(Channel.TEAMS, default) == StreamFlushRate(5.0, 16000)
+    finally:
+        from pocketpaw.bus import coalesce
+
+        coalesce._flush_rates.pop(Channel.TEAMS, None)
@@ -0,0 +1,126 @@
+"""Tests for the pluggable, cached tokenizer used for context budgets."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pydantic import ValidationError
+
+from pocketpaw.config import Settings
+from pocketpaw.llm import tokenizer as tokenizer_mod
+from pocketpaw.llm.tokenizer import (
+    CachedTokenizer,
+    HeuristicTokenizer,
+    get_tokenizer,
+    register_tokenizer,
+)
+from pocketpaw.memory.manager import MemoryManager
+from pocketpaw.memory.protocol import MemoryEntry, MemoryType
+
+
+@pytest.fixture(autouse=True)
+def _restore_registry():
+    factories = dict(tokenizer_mod._FACTORIES)
+    yield
+    tokenizer_mod._FACTORIES.clear()
+    tokenizer_mod._FACTORIES.update(factories)
+    tokenizer_mod._tokenizers.clear()
+
+
+class TestHeuristicTokenizer:
+    def test_empty(self):
+        assert HeuristicTokenizer().count("") == 0
+
+    def test_english_about_four_chars_per_token(self):
+        text = "the quick brown fox jumps over the lazy dog " * 10
+        count = HeuristicTokenizer().count(text)
+        assert len(text) / 6 <= count <= len(text) / 2
+
+    def test_cjk_costs_more_per_char_than_english(self):
+        tok = HeuristicTokenizer()
+        cjk = "你好世界今天天气很好" * 10
+        english = "helloworld" * 10
+        assert len(cjk) == len(english)
+        assert tok.count(cjk) == len(cjk)
+        assert tok.count(cjk) > 3 * tok.count(english)
+
+    def test_other_scripts(self):
+        assert HeuristicTokenizer().count("привет") == 3
+
+    def test_truncate_fits_budget(self):
+        tok = HeuristicTokenizer()
+        text = "alpha beta gamma delta " * 50
+        cut = tok.truncate(text, 20)
+        assert text.startswith(cut)
+        assert tok.count(cut) <= 20
+        assert tok.truncate(text, 0) == ""
+        assert tok.truncate("short", 100) == "short"
+
+
+class TestRegistry:
+    def test_default_is_heuristic_and_shared(self):
+        tok = get_tokenizer()
+        assert isinstance(tok, CachedTokenizer)
+        assert tok.name == "heuristic"
+        assert get_tokenizer() is tok
+
+    def test_counts_are_cached(self):
+        tok = get_tokenizer()
+        tok.count("some repeated text")
+        tok.count("some repeated text")
+        assert tok.cache_info().hits >= 1
+
+    def test_registered_factory_used_for_prefix(self):
+        class Fixed:
+            name = "fixed"
+
+            def count(self, text):
+                return 7
+
+            def truncate(self, text, max_tokens):
+                return text
+
+        register_tokenizer("acme-", lambda model: Fixed())
+        tok = get_tokenizer("acme-large")
+        assert tok.name == "fixed"
+        assert tok.count("anything") == 7
+        assert get_tokenizer("other-model").name == "heuristic"
+
+    def test_unavailable_factory_falls_back(self):
+        register_tokenizer("acme-", lambda model: None)
+        assert get_tokenizer("acme-large").name == "heuristic"
+
+
+class TestMemoryContextTokenBudget:
+    async def test_context_truncated_to_tokens(self):
+        long_term = [
+            MemoryEntry(id=str(i), type=MemoryType.LONG_TERM, content="fact number " * 20)
+            for i in range(30)
+        ]
+        store = AsyncMock()
+        store.get_by_type = AsyncMock(side_effect=[long_term, []])
+        mgr = MemoryManager(store=store)
+
+        context = await mgr.get_context_for_agent(max_tokens=100)
+        body = context.removesuffix("\n...(truncated)")
+        assert context.endswith("...(truncated)")
+        assert mgr.tokenizer.count(body) <= 100
+
+    async def test_semantic_context_passes_budget(self):
+        store = MagicMock(spec=["semantic_search", "get_by_type"])
+        store.semantic_search = AsyncMock(
+            return_value=[{"memory": "remembered thing " * 50} for _ in range(10)]
+        )
+        mgr = MemoryManager(store=store)
+
+        context = await mgr.get_semantic_context("q", max_tokens=40)
+        assert mgr.tokenizer.count(context.removesuffix("\n...(truncated)")) <= 40
+
+
+class TestContextBudgetUnit:
+    def test_accepts_known_units(self):
+        assert Settings(context_budget_unit="tokens").context_budget_unit == "tokens"
+        assert Settings(context_budget_unit="chars").context_budget_unit == "chars"
+
+    def test_rejects_unknown_unit(self):
+        with pytest.raises(ValidationError):
+            Settings(context_budget_unit="token")
@@ -0,0 +1,89 @@
+"""Tests for relevance-based tool selection (pocketpaw.tools.retrieval)."""
+
+from types import SimpleNamespace
+
+from pocketpaw.tools.retrieval import LOAD_TOOLS_NAME, ToolIndex, ToolSelection
+from tests.test_native_parallel_tools import _collect, _make_orchestrator, _tool, _turns
+
+
+def _mcp(server: str, name: str, description: str, **props) -> dict:
+    return {
+        "name": f"mcp_{server}__{name}",
+        "description": description,
+        "input_schema": {
+            "type": "object",
+            "properties": {k: {"type": "string", "description": v} for k, v in props.items()},
+        },
+    }
+
+
+CATALOG = [
+    _mcp("github", "create_issue", "Open a new issue in a GitHub repository", title="Issue title"),
+    _mcp("github", "list_pull_requests", "List pull requests of a repository"),
+    _mcp("slack", "post_message", "Post a message to a Slack channel", channel="Channel name"),
+    _mcp("calendar", "createEvent", "Schedule a calendar event", start="Start time"),
+    _mcp("weather", "forecast", "Weather forecast for a city", city="City name"),
+]
+
+
+class TestToolIndex:
+    def test_ranks_by_relevance(self):
+        index = ToolIndex(CATALOG)
+        assert index.search("open an issue on github", 2)[0] == "mcp_github__create_issue"
+        assert index.search("what's the weather in Paris", 1) == ["mcp_weather__forecast"]
+
+    def test_splits_identifiers_and_folds_plurals(self):
+        index = ToolIndex(CATALOG)
+        assert index.search("create events", 1) == ["mcp_calendar__createEvent"]
+
+    def test_no_match_and_exclude(self):
+        index = ToolIndex(CATALOG)
+        assert index.search("zzz", 5) == []
+        assert "mcp_slack__post_message" not in index.search(
+            "slack message", 5, exclude={"mcp_slack__post_message"}
+        )
+
+
+class TestToolSelection:
+    def test_load_adds_matches(self):
+        selection = ToolSelection(ToolIndex(CATALOG), "weather in Paris", top_k=1)
+        assert selection.names == {"mcp_weather__forecast"}
+
+        summary = selection.load("post to slack")
+        assert "mcp_slack__post_message" in summary
+        assert "mcp_slack__post_message" in selection.names
+        assert [t["name"] for t in selection.tools()] == sorted(selection.names)
+        assert selection.load("zzz").startswith("No additional tools")
+
+
+class TestNativeToolSubset:
+    def _orch(self, responses, top_k=2):
+        orch = _make_orchestrator(responses, native_tool_top_k=top_k)
+        builtin = [{"name": "read_file", "description": "Read a file", "input_schema": {}}]
+        orch._get_filtered_tools = lambda: builtin + CATALOG
+        return orch
+
+    async def test_small_catalog_sends_everything(self):
+        response = SimpleNamespace(content=[], stop_reason="end_turn", usage=None)
+        orch = self._orch([response], top_k=10)
+        await _collect(orch)
+        tools = orch._client.messages.create.call_args.kwargs["tools"]
+        assert len(tools) == 1 + len(CATALOG)
+
+    async def test_large_catalog_offers_subset_and_load_tools(self):
+        orch = self._orch(_turns(_tool("t1", LOAD_TOOLS_NAME, query="slack message")))
+        orch._execute_tool = None  # load_tools must not reach the tool registry
+
+        events = [e async for e in orch.chat("open a github issue for the flaky test")]
+
+        first, second = (c.kwargs["tools"] for c in orch._client.messages.create.call_args_list)
+        names = [t["name"] for t in first]
+        assert names[0] == "read_file"
+        assert names[-1] == LOAD_TOOLS_NAME
+        assert len(names) == 1 + 2 + 1  # builtin + top_k + load_tools
+        assert "mcp_github__create_issue" in names
+        assert "mcp_slack__post_message" not in names
+        assert "mcp_slack__post_message" in [t["name"] for t in second]
+
+        result = next(e for e in events if e.type == "tool_result")
+        assert "mcp_slack__post_message" in result.content
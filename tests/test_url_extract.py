@@ -6,9 +6,20 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import httpx
 import pytest
 
+from pocketpaw.tools import http_client
+from pocketpaw.tools.builtin import url_extract
 from pocketpaw.tools.builtin.url_extract import UrlExtractTool
 
 
+@pytest.fixture(autouse=True)
+def _fresh_client_and_cache():
+    http_client._reset()
+    url_extract._page_cache.clear()
+    yield
+    http_client._reset()
+    url_extract._page_cache.clear()
+
+
 @pytest.fixture
 def tool():
     return UrlExtractTool()
@@ -283,7 +294,7 @@ class TestUrlExtractTool:
             response=MagicMock(status_code=404),
         )
 
-        async def mock_get(url):
+        async def mock_get(url, **kwargs):
             if "good" in url:
                 return good_resp
             return bad_resp
@@ -316,3 +327,98 @@ class TestUrlExtractTool:
         result = await tool.execute(urls=[])
         assert "Error" in result
         assert "No URLs" in result
+
+
+def _html_response(title: str, status: int = 200, headers: dict | None = None) -> MagicMock:
+    resp = MagicMock()
+    resp.status_code = status
+    resp.raise_for_status = MagicMock()
+    resp.headers = {"content-type": "text/html", **(headers or {})}
+    resp.text = f"<html><title>{title}</title><body><p>{title} body</p></body></html>"
+    return resp
+
+
+class TestLocalFetching:
+    """Concurrency, caching and revalidation of local extraction."""
+
+    @pytest.fixture(autouse=True)
+    def _local_provider(self):
+        with patch("pocketpaw.tools.builtin.url_extract.get_settings") as mock_settings:
+            mock_settings.return_value = MagicMock(url_extract_provider="local")
+            yield
+
+    async def test_urls_fetched_concurrently(self, tool):
+        import asyncio
+
+        running = 0
+        peak = 0
+
+        async def get(url, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.02)
+            running -= 1
+            return _html_response(url.rsplit("/", 1)[-1])
+
+        client = MagicMock(get=get)
+        with patch("pocketpaw.tools.builtin.url_extract.get_http_client", return_value=client):
+            result = await tool.execute(urls=[f"https://example.com/p{i}" for i in range(4)])
+
+        assert peak == 4
+        # Results keep the order of the requested URLs
+        assert result.index("p0") < result.index("p1") < result.index("p3")
+
+    async def test_cached_page_not_refetched(self, tool):
+        client = MagicMock(get=AsyncMock(return_value=_html_response("Cached")))
+        with patch("pocketpaw.tools.builtin.url_extract.get_http_client", return_value=client):
+            first = await tool.execute(urls=["https://example.com"])
+            second = await tool.execute(urls=["https://example.com"])
+
+        assert client.get.await_count == 1
+        assert first == second
+        assert "Cached body" in second
+
+    async def test_stale_page_revalidated(self, tool):
+        client = MagicMock(
+            get=AsyncMock(
+                side_effect=[
+                    _html_response("Page", headers={"etag": '"v1"'}),
+                    _html_response("ignored", status=304),
+                ]
+            )
+        )
+        with (
+            patch("pocketpaw.tools.builtin.url_extract.get_http_client", return_value=client),
+            patch("pocketpaw.tools.builtin.url_extract._CACHE_TTL_SECONDS", 0),
+        ):
+            await tool.execute(urls=["https://example.com"])
+            result = await tool.execute(urls=["https://example.com"])
+
+        assert client.get.await_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+        assert "Page body" in result
+
+    async def test_failed_fetch_not_cached(self, tool):
+        bad = MagicMock(status_code=500)
+        bad.raise_for_status.side_effect = httpx.HTTPStatusError(
+            "Server Error", request=MagicMock(), response=MagicMock(status_code=500)
+        )
+        client = MagicMock(get=AsyncMock(side_effect=[bad, _html_response("Recovered")]))
+        with patch("pocketpaw.tools.builtin.url_extract.get_http_client", return_value=client):
+            first = await tool.execute(urls=["https://example.com"])
+            second = await tool.execute(urls=["https://example.com"])
+
+        assert "Error fetching URL" in first
+        assert "Recovered" in second
+
+
+class TestSharedHttpClient:
+    async def test_reused_within_loop(self):
+        client = http_client.get_http_client()
+        try:
+            assert http_client.get_http_client() is client
+        finally:
+            await http_client.close_http_client()
+        assert client.is_closed
+        assert http_client.get_http_client() is not client
+        await http_client.close_http_client()
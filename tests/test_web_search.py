@@ -6,9 +6,19 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import httpx
 import pytest
 
+from pocketpaw.tools import http_client, search_cache
 from pocketpaw.tools.builtin.web_search import WebSearchTool
 
 
+@pytest.fixture(autouse=True)
+def _fresh_client_and_cache():
+    http_client._reset()
+    search_cache._cache = None
+    yield
+    http_client._reset()
+    search_cache._cache = None
+
+
 @pytest.fixture
 def tool():
     return WebSearchTool()